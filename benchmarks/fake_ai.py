@@ -0,0 +1,228 @@
+"""
+Fake AI Provider Module
+
+This module provides a deterministic stand-in for `GeminiProvider` so the
+chat pipeline can be load-tested without network access. Every call sleeps
+for a latency drawn from a seeded log-normal distribution and returns a
+canned answer shaped like the prompt that was sent.
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from flare_ai_defai.ai.base import BaseAIProvider, ModelResponse
+from flare_ai_defai.ai.rag import Document, RetrievalResult
+from flare_ai_defai.prompts import SemanticRouterResponse
+
+# z-score of the 99th percentile of a standard normal distribution
+Z_P99 = 2.326
+
+# Keywords used to answer semantic_router prompts, checked in order
+ROUTE_KEYWORDS = (
+    ("stake", SemanticRouterResponse.STAKE_FLR),
+    ("balance", SemanticRouterResponse.CHECK_BALANCE),
+    ("send", SemanticRouterResponse.SEND_TOKEN),
+    ("swap", SemanticRouterResponse.SWAP_TOKEN),
+    ("attest", SemanticRouterResponse.REQUEST_ATTESTATION),
+)
+
+CANNED_ANSWER = (
+    "The Flare Time Series Oracle (FTSO) delivers decentralized price feeds "
+    "to smart contracts on Flare. Data providers submit estimates every "
+    "voting round and the protocol publishes a weighted median."
+)
+CANNED_SUGGESTIONS = ["Check my balance", "Swap 1 FLR to USDT", "What is FTSO?"]
+
+
+@dataclass
+class LatencyModel:
+    """
+    Log-normal latency distribution described by its median and p99.
+
+    Attributes:
+        median (float): Median latency in seconds
+        p99 (float): 99th percentile latency in seconds
+    """
+
+    median: float
+    p99: float
+
+    @property
+    def sigma(self) -> float:
+        """Shape parameter of the underlying normal distribution."""
+        if self.median <= 0 or self.p99 <= self.median:
+            return 0.0
+        return math.log(self.p99 / self.median) / Z_P99
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency in seconds."""
+        if self.median <= 0:
+            return 0.0
+        return self.median * math.exp(rng.gauss(0.0, self.sigma))
+
+
+class _Sampler:
+    """Thread-safe seeded sampler shared by sync and async calls."""
+
+    def __init__(self, latency: LatencyModel, seed: int) -> None:
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            return self.latency.sample(self._rng)
+
+
+class FakeRAGProcessor:
+    """Returns the same small document set for every query."""
+
+    version = 0
+
+    def __init__(self, dimensions: int = 768) -> None:
+        self._embedding = np.ones(dimensions, dtype=np.float32) / math.sqrt(dimensions)
+        self._documents = [
+            Document(
+                content=CANNED_ANSWER,
+                metadata={"source_file": "ftso.md"},
+                source="ftso.md",
+                doc_id=0,
+            )
+        ]
+
+    async def retrieve_relevant_docs(
+        self, query: str, image_description: str | None = None, k: int = 3
+    ) -> RetrievalResult:
+        """Return the canned documents."""
+        return RetrievalResult(
+            documents=self._documents[:k],
+            scores=[0.9] * min(k, len(self._documents)),
+            query_embedding=self._embedding,
+        )
+
+    def augment_prompt(
+        self,
+        query: str,
+        retrieved_docs: RetrievalResult,
+        image_description: str | None = None,
+    ) -> str:
+        """Prepend the canned documents to the query."""
+        context = "\n".join(doc.content for doc in retrieved_docs.documents)
+        return f"{context}\n\n{query}"
+
+
+class FakeAIProvider(BaseAIProvider):
+    """
+    Deterministic `BaseAIProvider` with configurable latency.
+
+    Attributes:
+        latency (LatencyModel): Time to a complete response
+        chunk_count (int): Chunks a streamed response is split into
+        calls (dict[str, int]): Calls made per method
+    """
+
+    def __init__(
+        self,
+        api_key: str = "",
+        model: str = "fake",
+        latency: LatencyModel | None = None,
+        chunk_count: int = 8,
+        seed: int = 0,
+        **kwargs: str,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: Ignored
+            model: Model name reported in responses
+            latency: Time to a complete response
+            chunk_count: Chunks a streamed response is split into
+            seed: Seed for the latency sampler
+            **kwargs: Ignored
+        """
+        super().__init__(api_key, model)
+        self.latency = latency or LatencyModel(median=0.4, p99=1.5)
+        self.chunk_count = chunk_count
+        self.rag_processor = FakeRAGProcessor()
+        self.calls: dict[str, int] = {}
+        self._sample = _Sampler(self.latency, seed)
+        self._lock = threading.Lock()
+
+    def _count(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+
+    def _response(self, text: str) -> ModelResponse:
+        return ModelResponse(
+            text=text, raw_response=None, metadata={"model": self.model}
+        )
+
+    def reset(self, session_id: str | None = None) -> None:
+        """Nothing to reset; the fake keeps no history."""
+
+    def generate(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+        session_id: str | None = None,
+    ) -> ModelResponse:
+        """Sleep, then answer in the format the prompt asks for."""
+        self._count("generate")
+        time.sleep(self._sample())
+        if response_schema is SemanticRouterResponse:
+            # Only the user's input counts; the template mentions every route
+            _, _, tail = prompt.partition("Input:")
+            lowered = tail.split("\n", 1)[0].lower()
+            route = next(
+                (r for word, r in ROUTE_KEYWORDS if word in lowered),
+                SemanticRouterResponse.CONVERSATIONAL,
+            )
+            return self._response(route.value)
+        if response_mime_type == "application/json":
+            return self._response(json.dumps(CANNED_SUGGESTIONS))
+        return self._response(CANNED_ANSWER)
+
+    async def send_message(
+        self, msg: str, session_id: str | None = None
+    ) -> ModelResponse:
+        """Sleep without blocking the event loop, then answer."""
+        self._count("send_message")
+        await asyncio.sleep(self._sample())
+        return self._response(CANNED_ANSWER)
+
+    async def stream_message(
+        self,
+        msg: str,
+        session_id: str | None = None,
+        retrieved_docs: RetrievalResult | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the canned answer in evenly spaced chunks."""
+        self._count("stream_message")
+        delay = self._sample() / self.chunk_count
+        size = math.ceil(len(CANNED_ANSWER) / self.chunk_count)
+        for start in range(0, len(CANNED_ANSWER), size):
+            await asyncio.sleep(delay)
+            yield CANNED_ANSWER[start : start + size]
+
+    async def send_message_with_attachment(
+        self,
+        msg: str,
+        file_data: bytes,
+        mime_type: str,
+        session_id: str | None = None,
+    ) -> ModelResponse:
+        """Sleep, then answer as if the attachment had been read."""
+        self._count("send_message_with_attachment")
+        await asyncio.sleep(self._sample())
+        return self._response(CANNED_ANSWER)
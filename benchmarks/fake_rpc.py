@@ -0,0 +1,392 @@
+"""
+Fake JSON-RPC Node Module
+
+This module serves a local stand-in for a Flare RPC node. It answers the
+calls the chat handlers make (chain ID, balances, gas and fee data, nonces,
+block numbers) and decodes `eth_call` by function selector to answer ERC20
+`balanceOf`/`allowance`/`decimals` and the BlazeSwap `getAmountsOut`,
+`getPair` and `getReserves` reads, and the factory `allPairsLength`/`allPairs`
+and pair `token0`/`token1` reads of a factory holding a pool for every pair of
+BlazeSwap's mainnet tokens. Multicall3 `aggregate3` and
+`getEthBalance` are answered too unless the node is started without it, as
+are the contract registry lookups, FtsoV2 `getFeedsById` and
+FlareSystemsManager `getCurrentVotingEpochId` reads of the FTSO.
+
+Answers are derived from the request (e.g. a balance from the address), so
+repeated runs see identical data. Each request sleeps for a latency drawn
+from a seeded `LatencyModel`, so RPC tail latency can be simulated too.
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import uvicorn
+from eth_abi import decode, encode
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from web3 import Web3
+
+from benchmarks.fake_ai import LatencyModel
+
+FLARE_CHAIN_ID = 14
+GAS_PRICE = 25 * 10**9
+PRIORITY_FEE = 10**9
+BLOCK_TIME = 1.8
+# Constant-product reserves reported for every pair
+RESERVE = 10**24
+# BlazeSwap (Uniswap V2) swap fee
+FEE_NUMERATOR, FEE_DENOMINATOR = 997, 1000
+MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+# Addresses the contract registry resolves by name
+REGISTRY_CONTRACTS = {
+    "FtsoV2": "0x7BDE3Df0624114eDB3A67dFe6753e62f4e7c1d20",
+    "FlareSystemsManager": "0x89e50DC0380e597ecE79c8494bAAFD84537AD0D4",
+}
+FIRST_VOTING_ROUND_START = 1658430000
+VOTING_ROUND_SECONDS = 90
+FEED_DECIMALS = 5
+# WFLR, USDT, WETH and FLX on Flare mainnet
+POOL_TOKENS = [
+    "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",
+    "0xC1A5B41512496B80903D1f32d6dEa3a73212E71F",
+    "0x1502FA4be69d526124D453619276FacCab275d3D",
+    "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",
+]
+
+
+def selector(signature: str) -> str:
+    """Return the 4-byte selector of a function signature as 0x-hex."""
+    return "0x" + Web3.keccak(text=signature)[:4].hex().removeprefix("0x")
+
+
+def _word(value: int) -> str:
+    return "0x" + encode(["uint256"], [value]).hex()
+
+
+def _amount_out(amount_in: int) -> int:
+    amount_in_with_fee = amount_in * FEE_NUMERATOR
+    return amount_in_with_fee * RESERVE // (RESERVE * FEE_DENOMINATOR + amount_in_with_fee)
+
+
+def _balance_of(_to: str, args: bytes) -> str:
+    (holder,) = decode(["address"], args)
+    return _word(int(holder, 16) % 10**6 * 10**15)
+
+
+def _allowance(_to: str, args: bytes) -> str:
+    return _word(0)
+
+
+def _decimals(_to: str, args: bytes) -> str:
+    return _word(18)
+
+
+def _total_supply(_to: str, args: bytes) -> str:
+    return _word(10**27)
+
+
+def _get_amounts_out(_to: str, args: bytes) -> str:
+    amount_in, path = decode(["uint256", "address[]"], args)
+    amounts = [amount_in]
+    for _ in path[1:]:
+        amounts.append(_amount_out(amounts[-1]))
+    return "0x" + encode(["uint256[]"], [amounts]).hex()
+
+
+def pair_address(token_a: str, token_b: str) -> str:
+    """Return the deterministic fake pair address of two tokens."""
+    token0, token1 = sorted([token_a.lower(), token_b.lower()])
+    pair = Web3.keccak(hexstr=token0 + token1.removeprefix("0x"))[-20:]
+    return Web3.to_checksum_address(pair)
+
+
+# Factory pairs in creation order, and each pair's (token0, token1)
+PAIRS = [
+    pair_address(a, b) for i, a in enumerate(POOL_TOKENS) for b in POOL_TOKENS[i + 1 :]
+]
+PAIR_TOKENS = {
+    pair_address(a, b).lower(): tuple(sorted([a.lower(), b.lower()]))
+    for i, a in enumerate(POOL_TOKENS)
+    for b in POOL_TOKENS[i + 1 :]
+}
+
+
+def _address_word(address: str) -> str:
+    return "0x" + encode(["address"], [address]).hex()
+
+
+def _get_pair(_to: str, args: bytes) -> str:
+    token_a, token_b = decode(["address", "address"], args)
+    pair = pair_address(token_a, token_b)
+    return _address_word(pair if pair.lower() in PAIR_TOKENS else "0x" + "00" * 20)
+
+
+def _all_pairs_length(_to: str, args: bytes) -> str:
+    return _word(len(PAIRS))
+
+
+def _all_pairs(_to: str, args: bytes) -> str:
+    (index,) = decode(["uint256"], args)
+    return _address_word(PAIRS[index])
+
+
+def _token0(to: str, args: bytes) -> str:
+    return _address_word(PAIR_TOKENS[to.lower()][0])
+
+
+def _token1(to: str, args: bytes) -> str:
+    return _address_word(PAIR_TOKENS[to.lower()][1])
+
+
+def _get_reserves(_to: str, args: bytes) -> str:
+    return "0x" + encode(
+        ["uint112", "uint112", "uint32"], [RESERVE, RESERVE, int(time.time())]
+    ).hex()
+
+
+def _get_contract_address_by_name(_to: str, args: bytes) -> str:
+    (name,) = decode(["string"], args)
+    return _address_word(REGISTRY_CONTRACTS[name])
+
+
+def feed_value(feed_id: bytes) -> int:
+    """Return the raw value (`FEED_DECIMALS` decimals) reported for a feed."""
+    return int.from_bytes(feed_id[1:5], "big") % 10**7 + 10**4
+
+
+def _get_feeds_by_id(_to: str, args: bytes) -> str:
+    (feed_ids,) = decode(["bytes21[]"], args)
+    return "0x" + encode(
+        ["uint256[]", "int8[]", "uint64"],
+        [
+            [feed_value(feed_id) for feed_id in feed_ids],
+            [FEED_DECIMALS] * len(feed_ids),
+            int(time.time()),
+        ],
+    ).hex()
+
+
+def voting_round(now: float | None = None) -> int:
+    """Return the FTSO voting round of a unix time (default: now)."""
+    elapsed = (time.time() if now is None else now) - FIRST_VOTING_ROUND_START
+    return int(elapsed // VOTING_ROUND_SECONDS)
+
+
+def _get_current_voting_epoch_id(_to: str, _args: bytes) -> str:
+    return _word(voting_round())
+
+
+def _aggregate3(_to: str, args: bytes) -> str:
+    (calls,) = decode(["(address,bool,bytes)[]"], args)
+    results = []
+    for target, _allow_failure, data in calls:
+        handler = CALL_HANDLERS.get("0x" + data[:4].hex())
+        try:
+            result = handler(target, data[4:]) if handler else _word(0)
+        except (KeyError, IndexError):
+            results.append((False, b""))
+            continue
+        results.append((True, bytes.fromhex(result.removeprefix("0x"))))
+    return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+
+CALL_HANDLERS: dict[str, Callable[[str, bytes], str]] = {
+    selector("aggregate3((address,bool,bytes)[])"): _aggregate3,
+    selector("getEthBalance(address)"): _balance_of,
+    selector("balanceOf(address)"): _balance_of,
+    selector("allowance(address,address)"): _allowance,
+    selector("decimals()"): _decimals,
+    selector("totalSupply()"): _total_supply,
+    selector("getAmountsOut(uint256,address[])"): _get_amounts_out,
+    selector("getPair(address,address)"): _get_pair,
+    selector("getReserves()"): _get_reserves,
+    selector("allPairsLength()"): _all_pairs_length,
+    selector("allPairs(uint256)"): _all_pairs,
+    selector("token0()"): _token0,
+    selector("token1()"): _token1,
+    selector("getContractAddressByName(string)"): _get_contract_address_by_name,
+    selector("getFeedsById(bytes21[])"): _get_feeds_by_id,
+    selector("getCurrentVotingEpochId()"): _get_current_voting_epoch_id,
+}
+
+
+class FakeRPCNode:
+    """
+    JSON-RPC method dispatcher with simulated latency.
+
+    Attributes:
+        chain_id (int): Chain ID reported by eth_chainId
+        latency (LatencyModel): Per-request latency
+        multicall (bool): Whether Multicall3 is deployed
+        calls (dict[str, int]): Requests served per method
+        http_requests (int): HTTP requests served (a batch counts once)
+    """
+
+    def __init__(
+        self,
+        chain_id: int = FLARE_CHAIN_ID,
+        latency: LatencyModel | None = None,
+        seed: int = 0,
+        multicall: bool = True,
+    ) -> None:
+        """
+        Initialize the node.
+
+        Args:
+            chain_id: Chain ID reported by eth_chainId
+            latency: Per-request latency
+            seed: Seed for the latency sampler
+            multicall: Whether Multicall3 is deployed
+        """
+        self.chain_id = chain_id
+        self.multicall = multicall
+        self.latency = latency or LatencyModel(median=0.05, p99=0.3)
+        self.calls: dict[str, int] = {}
+        self.http_requests = 0
+        self._rng = random.Random(seed)
+        self._started_at = time.monotonic()
+        self._nonces: dict[str, int] = {}
+        self.methods: dict[str, Callable[..., Any]] = {
+            "eth_chainId": lambda: hex(self.chain_id),
+            "net_version": lambda: str(self.chain_id),
+            "eth_blockNumber": lambda: hex(self.block_number),
+            "eth_gasPrice": lambda: hex(GAS_PRICE),
+            "eth_maxPriorityFeePerGas": lambda: hex(PRIORITY_FEE),
+            "eth_getBalance": self.get_balance,
+            "eth_getTransactionCount": self.get_transaction_count,
+            "eth_estimateGas": lambda *_: hex(150_000),
+            "eth_getBlockByNumber": self.get_block,
+            "eth_feeHistory": self.fee_history,
+            "eth_getCode": self.get_code,
+            "eth_call": self.call,
+        }
+
+    @property
+    def block_number(self) -> int:
+        """Block height advancing at Flare's block time."""
+        return 30_000_000 + int((time.monotonic() - self._started_at) / BLOCK_TIME)
+
+    def get_balance(self, address: str, _block: str = "latest") -> str:
+        """Return a balance derived from the address."""
+        return hex(int(address, 16) % 10**6 * 10**15)
+
+    def get_transaction_count(self, address: str, _block: str = "latest") -> str:
+        """Return the address's nonce."""
+        return hex(self._nonces.get(address.lower(), 0))
+
+    def get_block(self, number: str, _full: bool = False) -> dict[str, Any]:
+        """Return a minimal block header."""
+        height = self.block_number if number in ("latest", "pending") else int(number, 16)
+        return {
+            "number": hex(height),
+            "hash": "0x" + f"{height:064x}",
+            "parentHash": "0x" + f"{height - 1:064x}",
+            "timestamp": hex(int(time.time())),
+            "baseFeePerGas": hex(GAS_PRICE - PRIORITY_FEE),
+            "gasLimit": hex(15_000_000),
+            "gasUsed": hex(7_500_000),
+            "transactions": [],
+        }
+
+    def fee_history(
+        self, count: int | str, _newest: str, percentiles: list[float] | None = None
+    ) -> dict[str, Any]:
+        """Return a flat fee history."""
+        blocks = int(count, 16) if isinstance(count, str) else count
+        percentiles = percentiles or []
+        return {
+            "oldestBlock": hex(self.block_number - blocks + 1),
+            "baseFeePerGas": [hex(GAS_PRICE - PRIORITY_FEE)] * (blocks + 1),
+            "gasUsedRatio": [0.5] * blocks,
+            "reward": [[hex(PRIORITY_FEE)] * len(percentiles)] * blocks,
+        }
+
+    def get_code(self, address: str, _block: str = "latest") -> str:
+        """Report code at every address except an undeployed Multicall3."""
+        if address.lower() == MULTICALL3_ADDRESS and not self.multicall:
+            return "0x"
+        return "0x6080"
+
+    def call(self, tx: dict[str, Any], _block: str = "latest") -> str:
+        """Answer a contract read by its function selector."""
+        if self.get_code(tx.get("to") or "") == "0x":
+            return "0x"
+        data = tx.get("data") or tx.get("input") or "0x"
+        handler = CALL_HANDLERS.get(data[:10])
+        if handler is None:
+            return _word(0)
+        return handler(tx.get("to") or "", bytes.fromhex(data[10:]))
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer a single JSON-RPC request object."""
+        method = request.get("method", "")
+        self.calls[method] = self.calls.get(method, 0) + 1
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        handler = self.methods.get(method)
+        if handler is None:
+            response["error"] = {"code": -32601, "message": f"Method not found: {method}"}
+            return response
+        try:
+            response["result"] = handler(*request.get("params", []))
+        except Exception as e:  # noqa: BLE001
+            response["error"] = {"code": -32000, "message": str(e)}
+        return response
+
+    async def handle(self, request: Request) -> JSONResponse:
+        """Serve a single or batched JSON-RPC request."""
+        payload = await request.json()
+        self.http_requests += 1
+        await asyncio.sleep(self.latency.sample(self._rng))
+        if isinstance(payload, list):
+            return JSONResponse([self.dispatch(item) for item in payload])
+        return JSONResponse(self.dispatch(payload))
+
+
+class FakeRPCServer:
+    """
+    Runs a FakeRPCNode on a local port in a background thread.
+
+    Use as a context manager; `url` is set once the server is listening.
+
+    Attributes:
+        node (FakeRPCNode): Node answering requests
+        url (str): HTTP endpoint of the running server
+    """
+
+    def __init__(self, node: FakeRPCNode | None = None) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            node: Node answering requests (defaults to a Flare mainnet node)
+        """
+        self.node = node or FakeRPCNode()
+        self.url = ""
+        app = Starlette(routes=[Route("/", self.node.handle, methods=["POST"])])
+        config = uvicorn.Config(app, log_level="warning", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "FakeRPCServer":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [sock]}, daemon=True
+        )
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,346 @@
+"""
+Chat Load Driver Module
+
+This module drives the chat API offline and reports throughput, latency
+percentiles and memory for each chat route. The app is wired exactly like
+`flare_ai_defai.main` but with a `FakeAIProvider` and providers pointed at a
+local `FakeRPCServer`. Requests go through the ASGI stack in-process, so the
+numbers measure the application and not the network.
+
+Usage:
+    uv run python -m benchmarks.load --requests 200 --concurrency 32
+    uv run python -m benchmarks.load --scenario swap --gemini-median 0 --json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import logging
+import resource
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+import numpy as np
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from web3 import Web3
+
+from benchmarks.fake_ai import FakeAIProvider, LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from flare_ai_defai.api.middleware.timing import TimingMiddleware
+from flare_ai_defai.api.routes.chat import ChatRouter
+from flare_ai_defai.attestation import Vtpm
+from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.blockchain.blazeswap import BlazeSwapHandler
+from flare_ai_defai.metrics import STAGE_SECONDS, UPSTREAM_SECONDS, Summary, metrics
+from flare_ai_defai.prompts import PromptService
+from flare_ai_defai.warmup import WarmUp, lifespan
+
+CHAT_PREFIX = "/api/routes/chat"
+WALLET = Web3.to_checksum_address("0x00000000000000000000000000000000000a11ce")
+RECIPIENT = Web3.to_checksum_address("0x000000000000000000000000000000000000b0b0")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A chat route exercised by the load driver.
+
+    Attributes:
+        path (str): Endpoint under the chat prefix
+        message (str): Message sent in every request
+        stream (bool): Whether the endpoint returns server-sent events
+    """
+
+    path: str
+    message: str
+    stream: bool = False
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "help": Scenario("/", "help"),
+    "balance": Scenario("/", "balance"),
+    "send": Scenario("/", f"send 1.5 FLR to {RECIPIENT}"),
+    "swap": Scenario("/", "swap 1 FLR to USDT"),
+    "conversational": Scenario("/", "What is the FTSO and how are prices agreed?"),
+    "stream": Scenario("/stream", "What is the FTSO and how are prices agreed?", stream=True),
+}
+
+
+@dataclass
+class RouteReport:
+    """
+    Results for one scenario.
+
+    Attributes:
+        scenario (str): Scenario name
+        requests (int): Requests sent
+        errors (int): Non-200 responses or transport failures
+        rps (float): Completed requests per second
+        p50_ms (float): Median latency
+        p95_ms (float): 95th percentile latency
+        p99_ms (float): 99th percentile latency
+        peak_alloc_kib (float): Peak Python heap growth during the run
+        retained_kib (float): Python heap growth still held after the run
+    """
+
+    scenario: str
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_alloc_kib: float
+    retained_kib: float
+
+
+def build_app(ai: FakeAIProvider, rpc_url: str) -> FastAPI:
+    """
+    Build the chat API with fake upstreams.
+
+    Args:
+        ai: AI provider standing in for Gemini
+        rpc_url: JSON-RPC endpoint standing in for Flare
+
+    Returns:
+        FastAPI: App exposing the chat routes, /ready and /metrics, with the
+            warm-up of `flare_ai_defai.main` (run it with `lifespan`)
+    """
+    chat = ChatRouter(
+        ai=ai,  # type: ignore[arg-type]
+        blockchain=FlareProvider(web3_provider_url=rpc_url),
+        attestation=Vtpm(simulate=True),
+        prompts=PromptService(),
+        blazeswap=BlazeSwapHandler(rpc_url),
+    )
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(TimingMiddleware)
+    app.include_router(chat.router, prefix=CHAT_PREFIX)
+    app.state.warm_up = warm_up = WarmUp.for_chat(chat)
+
+    @app.get("/ready")
+    async def ready() -> JSONResponse:
+        return JSONResponse(warm_up.status(), status_code=200 if warm_up.ready else 503)
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def prometheus_metrics() -> str:
+        return metrics.render()
+
+    return app
+
+
+async def _send(client: httpx.AsyncClient, scenario: Scenario) -> float | None:
+    """Send one request and return its latency, or None on failure."""
+    data = {"message": scenario.message, "walletAddress": WALLET}
+    started_at = time.perf_counter()
+    try:
+        if scenario.stream:
+            async with client.stream(
+                "POST", CHAT_PREFIX + scenario.path, data=data
+            ) as response:
+                async for _ in response.aiter_bytes():
+                    pass
+        else:
+            response = await client.post(CHAT_PREFIX + scenario.path, data=data)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:  # noqa: PLR2004
+        return None
+    return time.perf_counter() - started_at
+
+
+async def run_scenario(
+    app: FastAPI,
+    name: str,
+    requests: int,
+    concurrency: int,
+    warmup: int = 5,
+) -> RouteReport:
+    """
+    Load one scenario and measure it.
+
+    Args:
+        app: App under test
+        name: Key into SCENARIOS
+        requests: Requests to send after warm-up
+        concurrency: Maximum requests in flight
+        warmup: Requests sent before measuring
+
+    Returns:
+        RouteReport: Throughput, latency and memory for the scenario
+    """
+    scenario = SCENARIOS[name]
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=None
+    ) as client:
+        for _ in range(warmup):
+            await _send(client, scenario)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded() -> float | None:
+            async with semaphore:
+                return await _send(client, scenario)
+
+        gc.collect()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        started_at = time.perf_counter()
+        results = await asyncio.gather(*(bounded() for _ in range(requests)))
+        elapsed = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+
+    latencies = np.array([r for r in results if r is not None]) * 1000
+    p50, p95, p99 = (
+        np.percentile(latencies, [50, 95, 99]).tolist() if latencies.size else [0.0] * 3
+    )
+    return RouteReport(
+        scenario=name,
+        requests=requests,
+        errors=requests - int(latencies.size),
+        rps=latencies.size / elapsed if elapsed else 0.0,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        peak_alloc_kib=(peak - baseline) / 1024,
+        retained_kib=(retained - baseline) / 1024,
+    )
+
+
+def breakdown(summary: Summary) -> dict[str, dict[str, float]]:
+    """Return p50/p95/p99 in milliseconds for every label set of a summary."""
+    result = {}
+    for labels in summary.label_sets():
+        name = ".".join(labels.values())
+        result[name] = {
+            f"p{round(q * 100)}_ms": round(v * 1000, 2)
+            for q, v in summary.quantiles(**labels).items()
+        }
+    return result
+
+
+async def run(
+    scenarios: list[str],
+    requests: int,
+    concurrency: int,
+    gemini: LatencyModel,
+    rpc: LatencyModel,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Start the fake RPC node, build the app and load every scenario in turn.
+
+    Args:
+        scenarios: Scenario names to run
+        requests: Requests per scenario
+        concurrency: Maximum requests in flight
+        gemini: Latency of fake Gemini calls
+        rpc: Latency of fake RPC requests
+        seed: Seed for both latency samplers
+
+    Returns:
+        dict: Per-route reports, per-stage and per-upstream latencies, RPC
+            calls served and process memory
+    """
+    tracemalloc.start()
+    with FakeRPCServer(FakeRPCNode(latency=rpc, seed=seed)) as server:
+        app = build_app(FakeAIProvider(latency=gemini, seed=seed), server.url)
+        async with lifespan(app):
+            reports = [
+                await run_scenario(app, name, requests, concurrency)
+                for name in scenarios
+            ]
+        rpc_calls = dict(server.node.calls)
+    tracemalloc.stop()
+    return {
+        "routes": [asdict(report) for report in reports],
+        "stages": breakdown(STAGE_SECONDS),
+        "upstreams": breakdown(UPSTREAM_SECONDS),
+        "rpc_calls": rpc_calls,
+        "max_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def format_report(result: dict[str, Any]) -> str:
+    """Render a result as aligned text tables."""
+    lines = [
+        f"{'route':<16}{'reqs':>6}{'err':>5}{'rps':>9}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>11}{'kept KiB':>10}"
+    ]
+    lines.extend(
+        f"{r['scenario']:<16}{r['requests']:>6}{r['errors']:>5}{r['rps']:>9.1f}"
+        f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+        f"{r['peak_alloc_kib']:>11.0f}{r['retained_kib']:>10.0f}"
+        for r in result["routes"]
+    )
+    for section in ("stages", "upstreams"):
+        lines.append("")
+        lines.append(f"{section[:-1]:<40}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        lines.extend(
+            f"{name:<40}{q.get('p50_ms', 0):>10.1f}{q.get('p95_ms', 0):>10.1f}"
+            f"{q.get('p99_ms', 0):>10.1f}"
+            for name, q in sorted(result[section].items())
+        )
+    lines.append("")
+    lines.append(f"max RSS: {result['max_rss_mib']:.1f} MiB")
+    return "\n".join(lines)
+
+
+def _quiet() -> Callable[[], contextlib.AbstractContextManager[Any]]:
+    """Silence app logging and the handlers' debug prints during a run."""
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    logging.getLogger().setLevel(logging.WARNING)
+    return lambda: contextlib.redirect_stdout(io.StringIO())
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Route to load (repeatable, default: all)",
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--gemini-median", type=float, default=0.4)
+    parser.add_argument("--gemini-p99", type=float, default=1.5)
+    parser.add_argument("--rpc-median", type=float, default=0.05)
+    parser.add_argument("--rpc-p99", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    quiet = _quiet()
+    with quiet():
+        result = asyncio.run(
+            run(
+                args.scenario or list(SCENARIOS),
+                requests=args.requests,
+                concurrency=args.concurrency,
+                gemini=LatencyModel(args.gemini_median, args.gemini_p99),
+                rpc=LatencyModel(args.rpc_median, args.rpc_p99),
+                seed=args.seed,
+            )
+        )
+    print(json.dumps(result, indent=2) if args.json else format_report(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Startup Benchmark Module
+
+This module measures how long the chat API takes to become useful after a
+cold start, against a local `FakeRPCServer` whose latency is configurable,
+so a slow RPC node can be simulated. It reports:
+
+- build: seconds to build the app (wired like `flare_ai_defai.main`)
+- first_request: seconds from the start of the build to the first answered
+  chat request
+- ready: seconds from the start of the build until `/ready` returns 200
+- first_swap: latency of a swap request sent once the app is ready
+
+Usage:
+    uv run python -m benchmarks.startup
+    uv run python -m benchmarks.startup --rpc-median 1.0 --rpc-p99 3.0 --json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+
+from benchmarks.fake_ai import FakeAIProvider, LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from benchmarks.load import CHAT_PREFIX, SCENARIOS, WALLET, _quiet, build_app
+from flare_ai_defai.warmup import lifespan
+
+# Interval between /ready polls in seconds
+READY_POLL_INTERVAL = 0.01
+
+
+async def _chat(client: httpx.AsyncClient, scenario: str) -> bool:
+    data = {"message": SCENARIOS[scenario].message, "walletAddress": WALLET}
+    response = await client.post(CHAT_PREFIX + SCENARIOS[scenario].path, data=data)
+    return response.status_code == 200  # noqa: PLR2004
+
+
+async def run(
+    rpc: LatencyModel,
+    gemini: LatencyModel,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Cold-start the app against a fake RPC node and time it.
+
+    Args:
+        rpc: Latency of fake RPC requests
+        gemini: Latency of fake Gemini calls
+        seed: Seed for both latency samplers
+
+    Returns:
+        dict: Startup timings in seconds and the RPC calls made until ready
+    """
+    with FakeRPCServer(FakeRPCNode(latency=rpc, seed=seed)) as server:
+        started_at = time.perf_counter()
+        app = build_app(FakeAIProvider(latency=gemini, seed=seed), server.url)
+        result: dict[str, Any] = {"build": time.perf_counter() - started_at}
+
+        transport = httpx.ASGITransport(app=app)
+        async with lifespan(app), httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            result["first_request_ok"] = await _chat(client, "help")
+            result["first_request"] = time.perf_counter() - started_at
+            while (await client.get("/ready")).status_code != 200:  # noqa: PLR2004
+                await asyncio.sleep(READY_POLL_INTERVAL)
+            result["ready"] = time.perf_counter() - started_at
+            result["rpc_calls_until_ready"] = dict(server.node.calls)
+            swap_started_at = time.perf_counter()
+            result["first_swap_ok"] = await _chat(client, "swap")
+            result["first_swap"] = time.perf_counter() - swap_started_at
+    return result
+
+
+def format_report(result: dict[str, Any]) -> str:
+    """Render a result as an aligned text table."""
+    lines = [f"{'phase':<16}{'seconds':>10}"]
+    for phase in ("build", "first_request", "ready", "first_swap"):
+        lines.append(f"{phase:<16}{result[phase]:>10.3f}")
+    calls = sum(result["rpc_calls_until_ready"].values())
+    lines.append("")
+    lines.append(f"RPC calls until ready: {calls}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rpc-median", type=float, default=0.3)
+    parser.add_argument("--rpc-p99", type=float, default=1.0)
+    parser.add_argument("--gemini-median", type=float, default=0.0)
+    parser.add_argument("--gemini-p99", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    quiet = _quiet()
+    with quiet():
+        result = asyncio.run(
+            run(
+                rpc=LatencyModel(args.rpc_median, args.rpc_p99),
+                gemini=LatencyModel(args.gemini_median, args.gemini_p99),
+                seed=args.seed,
+            )
+        )
+    print(json.dumps(result, indent=2) if args.json else format_report(result))
+
+
+if __name__ == "__main__":
+    main()
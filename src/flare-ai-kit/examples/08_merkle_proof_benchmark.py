@@ -0,0 +1,94 @@
+"""
+Benchmark local verification of FTSO anchor feed Merkle proofs.
+
+Builds synthetic rounds of anchor feeds with valid proofs and reports proofs
+verified per second three ways: one proof at a time with nothing shared, with
+one `MerkleVerifier` sharing proven nodes per round, and with the verifier
+spreading chunks over a process pool.
+
+    uv run python examples/08_merkle_proof_benchmark.py --rounds 200 --feeds 64
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from flare_ai_kit.common import FTSOAnchorFeedsWithProof
+from flare_ai_kit.ecosystem.protocols.merkle import (
+    MerkleVerifier,
+    build_merkle_tree,
+    feed_leaf,
+)
+
+Round = tuple[bytes, list[FTSOAnchorFeedsWithProof]]
+
+
+def make_rounds(n_rounds: int, n_feeds: int) -> list[Round]:
+    rounds: list[Round] = []
+    for voting_round in range(n_rounds):
+        feeds = [
+            FTSOAnchorFeedsWithProof.model_validate(
+                {
+                    "body": {
+                        "votingRoundId": voting_round,
+                        "id": f"0x01{i:040x}",
+                        "value": 10_000 + voting_round + i,
+                        "turnoutBIPS": 9000,
+                        "decimals": 5,
+                    },
+                    "proof": [],
+                }
+            )
+            for i in range(n_feeds)
+        ]
+        root, proofs = build_merkle_tree([feed_leaf(feed.body) for feed in feeds])
+        for feed, proof in zip(feeds, proofs, strict=True):
+            feed.proof = ["0x" + node.hex() for node in proof]
+        rounds.append((root, feeds))
+    return rounds
+
+
+def one_at_a_time(rounds: list[Round]) -> list[list[bool]]:
+    # A fresh verifier per proof shares nothing, like verifying in isolation
+    return [
+        [MerkleVerifier().verify_round(root, [feed])[0] for feed in feeds]
+        for root, feeds in rounds
+    ]
+
+
+def measure(name: str, run: Callable[[], list[list[bool]]], proofs: int) -> None:
+    started_at = time.perf_counter()
+    results = run()
+    elapsed = time.perf_counter() - started_at
+    if not all(all(r) for r in results):
+        msg = f"{name}: invalid proof"
+        raise RuntimeError(msg)
+    print(f"{name:<16}{proofs / elapsed:>14,.0f} proofs/s{elapsed:>10.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--feeds", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rounds = make_rounds(args.rounds, args.feeds)
+    proofs = args.rounds * args.feeds
+    print(f"{args.rounds} rounds x {args.feeds} feeds = {proofs} proofs\n")
+    measure("one at a time", lambda: one_at_a_time(rounds), proofs)
+    measure("shared nodes", lambda: MerkleVerifier().verify_batch(rounds), proofs)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Start the workers before timing
+        list(pool.map(abs, range(args.workers)))
+        measure(
+            f"{args.workers} processes",
+            lambda: MerkleVerifier().verify_batch(rounds, executor=pool),
+            proofs,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""JSON-RPC request batching for the Flare web3 provider."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = structlog.get_logger(__name__)
+
+_Call = tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]"]
+
+
+@dataclass
+class _PendingBatch:
+    flush: asyncio.TimerHandle
+    calls: list[_Call] = field(default_factory=list[_Call])
+
+
+class BatchingAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that coalesces concurrent requests into JSON-RPC batches.
+
+    A request waits up to `batch_window` seconds for others (e.g. the other
+    legs of an `asyncio.gather`) and is then sent with them as one HTTP
+    request of at most `batch_max_size` calls. Responses are matched back to
+    their callers by request id, so an error response only fails the call it
+    belongs to. Pending batches are kept per event loop.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        batch_window: float,
+        batch_max_size: int,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            endpoint_uri: JSON-RPC endpoint.
+            batch_window: Seconds a request waits for others to join its batch.
+            batch_max_size: Maximum requests per batch (1 disables batching).
+            **kwargs: Passed on to AsyncHTTPProvider, e.g. `request_kwargs`.
+
+        """
+        super().__init__(endpoint_uri, **kwargs)
+        self.batch_window = batch_window
+        self.batch_max_size = batch_max_size
+        self._pending: dict[asyncio.AbstractEventLoop, _PendingBatch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request, batched with concurrent ones if enabled."""
+        if self.batch_max_size <= 1:
+            return await super().make_request(method, params)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[RPCResponse] = loop.create_future()
+        batch = self._pending.get(loop)
+        if batch is None:
+            flush = loop.call_later(self.batch_window, self._flush, loop)
+            batch = self._pending[loop] = _PendingBatch(flush)
+        batch.calls.append((method, params, future))
+        if len(batch.calls) >= self.batch_max_size:
+            self._flush(loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Send the loop's pending batch."""
+        batch = self._pending.pop(loop, None)
+        if batch is None:
+            return
+        batch.flush.cancel()
+        task = loop.create_task(self._send_batch(batch.calls))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send_batch(self, calls: list[_Call]) -> None:
+        """Send calls as one HTTP request and resolve their futures."""
+        try:
+            if len(calls) == 1:
+                method, params, _ = calls[0]
+                responses = [await super().make_request(method, params)]
+            else:
+                batch = await self.make_batch_request([(m, p) for m, p, _ in calls])
+                # A rejected batch is one error response shared by every call
+                responses = batch if isinstance(batch, list) else [batch] * len(calls)
+                if len(responses) != len(calls):
+                    msg = (
+                        f"JSON-RPC batch returned {len(responses)} "
+                        f"of {len(calls)} responses"
+                    )
+                    raise ValueError(msg)  # noqa: TRY301
+        except Exception as e:  # noqa: BLE001
+            logger.debug("JSON-RPC batch failed", size=len(calls), error=str(e))
+            for *_, future in calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), response in zip(calls, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
@@ -7,7 +7,7 @@ from typing import Any, TypeVar, cast
 
 import structlog
 from eth_typing import ChecksumAddress
-from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3 import AsyncWeb3
 from web3.contract.async_contract import AsyncContractFunction
 from web3.exceptions import (
     ContractLogicError,
@@ -18,9 +18,12 @@ from web3.exceptions import (
 from web3.middleware import (
     ExtraDataToPOAMiddleware,  # pyright: ignore[reportUnknownVariableType]
 )
-from web3.types import TxParams
+from web3.types import Nonce, TxParams
 
 from flare_ai_kit.common import FlareTxError, FlareTxRevertedError, load_abi
+from flare_ai_kit.ecosystem.batching import BatchingAsyncHTTPProvider
+from flare_ai_kit.ecosystem.nonce import get_nonce_manager
+from flare_ai_kit.ecosystem.rpc_pool import RPCPoolProvider
 from flare_ai_kit.ecosystem.settings import EcosystemSettings
 
 logger = structlog.get_logger(__name__)
@@ -98,11 +101,26 @@ class Flare:
         self.retry_delay = settings.retry_delay
 
         try:
+            providers = [
+                BatchingAsyncHTTPProvider(
+                    url,
+                    batch_window=settings.web3_batch_window,
+                    batch_max_size=settings.web3_batch_max_size,
+                    request_kwargs={"timeout": settings.web3_provider_timeout},
+                )
+                for url in [
+                    self.web3_provider_url,
+                    *map(str, settings.web3_provider_fallback_urls),
+                ]
+            ]
             # Handle injecting PoA middlewares for testnets
             self.w3 = AsyncWeb3(
-                AsyncHTTPProvider(
-                    self.web3_provider_url,
-                    request_kwargs={"timeout": settings.web3_provider_timeout},
+                providers[0]
+                if len(providers) == 1
+                else RPCPoolProvider(
+                    providers,
+                    hedge_max_delay=settings.web3_hedge_max_delay,
+                    max_block_lag=settings.web3_max_block_lag,
                 ),
                 middleware=[ExtraDataToPOAMiddleware] if settings.is_testnet else [],
             )
@@ -110,6 +128,10 @@ class Flare:
                 address=self.w3.to_checksum_address(CONTRACT_REGISTRY_ADDRESS),
                 abi=load_abi("FlareContractRegistry"),
             )
+            # Shared per endpoint so concurrent flows never reuse a nonce
+            self.nonces = get_nonce_manager(
+                self.web3_provider_url, self.w3, settings.nonce_reservation_ttl
+            )
         except Exception as e:
             msg = "Failed to initialize Flare provider"
             logger.exception(msg)
@@ -162,7 +184,7 @@ class Flare:
 
     async def _prepare_base_tx_params(self, from_addr: ChecksumAddress) -> TxParams:
         """
-        Fetches nonce, gas fees (EIP-1559), and chain ID for a transaction.
+        Reserves a nonce and fetches gas fees (EIP-1559) and chain ID for a transaction.
 
         Args:
             from_addr: The sender's checksummed address.
@@ -176,17 +198,14 @@ class Flare:
 
         """
         try:
-            (
-                nonce,
-                gas_price,
-                max_priority_fee,
-                chain_id,
-            ) = await asyncio.gather(
-                self.w3.eth.get_transaction_count(from_addr),
+            gas_price, max_priority_fee, chain_id = await asyncio.gather(
                 self.w3.eth.gas_price,  # Fetches current gas price
                 self.w3.eth.max_priority_fee,  # Fetches max priority fee
                 self.w3.eth.chain_id,
             )
+            # Reserved only once the fee reads succeed, so a failed read
+            # cannot leave a nonce reserved with no transaction behind it
+            nonce = await self._reserve_nonce(from_addr)
             params: TxParams = {
                 "from": from_addr,
                 "nonce": nonce,
@@ -203,14 +222,26 @@ class Flare:
         else:
             return params
 
+    async def _reserve_nonce(self, from_addr: ChecksumAddress) -> Nonce:
+        """Reserve the next nonce of an address from the shared nonce manager."""
+        (nonce,) = await self.nonces.reserve(from_addr)
+        return Nonce(nonce)
+
     @with_web3_error_handling("Building transaction")
     async def build_transaction(
         self, function_call: AsyncContractFunction, from_addr: ChecksumAddress
     ) -> TxParams | None:
         """Builds a transaction with dynamic gas and nonce parameters."""
         base_tx = await self._prepare_base_tx_params(from_addr)
-        # Let web3.py handle gas estimation within build_transaction if not provided
-        tx = await function_call.build_transaction(base_tx)
+        try:
+            # Let web3.py handle gas estimation within build_transaction if not provided
+            tx = await function_call.build_transaction(base_tx)
+        except Exception:
+            # A reverting estimate means the transaction is never sent
+            nonce = base_tx.get("nonce")
+            if nonce is not None:
+                self.nonces.release(from_addr, [nonce])
+            raise
         logger.debug("Transaction built successfully", tx=tx)
         return tx
 
@@ -233,24 +264,41 @@ class Flare:
             msg = "Account not initialized"
             raise ValueError(msg)
 
+        sender = self.w3.to_checksum_address(tx.get("from", self.address))
+        nonce = tx.get("nonce")
         try:
             signed_tx = self.w3.eth.account.sign_transaction(
                 tx, private_key=self.private_key
             )
             logger.debug("Transaction signed.")
         except Web3Exception as e:
+            if nonce is not None:
+                self.nonces.release(sender, [int(nonce)])
             msg = f"Failed to sign transaction: {e}"
             logger.exception(msg, tx_details=tx)
             raise FlareTxError(msg) from e
-
         try:
-            tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            try:
+                tx_hash = await self.w3.eth.send_raw_transaction(
+                    signed_tx.raw_transaction
+                )
+            except Exception:
+                if nonce is not None:
+                    self.nonces.release(sender, [int(nonce)])
+                raise
             logger.info(
                 "Transaction sent, waiting for receipt...", tx_hash=tx_hash.hex()
             )
 
             # Wait for the transaction receipt
-            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            try:
+                receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            except TimeExhausted:
+                # Dropped or stuck: re-read the pending count before the next nonce
+                self.nonces.forget(sender)
+                raise
+            if nonce is not None:
+                self.nonces.confirm(sender, int(nonce))
             logger.info(
                 "Transaction confirmed.", tx_hash=tx_hash.hex(), receipt=receipt
             )
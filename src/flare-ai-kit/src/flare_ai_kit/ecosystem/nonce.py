@@ -0,0 +1,165 @@
+"""Local nonce allocation for Flare transactions."""
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3
+
+logger = structlog.get_logger(__name__)
+
+# One manager per RPC endpoint, shared by every Flare instance using it
+_managers: dict[str, "NonceManager"] = {}
+
+
+@dataclass
+class _Account:
+    next_nonce: int
+    # Outstanding nonce -> monotonic time its reservation expires
+    reserved: dict[int, float] = field(default_factory=dict[int, float])
+    stale: bool = False
+
+
+class NonceManager:
+    """
+    Hands out sequential nonces per address without a transaction count RPC each.
+
+    Each address is seeded once from its `pending` transaction count. Nonces
+    stay reserved until the transaction's receipt is seen (`confirm`), the
+    caller gives them back (`release`) or the reservation expires. After an
+    expiry, or a transaction dropped from the mempool (`forget`), the next
+    reservation re-reads the pending count and continues from whichever is
+    higher: the chain or the highest live reservation.
+    """
+
+    def __init__(self, w3: AsyncWeb3[Any], reservation_ttl: float) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            w3: Client used for pending transaction count reads.
+            reservation_ttl: Seconds an unconfirmed nonce stays reserved.
+
+        """
+        self.w3 = w3
+        self.reservation_ttl = reservation_ttl
+        self._accounts: dict[ChecksumAddress, _Account] = {}
+        self._syncing: dict[ChecksumAddress, asyncio.Task[int]] = {}
+
+    async def reserve(self, address: ChecksumAddress, count: int = 1) -> list[int]:
+        """
+        Reserve consecutive nonces for a bundle of transactions.
+
+        Args:
+            address: Sending address.
+            count: Number of transactions in the bundle.
+
+        Returns:
+            The nonces, in submission order.
+
+        """
+        account = self._accounts.get(address)
+        now = time.monotonic()
+        if account is not None:
+            expired = [n for n, expires in account.reserved.items() if expires <= now]
+            for nonce in expired:
+                del account.reserved[nonce]
+            account.stale = account.stale or bool(expired)
+        if account is None or account.stale:
+            pending = await self._pending_count(address)
+            account = self._accounts.setdefault(address, _Account(pending))
+            if account.stale:
+                # Reservations made while the read was in flight stay valid
+                account.next_nonce = max(pending, max(account.reserved, default=-1) + 1)
+                account.stale = False
+
+        nonces = list(range(account.next_nonce, account.next_nonce + count))
+        account.next_nonce += count
+        expires_at = time.monotonic() + self.reservation_ttl
+        for nonce in nonces:
+            account.reserved[nonce] = expires_at
+        logger.debug("Reserved nonces", address=address, nonces=nonces)
+        return nonces
+
+    def confirm(self, address: ChecksumAddress, nonce: int) -> None:
+        """
+        Record a mined transaction, which also settles every lower nonce.
+
+        Args:
+            address: Sending address.
+            nonce: Nonce of the mined transaction.
+
+        """
+        account = self._accounts.get(address)
+        if account is None:
+            return
+        for reserved in [n for n in account.reserved if n <= nonce]:
+            del account.reserved[reserved]
+        account.next_nonce = max(account.next_nonce, nonce + 1)
+
+    def release(self, address: ChecksumAddress, nonces: Iterable[int]) -> None:
+        """
+        Give back nonces whose transactions were not sent.
+
+        The counter rewinds only if no live reservation sits above them.
+
+        Args:
+            address: Sending address.
+            nonces: Nonces to give back.
+
+        """
+        account = self._accounts.get(address)
+        if account is None:
+            return
+        released = [n for n in nonces if account.reserved.pop(n, None) is not None]
+        if released:
+            floor = max(account.reserved, default=-1) + 1
+            account.next_nonce = min(account.next_nonce, max(floor, min(released)))
+
+    def forget(self, address: ChecksumAddress) -> None:
+        """
+        Mark an address for re-reading its pending count, e.g. after a drop.
+
+        Args:
+            address: Sending address.
+
+        """
+        account = self._accounts.get(address)
+        if account is not None:
+            account.stale = True
+
+    async def _pending_count(self, address: ChecksumAddress) -> int:
+        """Read the pending count, sharing one read between concurrent callers."""
+        task = self._syncing.get(address)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.w3.eth.get_transaction_count(address, "pending")
+            )
+            self._syncing[address] = task
+            task.add_done_callback(lambda _: self._syncing.pop(address, None))
+        return await asyncio.shield(task)
+
+
+def get_nonce_manager(
+    web3_provider_url: str, w3: AsyncWeb3[Any], reservation_ttl: float
+) -> NonceManager:
+    """
+    Return the shared NonceManager for an RPC endpoint.
+
+    Args:
+        web3_provider_url: RPC endpoint the manager is shared under.
+        w3: Client used if the manager has to be created.
+        reservation_ttl: Reservation lifetime if the manager has to be created.
+
+    Returns:
+        The endpoint's NonceManager.
+
+    """
+    manager = _managers.get(web3_provider_url)
+    if manager is None:
+        manager = _managers[web3_provider_url] = NonceManager(w3, reservation_ttl)
+    return manager
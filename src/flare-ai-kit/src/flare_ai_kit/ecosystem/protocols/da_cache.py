@@ -0,0 +1,116 @@
+"""Cache of immutable Data Availability Layer responses."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class ResponseCache:
+    """
+    LRU cache of DA Layer responses that never change, optionally on disk.
+
+    Data of a finalized voting round (feed values, proofs) is fixed, so once
+    fetched it can be served forever. The most recently used `max_entries`
+    responses are kept in memory; with a directory every response is also
+    written there as one JSON file, so entries evicted from memory, or
+    fetched by an earlier process, are still found without a request.
+    """
+
+    def __init__(self, max_entries: int, directory: str | Path | None = None) -> None:
+        """
+        Create the cache.
+
+        Args:
+            max_entries: Responses kept in memory.
+            directory: Directory responses are also kept in (default: none).
+
+        """
+        self.max_entries = max_entries
+        self.directory = None if directory is None else Path(directory)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of responses held in memory."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> str:
+        """Return the cache key of a request."""
+        request = json.dumps(
+            [method.upper(), endpoint, params, data],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return a cached response.
+
+        Args:
+            key: Key of the request (see `key`).
+
+        Returns:
+            The response, or None if it is not cached.
+
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        value = self._read(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Key of the request (see `key`).
+            value: Decoded JSON response.
+
+        """
+        self._remember(key, value)
+        if self.directory is not None:
+            path = self.directory / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(value))
+            tmp.replace(path)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> Any | None:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Unreadable DA Layer cache entry", path=str(path))
+            return None
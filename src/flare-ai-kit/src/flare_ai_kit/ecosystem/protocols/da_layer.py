@@ -1,7 +1,12 @@
 """Interactions with Flare Data Availability (DA) Layer."""
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from importlib.util import find_spec
 from types import TracebackType
-from typing import Any, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Self, TypeVar
 from urllib.parse import urljoin
 
 import httpx
@@ -13,12 +18,28 @@ from flare_ai_kit.common import (
     FTSOAnchorFeed,
     FTSOAnchorFeedsWithProof,
     VotingRound,
+    load_abi,
 )
 from flare_ai_kit.ecosystem.flare import Flare
+from flare_ai_kit.ecosystem.protocols.da_cache import ResponseCache
+from flare_ai_kit.ecosystem.protocols.merkle import (
+    FTSO_PROTOCOL_ID,
+    PARALLEL_MIN_PROOFS,
+    MerkleVerifier,
+)
 from flare_ai_kit.ecosystem.settings import EcosystemSettings
 
+if TYPE_CHECKING:
+    from web3.contract import AsyncContract
+
+    from .ftso_store import FtsoHistoryStore
+
 # HTTP Status Codes
 HTTP_NOT_FOUND = 404
+# Responses retried with backoff: rate limited or a transient server error
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Seconds an idle connection is kept open between requests
+KEEPALIVE_EXPIRY = 30.0
 
 logger = structlog.get_logger(__name__)
 
@@ -43,6 +64,18 @@ class DataAvailabilityLayer(Flare):
         self.da_layer_api_key = settings.da_layer_api_key
         self.client: httpx.AsyncClient | None = None
         self.timeout = httpx.Timeout(30.0)
+        self.concurrency = settings.da_layer_concurrency
+        self.request_retries = settings.da_layer_max_retries
+        self.retry_backoff = settings.da_layer_retry_backoff
+        # HTTP/2 needs h2 (the `da` extra); without it requests use HTTP/1.1
+        self.http2 = settings.da_layer_http2 and find_spec("h2") is not None
+        self.cache = ResponseCache(
+            settings.da_layer_cache_size, settings.da_layer_cache_dir
+        )
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self.verifier = MerkleVerifier()
+        self.relay: AsyncContract | None = None
+        self._merkle_roots: dict[int, bytes] = {}
 
     @classmethod
     async def create(cls, settings: EcosystemSettings) -> Self:
@@ -59,22 +92,7 @@ class DataAvailabilityLayer(Flare):
         instance = cls(settings)
         logger.debug("Initializing DataAvailabilityLayer...")
 
-        # Initialize HTTP client
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "flare-ai-kit/1.0.0",
-        }
-
-        # Add API key to headers if available
-        if instance.da_layer_api_key:
-            headers["Authorization"] = (
-                f"Bearer {instance.da_layer_api_key.get_secret_value()}"
-            )
-
-        instance.client = httpx.AsyncClient(
-            timeout=instance.timeout,
-            headers=headers,
-        )
+        instance.client = instance._new_client()
 
         # Verify connection to DA Layer
         await instance._verify_connection()
@@ -86,21 +104,7 @@ class DataAvailabilityLayer(Flare):
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
         if not self.client:
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "flare-ai-kit/1.0.0",
-            }
-
-            # Add API key to headers if available
-            if self.da_layer_api_key:
-                headers["Authorization"] = (
-                    f"Bearer {self.da_layer_api_key.get_secret_value()}"
-                )
-
-            self.client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers=headers,
-            )
+            self.client = self._new_client()
         return self
 
     async def __aexit__(
@@ -112,6 +116,34 @@ class DataAvailabilityLayer(Flare):
         """Async context manager exit."""
         await self.close()
 
+    def _new_client(self) -> httpx.AsyncClient:
+        """
+        Create the HTTP client shared by all requests.
+
+        Connections are kept alive between requests and, with HTTP/2,
+        concurrent requests are multiplexed over a single connection.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "flare-ai-kit/1.0.0",
+        }
+
+        # Add API key to headers if available
+        if self.da_layer_api_key:
+            headers["Authorization"] = (
+                f"Bearer {self.da_layer_api_key.get_secret_value()}"
+            )
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=headers,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.concurrency,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self.client:
@@ -139,15 +171,23 @@ class DataAvailabilityLayer(Flare):
         endpoint: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        *,
+        immutable: bool = False,
     ) -> dict[str, Any]:
         """
         Make HTTP request to DA Layer API.
 
+        Transport errors and `RETRY_STATUS_CODES` responses are retried with
+        exponential backoff. Immutable responses are served from the response
+        cache, and identical requests in flight at once share one request.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
+            immutable: Whether the response never changes, e.g. data of a
+                finalized voting round
 
         Returns:
             Response data as dictionary
@@ -156,6 +196,43 @@ class DataAvailabilityLayer(Flare):
             DALayerError: If request fails
 
         """
+        if not immutable:
+            return await self._request(method, endpoint, params, data)
+
+        key = ResponseCache.key(method, endpoint, params, data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._request_and_cache(key, method, endpoint, params, data)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller's cancellation does not fail the others
+        return await asyncio.shield(future)
+
+    async def _request_and_cache(
+        self,
+        key: str,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        result = await self._request(method, endpoint, params, data)
+        if result:
+            self.cache.put(key, result)
+        return result
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
         if not self.client:
             msg = "HTTP client not initialized. Use create() method."
             raise DALayerError(msg)
@@ -163,9 +240,7 @@ class DataAvailabilityLayer(Flare):
         url = urljoin(self.da_layer_base_url, endpoint)
 
         try:
-            response = await self.client.request(
-                method=method, url=url, params=params, json=data
-            )
+            response = await self._send(self.client, method, url, params, data)
             if response.status_code == HTTP_NOT_FOUND:
                 self._raise_not_found_error(endpoint)
             response.raise_for_status()
@@ -187,6 +262,37 @@ class DataAvailabilityLayer(Flare):
             )
             return result
 
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures with backoff."""
+        attempt = 0
+        while True:
+            try:
+                response = await client.request(
+                    method=method, url=url, params=params, json=data
+                )
+            except httpx.TransportError:
+                if attempt >= self.request_retries:
+                    raise
+            else:
+                if (
+                    attempt >= self.request_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+            delay = self.retry_backoff * 2**attempt
+            attempt += 1
+            logger.debug(
+                "Retrying DA Layer request", url=url, attempt=attempt, delay=delay
+            )
+            await asyncio.sleep(delay)
+
     async def get_latest_voting_round(self) -> VotingRound:
         """
         Retrieve the latest voting round.
@@ -239,12 +345,17 @@ class DataAvailabilityLayer(Flare):
     async def get_ftso_anchor_feeds_with_proof(
         self,
         feed_ids: list[str],
+        voting_round_id: int | None = None,
     ) -> list[FTSOAnchorFeedsWithProof]:
         """
         Retrieve FTSO anchor feeds with Merkle proofs for a specific voting round.
 
+        The DA Layer only serves finalized rounds, so feeds of an explicit
+        round never change and are cached (see `ResponseCache`).
+
         Args:
             feed_ids: Optional list of specific feed IDs to retrieve
+            voting_round_id: Voting round to retrieve (default: the latest)
 
         Returns:
             FTSO anchor feeds with proofs for the voting round
@@ -255,9 +366,18 @@ class DataAvailabilityLayer(Flare):
         """
         endpoint = "v0/ftso/anchor-feeds-with-proof"
         payload = {"feed_ids": feed_ids}
+        params = (
+            None if voting_round_id is None else {"voting_round_id": voting_round_id}
+        )
 
         try:
-            data = await self._make_request("POST", endpoint, data=payload)
+            data = await self._make_request(
+                "POST",
+                endpoint,
+                params=params,
+                data=payload,
+                immutable=voting_round_id is not None,
+            )
             feeds: list[FTSOAnchorFeedsWithProof] = [
                 FTSOAnchorFeedsWithProof.model_validate(feed) for feed in data
             ]
@@ -271,3 +391,183 @@ class DataAvailabilityLayer(Flare):
             raise DALayerError(msg) from e
         else:
             return feeds
+
+    async def get_ftso_anchor_feeds_for_rounds(
+        self,
+        feed_ids: list[str],
+        voting_round_ids: Iterable[int],
+        concurrency: int | None = None,
+    ) -> dict[int, list[FTSOAnchorFeedsWithProof]]:
+        """
+        Retrieve FTSO anchor feeds with Merkle proofs for many voting rounds.
+
+        Rounds are fetched concurrently, at most `concurrency` at a time, over
+        the shared connection. Rounds fetched before come from the response
+        cache without a request.
+
+        Args:
+            feed_ids: Feed IDs to retrieve in every round.
+            voting_round_ids: Voting rounds to retrieve.
+            concurrency: Rounds fetched at once (default: settings).
+
+        Returns:
+            FTSO anchor feeds with proofs by voting round, in input order.
+
+        Raises:
+            DALayerError: If a round cannot be fetched.
+
+        """
+        rounds = list(dict.fromkeys(voting_round_ids))
+        pending = iter(rounds)
+        results: dict[int, list[FTSOAnchorFeedsWithProof]] = {}
+
+        async def worker() -> None:
+            for voting_round in pending:
+                results[voting_round] = await self.get_ftso_anchor_feeds_with_proof(
+                    feed_ids, voting_round_id=voting_round
+                )
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(concurrency or self.concurrency, len(rounds))):
+                    group.create_task(worker())
+        except* DALayerError as errors:
+            msg = f"Failed to retrieve FTSO anchor feeds of {len(rounds)} rounds"
+            raise DALayerError(msg) from errors.exceptions[0]
+        return {voting_round: results[voting_round] for voting_round in rounds}
+
+    async def backfill_ftso_history(
+        self,
+        store: "FtsoHistoryStore",
+        start_round: int,
+        end_round: int,
+        concurrency: int | None = None,
+    ) -> int:
+        """
+        Download the store's feeds for every round it is missing in a range.
+
+        Rounds are fetched concurrently, at most `concurrency` at a time, and
+        written to the store as they arrive. Rounds already stored are
+        skipped, so an interrupted backfill resumes where it stopped.
+
+        Args:
+            store: Store receiving the feed values.
+            start_round: First voting round to backfill.
+            end_round: Voting round after the last one to backfill.
+            concurrency: Rounds fetched at once (default: settings).
+
+        Returns:
+            Number of rounds written.
+
+        Raises:
+            DALayerError: If a round cannot be fetched; rounds fetched so far
+                stay stored.
+
+        """
+        rounds = iter(store.missing(start_round, end_round))
+        written = 0
+
+        async def worker() -> None:
+            nonlocal written
+            for voting_round in rounds:
+                feeds = await self.get_ftso_anchor_feeds_with_proof(
+                    store.feed_ids, voting_round_id=voting_round
+                )
+                written += store.put(voting_round, feeds)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(concurrency or self.concurrency):
+                    group.create_task(worker())
+        except* DALayerError as errors:
+            msg = f"FTSO history backfill stopped after {written} rounds"
+            raise DALayerError(msg) from errors.exceptions[0]
+        finally:
+            store.flush()
+        logger.info(
+            "FTSO history backfilled",
+            start_round=start_round,
+            end_round=end_round,
+            written=written,
+        )
+        return written
+
+    async def get_relay_merkle_root(self, voting_round_id: int) -> bytes:
+        """
+        Read the FTSO Merkle root of a voting round from the Relay contract.
+
+        Finalized roots never change, so each one is read only once.
+
+        Args:
+            voting_round_id: Voting round of the root.
+
+        Returns:
+            The 32-byte root, all zeros if the round is not finalized yet.
+
+        """
+        root = self._merkle_roots.get(voting_round_id)
+        if root is not None:
+            return root
+        if self.relay is None:
+            address = await self.get_protocol_contract_address("Relay")
+            self.relay = self.w3.eth.contract(
+                address=self.w3.to_checksum_address(address), abi=load_abi("Relay")
+            )
+        root = bytes(
+            await self.relay.functions.merkleRoots(
+                FTSO_PROTOCOL_ID, voting_round_id
+            ).call()
+        )
+        if any(root):
+            self._merkle_roots[voting_round_id] = root
+        return root
+
+    async def verify_ftso_anchor_feeds(
+        self,
+        feeds: list[FTSOAnchorFeedsWithProof],
+        executor: Executor | None = None,
+    ) -> list[bool]:
+        """
+        Verify anchor feed proofs against the Relay-confirmed Merkle roots.
+
+        Feeds are grouped by voting round, the roots of all rounds are read
+        concurrently, and each round's proofs are checked in one pass that
+        shares intermediate nodes (see `MerkleVerifier`). Large batches run
+        on `executor` when one is given, off the event loop.
+
+        Args:
+            feeds: Feeds with proofs, from any number of voting rounds.
+            executor: Pool for large batches, e.g. a `ProcessPoolExecutor`.
+
+        Returns:
+            Whether each feed's proof is valid, in input order.
+
+        """
+        by_round: defaultdict[int, list[int]] = defaultdict(list)
+        for i, feed in enumerate(feeds):
+            by_round[feed.body.voting_round_id].append(i)
+        roots = await asyncio.gather(
+            *(self.get_relay_merkle_root(voting_round) for voting_round in by_round)
+        )
+        batch = [
+            (root, [feeds[i] for i in indices])
+            for root, indices in zip(roots, by_round.values(), strict=True)
+        ]
+        if executor is None or len(feeds) < PARALLEL_MIN_PROOFS:
+            results = self.verifier.verify_batch(batch)
+        else:
+            # Waiting on the pool happens in a thread to keep the loop free
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, MerkleVerifier().verify_batch, batch, executor
+            )
+        valid = [False] * len(feeds)
+        for indices, round_results in zip(by_round.values(), results, strict=True):
+            for i, ok in zip(indices, round_results, strict=True):
+                valid[i] = ok
+        logger.debug(
+            "Verified FTSO anchor feed proofs",
+            feeds=len(feeds),
+            rounds=len(by_round),
+            invalid=valid.count(False),
+        )
+        return valid
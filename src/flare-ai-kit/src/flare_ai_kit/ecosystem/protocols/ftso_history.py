@@ -0,0 +1,82 @@
+"""In-memory ring buffers of streamed FTSOv2 feed values."""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class PriceRingBuffer:
+    """
+    Fixed-size history of one feed's price, decimals and timestamp.
+
+    Values live in preallocated NumPy arrays written in a circle, so appending
+    never allocates and the newest `capacity` updates are always kept.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Allocate the buffer.
+
+        Args:
+            capacity: Number of updates kept.
+
+        """
+        self.capacity = capacity
+        self.prices: NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.decimals: NDArray[np.int8] = np.zeros(capacity, dtype=np.int8)
+        self.timestamps: NDArray[np.int64] = np.zeros(capacity, dtype=np.int64)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of updates held."""
+        return self._size
+
+    def append(self, value: int, decimals: int, timestamp: int) -> None:
+        """
+        Store one update, overwriting the oldest once full.
+
+        Args:
+            value: Raw feed value as returned by the contract.
+            decimals: Decimals of the raw value.
+            timestamp: Unix time of the update.
+
+        """
+        i = self._next
+        self.prices[i] = value / 10**decimals
+        self.decimals[i] = decimals
+        self.timestamps[i] = timestamp
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def latest(self) -> tuple[float, int, int] | None:
+        """Return the newest (price, decimals, timestamp), or None if empty."""
+        if not self._size:
+            return None
+        i = self._next - 1
+        return (
+            float(self.prices[i]),
+            int(self.decimals[i]),
+            int(self.timestamps[i]),
+        )
+
+    def window(
+        self, seconds: float | None = None, now: float | None = None
+    ) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+        """
+        Return prices and timestamps, oldest first.
+
+        Args:
+            seconds: Only updates at most this old (default: all held).
+            now: Reference unix time (default: the newest update).
+
+        Returns:
+            Copies of the price and timestamp arrays.
+
+        """
+        order = (np.arange(self._size) + self._next - self._size) % self.capacity
+        prices, timestamps = self.prices[order], self.timestamps[order]
+        if seconds is not None and self._size:
+            end = timestamps[-1] if now is None else now
+            keep = timestamps >= end - seconds
+            prices, timestamps = prices[keep], timestamps[keep]
+        return prices, timestamps
@@ -0,0 +1,228 @@
+"""Append-only, memory-mapped store of FTSO anchor feed history."""
+
+import json
+from pathlib import Path
+from typing import Any, Final, Literal
+
+import numpy as np
+import structlog
+from numpy.typing import NDArray
+
+from flare_ai_kit.common import FTSOAnchorFeedsWithProof
+
+logger = structlog.get_logger(__name__)
+
+# One record per feed and voting round
+RECORD_DTYPE: Final = np.dtype(
+    [("value", "<i8"), ("decimals", "i1"), ("turnout_bips", "<u2")]
+)
+# Rounds added to every column when a write lands past the end (~4 days)
+GROWTH_ROUNDS: Final[int] = 4096
+META_FILE: Final[str] = "meta.json"
+FILLED_FILE: Final[str] = "rounds.filled"
+
+
+class FtsoHistoryStore:
+    """
+    Columnar FTSO anchor feed history on disk, indexed by voting round.
+
+    Each feed is one memory-mapped file of fixed-size records (value,
+    decimals, turnout) and a shared bitmap marks which rounds are stored, so
+    the record of any round is found by offset in O(1) and range reads are
+    zero-copy views of the mapped files. Stored rounds are never rewritten.
+    The columns grow by `GROWTH_ROUNDS` whenever a write lands past the end.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        feed_ids: list[str] | None = None,
+        first_round: int | None = None,
+    ) -> None:
+        """
+        Open an existing store, or create one.
+
+        Args:
+            directory: Directory holding the store's files.
+            feed_ids: Feeds stored (required to create, checked when opening).
+            first_round: First voting round held (required to create).
+
+        Raises:
+            ValueError: If a new store lacks feeds or a first round, or the
+                given feeds differ from the stored ones.
+
+        """
+        self.directory = Path(directory)
+        meta_path = self.directory / META_FILE
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if (
+                feed_ids is not None
+                and [f.lower() for f in feed_ids] != meta["feed_ids"]
+            ):
+                msg = f"Store at {self.directory} holds different feeds"
+                raise ValueError(msg)
+            self.feed_ids: list[str] = meta["feed_ids"]
+            self.first_round: int = meta["first_round"]
+            self.capacity: int = meta["capacity"]
+            mode = "r+"
+        else:
+            if not feed_ids or first_round is None:
+                msg = "A new store needs feed_ids and first_round"
+                raise ValueError(msg)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.feed_ids = [feed_id.lower() for feed_id in feed_ids]
+            self.first_round = first_round
+            self.capacity = GROWTH_ROUNDS
+            mode = "w+"
+        self._columns = {
+            feed_id: self._map(self._column_path(feed_id), RECORD_DTYPE, mode)
+            for feed_id in self.feed_ids
+        }
+        self._filled = self._map(self.directory / FILLED_FILE, np.dtype(np.uint8), mode)
+        if mode == "w+":
+            self._write_meta()
+
+    def __contains__(self, voting_round: int) -> bool:
+        """Return whether a round is stored."""
+        i = voting_round - self.first_round
+        return 0 <= i < self.capacity and bool(self._filled[i])
+
+    @property
+    def last_round(self) -> int | None:
+        """Return the highest stored round, or None if empty."""
+        stored = np.flatnonzero(self._filled)
+        return None if not stored.size else self.first_round + int(stored[-1])
+
+    def missing(self, start: int, end: int) -> list[int]:
+        """
+        Return the rounds in `[start, end)` that are not stored yet.
+
+        Args:
+            start: First round of the range.
+            end: Round after the last of the range.
+
+        """
+        start = max(start, self.first_round)
+        lo, hi = start - self.first_round, min(end - self.first_round, self.capacity)
+        stored = self._filled[lo:hi] if lo < hi else np.empty(0, dtype=np.uint8)
+        gaps = [start + int(i) for i in np.flatnonzero(stored == 0)]
+        return gaps + list(range(max(start, self.first_round + self.capacity), end))
+
+    def put(self, voting_round: int, feeds: list[FTSOAnchorFeedsWithProof]) -> bool:
+        """
+        Store one round's feed values.
+
+        Args:
+            voting_round: Voting round of the values.
+            feeds: Feed values of the round; feeds not held by the store
+                are ignored.
+
+        Returns:
+            False if the round was already stored and nothing was written.
+
+        Raises:
+            ValueError: If the round precedes the store's first round.
+
+        """
+        i = voting_round - self.first_round
+        if i < 0:
+            msg = f"Round {voting_round} precedes first round {self.first_round}"
+            raise ValueError(msg)
+        if voting_round in self:
+            return False
+        if i >= self.capacity:
+            self._grow(i + 1)
+        for feed in feeds:
+            column = self._columns.get(feed.body.feed_id.lower())
+            if column is not None:
+                body = feed.body
+                column[i] = (body.value, body.decimals, body.turnout_bips)
+        self._filled[i] = 1
+        return True
+
+    def get(self, voting_round: int, feed_id: str) -> tuple[int, int, int] | None:
+        """
+        Return a feed's (value, decimals, turnout_bips) in a round.
+
+        Args:
+            voting_round: Voting round to read.
+            feed_id: Feed to read.
+
+        Returns:
+            The stored record, or None if the round is not stored.
+
+        """
+        if voting_round not in self:
+            return None
+        value, decimals, turnout = self._columns[feed_id.lower()][
+            voting_round - self.first_round
+        ]
+        return int(value), int(decimals), int(turnout)
+
+    def records(
+        self, feed_id: str, start: int, end: int
+    ) -> tuple[NDArray[Any], NDArray[np.uint8]]:
+        """
+        Return a feed's records for rounds `[start, end)` without copying.
+
+        Args:
+            feed_id: Feed to read.
+            start: First round of the range.
+            end: Round after the last of the range.
+
+        Returns:
+            Views of the mapped records (fields value, decimals and
+            turnout_bips) and of the stored-round flags; unstored rounds hold
+            zeros.
+
+        """
+        lo = max(start - self.first_round, 0)
+        hi = min(max(end - self.first_round, lo), self.capacity)
+        return self._columns[feed_id.lower()][lo:hi], self._filled[lo:hi]
+
+    def prices(self, feed_id: str, start: int, end: int) -> NDArray[np.float64]:
+        """Return a feed's prices for rounds `[start, end)`, NaN where unstored."""
+        records, filled = self.records(feed_id, start, end)
+        prices = records["value"] / np.power(10.0, records["decimals"])
+        prices[filled == 0] = np.nan
+        return prices
+
+    def flush(self) -> None:
+        """Write mapped changes to disk."""
+        for column in self._columns.values():
+            column.flush()
+        self._filled.flush()
+
+    def _column_path(self, feed_id: str) -> Path:
+        return self.directory / f"{feed_id.removeprefix('0x')}.feed"
+
+    def _map(
+        self, path: Path, dtype: np.dtype[Any], mode: Literal["r+", "w+"]
+    ) -> np.memmap[Any, Any]:
+        return np.memmap(path, dtype=dtype, mode=mode, shape=(self.capacity,))
+
+    def _grow(self, needed: int) -> None:
+        """Extend every column to hold at least `needed` rounds."""
+        self.flush()
+        self.capacity = -(-needed // GROWTH_ROUNDS) * GROWTH_ROUNDS
+        paths = {feed_id: self._column_path(feed_id) for feed_id in self.feed_ids}
+        for feed_id, path in paths.items():
+            with path.open("r+b") as f:
+                f.truncate(self.capacity * RECORD_DTYPE.itemsize)
+            self._columns[feed_id] = self._map(path, RECORD_DTYPE, "r+")
+        with (self.directory / FILLED_FILE).open("r+b") as f:
+            f.truncate(self.capacity)
+        self._filled = self._map(self.directory / FILLED_FILE, np.dtype(np.uint8), "r+")
+        self._write_meta()
+        logger.debug("FTSO history store grown", capacity=self.capacity)
+
+    def _write_meta(self) -> None:
+        meta = {
+            "feed_ids": self.feed_ids,
+            "first_round": self.first_round,
+            "capacity": self.capacity,
+        }
+        tmp = self.directory / f"{META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta))
+        tmp.replace(self.directory / META_FILE)
@@ -1,6 +1,9 @@
 """Interactions with Flare Time Series Oracle V2 (FTSOv2)."""
 
-from typing import Final, Self, TypeVar
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Final, Self, TypeVar
 
 import structlog
 
@@ -8,21 +11,42 @@ from flare_ai_kit.common import FtsoFeedCategory, FtsoV2Error, load_abi
 from flare_ai_kit.ecosystem.flare import Flare
 from flare_ai_kit.ecosystem.settings import EcosystemSettings
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from .ftso_history import PriceRingBuffer
+
 logger = structlog.get_logger(__name__)
 
 # Valid categories when querying FTSOv2 prices
 VALID_CATEGORIES: Final[frozenset[str]] = frozenset(["01", "02", "03", "04", "05"])
 
+# Streamed prices older than this many poll intervals are read from the chain
+STREAM_STALE_INTERVALS: Final[int] = 3
+
 # Type variable for the factory method pattern
 T = TypeVar("T", bound="FtsoV2")
 
 
 class FtsoV2(Flare):
-    """Fetches price data from Flare Time Series Oracle V2 contracts."""
+    """
+    Fetches price data from Flare Time Series Oracle V2 contracts.
+
+    Optionally streams a set of feeds in the background (see
+    `start_price_stream`), keeping their recent history in memory so latest
+    prices and history windows are served without an RPC call.
+    """
 
     def __init__(self, settings: EcosystemSettings) -> None:
         super().__init__(settings)
         self.ftsov2 = None  # Will be initialized in 'create'
+        self.stream_interval = settings.ftso_stream_interval
+        self.history_size = settings.ftso_history_size
+        self._history: dict[str, PriceRingBuffer] = {}
+        self._stream: asyncio.Task[None] | None = None
+        self._streamed_at = 0.0
+        self._updated = asyncio.Condition()
 
     # Factory method for asynchronous initialization
     @classmethod
@@ -46,6 +70,8 @@ class FtsoV2(Flare):
             abi=load_abi("FtsoV2"),  # Assuming load_abi is sync
         )
         logger.debug("FtsoV2 initialized", address=ftsov2_address)
+        if settings.ftso_stream_feeds:
+            await instance.start_price_stream(settings.ftso_stream_feeds)
         return instance
 
     async def _get_feed_by_id(self, feed_id: str) -> tuple[int, int, int]:
@@ -74,7 +100,7 @@ class FtsoV2(Flare):
 
     async def _get_feeds_by_id(
         self, feed_ids: list[str]
-    ) -> tuple[list[int], list[int], list[int]]:
+    ) -> tuple[list[int], list[int], int]:
         """
         Internal method to call the getFeedsById contract function for multiple feeds.
 
@@ -150,6 +176,9 @@ class FtsoV2(Flare):
 
         """
         feed_id = self._feed_name_to_id(feed_name, category)
+        streamed = self._streamed(feed_id)
+        if streamed is not None:
+            return streamed[0]
         value, decimals, timestamp = await self._get_feed_by_id(feed_id)
         logger.debug(
             "get_latest_price",
@@ -189,6 +218,9 @@ class FtsoV2(Flare):
         feed_ids = [
             self._feed_name_to_id(feed_name, category) for feed_name in feed_names
         ]
+        streamed = [self._streamed(feed_id) for feed_id in feed_ids]
+        if all(latest is not None for latest in streamed):
+            return [latest[0] for latest in streamed if latest is not None]
         values, decimals, timestamp = await self._get_feeds_by_id(feed_ids)
         logger.debug(
             "get_latest_prices",
@@ -201,3 +233,125 @@ class FtsoV2(Flare):
         return [
             value / 10**decimal for value, decimal in zip(values, decimals, strict=True)
         ]
+
+    async def start_price_stream(
+        self,
+        feed_names: list[str],
+        category: FtsoFeedCategory = FtsoFeedCategory.CRYPTO,
+        interval: float | None = None,
+    ) -> None:
+        """
+        Poll a set of feeds in the background and keep their history in memory.
+
+        All feeds are read with one `getFeedsById` call per poll, and an update
+        is stored only when the feeds' timestamp moved. The first poll happens
+        before returning, so streamed prices are available immediately. While
+        the stream is healthy, `get_latest_price(s)` for streamed feeds are
+        answered from memory. Requires the `ftso` extra (NumPy).
+
+        Args:
+            feed_names: Human-readable feed names to stream.
+            category: The feed category for all streamed feeds (default: "01").
+            interval: Seconds between polls (default: settings, one block).
+
+        Raises:
+            FtsoV2Error: If a feed name cannot be converted or the first poll
+                fails.
+
+        """
+        from .ftso_history import PriceRingBuffer  # noqa: PLC0415
+
+        await self.stop_price_stream()
+        self.stream_interval = interval or self.stream_interval
+        feed_ids = [self._feed_name_to_id(name, category) for name in feed_names]
+        self._history = {
+            feed_id: PriceRingBuffer(self.history_size) for feed_id in feed_ids
+        }
+        await self._poll_prices(feed_ids)
+        self._stream = asyncio.create_task(self._stream_prices(feed_ids))
+        logger.info("FTSO price stream started", feeds=feed_names)
+
+    async def stop_price_stream(self) -> None:
+        """Stop the background stream; the history kept so far stays readable."""
+        if self._stream is None:
+            return
+        self._stream.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._stream
+        self._stream = None
+
+    def get_price_history(
+        self,
+        feed_name: str,
+        seconds: float | None = None,
+        category: FtsoFeedCategory = FtsoFeedCategory.CRYPTO,
+    ) -> "tuple[NDArray[np.float64], NDArray[np.int64]]":
+        """
+        Return a streamed feed's recent prices from memory.
+
+        Args:
+            feed_name: The human-readable feed name (e.g., "BTC/USD").
+            seconds: Only updates this close to the newest one (default: all).
+            category: The feed category (default: CRYPTO i.e. "01").
+
+        Returns:
+            Prices (adjusted for decimals) and their unix timestamps, oldest
+            first.
+
+        Raises:
+            FtsoV2Error: If the feed is not streamed.
+
+        """
+        history = self._history.get(self._feed_name_to_id(feed_name, category))
+        if history is None:
+            msg = f"Feed '{feed_name}' is not streamed. Use start_price_stream()."
+            raise FtsoV2Error(msg)
+        return history.window(seconds)
+
+    async def wait_for_price_update(self) -> int:
+        """
+        Wait for the stream's next update.
+
+        Bound the wait with `asyncio.timeout` if it should not block forever.
+
+        Returns:
+            The unix timestamp of the update.
+
+        """
+        async with self._updated:
+            await self._updated.wait()
+        return max(
+            (latest[2] for h in self._history.values() if (latest := h.latest())),
+            default=0,
+        )
+
+    def _streamed(self, feed_id: str) -> tuple[float, int, int] | None:
+        """Return a streamed feed's latest update while the stream is fresh."""
+        history = self._history.get(feed_id)
+        if history is None or self._stream is None or self._stream.done():
+            return None
+        age = time.monotonic() - self._streamed_at
+        if age > STREAM_STALE_INTERVALS * self.stream_interval:
+            return None
+        return history.latest()
+
+    async def _poll_prices(self, feed_ids: list[str]) -> None:
+        """Read the streamed feeds once and store them if they changed."""
+        values, decimals, timestamp = await self._get_feeds_by_id(feed_ids)
+        self._streamed_at = time.monotonic()
+        latest = self._history[feed_ids[0]].latest()
+        if latest is not None and latest[2] == timestamp:
+            return
+        for feed_id, value, decimal in zip(feed_ids, values, decimals, strict=True):
+            self._history[feed_id].append(value, decimal, timestamp)
+        async with self._updated:
+            self._updated.notify_all()
+
+    async def _stream_prices(self, feed_ids: list[str]) -> None:
+        """Poll the streamed feeds until cancelled."""
+        while True:
+            await asyncio.sleep(self.stream_interval)
+            try:
+                await self._poll_prices(feed_ids)
+            except FtsoV2Error as e:
+                logger.warning("FTSO price stream poll failed", error=str(e))
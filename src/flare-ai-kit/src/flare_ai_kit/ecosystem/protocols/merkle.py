@@ -0,0 +1,219 @@
+"""Local verification of FTSO anchor feed Merkle proofs."""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Final
+
+from eth_abi.abi import encode
+from eth_utils.crypto import keccak
+
+from flare_ai_kit.common import FTSOAnchorFeedBody, FTSOAnchorFeedsWithProof
+
+# Protocol ID of FTSO anchor feed Merkle roots in the Relay contract
+FTSO_PROTOCOL_ID: Final[int] = 100
+# Rounds whose proven nodes are kept by a verifier
+MAX_CACHED_ROUNDS: Final[int] = 64
+# Batches with fewer proofs are verified in-process even given an executor
+PARALLEL_MIN_PROOFS: Final[int] = 2048
+# Consecutive proofs of one round sent to a worker at a time
+PARALLEL_CHUNK_PROOFS: Final[int] = 512
+
+# Leaf hash and proof path of one feed
+LeafProof = tuple[bytes, list[bytes]]
+
+
+def feed_leaf(body: FTSOAnchorFeedBody) -> bytes:
+    """
+    Hash an anchor feed the way the FTSO Merkle tree does.
+
+    The leaf is the keccak256 of the ABI-encoded FeedData struct
+    (votingRoundId, id, value, turnoutBIPS, decimals).
+
+    Args:
+        body: Feed values of one round.
+
+    Returns:
+        The 32-byte leaf hash.
+
+    """
+    return keccak(
+        encode(
+            ["uint32", "bytes21", "int32", "uint16", "int8"],
+            [
+                body.voting_round_id,
+                bytes.fromhex(body.feed_id.removeprefix("0x")),
+                body.value,
+                body.turnout_bips,
+                body.decimals,
+            ],
+        )
+    )
+
+
+def hash_pair(a: bytes, b: bytes) -> bytes:
+    """Hash two sibling nodes in sorted order, as OpenZeppelin's MerkleProof."""
+    return keccak(a + b) if a < b else keccak(b + a)
+
+
+def build_merkle_tree(leaves: Sequence[bytes]) -> tuple[bytes, list[list[bytes]]]:
+    """
+    Build a sorted-pair Merkle tree the way the FSP lays it out.
+
+    Leaves are sorted and stored as the last nodes of a complete binary tree
+    in array form; node `i` hashes nodes `2i + 1` and `2i + 2`. Useful to
+    produce proofs locally, e.g. in tests and benchmarks.
+
+    Args:
+        leaves: Leaf hashes (at least one).
+
+    Returns:
+        The root and each leaf's proof, in input order.
+
+    """
+    n = len(leaves)
+    tree = [b""] * (n - 1) + sorted(leaves)
+    for i in range(n - 2, -1, -1):
+        tree[i] = hash_pair(tree[2 * i + 1], tree[2 * i + 2])
+    position = {leaf: n - 1 + i for i, leaf in enumerate(tree[n - 1 :])}
+    proofs: list[list[bytes]] = []
+    for leaf in leaves:
+        j = position[leaf]
+        proof: list[bytes] = []
+        while j > 0:
+            proof.append(tree[j + 1 if j % 2 else j - 1])
+            j = (j - 1) // 2
+        proofs.append(proof)
+    return tree[0], proofs
+
+
+def _to_bytes(value: str | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return bytes.fromhex(value.removeprefix("0x"))
+
+
+def _leaf_proof(feed: FTSOAnchorFeedsWithProof) -> LeafProof:
+    return feed_leaf(feed.body), [_to_bytes(node) for node in feed.proof]
+
+
+class MerkleVerifier:
+    """
+    Verifies Merkle proofs against per-round roots, sharing work between them.
+
+    Proofs of one round overlap near the root. Every node a valid proof passes
+    through is remembered as leading to that round's root, so later proofs
+    stop hashing as soon as they reach a proven node. Nodes of the
+    `MAX_CACHED_ROUNDS` most recently used roots are kept.
+    """
+
+    def __init__(self) -> None:
+        self._proven: OrderedDict[bytes, set[bytes]] = OrderedDict()
+        self.hashes = 0
+        self.shortcuts = 0
+
+    def verify(self, root: str | bytes, leaf: bytes, proof: Sequence[bytes]) -> bool:
+        """
+        Check that a leaf belongs to the tree with the given root.
+
+        Args:
+            root: Merkle root of the round.
+            leaf: Leaf hash.
+            proof: Sibling hashes from the leaf up to the root.
+
+        Returns:
+            Whether the proof leads from the leaf to the root.
+
+        """
+        proven = self._proven_nodes(_to_bytes(root))
+        node = leaf
+        path: list[bytes] = []
+        for sibling in proof:
+            if node in proven:
+                self.shortcuts += 1
+                break
+            path.append(node)
+            node = hash_pair(node, sibling)
+            self.hashes += 1
+        if node not in proven:
+            return False
+        proven.update(path)
+        return True
+
+    def verify_round(
+        self, root: str | bytes, feeds: Sequence[FTSOAnchorFeedsWithProof]
+    ) -> list[bool]:
+        """
+        Verify every feed proof of one voting round.
+
+        Args:
+            root: Relay-confirmed Merkle root of the round.
+            feeds: Feeds with proofs from the DA Layer.
+
+        Returns:
+            Whether each feed's proof is valid, in input order.
+
+        """
+        return self.verify_leaves(root, [_leaf_proof(feed) for feed in feeds])
+
+    def verify_leaves(
+        self, root: str | bytes, leaves: Sequence[LeafProof]
+    ) -> list[bool]:
+        """Verify hashed leaves and their proofs against one root."""
+        return [self.verify(root, leaf, proof) for leaf, proof in leaves]
+
+    def verify_batch(
+        self,
+        rounds: Sequence[tuple[str | bytes, Sequence[FTSOAnchorFeedsWithProof]]],
+        executor: Executor | None = None,
+    ) -> list[list[bool]]:
+        """
+        Verify the feed proofs of many rounds.
+
+        With an executor (typically a `ProcessPoolExecutor`) and at least
+        `PARALLEL_MIN_PROOFS` proofs, the work is split into chunks of
+        `PARALLEL_CHUNK_PROOFS` consecutive proofs of one round, so each
+        worker still shares nodes between the proofs it checks.
+
+        Args:
+            rounds: Merkle root and feeds of each round.
+            executor: Pool the chunks are verified on (default: in-process).
+
+        Returns:
+            Whether each feed's proof is valid, per round in input order.
+
+        """
+        total = sum(len(feeds) for _, feeds in rounds)
+        if executor is None or total < PARALLEL_MIN_PROOFS:
+            return [self.verify_round(root, feeds) for root, feeds in rounds]
+        size = PARALLEL_CHUNK_PROOFS
+        futures = [
+            [
+                executor.submit(
+                    _verify_chunk,
+                    _to_bytes(root),
+                    [_leaf_proof(feed) for feed in feeds[i : i + size]],
+                )
+                for i in range(0, len(feeds), size)
+            ]
+            for root, feeds in rounds
+        ]
+        return [
+            [valid for future in chunks for valid in future.result()]
+            for chunks in futures
+        ]
+
+    def _proven_nodes(self, root: bytes) -> set[bytes]:
+        proven = self._proven.get(root)
+        if proven is None:
+            proven = self._proven[root] = {root}
+            if len(self._proven) > MAX_CACHED_ROUNDS:
+                self._proven.popitem(last=False)
+        else:
+            self._proven.move_to_end(root)
+        return proven
+
+
+def _verify_chunk(root: bytes, leaves: list[LeafProof]) -> list[bool]:
+    """Verify one chunk in a worker process."""
+    return MerkleVerifier().verify_leaves(root, leaves)
@@ -0,0 +1,227 @@
+"""Health-scored routing of JSON-RPC requests over several Flare endpoints."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
+from web3 import AsyncHTTPProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.providers.rpc.utils import ExceptionRetryConfiguration
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = structlog.get_logger(__name__)
+
+# Writes, and the nonce reads they are built from, stay on one endpoint
+STICKY_METHODS = frozenset(
+    {"eth_sendRawTransaction", "eth_sendTransaction", "eth_getTransactionCount"}
+)
+LATENCY_WINDOW = 200
+ERROR_RATE_ALPHA = 0.1
+MIN_HEDGE_DELAY = 0.05
+PROBE_INTERVAL = 5.0
+FAILURE_COOLDOWN = 5.0
+
+
+class _Endpoint:
+    def __init__(self, provider: AsyncJSONBaseProvider) -> None:
+        self.provider = provider
+        self.url: str = getattr(provider, "endpoint_uri", repr(provider))
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.error_rate = 0.0
+        self.head = 0
+        self.cooldown_until = 0.0
+
+    def quantile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+    def record(self, seconds: float, *, failed: bool) -> None:
+        self.error_rate += ERROR_RATE_ALPHA * (float(failed) - self.error_rate)
+        if failed:
+            self.cooldown_until = time.monotonic() + FAILURE_COOLDOWN
+        else:
+            self.latencies.append(seconds)
+
+    def rank(
+        self, best_head: int, now: float, max_block_lag: int
+    ) -> tuple[bool, bool, float]:
+        median = self.quantile(0.5) or 0.0
+        return (
+            self.cooldown_until > now,
+            best_head - self.head > max_block_lag,
+            median * (1.0 + 10.0 * self.error_rate),
+        )
+
+
+class RPCPoolProvider(AsyncJSONBaseProvider):
+    """
+    Async provider routing each request to the healthiest of several endpoints.
+
+    Endpoints are ranked by recent latency, error rate and head-block lag
+    (refreshed by probing `eth_blockNumber` every few seconds). Reads go to
+    the best endpoint and are hedged to the runner-up once they take longer
+    than the endpoint's p95 latency; a failed read fails over to the next
+    endpoint. Writes stick to one endpoint until it fails or falls behind.
+    Only transport errors count against an endpoint; JSON-RPC error
+    responses are returned to the caller as usual.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[AsyncJSONBaseProvider],
+        hedge_max_delay: float,
+        max_block_lag: int,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            providers: One provider per endpoint, in order of preference.
+            hedge_max_delay: Upper bound on the delay before a read is hedged.
+            max_block_lag: Blocks an endpoint may trail the best head.
+
+        """
+        super().__init__()
+        for provider in providers:
+            # The pool fails over instead of retrying one endpoint with backoff
+            if isinstance(provider, AsyncHTTPProvider):
+                provider.exception_retry_configuration = ExceptionRetryConfiguration(
+                    errors=()
+                )
+        self.endpoints = [_Endpoint(provider) for provider in providers]
+        self.endpoint_uri = self.endpoints[0].url
+        self.hedge_max_delay = hedge_max_delay
+        self.max_block_lag = max_block_lag
+        self._sticky = self.endpoints[0]
+        self._probed_at = -math.inf
+        self._probe: asyncio.Future[list[Any]] | None = None
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a request to the sticky endpoint (writes) or the best (reads)."""
+        self._maybe_probe()
+        if method in STICKY_METHODS:
+            return await self._send_sticky(method, params)
+        return await self._send_hedged(method, params)
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send a batch to the best endpoint, failing over without hedging."""
+        self._maybe_probe()
+        error: Exception | None = None
+        for endpoint in self._ranked():
+            try:
+                return await self._timed(
+                    endpoint, endpoint.provider.make_batch_request(requests)
+                )
+            except Exception as e:  # noqa: BLE001
+                error = e
+        raise error  # type: ignore[misc]
+
+    def _best_head(self) -> int:
+        return max(e.head for e in self.endpoints)
+
+    def _ranked(self) -> list[_Endpoint]:
+        best_head, now = self._best_head(), time.monotonic()
+        return sorted(
+            self.endpoints, key=lambda e: e.rank(best_head, now, self.max_block_lag)
+        )
+
+    async def _timed(self, endpoint: _Endpoint, request: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            response = await request
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            endpoint.record(time.perf_counter() - started_at, failed=True)
+            logger.warning("RPC endpoint failed", url=endpoint.url)
+            raise
+        endpoint.record(time.perf_counter() - started_at, failed=False)
+        return response
+
+    async def _send(
+        self, endpoint: _Endpoint, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        response = await self._timed(
+            endpoint, endpoint.provider.make_request(method, params)
+        )
+        if method == "eth_blockNumber" and isinstance(response.get("result"), str):
+            endpoint.head = max(endpoint.head, int(response["result"], 16))
+        return response
+
+    async def _send_sticky(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        ranked = self._ranked()
+        now = time.monotonic()
+        if any(self._sticky.rank(self._best_head(), now, self.max_block_lag)[:2]):
+            self._sticky = ranked[0]
+        error: Exception | None = None
+        for endpoint in [self._sticky, *(e for e in ranked if e is not self._sticky)]:
+            try:
+                response = await self._send(endpoint, method, params)
+            except Exception as e:  # noqa: BLE001
+                error = e
+                continue
+            self._sticky = endpoint
+            return response
+        raise error  # type: ignore[misc]
+
+    async def _send_hedged(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        candidates = iter(self._ranked())
+        primary = next(candidates)
+        p95 = primary.quantile(0.95)
+        hedge_delay: float | None = (
+            self.hedge_max_delay
+            if p95 is None
+            else min(max(p95, MIN_HEDGE_DELAY), self.hedge_max_delay)
+        )
+        pending = {asyncio.ensure_future(self._send(primary, method, params))}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The primary is slower than usual: race the runner-up
+                    hedge_delay = None
+                    runner_up = next(candidates, None)
+                    if runner_up is not None:
+                        pending.add(
+                            asyncio.ensure_future(self._send(runner_up, method, params))
+                        )
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                fallback = None if pending else next(candidates, None)
+                if fallback is not None:
+                    pending.add(
+                        asyncio.ensure_future(self._send(fallback, method, params))
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error  # type: ignore[misc]
+
+    def _maybe_probe(self) -> None:
+        now = time.monotonic()
+        if now - self._probed_at < PROBE_INTERVAL:
+            return
+        self._probed_at = now
+        self._probe = asyncio.ensure_future(
+            asyncio.gather(
+                *(
+                    self._send(endpoint, RPCEndpoint("eth_blockNumber"), [])
+                    for endpoint in self.endpoints
+                ),
+                return_exceptions=True,
+            )
+        )
@@ -1,5 +1,6 @@
 """Settings for Ecosystem."""
 
+from pathlib import Path
 from typing import cast
 
 from eth_typing import ChecksumAddress
@@ -7,6 +8,9 @@ from pydantic import (
     BaseModel,
     Field,
     HttpUrl,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
     PositiveInt,
     SecretStr,
     model_validator,
@@ -77,6 +81,39 @@ class EcosystemSettings(BaseSettings):
         default=5,
         description="Timeout when interacting with web3 provider (in s).",
     )
+    web3_provider_fallback_urls: list[HttpUrl] = Field(
+        default_factory=list[HttpUrl],
+        description="Further Flare RPC endpoints pooled with web3_provider_url.",
+    )
+    web3_hedge_max_delay: PositiveFloat = Field(
+        default=1.0,
+        description="Maximum delay before a slow read is hedged (in seconds).",
+    )
+    web3_max_block_lag: PositiveInt = Field(
+        default=3,
+        description="Blocks a pooled endpoint may trail the best head.",
+    )
+    web3_batch_window: NonNegativeFloat = Field(
+        default=0.002,
+        description="Seconds a JSON-RPC request waits for others to join its batch.",
+    )
+    web3_batch_max_size: PositiveInt = Field(
+        default=100,
+        description="Maximum JSON-RPC requests per HTTP request (1 disables).",
+    )
+    ftso_stream_feeds: list[str] = Field(
+        default_factory=list,
+        description="FTSO crypto feeds polled in the background (empty disables).",
+        examples=['env var: ECOSYSTEM__FTSO_STREAM_FEEDS=["FLR/USD","BTC/USD"]'],
+    )
+    ftso_stream_interval: PositiveFloat = Field(
+        default=1.8,
+        description="Seconds between FTSO stream polls (one block).",
+    )
+    ftso_history_size: PositiveInt = Field(
+        default=1024,
+        description="Updates kept in memory per streamed FTSO feed.",
+    )
     block_explorer_url: HttpUrl = Field(
         default=HttpUrl("https://flare-explorer.flare.network/api"),
         description="Flare Block Explorer URL.",
@@ -93,6 +130,10 @@ class EcosystemSettings(BaseSettings):
         default=5,
         description="Delay between retries for Flare transactions (in seconds).",
     )
+    nonce_reservation_ttl: PositiveInt = Field(
+        default=120,
+        description="Seconds an unconfirmed nonce stays reserved (in seconds).",
+    )
     account_address: ChecksumAddress | None = Field(
         default=None,
         description="Account address to use when interacting onchain.",
@@ -113,3 +154,27 @@ class EcosystemSettings(BaseSettings):
         default=None,
         description="Optional API key for Flare Data Availability Layer.",
     )
+    da_layer_concurrency: PositiveInt = Field(
+        default=8,
+        description="Requests sent at once by DA Layer bulk fetches and backfills.",
+    )
+    da_layer_max_retries: NonNegativeInt = Field(
+        default=3,
+        description="Retries of a DA Layer request failing with a transient error.",
+    )
+    da_layer_retry_backoff: PositiveFloat = Field(
+        default=0.5,
+        description="Delay before the first DA Layer retry, doubled on each retry.",
+    )
+    da_layer_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for the DA Layer API (needs the `da` extra).",
+    )
+    da_layer_cache_size: PositiveInt = Field(
+        default=4096,
+        description="Finalized-round DA Layer responses kept in memory.",
+    )
+    da_layer_cache_dir: Path | None = Field(
+        default=None,
+        description="Directory finalized-round DA Layer responses are kept in.",
+    )
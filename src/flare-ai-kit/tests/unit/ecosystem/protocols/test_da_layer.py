@@ -0,0 +1,156 @@
+"""Unit tests for DA Layer bulk fetches, retries and response caching."""
+
+import asyncio
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from flare_ai_kit.common import DALayerError
+from flare_ai_kit.ecosystem.protocols import DataAvailabilityLayer
+from flare_ai_kit.ecosystem.protocols.da_cache import ResponseCache
+from flare_ai_kit.ecosystem.settings import EcosystemSettings
+
+FLR = "0x01464c522f55534400000000000000000000000000"
+
+
+def feed_json(voting_round: int) -> list[dict[str, Any]]:
+    """Anchor feed response of one round."""
+    return [
+        {
+            "body": {
+                "votingRoundId": voting_round,
+                "id": FLR,
+                "value": voting_round * 10,
+                "turnoutBIPS": 9000,
+                "decimals": 3,
+            },
+            "proof": [],
+        }
+    ]
+
+
+class FakeDALayerAPI:
+    """Anchor feed endpoint that records requests and fails on demand."""
+
+    def __init__(self) -> None:
+        self.requests: Counter[int | None] = Counter()
+        self.failures: Counter[int] = Counter()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Serve one request."""
+        param = request.url.params.get("voting_round_id")
+        voting_round = None if param is None else int(param)
+        self.requests[voting_round] += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if voting_round is not None and self.failures[voting_round]:
+            self.failures[voting_round] -= 1
+            return httpx.Response(503)
+        return httpx.Response(200, json=feed_json(voting_round or 999))
+
+
+def da_layer_for(api: FakeDALayerAPI, **settings: Any) -> DataAvailabilityLayer:
+    """DA Layer client whose requests are served by `api`."""
+    da_layer = DataAvailabilityLayer(
+        EcosystemSettings(da_layer_retry_backoff=0.001, **settings)
+    )
+    da_layer.client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    return da_layer
+
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_is_bounded_retried_and_cached():
+    """Rounds are fetched within the limit, retried, and never fetched twice."""
+    api = FakeDALayerAPI()
+    api.failures[5] = 2
+    da_layer = da_layer_for(api)
+
+    rounds = [3, 1, 2, *range(4, 20), 1]
+    feeds = await da_layer.get_ftso_anchor_feeds_for_rounds(
+        [FLR], rounds, concurrency=4
+    )
+    assert list(feeds) == [3, 1, 2, *range(4, 20)]
+    assert feeds[12][0].body.value == 120
+    assert api.peak <= 4
+    assert api.requests[5] == 3
+    assert sum(api.requests.values()) == 19 + 2
+
+    api.requests.clear()
+    again = await da_layer.get_ftso_anchor_feeds_for_rounds([FLR], rounds)
+    assert again == feeds
+    assert not api.requests
+
+    # The latest round is not final and always goes over the network
+    await da_layer.get_ftso_anchor_feeds_with_proof([FLR])
+    await da_layer.get_ftso_anchor_feeds_with_proof([FLR])
+    assert api.requests[None] == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_fails_once_retries_run_out():
+    """A round failing past the retry limit fails the bulk fetch, uncached."""
+    api = FakeDALayerAPI()
+    api.failures[2] = 3
+    da_layer = da_layer_for(api, da_layer_max_retries=2)
+
+    with pytest.raises(DALayerError, match="of 4 rounds"):
+        await da_layer.get_ftso_anchor_feeds_for_rounds([FLR], range(4))
+    assert api.requests[2] == 3
+
+    feeds = await da_layer.get_ftso_anchor_feeds_for_rounds([FLR], range(4))
+    assert feeds[2][0].body.value == 20
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_and_persist(tmp_path: Path):
+    """Concurrent lookups of a round send one request; disk outlives memory."""
+    api = FakeDALayerAPI()
+    da_layer = da_layer_for(api, da_layer_cache_size=1, da_layer_cache_dir=tmp_path)
+
+    first, second = await asyncio.gather(
+        da_layer.get_ftso_anchor_feeds_with_proof([FLR], voting_round_id=7),
+        da_layer.get_ftso_anchor_feeds_with_proof([FLR], voting_round_id=7),
+    )
+    assert first == second
+    assert api.requests[7] == 1
+    assert not da_layer._inflight
+
+    await da_layer.get_ftso_anchor_feeds_with_proof([FLR], voting_round_id=8)
+    assert len(da_layer.cache) == 1
+
+    restarted = da_layer_for(api, da_layer_cache_dir=tmp_path)
+    feeds = await restarted.get_ftso_anchor_feeds_with_proof([FLR], voting_round_id=7)
+    assert feeds == first
+    assert api.requests[7] == 1
+    assert restarted.cache.hits == 1
+
+
+def test_response_cache_keys_and_eviction(tmp_path: Path):
+    """Keys ignore dict order; evicted entries are read back from disk."""
+    body = {"feed_ids": [FLR]}
+    key = ResponseCache.key("post", "v0/x", {"a": 1, "b": 2}, body)
+    assert key == ResponseCache.key("POST", "v0/x", {"b": 2, "a": 1}, body)
+    assert key != ResponseCache.key("POST", "v0/x", {"a": 2, "b": 2}, body)
+
+    memory = ResponseCache(2)
+    for name in "abc":
+        memory.put(name, [name])
+    assert memory.get("a") is None
+    assert memory.get("c") == ["c"]
+
+    disk = ResponseCache(1, tmp_path)
+    disk.put("a", {"value": 1})
+    disk.put("b", {"value": 2})
+    assert json.loads((tmp_path / "a.json").read_text()) == {"value": 1}
+    assert disk.get("a") == {"value": 1}
+    (tmp_path / "broken.json").write_text("{")
+    assert disk.get("broken") is None
+    assert (disk.hits, disk.misses) == (1, 1)
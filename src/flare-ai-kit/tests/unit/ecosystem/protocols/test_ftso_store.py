@@ -0,0 +1,97 @@
+"""Unit tests for the FTSO history store and the DA Layer backfill."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from flare_ai_kit.common import DALayerError, FTSOAnchorFeedsWithProof
+from flare_ai_kit.ecosystem.protocols import DataAvailabilityLayer, ftso_store
+from flare_ai_kit.ecosystem.protocols.ftso_store import FtsoHistoryStore
+from flare_ai_kit.ecosystem.settings import EcosystemSettings
+
+FLR, BTC = "0x01464c522f55534400000000000000000000000000", "0x014254432f55534400000000000000000000000000"
+
+
+def feeds_for(voting_round: int) -> list[FTSOAnchorFeedsWithProof]:
+    """Anchor feeds whose values are derived from the round."""
+    return [
+        FTSOAnchorFeedsWithProof.model_validate(
+            {
+                "body": {
+                    "votingRoundId": voting_round,
+                    "id": feed_id,
+                    "value": voting_round * 10 + i,
+                    "turnoutBIPS": 9000,
+                    "decimals": 3,
+                },
+                "proof": [],
+            }
+        )
+        for i, feed_id in enumerate([FLR, BTC])
+    ]
+
+
+def test_store_reads_by_round_and_persists(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Rounds are found by offset, survive reopening and grow the columns."""
+    monkeypatch.setattr(ftso_store, "GROWTH_ROUNDS", 4)
+    store = FtsoHistoryStore(tmp_path, [FLR, BTC], first_round=100)
+    for voting_round in (100, 101, 109):
+        assert store.put(voting_round, feeds_for(voting_round))
+    assert not store.put(100, feeds_for(999))
+    store.flush()
+
+    reopened = FtsoHistoryStore(tmp_path)
+    assert reopened.capacity == 12
+    assert reopened.last_round == 109
+    assert reopened.get(101, BTC) == (1011, 3, 9000)
+    assert reopened.get(102, BTC) is None
+    assert reopened.missing(100, 111) == [102, 103, 104, 105, 106, 107, 108, 110]
+
+    records, filled = reopened.records(FLR, 100, 110)
+    assert isinstance(records.base, np.memmap) or isinstance(records, np.memmap)
+    assert records["value"][[0, 1, 9]].tolist() == [1000, 1010, 1090]
+    assert filled.sum() == 3
+    np.testing.assert_allclose(reopened.prices(FLR, 100, 102), [1.0, 1.01])
+    assert np.isnan(reopened.prices(FLR, 102, 103)).all()
+
+    with pytest.raises(ValueError, match="different feeds"):
+        FtsoHistoryStore(tmp_path, [FLR])
+
+
+@pytest.mark.asyncio
+async def test_backfill_is_bounded_and_resumes(tmp_path: Path):
+    """Rounds are fetched concurrently within the limit and never twice."""
+    da_layer = DataAvailabilityLayer(EcosystemSettings())
+    store = FtsoHistoryStore(tmp_path, [FLR, BTC], first_round=0)
+    in_flight, peak, failing = 0, 0, {7}
+
+    async def fetch(
+        feed_ids: list[str], voting_round_id: int
+    ) -> list[FTSOAnchorFeedsWithProof]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if voting_round_id in failing:
+            msg = "Failed to retrieve FTSO anchor feeds"
+            raise DALayerError(msg)
+        return feeds_for(voting_round_id)
+
+    da_layer.get_ftso_anchor_feeds_with_proof = AsyncMock(side_effect=fetch)  # type: ignore[method-assign]
+    with pytest.raises(DALayerError, match="backfill stopped"):
+        await da_layer.backfill_ftso_history(store, 0, 40, concurrency=4)
+    assert peak <= 4
+    assert 7 not in store
+    stored = 40 - len(store.missing(0, 40))
+
+    failing.clear()
+    da_layer.get_ftso_anchor_feeds_with_proof.reset_mock()
+    written = await da_layer.backfill_ftso_history(store, 0, 40, concurrency=4)
+    assert written == 40 - stored
+    assert da_layer.get_ftso_anchor_feeds_with_proof.await_count == written
+    assert store.missing(0, 40) == []
+    assert store.get(39, FLR) == (390, 3, 9000)
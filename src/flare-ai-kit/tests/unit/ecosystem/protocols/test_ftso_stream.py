@@ -0,0 +1,77 @@
+"""Unit tests for FtsoV2 price streaming and its ring buffers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from flare_ai_kit.common import FtsoV2Error
+from flare_ai_kit.ecosystem.protocols import FtsoV2
+from flare_ai_kit.ecosystem.protocols.ftso_history import PriceRingBuffer
+from flare_ai_kit.ecosystem.settings import EcosystemSettings
+
+
+def test_ring_buffer_keeps_newest_updates_in_order():
+    """Once full, the oldest updates are overwritten and windows stay ordered."""
+    buffer = PriceRingBuffer(capacity=3)
+    assert buffer.latest() is None
+    for t in range(5):
+        buffer.append(1000 + t, 2, 100 + t)
+    prices, timestamps = buffer.window()
+    assert len(buffer) == 3
+    assert timestamps.tolist() == [102, 103, 104]
+    np.testing.assert_allclose(prices, [10.02, 10.03, 10.04])
+    assert buffer.latest() == (10.04, 2, 104)
+    assert buffer.window(seconds=1)[1].tolist() == [103, 104]
+
+
+def make_ftso(timestamps: list[int]) -> tuple[FtsoV2, AsyncMock]:
+    """Create an FtsoV2 whose getFeedsById reports each timestamp in turn."""
+    ftso = FtsoV2(EcosystemSettings(ftso_history_size=8))
+    ftso.ftsov2 = MagicMock()
+    reads = iter(timestamps)
+
+    async def feeds(feed_ids: list[str]) -> tuple[list[int], list[int], int]:
+        t = next(reads, timestamps[-1])
+        return [t * 10 + i for i in range(len(feed_ids))], [1] * len(feed_ids), t
+
+    ftso._get_feeds_by_id = AsyncMock(side_effect=feeds)  # type: ignore[method-assign]
+    ftso._get_feed_by_id = AsyncMock()  # type: ignore[method-assign]
+    return ftso, ftso._get_feeds_by_id
+
+
+@pytest.mark.asyncio
+async def test_stream_serves_prices_and_history_from_memory():
+    """Streamed feeds are answered without RPC and listeners see each update."""
+    ftso, feeds = make_ftso([100, 100, 101, 102])
+    await ftso.start_price_stream(["FLR/USD", "BTC/USD"], interval=0.01)
+    try:
+        assert await ftso.get_latest_price("FLR/USD") == 100.0
+        assert await ftso.get_latest_prices(["FLR/USD", "BTC/USD"]) == [100.0, 100.1]
+        async with asyncio.timeout(1):
+            assert await ftso.wait_for_price_update() == 101
+            assert await ftso.wait_for_price_update() == 102
+    finally:
+        await ftso.stop_price_stream()
+    ftso._get_feed_by_id.assert_not_awaited()
+    prices, timestamps = ftso.get_price_history("BTC/USD")
+    # The repeated timestamp 100 was stored once
+    assert timestamps.tolist() == [100, 101, 102]
+    np.testing.assert_allclose(prices, [100.1, 101.1, 102.1])
+    assert feeds.await_count >= 4
+
+
+@pytest.mark.asyncio
+async def test_stopped_stream_falls_back_to_chain():
+    """Without a running stream, latest prices are read from the contract."""
+    ftso, _ = make_ftso([100])
+    await ftso.start_price_stream(["FLR/USD"], interval=60)
+    await ftso.stop_price_stream()
+    ftso._get_feed_by_id.return_value = (250, 2, 200)
+    assert await ftso.get_latest_price("FLR/USD") == 2.5
+    with pytest.raises(FtsoV2Error):
+        ftso.get_price_history("ETH/USD")
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await ftso.wait_for_price_update()
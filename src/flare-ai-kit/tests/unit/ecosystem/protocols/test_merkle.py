@@ -0,0 +1,79 @@
+"""Unit tests for FTSO anchor feed Merkle proof verification."""
+
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+
+from flare_ai_kit.common import FTSOAnchorFeedsWithProof
+from flare_ai_kit.ecosystem.protocols import DataAvailabilityLayer, merkle
+from flare_ai_kit.ecosystem.protocols.merkle import (
+    MerkleVerifier,
+    build_merkle_tree,
+    feed_leaf,
+)
+from flare_ai_kit.ecosystem.settings import EcosystemSettings
+
+
+def make_round(
+    voting_round: int, n_feeds: int
+) -> tuple[bytes, list[FTSOAnchorFeedsWithProof]]:
+    """Build a round of feeds with valid proofs and return its root."""
+    bodies = [
+        {
+            "votingRoundId": voting_round,
+            "id": f"0x01{i:040x}",
+            "value": 1000 + i,
+            "turnoutBIPS": 8000,
+            "decimals": 4,
+        }
+        for i in range(n_feeds)
+    ]
+    feeds = [
+        FTSOAnchorFeedsWithProof.model_validate({"body": body, "proof": []})
+        for body in bodies
+    ]
+    root, proofs = build_merkle_tree([feed_leaf(feed.body) for feed in feeds])
+    for feed, proof in zip(feeds, proofs, strict=True):
+        feed.proof = ["0x" + node.hex() for node in proof]
+    return root, feeds
+
+
+def test_round_is_verified_sharing_nodes():
+    """Valid proofs pass, tampered values fail and shared nodes are hashed once."""
+    root, feeds = make_round(7, 64)
+    verifier = MerkleVerifier()
+    assert verifier.verify_round(root, feeds) == [True] * 64
+    # Without sharing: 64 proofs of 6 hashes each
+    assert verifier.hashes < 64 * 6 / 2
+    assert verifier.shortcuts > 0
+
+    tampered = feeds[3].model_copy(deep=True)
+    tampered.body.value += 1
+    assert verifier.verify_round(root, [tampered, feeds[4]]) == [False, True]
+    assert MerkleVerifier().verify_round(b"\x00" * 32, feeds[:1]) == [False]
+
+
+def test_large_batches_run_on_a_process_pool(monkeypatch: pytest.MonkeyPatch):
+    """Chunks verified on a process pool give the in-process results."""
+    monkeypatch.setattr(merkle, "PARALLEL_MIN_PROOFS", 1)
+    monkeypatch.setattr(merkle, "PARALLEL_CHUNK_PROOFS", 16)
+    rounds = [make_round(r, 40) for r in range(3)]
+    rounds[1][1][5].body.decimals = 0
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = MerkleVerifier().verify_batch(rounds, executor=pool)
+    assert results == MerkleVerifier().verify_batch(rounds)
+    assert [r.count(False) for r in results] == [0, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_da_layer_checks_feeds_against_relay_roots():
+    """Feeds of several rounds are checked against each round's Relay root."""
+    da_layer = DataAvailabilityLayer(EcosystemSettings())
+    (root_a, feeds_a), (root_b, feeds_b) = make_round(10, 5), make_round(11, 5)
+    roots = {10: root_a, 11: root_b}
+    da_layer.get_relay_merkle_root = AsyncMock(side_effect=roots.__getitem__)  # type: ignore[method-assign]
+    feeds_b[2].body.value = 0
+    feeds = [feeds_a[0], feeds_b[2], feeds_a[1], feeds_b[0]]
+    assert await da_layer.verify_ftso_anchor_feeds(feeds) == [True, False, True, True]
+    assert da_layer.get_relay_merkle_root.await_count == 2
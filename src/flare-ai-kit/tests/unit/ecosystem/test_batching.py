@@ -0,0 +1,52 @@
+"""Unit tests for the BatchingAsyncHTTPProvider module."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from web3.types import RPCEndpoint
+
+from flare_ai_kit.ecosystem.batching import BatchingAsyncHTTPProvider
+
+
+def make_provider(batch_max_size: int) -> tuple[BatchingAsyncHTTPProvider, AsyncMock]:
+    """Create a provider whose batch requests echo each call's params."""
+    provider = BatchingAsyncHTTPProvider(
+        "http://localhost:8545", batch_window=0.005, batch_max_size=batch_max_size
+    )
+
+    async def respond(requests: list[tuple[RPCEndpoint, list[int]]]) -> list[dict]:
+        return [
+            {"jsonrpc": "2.0", "id": i, "error": {"code": -32601, "message": "nope"}}
+            if method == "eth_unknown"
+            else {"jsonrpc": "2.0", "id": i, "result": params[0]}
+            for i, (method, params) in enumerate(requests)
+        ]
+
+    batch = AsyncMock(side_effect=respond)
+    provider.make_batch_request = batch  # type: ignore[method-assign]
+    return provider, batch
+
+
+@pytest.mark.asyncio
+async def test_gathered_requests_share_one_batch():
+    """Concurrent requests are sent together and demultiplexed in order."""
+    provider, batch = make_provider(batch_max_size=100)
+    responses = await asyncio.gather(
+        *(provider.make_request(RPCEndpoint("eth_echo"), [i]) for i in range(10))
+    )
+    assert [r["result"] for r in responses] == list(range(10))
+    batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_isolated_and_batches_are_capped():
+    """An error response only reaches its own caller; batches stay under the cap."""
+    provider, batch = make_provider(batch_max_size=4)
+    failed, *responses = await asyncio.gather(
+        provider.make_request(RPCEndpoint("eth_unknown"), [0]),
+        *(provider.make_request(RPCEndpoint("eth_echo"), [i]) for i in range(1, 8)),
+    )
+    assert "error" in failed
+    assert [r["result"] for r in responses] == list(range(1, 8))
+    assert batch.await_count == 2
@@ -0,0 +1,82 @@
+"""Unit tests for the NonceManager module."""
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from web3.exceptions import ContractLogicError
+
+from flare_ai_kit.common import FlareTxRevertedError
+from flare_ai_kit.ecosystem.flare import Flare
+from flare_ai_kit.ecosystem.nonce import NonceManager
+
+if TYPE_CHECKING:
+    from eth_typing import ChecksumAddress
+
+ADDRESS = cast("ChecksumAddress", "0x00000000000000000000000000000000000A11cE")
+
+
+def make_manager(pending: int = 7, ttl: float = 60) -> tuple[NonceManager, AsyncMock]:
+    """Create a NonceManager over a mocked client reporting `pending`."""
+    w3 = MagicMock()
+    w3.eth.get_transaction_count = AsyncMock(return_value=pending)
+    return NonceManager(w3, reservation_ttl=ttl), w3.eth.get_transaction_count
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_are_unique_and_seeded_once():
+    """Concurrent bundles get distinct sequential nonces from one read."""
+    manager, count = make_manager()
+    bundles = await asyncio.gather(
+        *(manager.reserve(ADDRESS, 2) for _ in range(5))
+    )
+    nonces = sorted(n for bundle in bundles for n in bundle)
+    assert nonces == list(range(7, 17))
+    count.assert_awaited_once_with(ADDRESS, "pending")
+
+
+@pytest.mark.asyncio
+async def test_release_rewinds_the_counter():
+    """Released nonces with nothing reserved above them are handed out again."""
+    manager, _ = make_manager()
+    first = await manager.reserve(ADDRESS, 2)
+    manager.release(ADDRESS, [first[1]])
+    assert await manager.reserve(ADDRESS) == [8]
+    manager.release(ADDRESS, [7])
+    # 8 is still live, so 7 stays a gap instead of being reissued
+    assert await manager.reserve(ADDRESS) == [9]
+
+
+@pytest.mark.asyncio
+async def test_expired_reservations_reconcile_with_chain():
+    """An expired reservation triggers a re-read of the pending count."""
+    manager, count = make_manager(ttl=0)
+    assert await manager.reserve(ADDRESS) == [7]
+    count.return_value = 8
+    assert await manager.reserve(ADDRESS) == [8]
+    assert count.await_count == 2
+
+
+async def _value(value: int) -> int:
+    return value
+
+
+@pytest.mark.asyncio
+async def test_reverting_estimate_releases_the_nonce():
+    """A transaction that fails to build gives its nonce back for the next one."""
+    manager, _ = make_manager()
+    flare = Flare.__new__(Flare)
+    flare.nonces = manager
+    flare.w3 = MagicMock()
+    flare.w3.eth.gas_price = _value(100)
+    flare.w3.eth.max_priority_fee = _value(1)
+    flare.w3.eth.chain_id = _value(14)
+    function_call = MagicMock()
+    function_call.build_transaction = AsyncMock(
+        side_effect=ContractLogicError("execution reverted")
+    )
+
+    with pytest.raises(FlareTxRevertedError):
+        await flare.build_transaction(function_call, ADDRESS)
+    assert await manager.reserve(ADDRESS) == [7]
@@ -0,0 +1,48 @@
+"""Unit tests for the RPCPoolProvider module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from web3.types import RPCEndpoint
+
+from flare_ai_kit.ecosystem.rpc_pool import RPCPoolProvider
+
+
+def make_endpoint(url: str, delay: float = 0.0, *, fail: bool = False) -> MagicMock:
+    """Create an endpoint provider answering after `delay`, or raising."""
+
+    async def respond(method: RPCEndpoint, params: list) -> dict:
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionError(url)
+        result = "0x1c9c380" if method == "eth_blockNumber" else url
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    provider = MagicMock()
+    provider.endpoint_uri = url
+    provider.make_request = AsyncMock(side_effect=respond)
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_reads_fail_over_from_a_failing_endpoint():
+    """A transport error moves the read, and later reads, to the next endpoint."""
+    dead, live = make_endpoint("dead", fail=True), make_endpoint("live")
+    pool = RPCPoolProvider([dead, live], hedge_max_delay=1.0, max_block_lag=3)
+    for _ in range(3):
+        response = await pool.make_request(RPCEndpoint("eth_chainId"), [])
+        assert response["result"] == "live"
+    # The head probe and the first read; then the endpoint cools down
+    assert dead.make_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_are_hedged():
+    """A read slower than the hedge delay is answered by the runner-up."""
+    slow, fast = make_endpoint("slow", delay=0.5), make_endpoint("fast")
+    pool = RPCPoolProvider([slow, fast], hedge_max_delay=0.05, max_block_lag=3)
+    started_at = asyncio.get_running_loop().time()
+    response = await pool.make_request(RPCEndpoint("eth_chainId"), [])
+    assert response["result"] == "fast"
+    assert asyncio.get_running_loop().time() - started_at < 0.5
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any, Literal, Protocol, TypedDict, runtime_checkable
 
@@ -80,6 +81,20 @@ class BaseAIProvider(ABC):
             ModelResponse containing the response text and metadata
         """
 
+    @abstractmethod
+    def stream_message(
+        self, msg: str, session_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """Send a message in a conversational context and stream the reply
+
+        Args:
+            msg: Input message text
+            session_id: Optional session identifier for maintaining context
+
+        Returns:
+            Async iterator over response text chunks
+        """
+
     @abstractmethod
     async def send_message_with_attachment(
         self,
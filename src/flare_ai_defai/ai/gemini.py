@@ -6,14 +6,20 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import google.generativeai as genai
+import numpy as np
 import structlog
 from google.generativeai.types import ContentDict
 
 from flare_ai_defai.ai.base import BaseAIProvider, ModelResponse
-from flare_ai_defai.ai.rag import RAGProcessor
+from flare_ai_defai.ai.rag import RAGProcessor, RetrievalResult
+from flare_ai_defai.ai.semantic_cache import SemanticCache
+from flare_ai_defai.ai.session_store import History, SessionStore
+from flare_ai_defai.metrics import record_stage, timed
 
 logger = structlog.get_logger(__name__)
 
@@ -61,6 +67,8 @@ class GeminiProvider(BaseAIProvider):
         chat (genai.ChatSession | None): Active chat session
         model (genai.GenerativeModel): Configured Gemini model instance
         chat_history (list[ContentDict]): History of chat interactions
+        sessions (SessionStore): Bounded store of per-session chats
+        semantic_cache (SemanticCache): Cache of first-turn knowledge-base answers
         logger (BoundLogger): Structured logger for the provider
         rag_processor (RAGProcessor): Processor for retrieval augmented generation
     """
@@ -77,8 +85,8 @@ class GeminiProvider(BaseAIProvider):
                 - knowledge_base_path: Optional path to knowledge base for RAG
         """
         genai.configure(api_key=api_key)
-        # Dictionary to store active chat sessions keyed by session_id
-        self.sessions: dict[str, genai.ChatSession] = {}
+        # Bounded store of active chat sessions keyed by session_id
+        self.sessions = SessionStore.from_settings()
         self.model = genai.GenerativeModel(
             model_name=model,
             system_instruction=kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
@@ -88,6 +96,7 @@ class GeminiProvider(BaseAIProvider):
         ]
         self.logger = logger.bind(service="gemini")
         self.rag_processor = RAGProcessor(kwargs.get("knowledge_base_path"))
+        self.semantic_cache = SemanticCache.from_settings()
 
     # @override
     def reset(self, session_id: str | None = None) -> None:
@@ -99,11 +108,10 @@ class GeminiProvider(BaseAIProvider):
                         If None, clears all sessions.
         """
         if session_id:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+            self.sessions.pop(session_id)
             self.logger.debug("reset_gemini_session", session_id=session_id)
         else:
-            self.sessions = {}
+            self.sessions.clear()
             self.logger.debug("reset_all_gemini_sessions")
 
     # @override
@@ -134,9 +142,9 @@ class GeminiProvider(BaseAIProvider):
 
         # Use existing session or starting a temporary one if no session_id
         if session_id:
-            if session_id not in self.sessions:
-                self.sessions[session_id] = self.model.start_chat(history=[])
-            chat = self.sessions[session_id]
+            chat = self.sessions.get_or_create(
+                session_id, lambda history: self.model.start_chat(history=history or [])
+            )
         else:
             chat = self.model.start_chat(history=[])
 
@@ -159,11 +167,84 @@ class GeminiProvider(BaseAIProvider):
             },
         )
 
+    def _start_chat(self, history: History | None = None) -> genai.ChatSession:
+        """Start a chat from a rehydrated history or the provider greeting."""
+        return self.model.start_chat(
+            history=history if history is not None else self.chat_history
+        )
+
+    def _get_chat(self, session_id: str | None) -> genai.ChatSession:
+        """
+        Return the chat session for a session ID, starting it if needed.
+
+        Args:
+            session_id (str | None): Session ID, or None for the default chat
+
+        Returns:
+            genai.ChatSession: Chat session seeded with the provider history
+        """
+        if session_id:
+            return self.sessions.get_or_create(session_id, self._start_chat)
+        # Fallback to a single internal session for backward compatibility
+        # but ideally we should always use sessions
+        if not hasattr(self, "_default_chat") or self._default_chat is None:
+            self._default_chat = self.model.start_chat(history=self.chat_history)
+        return self._default_chat
+
+    def _cache_lookup(
+        self,
+        chat: genai.ChatSession,
+        question: str | None,
+        retrieved_docs: RetrievalResult,
+    ) -> tuple[np.ndarray | None, str | None]:
+        """
+        Check the semantic cache for a chat turn.
+
+        Turns are keyed by the embedding of the user's own question, not of
+        the prompt sent to the model, whose template would dominate it.
+        Retrieval already ran on the question, so its query embedding is
+        reused as the key. Only a session's first turn with a known question
+        is cacheable: later turns depend on the conversation so far and must
+        always reach the model.
+
+        Returns:
+            tuple[np.ndarray | None, str | None]: The question's embedding if
+                the turn is cacheable, and the cached answer on a hit
+        """
+        embedding = retrieved_docs.query_embedding
+        if (
+            question is None
+            or embedding is None
+            or len(chat.history) > len(self.chat_history)
+        ):
+            return None, None
+        return embedding, self.semantic_cache.get(
+            embedding, retrieved_docs.doc_ids, self.rag_processor.version
+        )
+
+    def _cache_store(
+        self, embedding: np.ndarray, retrieved_docs: RetrievalResult, text: str
+    ) -> None:
+        """Cache the answer to a cacheable first turn."""
+        self.semantic_cache.set(
+            embedding, retrieved_docs.doc_ids, self.rag_processor.version, text
+        )
+
+    @staticmethod
+    def _record_turn(chat: genai.ChatSession, prompt: str, text: str) -> None:
+        """Append a cache-served exchange so follow-ups keep their context."""
+        chat.history = [
+            *chat.history,
+            {"role": "user", "parts": [prompt]},
+            {"role": "model", "parts": [text]},
+        ]
+
     # @override
     async def send_message(
         self,
         msg: str,
         session_id: str | None = None,
+        question: str | None = None,
     ) -> ModelResponse:
         """
         Send a message in a chat session and get the response.
@@ -171,37 +252,52 @@ class GeminiProvider(BaseAIProvider):
         Args:
             msg (str): Message to send to the chat session
             session_id (str | None): Optional session ID for maintaining context
+            question (str | None): The user's own words when `msg` wraps them
+                in a prompt template; documents are retrieved for it and its
+                embedding keys the semantic cache. Turns without one are not
+                cached
 
         Returns:
             ModelResponse: Response from the chat session
         """
-        if session_id:
-            if session_id not in self.sessions:
-                self.sessions[session_id] = self.model.start_chat(
-                    history=self.chat_history
-                )
-            chat = self.sessions[session_id]
-        else:
-            # Fallback to a single internal session for backward compatibility
-            # but ideally we should always use sessions
-            if not hasattr(self, "_default_chat") or self._default_chat is None:
-                self._default_chat = self.model.start_chat(
-                    history=self.chat_history
-                )
-            chat = self._default_chat
-
-        # Retrieve relevant documents using RAG
-        retrieved_docs = await self.rag_processor.retrieve_relevant_docs(query=msg)
+        chat = self._get_chat(session_id)
+
+        # Retrieve relevant documents using RAG, searching on the user's own
+        # words when the message wraps them in a template
+        retrieved_docs = await self.rag_processor.retrieve_relevant_docs(
+            query=question or msg
+        )
 
         # Augment the prompt with retrieved context
         augmented_prompt = self.rag_processor.augment_prompt(
             query=msg, retrieved_docs=retrieved_docs
         )
 
-        # Use asyncio.to_thread for the blocking google-generativeai call if needed, 
-        # or just call it if it's fast enough. The genai library has async methods too.
-        response = await chat.send_message_async(augmented_prompt)
-        
+        docs_metadata = [
+            {"content": doc.content, "metadata": doc.metadata}
+            for doc in retrieved_docs.documents
+        ]
+
+        embedding, cached = self._cache_lookup(chat, question, retrieved_docs)
+        if cached is not None:
+            self._record_turn(chat, augmented_prompt, cached)
+            self.logger.debug("send_message_cache_hit", msg=msg)
+            return ModelResponse(
+                text=cached,
+                raw_response=None,
+                metadata={
+                    "candidate_count": 1,
+                    "prompt_feedback": None,
+                    "retrieved_docs": docs_metadata,
+                    "cached": True,
+                },
+            )
+
+        with timed("gemini.send_message"):
+            response = await chat.send_message_async(augmented_prompt)
+        if embedding is not None:
+            self._cache_store(embedding, retrieved_docs, response.text)
+
         self.logger.debug("send_message", msg=msg, response_text=response.text)
         return ModelResponse(
             text=response.text,
@@ -209,13 +305,78 @@ class GeminiProvider(BaseAIProvider):
             metadata={
                 "candidate_count": len(response.candidates),
                 "prompt_feedback": response.prompt_feedback,
-                "retrieved_docs": [
-                    {"content": doc.content, "metadata": doc.metadata}
-                    for doc in retrieved_docs.documents
-                ],
+                "retrieved_docs": docs_metadata,
             },
         )
 
+    # @override
+    async def stream_message(
+        self,
+        msg: str,
+        session_id: str | None = None,
+        retrieved_docs: RetrievalResult | None = None,
+        question: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Send a message in a chat session and yield the response as it streams.
+
+        The session history is updated once the stream is fully consumed,
+        exactly as with `send_message`. If the stream is abandoned (e.g. the
+        client disconnects), the session is rolled back to before the turn.
+
+        Args:
+            msg (str): Message to send to the chat session
+            session_id (str | None): Optional session ID for maintaining context
+            retrieved_docs (RetrievalResult | None): Documents already retrieved
+                for `question` (or `msg` without one); retrieval runs here when
+                omitted
+            question (str | None): The user's own words, as for `send_message`
+
+        Yields:
+            str: Text chunks in generation order
+        """
+        chat = self._get_chat(session_id)
+
+        if retrieved_docs is None:
+            retrieved_docs = await self.rag_processor.retrieve_relevant_docs(
+                query=question or msg
+            )
+        augmented_prompt = self.rag_processor.augment_prompt(
+            query=msg, retrieved_docs=retrieved_docs
+        )
+
+        embedding, cached = self._cache_lookup(chat, question, retrieved_docs)
+        if cached is not None:
+            self._record_turn(chat, augmented_prompt, cached)
+            self.logger.debug("stream_message_cache_hit", msg=msg)
+            yield cached
+            return
+
+        history = chat.history
+        started_at = time.perf_counter()
+        response = await chat.send_message_async(augmented_prompt, stream=True)
+        parts = []
+        completed = False
+        try:
+            async for chunk in response:
+                if chunk.text:
+                    if not parts:
+                        record_stage(
+                            "gemini.first_token", time.perf_counter() - started_at
+                        )
+                    parts.append(chunk.text)
+                    yield chunk.text
+            await response.resolve()
+            completed = True
+        finally:
+            if not completed:
+                # An unresolved streamed turn breaks every later message
+                chat.history = history
+        record_stage("gemini.stream", time.perf_counter() - started_at)
+        if embedding is not None:
+            self._cache_store(embedding, retrieved_docs, "".join(parts))
+        self.logger.debug("stream_message", msg=msg, chunks=len(parts))
+
     # @override
     async def send_message_with_attachment(
         self,
@@ -233,18 +394,7 @@ class GeminiProvider(BaseAIProvider):
             mime_type: MIME type of the file
             session_id: Optional session ID for maintaining context
         """
-        if session_id:
-            if session_id not in self.sessions:
-                self.sessions[session_id] = self.model.start_chat(
-                    history=self.chat_history
-                )
-            chat = self.sessions[session_id]
-        else:
-            if not hasattr(self, "_default_chat") or self._default_chat is None:
-                self._default_chat = self.model.start_chat(
-                    history=self.chat_history
-                )
-            chat = self._default_chat
+        chat = self._get_chat(session_id)
 
         # Retrieve relevant documents using RAG (still useful for context)
         retrieved_docs = await self.rag_processor.retrieve_relevant_docs(query=msg)
@@ -255,9 +405,10 @@ class GeminiProvider(BaseAIProvider):
         )
 
         # Send augmented prompt with attachment to chat
-        response = self.chat.send_message(
-            [augmented_prompt, {"mime_type": mime_type, "data": file_data}]
-        )
+        with timed("gemini.send_message_with_attachment"):
+            response = await chat.send_message_async(
+                [augmented_prompt, {"mime_type": mime_type, "data": file_data}]
+            )
 
         self.logger.debug(
             "send_message_with_attachment",
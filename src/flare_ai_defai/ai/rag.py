@@ -11,13 +11,22 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import structlog
 
+from flare_ai_defai.cache import TTLCache
+from flare_ai_defai.executor import GEMINI, blocking_executor
+from flare_ai_defai.metrics import timed
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
 from flare_ai_rag import RAGSystem
 
 logger = structlog.get_logger(__name__)
 
+# Identical concurrent queries share one embedding request
+embedding_flight = SingleFlight("rag_embedding")
+
 
 @dataclass
 class Document:
@@ -26,6 +35,7 @@ class Document:
     content: str
     metadata: dict[str, Any]
     source: str  # Source file name
+    doc_id: int | None = None  # Position in the vector store
 
 
 @dataclass
@@ -34,6 +44,12 @@ class RetrievalResult:
 
     documents: list[Document]
     scores: list[float]
+    query_embedding: np.ndarray | None = None
+
+    @property
+    def doc_ids(self) -> tuple[int | None, ...]:
+        """IDs of the retrieved documents, in rank order."""
+        return tuple(doc.doc_id for doc in self.documents)
 
 
 class RAGProcessor:
@@ -47,6 +63,12 @@ class RAGProcessor:
         """
         self.logger = logger.bind(processor="rag")
 
+        # Bumped whenever the knowledge base changes; invalidates derived caches
+        self.version = 0
+        self._query_embeddings: TTLCache[tuple[int, str], np.ndarray] = TTLCache(
+            maxsize=settings.semantic_cache_size, ttl=settings.semantic_cache_ttl
+        )
+
         # Initialize RAG system
         self.rag_system = RAGSystem(
             knowledge_base_path if knowledge_base_path else "src/data"
@@ -64,15 +86,22 @@ class RAGProcessor:
         """Reload the knowledge base, clearing existing data."""
         path = path or "src/data"
         self.rag_system.vector_store.clear()
+        self._invalidate()
         self._load_documents(path)
         return {"count": len(self.rag_system.vector_store.documents)}
 
+    def _invalidate(self) -> None:
+        """Mark the knowledge base as changed."""
+        self.version += 1
+        self._query_embeddings.clear()
+
     def _load_documents(self, path: str) -> None:
         """Load documents from CSV files in the specified directory
 
         Args:
             path: Directory containing CSV files
         """
+        self._invalidate()
         csv_files = glob.glob(os.path.join(path, "*.csv"))
 
         for file_path in csv_files:
@@ -173,6 +202,28 @@ class RAGProcessor:
                     file=os.path.basename(file_path),
                 )
 
+    async def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the embedding of identical recent queries
+
+        Args:
+            query: Search query
+
+        Returns:
+            Query embedding vector
+        """
+        key = (self.version, " ".join(query.lower().split()))
+        embedding = self._query_embeddings.get(key)
+        if embedding is None:
+            # Query embedding is a blocking Gemini call
+            embedding = await embedding_flight.do(
+                key,
+                lambda: blocking_executor.run(
+                    GEMINI, self.rag_system.vector_store.embed_query, query
+                ),
+            )
+            self._query_embeddings.set(key, embedding)
+        return embedding
+
     async def retrieve_relevant_docs(
         self, query: str, image_description: str | None = None, k: int = 3
     ) -> RetrievalResult:
@@ -184,15 +235,21 @@ class RAGProcessor:
             k: Number of documents to retrieve
 
         Returns:
-            RetrievalResult containing relevant documents and their scores
+            RetrievalResult containing relevant documents, their scores and
+            the query embedding
         """
         # Combine query with image description if available
         search_query = query
         if image_description:
             search_query = f"{query} {image_description}"
 
-        # Search vector store
-        results = self.rag_system.vector_store.similarity_search(search_query, k=k)
+        if not self.rag_system.vector_store.documents:
+            return RetrievalResult(documents=[], scores=[])
+
+        with timed("rag.embed"):
+            query_embedding = await self.embed_query(search_query)
+        with timed("rag.search"):
+            results = self.rag_system.vector_store.search_by_vector(query_embedding, k=k)
 
         # Convert to Document objects
         documents = []
@@ -203,11 +260,14 @@ class RAGProcessor:
                 content=result["text"],
                 metadata=result["metadata"],
                 source=result["metadata"].get("source_file", "unknown"),
+                doc_id=result.get("id"),
             )
             documents.append(doc)
             scores.append(result["score"])
 
-        return RetrievalResult(documents=documents, scores=scores)
+        return RetrievalResult(
+            documents=documents, scores=scores, query_embedding=query_embedding
+        )
 
     def augment_prompt(
         self,
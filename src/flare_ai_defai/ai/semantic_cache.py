@@ -0,0 +1,170 @@
+"""
+Semantic Response Cache Module
+
+This module caches model answers to knowledge-base questions. An entry is
+reused when a new query embedding is within a cosine-similarity threshold of
+a cached one and retrieval returned the same documents, so paraphrases of a
+frequently asked question skip the Gemini call entirely.
+
+Entries are tagged with the knowledge-base version they were generated from.
+The whole cache is dropped as soon as a lookup sees a newer version, so a
+reload can never serve answers grounded in stale documents.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import structlog
+
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    vector: np.ndarray
+    doc_ids: tuple[Any, ...]
+    expires_at: float
+    value: str
+
+
+class SemanticCache:
+    """
+    Size- and TTL-bounded cache keyed on query embedding and document IDs.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a hit
+        maxsize (int): Maximum entries before LRU eviction
+        ttl (float): Seconds an entry stays valid
+    """
+
+    def __init__(
+        self, threshold: float = 0.95, maxsize: int = 512, ttl: float = 3600.0
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum entries before LRU eviction
+            ttl: Seconds an entry stays valid
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_key = 0
+        self._version: int | None = None
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self.logger = logger.bind(component="semantic_cache")
+
+    @classmethod
+    def from_settings(cls) -> "SemanticCache":
+        """Create a cache configured from the application settings."""
+        return cls(
+            threshold=settings.semantic_cache_threshold,
+            maxsize=settings.semantic_cache_size,
+            ttl=settings.semantic_cache_ttl,
+        )
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _check_version(self, version: int) -> None:
+        if self._version != version:
+            if self._entries:
+                self._counters["invalidations"] += 1
+                self.logger.debug("invalidated", old=self._version, new=version)
+            self._entries.clear()
+            self._version = version
+
+    def get(
+        self, embedding: np.ndarray, doc_ids: tuple[Any, ...], version: int
+    ) -> str | None:
+        """
+        Look up an answer for a semantically equivalent query.
+
+        Args:
+            embedding: Query embedding
+            doc_ids: IDs of the documents retrieved for the query
+            version: Current knowledge-base version
+
+        Returns:
+            str | None: The cached answer, or None on a miss
+        """
+        query = self._normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            self._check_version(version)
+            best_key, best_score = None, self.threshold
+            for key, entry in list(self._entries.items()):
+                if entry.expires_at < now:
+                    del self._entries[key]
+                    continue
+                if entry.doc_ids != doc_ids:
+                    continue
+                score = float(entry.vector @ query)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(best_key)
+            self._counters["hits"] += 1
+            return self._entries[best_key].value
+
+    def set(
+        self, embedding: np.ndarray, doc_ids: tuple[Any, ...], version: int, value: str
+    ) -> None:
+        """
+        Store an answer.
+
+        Args:
+            embedding: Query embedding
+            doc_ids: IDs of the documents retrieved for the query
+            version: Knowledge-base version the answer was grounded in
+            value: Model answer
+        """
+        with self._lock:
+            self._check_version(version)
+            self._entries[self._next_key] = _Entry(
+                vector=self._normalize(embedding),
+                doc_ids=doc_ids,
+                expires_at=time.monotonic() + self.ttl,
+                value=value,
+            )
+            self._next_key += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            dict: Size, hits, misses, evictions, invalidations and hit rate
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "size": size,
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
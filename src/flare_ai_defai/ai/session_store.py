@@ -0,0 +1,331 @@
+"""
+Chat Session Store Module
+
+This module bounds the memory held by per-user chat sessions. Sessions are
+kept in an LRU map with max-entries and idle-TTL eviction, and their history
+is truncated to a token budget before each use. An optional SQLite tier
+stores evicted sessions as compressed JSON and rehydrates them on demand, so
+a returning user keeps their context without the pod holding every
+conversation in memory.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Protocol
+
+import structlog
+
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Rough characters-per-token ratio used for the history budget
+CHARS_PER_TOKEN = 4
+
+History = list[dict[str, Any]]
+
+
+class SessionTier(Protocol):
+    """Secondary storage for evicted session histories."""
+
+    def save(self, session_id: str, history: History) -> None:
+        """Persist a session history."""
+        ...
+
+    def load(self, session_id: str) -> History | None:
+        """Remove and return a persisted history, or None if absent."""
+        ...
+
+    def delete(self, session_id: str) -> None:
+        """Drop a persisted history."""
+        ...
+
+    def clear(self) -> None:
+        """Drop all persisted histories."""
+        ...
+
+
+class SQLiteSessionTier:
+    """
+    Compact on-disk tier storing zlib-compressed JSON histories in SQLite.
+
+    Histories expire `ttl` seconds after they were saved; expired rows are
+    deleted whenever a history is saved, so the database stays bounded by
+    the sessions evicted within one TTL.
+
+    Attributes:
+        path (str): SQLite database path
+        ttl (float): Seconds a persisted history is kept
+    """
+
+    def __init__(self, path: str, ttl: float = 1800.0) -> None:
+        """
+        Open (or create) the session database.
+
+        Args:
+            path: SQLite database path
+            ttl: Seconds a persisted history is kept
+        """
+        self.path = path
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, history BLOB NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS sessions_updated_at "
+                "ON sessions (updated_at)"
+            )
+
+    def save(self, session_id: str, history: History) -> None:
+        """Persist a session history, replacing any previous copy."""
+        blob = zlib.compress(json.dumps(history).encode())
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (now - self.ttl,)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                (session_id, blob, now),
+            )
+
+    def load(self, session_id: str) -> History | None:
+        """Remove and return a persisted history, or None if absent or expired."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT history FROM sessions WHERE session_id = ? AND updated_at >= ?",
+                (session_id, time.time() - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+        return json.loads(zlib.decompress(row[0]))
+
+    def delete(self, session_id: str) -> None:
+        """Drop a persisted history."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+
+    def clear(self) -> None:
+        """Drop all persisted histories."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions")
+
+    def count(self) -> int:
+        """Return the number of persisted sessions."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+def serialize_history(history: list[Any]) -> History:
+    """
+    Convert chat history (protos.Content or ContentDict) into plain dicts.
+
+    Only text parts are kept; attachments are not persisted.
+
+    Args:
+        history: Chat session history
+
+    Returns:
+        list[dict]: Entries of the form {"role": str, "parts": [str, ...]}
+    """
+    entries = []
+    for content in history:
+        if isinstance(content, dict):
+            role = content.get("role", "user")
+            parts = [p for p in content.get("parts", []) if isinstance(p, str)]
+        else:
+            role = content.role
+            parts = [p.text for p in content.parts if p.text]
+        entries.append({"role": role, "parts": parts})
+    return entries
+
+
+def estimate_tokens(history: History) -> int:
+    """Estimate the token count of a serialized history."""
+    return sum(len(p) for entry in history for p in entry["parts"]) // CHARS_PER_TOKEN
+
+
+class SessionStore:
+    """
+    Bounded store for chat sessions keyed by session ID.
+
+    Sessions are any object with a settable `history` attribute (e.g.
+    `genai.ChatSession`), created through a caller-supplied factory that
+    receives the rehydrated history, or None for a fresh session.
+
+    Attributes:
+        max_entries (int): Maximum live sessions before LRU eviction
+        idle_ttl (float): Seconds of inactivity before a session is evicted
+        token_budget (int): Approximate history tokens kept per session
+        tier (SessionTier | None): Optional store for evicted sessions
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        idle_ttl: float = 1800.0,
+        token_budget: int = 8000,
+        tier: SessionTier | None = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Maximum live sessions before LRU eviction
+            idle_ttl: Seconds of inactivity before a session is evicted
+            token_budget: Approximate history tokens kept per session
+            tier: Optional store for evicted sessions
+        """
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self.token_budget = token_budget
+        self.tier = tier
+        self._sessions: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._counters = {
+            "created": 0,
+            "rehydrated": 0,
+            "evicted_idle": 0,
+            "evicted_capacity": 0,
+            "truncated": 0,
+        }
+        self.logger = logger.bind(component="session_store")
+
+    @classmethod
+    def from_settings(cls) -> "SessionStore":
+        """Create a store configured from the application settings."""
+        tier = (
+            SQLiteSessionTier(settings.session_db_path, ttl=settings.session_idle_ttl)
+            if settings.session_db_path
+            else None
+        )
+        return cls(
+            max_entries=settings.session_max_entries,
+            idle_ttl=settings.session_idle_ttl,
+            token_budget=settings.session_token_budget,
+            tier=tier,
+        )
+
+    def get_or_create(
+        self, session_id: str, factory: Callable[[History | None], Any]
+    ) -> Any:
+        """
+        Return the live session, rehydrating or creating it if needed.
+
+        Args:
+            session_id: Session identifier
+            factory: Builds a session from a rehydrated history or None
+
+        Returns:
+            The session object with its history within the token budget
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._evict_idle(now)
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                history = self.tier.load(session_id) if self.tier else None
+                session = factory(history)
+                self._counters["rehydrated" if history else "created"] += 1
+            else:
+                session = entry[1]
+            self._sessions[session_id] = (now, session)
+            self._sessions.move_to_end(session_id)
+            self._evict_capacity()
+        self._truncate(session_id, session)
+        return session
+
+    def _truncate(self, session_id: str, session: Any) -> None:
+        """Drop the oldest turns until the history fits the token budget."""
+        history = list(session.history)
+        entries = serialize_history(history)
+        if estimate_tokens(entries) <= self.token_budget:
+            return
+        dropped = 0
+        # Drop whole user/model exchanges so turn order is preserved
+        while len(history) > 2 and estimate_tokens(entries) > self.token_budget:  # noqa: PLR2004
+            del history[:2]
+            del entries[:2]
+            dropped += 2
+        session.history = history
+        with self._lock:
+            self._counters["truncated"] += 1
+        self.logger.debug("history_truncated", session_id=session_id, dropped=dropped)
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        _, session = self._sessions.pop(session_id)
+        self._counters[f"evicted_{reason}"] += 1
+        if self.tier:
+            self.tier.save(session_id, serialize_history(session.history))
+        self.logger.debug("session_evicted", session_id=session_id, reason=reason)
+
+    def _evict_idle(self, now: float) -> None:
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if now - last_used < self.idle_ttl:
+                break
+            self._evict(session_id, "idle")
+
+    def _evict_capacity(self) -> None:
+        while len(self._sessions) > self.max_entries:
+            self._evict(next(iter(self._sessions)), "capacity")
+
+    def pop(self, session_id: str) -> None:
+        """Forget a session in memory and in the secondary tier."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            if self.tier:
+                self.tier.delete(session_id)
+
+    def clear(self) -> None:
+        """Forget every session."""
+        with self._lock:
+            self._sessions.clear()
+            if self.tier:
+                self.tier.clear()
+
+    def __contains__(self, session_id: object) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report live sessions, eviction counters and approximate bytes held.
+
+        Returns:
+            dict: Session metrics
+        """
+        with self._lock:
+            sessions = [session for _, session in self._sessions.values()]
+            counters = dict(self._counters)
+        bytes_held = sum(
+            len(part.encode())
+            for session in sessions
+            for entry in serialize_history(session.history)
+            for part in entry["parts"]
+        )
+        return {
+            "live": len(sessions),
+            "bytes_held": bytes_held,
+            "persisted": self.tier.count() if isinstance(self.tier, SQLiteSessionTier) else 0,
+            **counters,
+        }
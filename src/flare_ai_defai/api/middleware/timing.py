@@ -0,0 +1,40 @@
+import time
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from flare_ai_defai.metrics import HTTP_SECONDS, start_request_timing
+
+
+class TimingMiddleware(BaseHTTPMiddleware):
+    """
+    Records request latency and, in debug mode, attaches an X-Timing header
+    breaking the request down by stage.
+
+    Streaming responses only carry the stages finished before the first byte.
+    """
+
+    def __init__(self, app: ASGIApp, expose_header: bool = False):
+        super().__init__(app)
+        self.expose_header = expose_header
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        recorder = start_request_timing()
+        started_at = time.perf_counter()
+        response = await call_next(request)
+        elapsed = time.perf_counter() - started_at
+
+        # Label by route template so path parameters don't explode cardinality
+        route = request.scope.get("route")
+        HTTP_SECONDS.observe(
+            elapsed,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(response.status_code),
+        )
+        if self.expose_header:
+            recorder.add("total", elapsed)
+            response.headers["X-Timing"] = recorder.header()
+        return response
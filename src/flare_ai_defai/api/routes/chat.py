@@ -11,13 +11,17 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
+import asyncio
 import json
-import os
 import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
 from typing import Any, Dict, List
+from uuid import UUID, uuid4
 
 import structlog
 from fastapi import APIRouter, HTTPException, Request, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from web3 import Web3
 
@@ -30,13 +34,25 @@ from flare_ai_defai.blockchain.sflr_staking import (
     parse_stake_command,
     stake_flr_to_sflr,
 )
-from flare_ai_defai.blockchain.ftso_context import get_ftso_context
+from flare_ai_defai.blockchain.ftso_context import ftso_stats, get_ftso_context
+from flare_ai_defai.blockchain.rpc_pool import rpc_pool_stats
+from flare_ai_defai.cache import TTLCache
+from flare_ai_defai.context import RequestContext, current_context, set_request_context
+from flare_ai_defai.executor import GEMINI, BlockingExecutor, blocking_executor
+from flare_ai_defai.intent import IntentClassifier
+from flare_ai_defai.metrics import record_stage, timed
 from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
 from flare_ai_defai.interceptor import DecisionInterceptor
+from flare_ai_defai.pipeline import OK, Stage, StageOutcome, run_stages
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight, singleflight_stats
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Identical concurrent messages share one semantic_router call
+router_flight = SingleFlight("semantic_router")
+
 # Constants
 HTTP_500_ERROR = "Internal server error occurred"
 WALLET_NOT_CONNECTED = "Please connect your wallet first"
@@ -50,6 +66,11 @@ NO_ROUTES_ERROR = "No valid routes found for this swap. This might be due to ins
 STAKING_ERROR = "Error preparing staking transaction"
 
 
+def _sse(event: str, data: Any) -> str:
+    """Encode a server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 class ChatMessage(BaseModel):
     """
     Pydantic model for chat message validation.
@@ -106,6 +127,9 @@ class ChatRouter:
         blockchain: FlareProvider,
         attestation: Vtpm,
         prompts: PromptService,
+        executor: BlockingExecutor | None = None,
+        intents: IntentClassifier | None = None,
+        blazeswap: BlazeSwapHandler | None = None,
     ) -> None:
         """
         Initialize the ChatRouter with required service providers.
@@ -115,29 +139,49 @@ class ChatRouter:
             blockchain: Provider for blockchain operations
             attestation: Provider for attestation services
             prompts: Service for managing prompts
+            executor: Thread pools for blocking provider calls
+                (defaults to the shared executor)
+            intents: Local classifier tried before the semantic_router prompt
+            blazeswap: BlazeSwap handler (defaults to one built from
+                settings.flare_rpc_url)
         """
         self._router = APIRouter()
         self.ai = ai
         self.blockchain = blockchain
         self.attestation = attestation
         self.prompts = prompts
+        self.executor = executor or blocking_executor
+        self.intents = intents or IntentClassifier.from_settings()
         self.logger = logger.bind(router="chat")
 
-        # Get Web3 provider URL from environment
-        web3_provider_url = os.getenv(
-            "WEB3_PROVIDER_URL", "https://flare-api.flare.network/ext/C/rpc"
-        )
-
-        # Initialize BlazeSwap handler with provider URL from environment
-        # Initialize BlazeSwap handler with provider URL from environment
-        self.blazeswap = BlazeSwapHandler(web3_provider_url)
+        if blazeswap is None:
+            # Same endpoint (and endpoint pool) as the Flare provider
+            blazeswap = BlazeSwapHandler(settings.flare_rpc_url)
+        self.blazeswap = blazeswap
         self.interceptor = DecisionInterceptor()
         
-        # Mapping from session_id to stateful decision_id
-        self.session_decisions: dict[str, Any] = {}
+        # Mapping from session_id to stateful decision_id, bounded like sessions
+        self.session_decisions: TTLCache[str, UUID] = TTLCache(
+            maxsize=settings.session_max_entries, ttl=settings.session_idle_ttl
+        )
+
+        # Suggestions that missed the response deadline, keyed by request_id
+        self.late_suggestions: TTLCache[str, list[str]] = TTLCache(
+            maxsize=settings.suggestions_cache_size,
+            ttl=settings.suggestions_cache_ttl,
+        )
+        self._pending_suggestions: dict[str, asyncio.Task[list[str]]] = {}
         
         self._setup_routes()
 
+    @property
+    def wallet_address(self) -> str | None:
+        """Wallet of the request being handled, else the provider's own account."""
+        ctx = current_context()
+        if ctx and ctx.wallet_address:
+            return ctx.wallet_address
+        return self.blockchain.address
+
     def _setup_routes(self) -> None:
         """
         Set up FastAPI routes for the chat endpoint.
@@ -170,6 +214,9 @@ class ChatRouter:
                     return {"response": "Message cannot be empty"}
 
                 # Initialize action source and response
+                request_id = uuid4().hex
+                # Each request runs in its own task, so this binding is request-scoped
+                set_request_context(RequestContext(request_id, wallet_address, session_id))
                 ai_action = "CONVERSATIONAL"
                 handler_response = {}
 
@@ -272,115 +319,24 @@ class ChatRouter:
 
                 # --- STANDARD COMMANDS / SEMANTIC ROUTING ---
                 if not handler_response:
-                    # Update the blockchain provider with the wallet address if provided
-                    if wallet_address:
-                        self.blockchain.address = wallet_address
-
-                    # Check for direct commands first
-                    words = message_text.lower().split()
-                    if words:
-                        command = words[0]
-                        # Map commands to actions
-                        command_map = {
-                            "swap": "SWAP",
-                            "balance": "CHECK_BALANCE",
-                            "check": "CHECK_BALANCE", 
-                            "send": "SEND",
-                            "stake": "STAKE",
-                            "pool": "POOL",
-                            "risk": "RISK",
-                            "attest": "ATTEST",
-                            "help": "HELP"
-                        }
-
-                        if command == "perp":
-                             handler_response = {
-                                "response": "Perpetuals trading is not supported. Please use BlazeSwap for token swaps."
-                            }
-                        elif command == "universal":
-                             handler_response = {
-                                "response": "Universal router swaps have been removed. Please use 'swap' command for BlazeSwap trading."
-                            }
-                        elif command in command_map:
-                            ai_action = command_map[command]
-                            # Dispatch to strict handler
-                            if command == "swap":
-                                handler_response = await self.handle_swap_token(message_text)
-                            elif command in ["balance", "check"]:
-                                handler_response = await self.handle_balance_check(message_text)
-                            elif command == "send":
-                                handler_response = await self.handle_send_token(message_text)
-                            elif command == "stake":
-                                handler_response = await self.handle_stake_command(message_text)
-                            elif command == "pool":
-                                handler_response = await self.handle_add_liquidity(message_text)
-                            elif command == "risk":
-                                handler_response = await self.handle_risk_assessment(message_text)
-                            elif command == "attest":
-                                handler_response = await self.handle_attestation(message_text)
-                            elif command == "help":
-                                handler_response = await self.handle_help_command()
-                    
-                    # If no direct command served, use semantic routing
-                    if not handler_response:
-                        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                            "semantic_router", user_input=message_text
+                    with timed("chat.route"):
+                        ai_action, _, dispatch = await self.resolve_route(
+                            message_text, session_id=session_id
                         )
-                        route_response = self.ai.generate(
-                            prompt=prompt, response_mime_type=mime_type, response_schema=schema,
-                            session_id=session_id
-                        )
-                        route = SemanticRouterResponse(route_response.text.strip())
-                        ai_action = route.value
-                        handler_response = await self.route_message(route, message_text, session_id=session_id)
+                    with timed(f"chat.handler.{ai_action}"):
+                        handler_response = await dispatch()
 
-                # --- INTERCEPTION POINT ---
                 if "response" in handler_response:
-                    try:
-                        # Fetch FTSO context if relevant
-                        ftso_data = {"ftso_feed_id": None, "ftso_round_id": None}
-                        if str(ai_action) in ["SWAP", "STAKE", "POOL", "SEND"]:
-                             # Heuristic: Default to FLR context if relevant action, or look for token
-                             target_token = "FLR"
-                             # Simple check for other tokens
-                             for t in ["WC2FLR", "WETH", "BTC", "USDT"]:
-                                 if t in message_text.upper():
-                                     target_token = t
-                                     break
-                             ftso_data = await get_ftso_context(self.blockchain, target_token)
-
-                        # Maintain stable decision_id per session
-                        stable_decision_id = None
-                        if session_id:
-                            if session_id not in self.session_decisions:
-                                from uuid import uuid4
-                                self.session_decisions[session_id] = uuid4()
-                            stable_decision_id = self.session_decisions[session_id]
-
-                        decision_packet = self.interceptor.intercept(
-                            wallet_address=wallet_address or "0x0000000000000000000000000000000000000000",
+                    with timed("chat.post_process"):
+                        await self.post_process(
+                            handler_response,
+                            request_id=request_id,
                             ai_action=str(ai_action),
-                            user_input=message_text,
-                            ai_response_text=handler_response["response"],
-                            transaction_data=handler_response.get("transaction"),
+                            message_text=message_text,
+                            wallet_address=wallet_address,
+                            session_id=session_id,
                             model_id=selected_models[0] if selected_models else "gemini-1.5-flash",
-                            ftso_feed_id=ftso_data.get("ftso_feed_id"),
-                            ftso_round_id=ftso_data.get("ftso_round_id"),
-                            decision_id=stable_decision_id
                         )
-                        # Attach packet to response
-                        handler_response["decision_packet"] = decision_packet.model_dump()
-                        from flare_ai_defai.settings import settings
-                        handler_response["decision_logger_address"] = settings.decision_logger_address
-                    except Exception as e:
-                        self.logger.error("interceptor_failed", error=str(e))
-                        # Fail open or closed? For PoC, log and proceed.
-                
-                # Generate follow-up suggestions
-                if "response" in handler_response:
-                    suggestions = await self.get_suggestions(handler_response["response"])
-                    if suggestions:
-                        handler_response["suggestions"] = suggestions
 
                 return handler_response
 
@@ -388,6 +344,30 @@ class ChatRouter:
                 self.logger.error("message_handling_failed", error=str(e))
                 return {"response": PROCESSING_ERROR}
 
+        @self._router.post("/stream")
+        async def stream(request: Request) -> StreamingResponse:
+            """
+            Handle a text chat message as a server-sent event stream.
+
+            Emits `route`, `retrieved_docs`, `token`, `transaction`,
+            `decision_packet` and `suggestions` events as each becomes
+            available, then `done`. Attachments and model selection are
+            only supported by the non-streaming endpoint.
+            """
+            data = await request.form()
+            message_text = data.get("message", "")
+            if not message_text:
+                raise HTTPException(status_code=400, detail="Message cannot be empty")
+            return StreamingResponse(
+                self.stream_events(
+                    message_text,
+                    wallet_address=data.get("walletAddress"),
+                    session_id=data.get("sessionId"),
+                ),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         @self._router.post("/connect_wallet")
         async def connect_wallet(request: ConnectWalletRequest):
             """Connect wallet endpoint"""
@@ -407,6 +387,33 @@ class ChatRouter:
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self._router.get("/stats")
+        async def stats() -> dict[str, Any]:
+            """Report upstream pool, intent classifier, session, cache, pool index, fee, nonce, FTSO and RPC endpoint counters."""
+            return {
+                "executor": self.executor.stats(),
+                "intent": self.intents.stats(),
+                "sessions": self.ai.sessions.stats(),
+                "semantic_cache": self.ai.semantic_cache.stats(),
+                "session_decisions": self.session_decisions.stats(),
+                "singleflight": singleflight_stats(),
+                **self.blazeswap.stats(),
+                "fees": self.blockchain.fee_oracle.stats(),
+                "nonces": self.blockchain.nonces.stats(),
+                "ftso": ftso_stats(),
+                "rpc": rpc_pool_stats(),
+            }
+
+        @self._router.get("/suggestions/{request_id}")
+        async def suggestions(request_id: str) -> dict[str, Any]:
+            """Fetch suggestions that were still generating when /chat returned."""
+            late = self.late_suggestions.get(request_id)
+            if late is not None:
+                return {"request_id": request_id, "status": "ready", "suggestions": late}
+            if request_id in self._pending_suggestions:
+                return {"request_id": request_id, "status": "pending", "suggestions": []}
+            raise HTTPException(status_code=404, detail="Unknown or expired request_id")
+
         @self._router.post("/confirm_decision")
         async def confirm_decision(request: Request) -> Dict[str, str]:
             """
@@ -458,9 +465,224 @@ class ChatRouter:
             return {"response": "Reset complete"}
         return {"response": "Unknown command"}
 
+    async def stream_events(
+        self,
+        message_text: str,
+        wallet_address: str | None = None,
+        session_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Run the chat pipeline for a message, yielding server-sent events.
+
+        Conversational replies are streamed token by token. Other handlers
+        produce their full response at once. The decision packet is computed
+        over the final assembled text, exactly as in the JSON endpoint.
+
+        Args:
+            message_text: Raw user message
+            wallet_address: Connected wallet, if any
+            session_id: Optional session ID for context memory
+
+        Yields:
+            str: Encoded server-sent events
+        """
+        request_id = uuid4().hex
+        # StreamingResponse drives this generator in its own task
+        set_request_context(RequestContext(request_id, wallet_address, session_id))
+        try:
+
+            with timed("chat.route"):
+                ai_action, route, dispatch = await self.resolve_route(
+                    message_text, session_id=session_id
+                )
+            yield _sse("route", {"request_id": request_id, "route": ai_action})
+
+            if route == SemanticRouterResponse.CONVERSATIONAL:
+                prompt, _, _ = self.prompts.get_formatted_prompt(
+                    "conversational", user_input=message_text, context="", image_data=""
+                )
+                retrieved_docs = await self.ai.rag_processor.retrieve_relevant_docs(
+                    query=message_text
+                )
+                yield _sse(
+                    "retrieved_docs",
+                    [
+                        {"content": doc.content, "metadata": doc.metadata, "score": score}
+                        for doc, score in zip(
+                            retrieved_docs.documents, retrieved_docs.scores, strict=False
+                        )
+                    ],
+                )
+                parts = []
+                async with aclosing(
+                    self.ai.stream_message(
+                        prompt,
+                        session_id=session_id,
+                        retrieved_docs=retrieved_docs,
+                        question=message_text,
+                    )
+                ) as chunks:
+                    async for chunk in chunks:
+                        parts.append(chunk)
+                        yield _sse("token", {"text": chunk})
+                handler_response: dict[str, Any] = {"response": "".join(parts)}
+            else:
+                with timed(f"chat.handler.{ai_action}"):
+                    handler_response = await dispatch()
+                if "response" in handler_response:
+                    yield _sse("token", {"text": handler_response["response"]})
+                for key in ("transaction", "transactions"):
+                    if handler_response.get(key):
+                        yield _sse("transaction", {key: handler_response[key]})
+
+            if "response" in handler_response:
+                queue: asyncio.Queue[tuple[str, Any] | None] = asyncio.Queue()
+
+                async def post_process() -> None:
+                    try:
+                        await self.post_process(
+                            handler_response,
+                            request_id=request_id,
+                            ai_action=ai_action,
+                            message_text=message_text,
+                            wallet_address=wallet_address,
+                            session_id=session_id,
+                            model_id="gemini-1.5-flash",
+                            on_stage=lambda name, value: queue.put_nowait((name, value)),
+                        )
+                    finally:
+                        queue.put_nowait(None)
+
+                post_task = asyncio.create_task(post_process())
+                try:
+                    while (item := await queue.get()) is not None:
+                        name, value = item
+                        if name == "decision_packet" and value:
+                            yield _sse(
+                                "decision_packet",
+                                {
+                                    "decision_packet": value,
+                                    "decision_logger_address": settings.decision_logger_address,
+                                },
+                            )
+                        elif name == "suggestions" and value:
+                            yield _sse("suggestions", value)
+                    await post_task
+                finally:
+                    # The client went away before post-processing finished
+                    if not post_task.done():
+                        post_task.cancel()
+
+            yield _sse(
+                "done",
+                {
+                    "request_id": request_id,
+                    "suggestions_pending": handler_response.get("suggestions_pending", False),
+                },
+            )
+        except Exception as e:
+            self.logger.error("stream_handling_failed", error=str(e))
+            yield _sse("error", {"request_id": request_id, "response": PROCESSING_ERROR})
+
+    async def resolve_route(
+        self, message_text: str, session_id: str | None = None
+    ) -> tuple[str, SemanticRouterResponse | None, Callable[[], Awaitable[dict[str, Any]]]]:
+        """
+        Decide how to handle a message without running the handler yet.
+
+        Direct command words dispatch straight to their handler. Everything
+        else goes through the local intent classifier, falling back to the
+        semantic_router prompt.
+
+        Args:
+            message_text: Raw user message
+            session_id: Optional session ID for context memory
+
+        Returns:
+            tuple: The action recorded in the decision packet, the semantic
+                route (None for direct commands) and a callable that runs
+                the handler
+        """
+        words = message_text.lower().split()
+        command = words[0] if words else ""
+
+        async def reply(text: str) -> dict[str, Any]:
+            return {"response": text}
+
+        if command == "perp":
+            return "CONVERSATIONAL", None, lambda: reply(
+                "Perpetuals trading is not supported. Please use BlazeSwap for token swaps."
+            )
+        if command == "universal":
+            return "CONVERSATIONAL", None, lambda: reply(
+                "Universal router swaps have been removed. Please use 'swap' command for BlazeSwap trading."
+            )
+
+        # Map command words to actions and strict handlers
+        command_map: dict[str, tuple[str, Callable[[str], Awaitable[dict[str, Any]]]]] = {
+            "swap": ("SWAP", self.handle_swap_token),
+            "balance": ("CHECK_BALANCE", self.handle_balance_check),
+            "check": ("CHECK_BALANCE", self.handle_balance_check),
+            "send": ("SEND", self.handle_send_token),
+            "stake": ("STAKE", self.handle_stake_command),
+            "pool": ("POOL", self.handle_add_liquidity),
+            "risk": ("RISK", self.handle_risk_assessment),
+            "attest": ("ATTEST", self.handle_attestation),
+            "help": ("HELP", lambda _: self.handle_help_command()),
+        }
+        if command in command_map:
+            ai_action, handler = command_map[command]
+            return ai_action, None, lambda: handler(message_text)
+
+        routed_message = message_text
+        match = self.intents.classify(message_text)
+        if match:
+            route = match.route
+            if {"amount", "token_in", "token_out"} <= match.params.keys():
+                # Normalise to the format handle_swap_token parses
+                routed_message = (
+                    f"swap {match.params['amount']} "
+                    f"{match.params['token_in']} to {match.params['token_out']}"
+                )
+        else:
+            route = await self.route_with_llm(message_text)
+        return route.value, route, lambda: self.route_message(
+            route, routed_message, session_id=session_id
+        )
+
+    async def route_with_llm(self, message: str) -> SemanticRouterResponse:
+        """
+        Classify a message with the semantic_router prompt.
+
+        The prompt is self-contained, so identical concurrent messages share
+        a single Gemini call.
+
+        Args:
+            message: Message to route
+
+        Returns:
+            SemanticRouterResponse: Route returned by the model
+        """
+        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+            "semantic_router", user_input=message
+        )
+
+        async def classify() -> SemanticRouterResponse:
+            route_response = await self.executor.run(
+                GEMINI,
+                self.ai.generate,
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
+            )
+            return SemanticRouterResponse(route_response.text.strip())
+
+        return await router_flight.do(" ".join(message.lower().split()), classify)
+
     async def get_semantic_route(self, message: str) -> SemanticRouterResponse:
         """
-        Determine the semantic route for a message using AI provider.
+        Determine the semantic route for a message, trying the local
+        classifier before the AI provider.
 
         Args:
             message: Message to route
@@ -468,18 +690,140 @@ class ChatRouter:
         Returns:
             SemanticRouterResponse: Determined route for the message
         """
+        match = self.intents.classify(message)
+        if match:
+            return match.route
         try:
-            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                "semantic_router", user_input=message
-            )
-            route_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
-            )
-            return SemanticRouterResponse(route_response.text.strip())
+            return await self.route_with_llm(message)
         except Exception as e:
             self.logger.exception("routing_failed", error=str(e))
             return SemanticRouterResponse.CONVERSATIONAL
 
+    async def post_process(
+        self,
+        handler_response: dict[str, Any],
+        *,
+        request_id: str,
+        ai_action: str,
+        message_text: str,
+        wallet_address: str | None,
+        session_id: str | None,
+        model_id: str,
+        on_stage: Callable[[str, Any], None] | None = None,
+    ) -> None:
+        """
+        Attach the decision packet and suggestions to a handler response.
+
+        FTSO context feeds the decision packet, while suggestions run in
+        parallel. Each stage has its own deadline. Suggestions that miss
+        theirs keep generating and can be fetched from
+        `/suggestions/{request_id}`.
+
+        Args:
+            handler_response: Handler output, updated in place
+            request_id: ID returned to the client for follow-up requests
+            ai_action: Route or command that produced the response
+            message_text: Raw user message
+            wallet_address: Connected wallet, if any
+            session_id: Optional session ID for a stable decision_id
+            model_id: Model recorded in the decision packet
+            on_stage: Optional callback receiving each stage's name and value
+                as soon as that stage succeeds
+        """
+        no_ftso = {
+            "ftso_feed_id": None,
+            "ftso_round_id": None,
+            "ftso_price": None,
+            "ftso_timestamp": None,
+        }
+
+        async def ftso() -> dict[str, Any]:
+            if ai_action not in ["SWAP", "STAKE", "POOL", "SEND"]:
+                return no_ftso
+            # Heuristic: Default to FLR context if relevant action, or look for token
+            target_token = "FLR"
+            for t in ["WC2FLR", "WETH", "BTC", "USDT"]:
+                if t in message_text.upper():
+                    target_token = t
+                    break
+            return await get_ftso_context(self.blockchain, target_token)
+
+        async def decision_packet(ftso: dict[str, Any]) -> dict[str, Any]:
+            # Maintain stable decision_id per session
+            stable_decision_id = None
+            if session_id:
+                stable_decision_id = self.session_decisions.get(session_id) or uuid4()
+                # Re-set on every use so the TTL is measured from last activity
+                self.session_decisions.set(session_id, stable_decision_id)
+
+            packet = self.interceptor.intercept(
+                wallet_address=wallet_address or "0x0000000000000000000000000000000000000000",
+                ai_action=ai_action,
+                user_input=message_text,
+                ai_response_text=handler_response["response"],
+                transaction_data=handler_response.get("transaction"),
+                model_id=model_id,
+                ftso_feed_id=ftso.get("ftso_feed_id"),
+                ftso_round_id=ftso.get("ftso_round_id"),
+                ftso_price=ftso.get("ftso_price"),
+                ftso_timestamp=ftso.get("ftso_timestamp"),
+                decision_id=stable_decision_id,
+            )
+            return packet.model_dump()
+
+        def report(name: str, outcome: StageOutcome) -> None:
+            record_stage(
+                f"post_process.{name}", outcome.elapsed, error=outcome.status != OK
+            )
+            if on_stage and outcome.status == OK:
+                on_stage(name, outcome.value)
+
+        result = await run_stages(
+            [
+                Stage("ftso", ftso, timeout=settings.ftso_stage_timeout, default=no_ftso),
+                Stage(
+                    "decision_packet",
+                    decision_packet,
+                    deps=("ftso",),
+                    timeout=settings.decision_packet_stage_timeout,
+                ),
+                Stage(
+                    "suggestions",
+                    lambda: self.get_suggestions(handler_response["response"]),
+                    timeout=settings.suggestions_stage_timeout,
+                    default=[],
+                    detach_on_timeout=True,
+                ),
+            ],
+            on_complete=report,
+        )
+        self.logger.debug("post_process", request_id=request_id, stages=result.timings())
+
+        handler_response["request_id"] = request_id
+        packet = result.value("decision_packet")
+        if packet is not None:
+            handler_response["decision_packet"] = packet
+            handler_response["decision_logger_address"] = settings.decision_logger_address
+
+        if result.value("suggestions"):
+            handler_response["suggestions"] = result.value("suggestions")
+        late = result.detached.get("suggestions")
+        if late is not None:
+            self._pending_suggestions[request_id] = late
+            late.add_done_callback(
+                lambda task: self._store_late_suggestions(request_id, task)
+            )
+            handler_response["suggestions_pending"] = True
+
+    def _store_late_suggestions(
+        self, request_id: str, task: asyncio.Task[list[str]]
+    ) -> None:
+        """Move a finished background suggestions task into the TTL cache."""
+        self._pending_suggestions.pop(request_id, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.late_suggestions.set(request_id, task.result())
+
     async def get_suggestions(self, ai_response: str) -> list[str]:
         """
         Generate dynamic suggestions based on the AI response.
@@ -488,8 +832,8 @@ class ChatRouter:
             prompt, mime_type, _ = self.prompts.get_formatted_prompt(
                 "suggestions_generator", ai_response=ai_response, context=""
             )
-            response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type
+            response = await self.executor.run(
+                GEMINI, self.ai.generate, prompt=prompt, response_mime_type=mime_type
             )
             import json
             suggestions = json.loads(response.text)
@@ -574,23 +918,24 @@ class ChatRouter:
 
     async def handle_balance_check(self, message: str) -> dict[str, str]:
         """Handle balance check requests - supports native FLR and ERC20 tokens."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {
                 "response": "Please make sure your wallet is connected to check your balance."
             }
 
         try:
-            # Get native balance
-            native_balance = self.blockchain.check_balance()
-            native_symbol = self.blockchain.native_symbol
-
-            # Get all token balances including zero balances using blazeswap tokens
-            token_balances = self.blockchain.check_all_token_balances(
-                self.blazeswap.tokens, self.blazeswap.token_decimals, include_zero=True
+            await self.blazeswap.ensure_network()
+            # Native and all blazeswap token balances (including zero) in one batched read
+            (wallet,) = await self.blockchain.get_wallet_balances(
+                [self.wallet_address],
+                self.blazeswap.tokens,
+                self.blazeswap.token_decimals,
             )
+            native_balance, token_balances = wallet.native, wallet.tokens
+            native_symbol = self.blockchain.native_symbol
 
             # Build response
-            response = f"Your wallet holdings ({self.blockchain.address[:6]}...{self.blockchain.address[-4:]}):\n\n"
+            response = f"Your wallet holdings ({self.wallet_address[:6]}...{self.wallet_address[-4:]}):\n\n"
             response += f"• **{native_symbol}**: {native_balance:,.6f}\n"
 
             # Separate tokens with balance from those with zero balance
@@ -620,28 +965,38 @@ class ChatRouter:
         Returns:
             dict[str, str]: Response containing transaction preview or follow-up prompt
         """
-        if not self.blockchain.address:
+        if not self.wallet_address:
             await self.handle_generate_account(message)
 
-        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-            "token_send", user_input=message
-        )
-        send_token_response = self.ai.generate(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
-        )
-        send_token_json = json.loads(send_token_response.text)
+        # Well-formed sends are parsed locally; only free-form text needs the LLM
+        send_token_json = self.intents.parse_send(message)
+        if send_token_json is None:
+            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                "token_send", user_input=message
+            )
+            send_token_response = await self.executor.run(
+                GEMINI,
+                self.ai.generate,
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
+            )
+            send_token_json = json.loads(send_token_response.text)
         expected_json_len = 2
         if (
             len(send_token_json) != expected_json_len
             or send_token_json.get("amount") == 0.0
         ):
             prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
+            follow_up_response = await self.executor.run(
+                GEMINI, self.ai.generate, prompt
+            )
             return {"response": follow_up_response.text}
 
-        tx = self.blockchain.create_send_flr_tx(
+        tx = await self.blockchain.create_send_flr_tx(
             to_address=send_token_json.get("to_address"),
             amount=send_token_json.get("amount"),
+            from_address=self.wallet_address,
         )
         self.logger.debug("send_token_tx", tx=tx)
 
@@ -669,7 +1024,7 @@ class ChatRouter:
 
     async def handle_swap_token(self, message: str) -> dict[str, str]:
         """Handle token swap requests."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
@@ -689,6 +1044,7 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
             token_out = parts[4].upper()
 
             # Validate tokens using blazeswap instance
+            await self.blazeswap.ensure_network()
             supported_tokens = list(self.blazeswap.tokens.keys())
             if token_in != "FLR" and token_in not in supported_tokens:
                 return {
@@ -705,26 +1061,49 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
                 token_in=token_in,
                 token_out=token_out,
                 amount_in=amount,
-                wallet_address=self.blockchain.address,
+                wallet_address=self.wallet_address,
                 router_address=self.blazeswap.contracts["router"],
             )
 
             # Convert transaction to JSON string - frontend expects 'transactions' (plural)
-            transaction_json = json.dumps([swap_data["transaction"]])  # Wrap in array
+            approval_tx = swap_data.get("approval_transaction")
+            if approval_tx:
+                # The approval must be signed first; the swap takes the next nonce
+                transaction_json = json.dumps(
+                    [
+                        {"tx": approval_tx, "description": f"1. Approve {amount} {token_in}"},
+                        {
+                            "tx": swap_data["transaction"],
+                            "description": f"2. Swap {amount} {token_in} for {token_out}",
+                        },
+                    ]
+                )
+            else:
+                transaction_json = json.dumps([swap_data["transaction"]])  # Wrap in array
 
             # Format the response based on the tokens involved
             min_amount = self.blockchain.w3.from_wei(
                 swap_data["min_amount_out"], "ether"
             )
-
+            route_details = ""
+            if len(swap_data.get("route", [])) > 2:  # noqa: PLR2004
+                route_details += f"- Route: {' → '.join(swap_data['route'])}\n"
+            if swap_data.get("price_impact") is not None:
+                route_details += f"- Price impact: {swap_data['price_impact']:.2%}\n"
 
             return {
                 "response": f"Ready to swap {amount} {token_in} for {token_out}.\n\n"
                 + "Transaction details:\n"
-                + f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+                + f"- From: {self.wallet_address[:6]}...{self.wallet_address[-4:]}\n"
                 + f"- Amount: {amount} {token_in}\n"
-                + f"- Minimum received: {min_amount} {token_out}\n\n"
-                + "Please confirm the transaction in your wallet.",
+                + f"- Minimum received: {min_amount} {token_out}\n"
+                + route_details
+                + (
+                    f"\nThis swap needs two transactions: approve {token_in}, then swap. "
+                    "Please confirm each transaction in your wallet."
+                    if approval_tx
+                    else "\nPlease confirm the transaction in your wallet."
+                ),
                 "transactions": transaction_json,  # Changed from 'transaction' to 'transactions'
             }
 
@@ -752,7 +1131,7 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
 
     async def handle_cross_chain_swap(self, message: str) -> dict[str, str]:
         """Handle cross-chain token swap requests."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {
                 "response": "Please connect your wallet first to perform cross-chain swaps."
             }
@@ -762,8 +1141,12 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "cross_chain_swap", user_input=message
             )
-            swap_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            swap_response = await self.executor.run(
+                GEMINI,
+                self.ai.generate,
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
             )
 
             # The schema ensures we get FLR to WC2FLR with just the amount
@@ -790,7 +1173,9 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
             dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await self.executor.run(
+            GEMINI, self.ai.generate, prompt=prompt
+        )
         self.attestation.attestation_requested = True
         return {"response": request_attestation_response.text}
 
@@ -801,7 +1186,9 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
         prompt, _, _ = self.prompts.get_formatted_prompt(
             "conversational", user_input=message, context="", image_data=""
         )
-        response = await self.ai.send_message(prompt, session_id=session_id)
+        response = await self.ai.send_message(
+            prompt, session_id=session_id, question=message
+        )
         return {"response": response.text}
 
     async def handle_onboarding(self, _: str) -> dict[str, str]:
@@ -912,7 +1299,7 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
 
     async def handle_stake_command(self, message: str) -> dict[str, str]:
         """Handle FLR staking to sFLR requests."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
@@ -925,9 +1312,9 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
             amount = parsed_command["amount"]
 
             # Prepare staking transaction
-            stake_data = stake_flr_to_sflr(
+            stake_data = await stake_flr_to_sflr(
                 web3_provider_url=self.blockchain.w3.provider.endpoint_uri,
-                wallet_address=self.blockchain.address,
+                wallet_address=self.wallet_address,
                 amount=amount,
             )
 
@@ -940,7 +1327,7 @@ Supported tokens: FLR, WFLR, WC2FLR, USDT, WETH, FLX"""
             return {
                 "response": f"Ready to stake {amount} FLR to sFLR.\n\n"
                 + "Transaction details:\n"
-                + f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+                + f"- From: {self.wallet_address[:6]}...{self.wallet_address[-4:]}\n"
                 + f"- Amount: {amount} FLR\n"
                 + f"- Contract: {SFLR_CONTRACT_ADDRESS[:6]}...{SFLR_CONTRACT_ADDRESS[-4:]}\n\n"
                 + "Please confirm the transaction in your wallet.",
@@ -992,7 +1379,7 @@ You can also ask me general questions about DeFi on Flare Network!
 
     async def handle_add_liquidity_nat(self, message: str) -> dict[str, str]:
         """Handle adding liquidity with native FLR and a token."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
@@ -1013,40 +1400,19 @@ Supported tokens: WC2FLR, USDT, WETH, FLX"""
             token = parts[4].upper()
 
             # Validate token using blazeswap instance
+            await self.blazeswap.ensure_network()
             supported_tokens = list(self.blazeswap.tokens.keys())
             if token not in supported_tokens or token == "FLR" or token == "WFLR":
                 return {
                     "response": f"Unsupported token: {token}. Supported tokens: {', '.join([t for t in supported_tokens if t not in ['FLR', 'WFLR']])}"
                 }
 
-            # Get token pair price to calculate the equivalent amount of token
-            # This is a simplified approach - in a real implementation, you would query the pool for the current ratio
-            # For now, we'll use a hardcoded ratio for FLR/WC2FLR and default to 1:1 for other pairs
-            token_ratios = {
-                "FLR_WC2FLR": 1.0,  # 1 FLR = 1 WC2FLR (1:1 wrap)
-                "WC2FLR_FLR": 1.0,  # 1 WC2FLR = 1 FLR
-                "FLR_FLX": 0.135,  # Approximate ratio (adjusted)
-                "FLX_FLR": 7.4,  # Approximate ratio (adjusted)
-            }
-
-            # Determine the pair key
-            pair_key = f"FLR_{token}"
-            reverse_pair_key = f"{token}_FLR"
-
-            # Calculate amount_token based on the ratio
-            amount_token = 0
-            if pair_key in token_ratios:
-                amount_token = amount_flr * token_ratios[pair_key]
-                print(f"Debug - Using ratio {token_ratios[pair_key]} for {pair_key}")
-            elif reverse_pair_key in token_ratios:
-                amount_token = amount_flr / token_ratios[reverse_pair_key]
-                print(
-                    f"Debug - Using inverse ratio 1/{token_ratios[reverse_pair_key]} for {reverse_pair_key}"
-                )
-            else:
-                # Default to 1:1 ratio if we don't have a specific ratio
+            # Size the token deposit at the pool's current reserve ratio
+            amount_token = await self.blazeswap.liquidity_amount("FLR", token, amount_flr)
+            if amount_token is None:
+                # No pool yet: the first deposit sets the price, default to 1:1
                 amount_token = amount_flr
-                print(f"Debug - Using default 1:1 ratio for {pair_key}")
+                print(f"Debug - No reserves for FLR/{token}, using 1:1 ratio")
 
             # Round to appropriate decimal places based on token
             if token.upper() == "WC2FLR":
@@ -1063,7 +1429,7 @@ Supported tokens: WC2FLR, USDT, WETH, FLX"""
                 token=token,
                 amount_token=amount_token,
                 amount_flr=amount_flr,
-                wallet_address=self.blockchain.address,
+                wallet_address=self.wallet_address,
                 router_address=self.blazeswap.contracts["router"],
             )
 
@@ -1115,7 +1481,7 @@ Supported tokens: WC2FLR, USDT, WETH, FLX"""
                 response_message += f"2. Add liquidity with FLR and {token}\n\n"
 
             response_message += "Transaction details:\n"
-            response_message += f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+            response_message += f"- From: {self.wallet_address[:6]}...{self.wallet_address[-4:]}\n"
             response_message += f"- FLR amount: {amount_flr} (min: {liquidity_data['amount_flr_min']})\n"
             response_message += f"- {token} amount: {amount_token:.6f} (min: {liquidity_data['amount_token_min']})\n\n"
             response_message += f"Please confirm {'each transaction' if needs_approval else 'the transaction'} in your wallet."
@@ -1130,7 +1496,7 @@ Supported tokens: WC2FLR, USDT, WETH, FLX"""
 
     async def handle_add_liquidity(self, message: str) -> dict[str, str]:
         """Handle adding liquidity with two tokens."""
-        if not self.blockchain.address:
+        if not self.wallet_address:
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
@@ -1152,6 +1518,7 @@ Supported tokens: WFLR, WC2FLR, USDT, WETH, FLX"""
             token_b = parts[4].upper()
 
             # Validate tokens using blazeswap instance
+            await self.blazeswap.ensure_network()
             supported_tokens = list(self.blazeswap.tokens.keys())
 
             # Special case: if either token is FLR, redirect to handle_add_liquidity_nat
@@ -1183,34 +1550,12 @@ Supported tokens: WFLR, WC2FLR, USDT, WETH, FLX"""
             if token_b == "WFLR":
                 print(f"Debug - Using WFLR as token B: {self.blazeswap.tokens['WFLR']}")
 
-            # Get token pair price to calculate the equivalent amount of token B
-            # This is a simplified approach - in a real implementation, you would query the pool for the current ratio
-            # For now, we'll use a hardcoded ratio for WFLR/WC2FLR and default to 1:1 for other pairs
-            token_ratios = {
-                "WFLR_WC2FLR": 1.0,  # 1 WFLR = 1 WC2FLR (1:1 wrap)
-                "WC2FLR_WFLR": 1.0,  # 1 WC2FLR = 1 WFLR
-                "WFLR_FLX": 0.135,  # Approximate ratio (adjusted)
-                "FLX_WFLR": 7.4,  # Approximate ratio (adjusted)
-            }
-
-            # Determine the pair key
-            pair_key = f"{token_a}_{token_b}"
-            reverse_pair_key = f"{token_b}_{token_a}"
-
-            # Calculate amount_b based on the ratio
-            amount_b = 0
-            if pair_key in token_ratios:
-                amount_b = amount_a * token_ratios[pair_key]
-                print(f"Debug - Using ratio {token_ratios[pair_key]} for {pair_key}")
-            elif reverse_pair_key in token_ratios:
-                amount_b = amount_a / token_ratios[reverse_pair_key]
-                print(
-                    f"Debug - Using inverse ratio 1/{token_ratios[reverse_pair_key]} for {reverse_pair_key}"
-                )
-            else:
-                # Default to 1:1 ratio if we don't have a specific ratio
+            # Size the token B deposit at the pool's current reserve ratio
+            amount_b = await self.blazeswap.liquidity_amount(token_a, token_b, amount_a)
+            if amount_b is None:
+                # No pool yet: the first deposit sets the price, default to 1:1
                 amount_b = amount_a
-                print(f"Debug - Using default 1:1 ratio for {pair_key}")
+                print(f"Debug - No reserves for {token_a}/{token_b}, using 1:1 ratio")
 
             # Round to appropriate decimal places based on token
             if token_b.upper() == "WC2FLR":
@@ -1228,7 +1573,7 @@ Supported tokens: WFLR, WC2FLR, USDT, WETH, FLX"""
                 token_b=token_b,
                 amount_a=amount_a,
                 amount_b=amount_b,
-                wallet_address=self.blockchain.address,
+                wallet_address=self.wallet_address,
                 router_address=self.blazeswap.contracts["router"],
             )
 
@@ -1264,7 +1609,7 @@ Supported tokens: WFLR, WC2FLR, USDT, WETH, FLX"""
                 response_message += f"- Add liquidity with {token_a} and {token_b}\n\n"
 
             response_message += "Transaction details:\n"
-            response_message += f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+            response_message += f"- From: {self.wallet_address[:6]}...{self.wallet_address[-4:]}\n"
             response_message += f"- {token_a} amount: {amount_a} (min: {liquidity_data['amount_a_min']})\n"
             response_message += f"- {token_b} amount: {amount_b:.6f} (min: {liquidity_data['amount_b_min']})\n\n"
             response_message += f"Please confirm {'each transaction' if num_approvals > 0 else 'the transaction'} in your wallet."
@@ -6,6 +6,7 @@ from eth_abi import encode
 from pathlib import Path
 import json
 
+from flare_ai_defai.blockchain.web3_client import get_async_web3
 from flare_ai_defai.decision_packet import DecisionPacket, hash_decision_packet
 from flare_ai_defai.settings import settings
 
@@ -56,13 +57,13 @@ async def log_decision(request: LogDecisionRequest) -> LogDecisionResponse:
 
     # 1.5 Replay Protection (On-Chain)
     try:
-        w3 = Web3(Web3.HTTPProvider(settings.flare_rpc_url))
+        w3 = get_async_web3(settings.flare_rpc_url)
         abi = get_abi()
         if abi:
             contract = w3.eth.contract(address=settings.decision_logger_address, abi=abi)
             # Check isDecisionLogged(bytes32)
             decision_id_bytes = packet.decision_id.bytes.ljust(32, b'\0')
-            is_logged = contract.functions.isDecisionLogged(decision_id_bytes).call()
+            is_logged = await contract.functions.isDecisionLogged(decision_id_bytes).call()
             if is_logged:
                 raise HTTPException(status_code=409, detail="Decision already logged on-chain")
     except HTTPException:
@@ -9,6 +9,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from web3 import Web3
 
+from flare_ai_defai.blockchain.web3_client import get_async_web3
 from flare_ai_defai.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -77,7 +78,7 @@ async def verify_decision(decision_id: UUID) -> VerificationResponse:
     
     try:
         # 1. Setup Web3 and Contract
-        w3 = Web3(Web3.HTTPProvider(settings.flare_rpc_url))
+        w3 = get_async_web3(settings.flare_rpc_url)
         abi = get_abi()
         if not abi:
             raise HTTPException(status_code=500, detail="Contract ABI not found")
@@ -93,7 +94,7 @@ async def verify_decision(decision_id: UUID) -> VerificationResponse:
         
         # 3. Call decisions() view function
         # Returns: (decisionId, ipfsCidHash, domainHash, chosenModelHash, subject, timestamp)
-        decision_data = contract.functions.decisions(decision_id_bytes).call()
+        decision_data = await contract.functions.decisions(decision_id_bytes).call()
         
         # Check if exists (timestamp 0 means not registered)
         if decision_data[5] == 0:
@@ -113,11 +114,12 @@ async def verify_decision(decision_id: UUID) -> VerificationResponse:
         tx_hash = None
         block_number = None
         try:
-            event_filter = contract.events.DecisionRegistered.create_filter(
-                fromBlock=0,
+            # eth_getLogs rather than a node-side filter, which would not
+            # survive being routed to another pooled endpoint
+            events = await contract.events.DecisionRegistered.get_logs(
+                from_block=0,
                 argument_filters={'decisionId': decision_id_bytes}
             )
-            events = event_filter.get_all_entries()
             if events:
                 tx_hash = events[0].transactionHash.hex()
                 block_number = events[0].blockNumber
@@ -0,0 +1,83 @@
+"""
+Wallet Routes
+
+Bulk balance lookups for back-office dashboards. Balances for every wallet
+and token in a request are read through the chat router's `FlareProvider`,
+which batches them with Multicall3.
+"""
+
+import structlog
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+from web3 import Web3
+
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+router = APIRouter(prefix="/wallets", tags=["wallets"])
+
+
+class BulkBalanceRequest(BaseModel):
+    addresses: list[str]
+    # Token symbols to include; all supported tokens when omitted
+    tokens: list[str] | None = None
+
+
+class WalletBalanceResponse(BaseModel):
+    address: str
+    native: float
+    tokens: dict[str, float]
+
+
+class BulkBalanceResponse(BaseModel):
+    native_symbol: str
+    wallets: list[WalletBalanceResponse]
+
+
+@router.post("/balances", response_model=BulkBalanceResponse)
+async def bulk_balances(body: BulkBalanceRequest, request: Request) -> BulkBalanceResponse:
+    """
+    Return native and ERC20 balances for many wallets.
+
+    Token symbols and decimals come from the BlazeSwap token table of the
+    chat router stored in app state.
+    """
+    if not body.addresses:
+        raise HTTPException(status_code=400, detail="No addresses given")
+    if len(body.addresses) > settings.bulk_balance_max_wallets:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.bulk_balance_max_wallets} addresses per request",
+        )
+    invalid = [a for a in body.addresses if not Web3.is_address(a)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid addresses: {invalid}")
+
+    chat = request.app.state.chat_router
+    try:
+        await chat.blazeswap.ensure_network()
+    except Exception as e:
+        logger.exception("chain_detection_failed")
+        raise HTTPException(status_code=502, detail=str(e)) from e
+    tokens = chat.blazeswap.tokens
+    if body.tokens is not None:
+        unknown = sorted(set(body.tokens) - set(tokens))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unsupported tokens: {unknown}")
+        tokens = {symbol: tokens[symbol] for symbol in body.tokens}
+
+    try:
+        balances = await chat.blockchain.get_wallet_balances(
+            body.addresses, tokens, chat.blazeswap.token_decimals
+        )
+    except Exception as e:
+        logger.exception("bulk_balances_failed", wallets=len(body.addresses))
+        raise HTTPException(status_code=502, detail=str(e)) from e
+
+    return BulkBalanceResponse(
+        native_symbol=chat.blockchain.native_symbol,
+        wallets=[
+            WalletBalanceResponse(address=b.address, native=b.native, tokens=b.tokens)
+            for b in balances
+        ],
+    )
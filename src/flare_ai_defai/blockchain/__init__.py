@@ -1,10 +1,31 @@
 from .blazeswap import BlazeSwapHandler
+from .fee_oracle import FeeOracle, Fees, get_fee_oracle
 from .flare import FlareProvider
+from .ftso_context import FtsoCache, FtsoSnapshot, get_ftso_context
+from .multicall import Multicall, WalletBalances
+from .nonce_manager import NonceManager, get_nonce_manager
+from .pool_registry import PoolRegistry
+from .quote import Quote, QuoteEngine
+from .rpc_pool import RPCPoolProvider
 from .sflr_staking import get_sflr_balance, parse_stake_command, stake_flr_to_sflr
 
 __all__ = [
     "BlazeSwapHandler",
+    "FeeOracle",
+    "Fees",
     "FlareProvider",
+    "FtsoCache",
+    "FtsoSnapshot",
+    "Multicall",
+    "NonceManager",
+    "PoolRegistry",
+    "Quote",
+    "QuoteEngine",
+    "RPCPoolProvider",
+    "WalletBalances",
+    "get_fee_oracle",
+    "get_ftso_context",
+    "get_nonce_manager",
     "get_sflr_balance",
     "parse_stake_command",
     "stake_flr_to_sflr",
@@ -1,325 +1,493 @@
+import asyncio
 import time
 from typing import Any
 
 from web3 import Web3
-
-
-class BlazeSwapHandler:
-    def __init__(self, web3_provider_url: str):
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
-
-        # Check if we're on mainnet or testnet
-        chain_id = self.w3.eth.chain_id
-        if chain_id == 14:  # Flare mainnet
-            # Mainnet addresses
-            self.contracts = {
-                "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Flare
-                "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Flare
-            }
-            self.tokens = {
-                "FLR": "native",
-                "WFLR": "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",  # Wrapped FLR on mainnet
-                "USDT": "0xC1A5B41512496B80903D1f32d6dEa3a73212E71F",  # USDT on Flare
-                "WETH": "0x1502FA4be69d526124D453619276FacCab275d3D",  # WETH on Flare
-                "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
-            }
-            self.wrapped_native_symbol = "WFLR"
-            # Token decimals
-            self.token_decimals = {
-                "FLR": 18,
-                "WFLR": 18,
-                "USDT": 6,
-                "WETH": 18,
-                "FLX": 18,
-            }
-        else:
-            # Coston2 testnet addresses
-            self.contracts = {
-                "router": "0x56a6552B5a9351C83A354C9359e9C179471f0084",  # BlazeSwap Router on Coston2
-                "factory": "0xf8866E8783451FE5A24Bde49e0839eD068307270",  # BlazeSwap Factory on Coston2
-            }
-            self.tokens = {
-                "C2FLR": "native",
-                "WC2FLR": "0xC67DCE33D7A8efA5FfEB961899C73fe01bCe9273",  # Wrapped C2FLR
-                "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
-                "sFLR": "0x12e605bc104e93B45e1aD99F9e555f659051c2BB",  # Staked FLR
-            }
-            self.wrapped_native_symbol = "WC2FLR"
-            # Token decimals
-            self.token_decimals = {
-                "C2FLR": 18,
-                "WC2FLR": 18,
-                "FLX": 18,
-                "sFLR": 18,
-            }
-
-        # Convert contract addresses to checksum addresses
-        self.contracts["router"] = self.w3.to_checksum_address(self.contracts["router"])
-        self.contracts["factory"] = self.w3.to_checksum_address(
-            self.contracts["factory"]
-        )
-
-        # Convert token addresses to checksum addresses (except "native")
-        for token, address in self.tokens.items():
-            if address != "native":
-                self.tokens[token] = self.w3.to_checksum_address(address)
-
-        print(f"Debug - Router address: {self.contracts['router']}")
-        print(f"Debug - Factory address: {self.contracts['factory']}")
-        print(f"Debug - Token addresses: {self.tokens}")
-
-        # ERC20 ABI (for approvals)
-        self.erc20_abi = [
+from web3.contract import AsyncContract
+
+from flare_ai_defai.blockchain.fee_oracle import get_fee_oracle
+from flare_ai_defai.blockchain.pool_registry import PoolRegistry, pair_key
+from flare_ai_defai.blockchain.quote import NoRouteError, Quote, QuoteEngine
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
+
+# Shares router getAmountsOut fallback quotes between identical concurrent swaps
+quote_flight = SingleFlight("blazeswap_quote")
+
+FLARE_CHAIN_ID = 14
+COSTON2_CHAIN_ID = 114
+
+# BlazeSwap contracts and tokens per chain ID. Any other chain is treated as
+# Coston2. Token and contract tables are copied into each handler once its
+# chain is known.
+NETWORKS: dict[int, dict[str, Any]] = {
+    FLARE_CHAIN_ID: {
+        "contracts": {
+            "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Flare
+            "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Flare
+        },
+        "tokens": {
+            "FLR": "native",
+            "WFLR": "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",  # Wrapped FLR on mainnet
+            "USDT": "0xC1A5B41512496B80903D1f32d6dEa3a73212E71F",  # USDT on Flare
+            "WETH": "0x1502FA4be69d526124D453619276FacCab275d3D",  # WETH on Flare
+            "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
+        },
+        "wrapped_native_symbol": "WFLR",
+        "token_decimals": {
+            "FLR": 18,
+            "WFLR": 18,
+            "USDT": 6,
+            "WETH": 18,
+            "FLX": 18,
+        },
+    },
+    COSTON2_CHAIN_ID: {
+        "contracts": {
+            "router": "0x56a6552B5a9351C83A354C9359e9C179471f0084",  # BlazeSwap Router on Coston2
+            "factory": "0xf8866E8783451FE5A24Bde49e0839eD068307270",  # BlazeSwap Factory on Coston2
+        },
+        "tokens": {
+            "C2FLR": "native",
+            "WC2FLR": "0xC67DCE33D7A8efA5FfEB961899C73fe01bCe9273",  # Wrapped C2FLR
+            "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
+            "sFLR": "0x12e605bc104e93B45e1aD99F9e555f659051c2BB",  # Staked FLR
+        },
+        "wrapped_native_symbol": "WC2FLR",
+        "token_decimals": {
+            "C2FLR": 18,
+            "WC2FLR": 18,
+            "FLX": 18,
+            "sFLR": 18,
+        },
+    },
+}
+
+# ERC20 ABI (for approvals)
+ERC20_ABI = [
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "owner", "type": "address"},
+            {"name": "spender", "type": "address"},
+        ],
+        "name": "allowance",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "spender", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "name": "approve",
+        "outputs": [{"name": "", "type": "bool"}],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# BlazeSwap Router ABI
+ROUTER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_factory", "type": "address"},
+            {"internalType": "address", "name": "_wNat", "type": "address"},
+            {"internalType": "bool", "name": "_splitFee", "type": "bool"},
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenA", "type": "address"},
+            {"internalType": "address", "name": "tokenB", "type": "address"},
             {
-                "constant": True,
-                "inputs": [
-                    {"name": "owner", "type": "address"},
-                    {"name": "spender", "type": "address"},
-                ],
-                "name": "allowance",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountADesired",
+                "type": "uint256",
             },
             {
-                "constant": False,
-                "inputs": [
-                    {"name": "spender", "type": "address"},
-                    {"name": "amount", "type": "uint256"},
-                ],
-                "name": "approve",
-                "outputs": [{"name": "", "type": "bool"}],
-                "payable": False,
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountBDesired",
+                "type": "uint256",
             },
-        ]
-
-        # BlazeSwap Router ABI
-        self.router_abi = [
             {
-                "inputs": [
-                    {"internalType": "address", "name": "_factory", "type": "address"},
-                    {"internalType": "address", "name": "_wNat", "type": "address"},
-                    {"internalType": "bool", "name": "_splitFee", "type": "bool"},
-                ],
-                "stateMutability": "nonpayable",
-                "type": "constructor",
+                "internalType": "uint256",
+                "name": "amountAMin",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {"internalType": "address", "name": "tokenA", "type": "address"},
-                    {"internalType": "address", "name": "tokenB", "type": "address"},
-                    {
-                        "internalType": "uint256",
-                        "name": "amountADesired",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountBDesired",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountAMin",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountBMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "uint256", "name": "feeBipsA", "type": "uint256"},
-                    {"internalType": "uint256", "name": "feeBipsB", "type": "uint256"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "addLiquidity",
-                "outputs": [
-                    {"internalType": "uint256", "name": "amountA", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountB", "type": "uint256"},
-                    {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountBMin",
+                "type": "uint256",
             },
+            {"internalType": "uint256", "name": "feeBipsA", "type": "uint256"},
+            {"internalType": "uint256", "name": "feeBipsB", "type": "uint256"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "addLiquidity",
+        "outputs": [
+            {"internalType": "uint256", "name": "amountA", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountB", "type": "uint256"},
+            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "token", "type": "address"},
             {
-                "inputs": [
-                    {"internalType": "address", "name": "token", "type": "address"},
-                    {
-                        "internalType": "uint256",
-                        "name": "amountTokenDesired",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountTokenMin",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountNATMin",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "feeBipsToken",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "addLiquidityNAT",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountToken",
-                        "type": "uint256",
-                    },
-                    {"internalType": "uint256", "name": "amountNAT", "type": "uint256"},
-                    {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
-                ],
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountTokenDesired",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                ],
-                "name": "getAmountsOut",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amounts",
-                        "type": "uint256[]",
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountTokenMin",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactNATForTokens",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountNATMin",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactTokensForTokens",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "feeBipsToken",
+                "type": "uint256",
             },
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "addLiquidityNAT",
+        "outputs": [
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactTokensForNAT",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountToken",
+                "type": "uint256",
             },
-        ]
-
-        # Add WFLR ABI at the top with other ABIs
-        self.wflr_abi = [
+            {"internalType": "uint256", "name": "amountNAT", "type": "uint256"},
+            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+        ],
+        "name": "getAmountsOut",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amounts",
+                "type": "uint256[]",
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
             {
-                "constant": False,
-                "inputs": [],
-                "name": "deposit",
-                "outputs": [],
-                "payable": True,
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
             },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactNATForTokens",
+        "outputs": [
             {
-                "constant": False,
-                "inputs": [{"name": "wad", "type": "uint256"}],
-                "name": "withdraw",
-                "outputs": [],
-                "payable": False,
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
             },
-        ]
-
-        # BlazeSwap Factory ABI (for pool validation)
-        self.factory_abi = [
             {
-                "constant": True,
-                "inputs": [
-                    {"name": "tokenA", "type": "address"},
-                    {"name": "tokenB", "type": "address"}
-                ],
-                "name": "getPair",
-                "outputs": [{"name": "pair", "type": "address"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
+            },
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
+            },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactTokensForTokens",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
+            },
+            {
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
+            },
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
+            },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactTokensForNAT",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
+            },
+            {
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
+            },
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# WFLR ABI (wrap/unwrap)
+WFLR_ABI = [
+    {
+        "constant": False,
+        "inputs": [],
+        "name": "deposit",
+        "outputs": [],
+        "payable": True,
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [{"name": "wad", "type": "uint256"}],
+        "name": "withdraw",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# BlazeSwap Factory ABI (for pool validation)
+FACTORY_ABI = [
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "tokenA", "type": "address"},
+            {"name": "tokenB", "type": "address"}
+        ],
+        "name": "getPair",
+        "outputs": [{"name": "pair", "type": "address"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+
+class BlazeSwapHandler:
+    # Built once at import and shared by every handler
+    erc20_abi = ERC20_ABI
+    router_abi = ROUTER_ABI
+    wflr_abi = WFLR_ABI
+    factory_abi = FACTORY_ABI
+
+    def __init__(self, web3_provider_url: str, chain_id: int | None = None):
+        # Shares the pooled async client with FlareProvider for the same URL
+        self.w3 = get_async_web3(web3_provider_url)
+        # Block-scoped fees and cached chain ID, shared with FlareProvider
+        self.fee_oracle = get_fee_oracle(web3_provider_url)
+
+        # Construction does no I/O. Unless the chain is given, it is detected
+        # on first use (or by warm_up) through the fee oracle's cached chain ID,
+        # and the contract and token tables are loaded then.
+        self.chain_id: int | None = None
+        if chain_id is not None:
+            self._configure(chain_id)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the chain is known and its tables are loaded."""
+        return self.chain_id is not None
+
+    async def ensure_network(self) -> None:
+        """Detect the chain and load its contracts and tokens on first use."""
+        if self.chain_id is None:
+            chain_id = await self.fee_oracle.chain_id()
+            # Another caller may have finished while this one awaited
+            if self.chain_id is None:
+                self._configure(chain_id)
+
+    async def warm_up(self) -> None:
+        """Detect the chain and load the pool index ahead of the first request."""
+        await self.ensure_network()
+        await self.pool_registry.ensure_loaded()
+
+    def stats(self) -> dict[str, Any]:
+        """Report pool index and quote counters (None until the chain is known)."""
+        return {
+            "pool_registry": self.pool_registry.stats() if self.ready else None,
+            "quotes": self.quotes.stats() if self.ready else None,
+        }
+
+    def _configure(self, chain_id: int) -> None:
+        network = NETWORKS.get(chain_id, NETWORKS[COSTON2_CHAIN_ID])
+        # Checksummed copies, so handlers never share mutable tables
+        self.contracts = {
+            name: Web3.to_checksum_address(address)
+            for name, address in network["contracts"].items()
+        }
+        self.tokens = {
+            symbol: address if address == "native" else Web3.to_checksum_address(address)
+            for symbol, address in network["tokens"].items()
+        }
+        self.wrapped_native_symbol = network["wrapped_native_symbol"]
+        self.token_decimals = dict(network["token_decimals"])
+
+        # Indexed factory pairs; pool checks are lookups instead of getPair calls
+        self.pool_registry = PoolRegistry.from_settings(self.w3, self.contracts["factory"])
+        # Local quotes and liquidity sizing from per-block cached reserves of
+        # the pools that can route between the configured tokens
+        self.quotes = QuoteEngine(
+            self.w3,
+            self.pool_registry,
+            tokens={
+                self.tokens[self.wrapped_native_symbol]
+                if address == "native"
+                else address
+                for address in self.tokens.values()
+            },
+        )
+        self.chain_id = chain_id
+
+        print(f"Debug - Router address: {self.contracts['router']}")
+        print(f"Debug - Factory address: {self.contracts['factory']}")
+        print(f"Debug - Token addresses: {self.tokens}")
+
+    async def _route(
+        self, router: AsyncContract, amount_in_wei: int, token_in: str, token_out: str
+    ) -> Quote:
+        """
+        Find the best route from cached reserves, falling back to the router.
+
+        If the local search cannot run (e.g. reserves could not be read), the
+        direct pair is quoted with the router's getAmountsOut; identical
+        concurrent fallback quotes share one call.
+
+        Args:
+            router: BlazeSwap router contract
+            amount_in_wei: Input amount in the input token's smallest unit
+            token_in: Address of the input token (wrapped for native)
+            token_out: Address of the output token (wrapped for native)
+
+        Returns:
+            Quote: Path and amounts at each hop of the best route
+
+        Raises:
+            NoRouteError: If no route of up to swap_max_hops pools exists
+        """
+        try:
+            return await self.quotes.best_route(amount_in_wei, token_in, token_out)
+        except NoRouteError:
+            raise
+        except Exception as e:
+            print(f"Debug - Local routing failed, asking router: {e!s}")
+        path = [token_in, token_out]
+        amounts = await quote_flight.do(
+            (router.address, amount_in_wei, tuple(path)),
+            lambda: router.functions.getAmountsOut(amount_in_wei, path).call(),
+        )
+        return Quote(tuple(path), tuple(amounts))
+
+    async def liquidity_amount(
+        self, token_a: str, token_b: str, amount_a: float
+    ) -> float | None:
+        """
+        Size a token B deposit matching `amount_a` of token A at the pool ratio.
+
+        Args:
+            token_a: Symbol of the token whose amount is fixed (FLR maps to
+                the wrapped native token)
+            token_b: Symbol of the other token
+            amount_a: Token A amount
+
+        Returns:
+            float | None: Token B amount, or None if the pool does not exist
+                or is empty
+        """
+        await self.ensure_network()
+        address_a, address_b = self._pool_token(token_a), self._pool_token(token_b)
+        if not address_a or not address_b or address_a == address_b:
+            return None
+        decimals_a = self.token_decimals.get(token_a.upper(), 18)
+        decimals_b = self.token_decimals.get(token_b.upper(), 18)
+        amount_b = await self.quotes.liquidity_amount(
+            address_a, address_b, int(amount_a * 10**decimals_a)
+        )
+        return None if amount_b is None else amount_b / 10**decimals_b
+
+    async def _fee_params(self, wallet_address: str) -> dict[str, int]:
+        """
+        Fetch the pending nonce and the fee oracle's transaction fields concurrently.
+
+        These transactions are signed and sent by the user's wallet, so the
+        nonce is read from the chain rather than reserved locally; a preview
+        that is never signed must not push later previews past a gap.
+
+        Args:
+            wallet_address: Address whose nonce is used for the transaction
+
+        Returns:
+            dict: nonce plus maxFeePerGas, maxPriorityFeePerGas, chainId and type
+        """
+        nonce, tx_params = await asyncio.gather(
+            self.w3.eth.get_transaction_count(wallet_address, "pending"),
+            self.fee_oracle.tx_params(),
+        )
+        return {"nonce": nonce, **tx_params}
+
+    async def _allowance(
+        self, token_address: str, owner: str, spender: str
+    ) -> int:
+        """Read an ERC20 allowance."""
+        token_contract = self.w3.eth.contract(
+            address=self.w3.to_checksum_address(token_address), abi=self.erc20_abi
+        )
+        return await token_contract.functions.allowance(owner, spender).call()
 
     async def check_pool_exists(self, token_a: str, token_b: str) -> bool:
         """
@@ -332,37 +500,32 @@ class BlazeSwapHandler:
         Returns:
             bool: True if pool exists, False otherwise
         """
+        await self.ensure_network()
+        token_a_address = self._pool_token(token_a)
+        token_b_address = self._pool_token(token_b)
+        if not token_a_address or not token_b_address or token_a_address == token_b_address:
+            return False
+
         try:
-            # Get token addresses
-            if token_a.upper() == "FLR" or token_a.upper() == "C2FLR":
-                token_a_address = self.tokens[self.wrapped_native_symbol]
-            else:
-                token_a_address = self.tokens.get(token_a.upper())
-            
-            token_b_address = self.tokens.get(token_b.upper())
-            
-            if not token_a_address or not token_b_address:
-                return False
-            
-            # Get factory contract
-            factory = self.w3.eth.contract(
-                address=self.contracts["factory"],
-                abi=self.factory_abi
-            )
-            
-            # Check if pair exists
-            pair_address = factory.functions.getPair(
-                self.w3.to_checksum_address(token_a_address),
-                self.w3.to_checksum_address(token_b_address)
-            ).call()
-            
-            # If pair address is zero address, pool doesn't exist
-            zero_address = "0x0000000000000000000000000000000000000000"
-            return pair_address.lower() != zero_address.lower()
-            
+            pool = await self.pool_registry.get_pool(token_a_address, token_b_address)
         except Exception as e:
             print(f"Error checking pool existence: {e}")
             return False
+        return pool is not None
+
+    def _pool_token(self, symbol: str) -> str | None:
+        """Return the address a token trades under in pools (native maps to wrapped)."""
+        address = self.tokens.get(symbol.upper()) or self.tokens.get(symbol)
+        if address == "native":
+            return self.tokens[self.wrapped_native_symbol]
+        return address
+
+    def _symbol(self, address: str) -> str:
+        """Return the symbol of a token address, or the address if unknown."""
+        for symbol, token_address in self.tokens.items():
+            if token_address != "native" and token_address.lower() == address.lower():
+                return symbol
+        return address
 
     async def get_available_pairs(self) -> list[dict[str, str]]:
         """
@@ -371,20 +534,25 @@ class BlazeSwapHandler:
         Returns:
             List of dicts with 'token_a' and 'token_b' keys
         """
-        available_pairs = []
+        await self.ensure_network()
+        try:
+            await self.pool_registry.ensure_loaded()
+        except Exception as e:
+            print(f"Error loading pool registry: {e}")
+            return []
+
         tokens = list(self.tokens.keys())
-        
-        # Check all possible combinations
+        pairs = []
         for i, token_a in enumerate(tokens):
-            for token_b in tokens[i+1:]:
-                if await self.check_pool_exists(token_a, token_b):
-                    available_pairs.append({
-                        "token_a": token_a,
-                        "token_b": token_b,
-                        "pair": f"{token_a}/{token_b}"
-                    })
-        
-        return available_pairs
+            for token_b in tokens[i + 1 :]:
+                address_a, address_b = self._pool_token(token_a), self._pool_token(token_b)
+                if address_a == address_b:
+                    continue
+                if pair_key(address_a, address_b) in self.pool_registry.pools:
+                    pairs.append(
+                        {"token_a": token_a, "token_b": token_b, "pair": f"{token_a}/{token_b}"}
+                    )
+        return pairs
 
     async def prepare_swap_transaction(
         self,
@@ -394,8 +562,14 @@ class BlazeSwapHandler:
         wallet_address: str,
         router_address: str,
     ) -> dict[str, Any]:
-        """Prepare a swap transaction"""
+        """
+        Prepare a swap transaction.
 
+        The best route of up to `swap_max_hops` pools is searched locally from
+        cached reserves while the fee parameters and allowance are read, and
+        the transaction is built along that route once they all return.
+        """
+        await self.ensure_network()
         try:
             print(f"Debug - Preparing swap: {amount_in} {token_in} to {token_out}")
             print(f"Debug - Available tokens: {list(self.tokens.keys())}")
@@ -411,50 +585,33 @@ class BlazeSwapHandler:
                     f"Unsupported output token: {token_out}. Supported tokens: {', '.join(self.tokens.keys())}"
                 )
 
-            # Check if pool exists (skip for wrapping operations)
-            is_wrap = (token_in.upper() in ["FLR", "C2FLR"] and token_out.upper() == self.wrapped_native_symbol)
-            is_unwrap = (token_in.upper() == self.wrapped_native_symbol and token_out.upper() in ["FLR", "C2FLR"])
-            
-            if not is_wrap and not is_unwrap:
-                pool_exists = await self.check_pool_exists(token_in, token_out)
-                if not pool_exists:
-                    # Get available pairs for helpful error message
-                    available_pairs = await self.get_available_pairs()
-                    pairs_str = ", ".join([p["pair"] for p in available_pairs]) if available_pairs else "None"
-                    
-                    raise ValueError(
-                        f"No liquidity pool exists for {token_in}/{token_out}. "
-                        f"Available pairs: {pairs_str}. "
-                        f"You can add liquidity for this pair to enable swaps."
-                    )
+            amount_in_wei = self.w3.to_wei(amount_in, "ether")
+            print(f"Debug - Amount in wei: {amount_in_wei}")
 
             # Special case: FLR to Wrapped Native (wrap)
             if token_in.upper() == "FLR" and token_out.upper() == self.wrapped_native_symbol:
-                amount_in_wei = self.w3.to_wei(amount_in, "ether")
                 wflr_contract = self.w3.eth.contract(
                     address=self.w3.to_checksum_address(self.tokens[self.wrapped_native_symbol]),
                     abi=self.wflr_abi,
                 )
 
                 # Estimate gas for the deposit
-                estimated_gas = wflr_contract.functions.deposit().estimate_gas(
-                    {"from": wallet_address, "value": amount_in_wei}
+                estimated_gas, fees = await asyncio.gather(
+                    wflr_contract.functions.deposit().estimate_gas(
+                        {"from": wallet_address, "value": amount_in_wei}
+                    ),
+                    self._fee_params(wallet_address),
                 )
 
                 # Add 20% buffer to estimated gas
                 gas_limit = int(estimated_gas * 1.2)
 
-                tx = wflr_contract.functions.deposit().build_transaction(
+                tx = await wflr_contract.functions.deposit().build_transaction(
                     {
                         "from": wallet_address,
                         "value": amount_in_wei,
                         "gas": gas_limit,  # Use estimated gas with buffer
-                        "maxFeePerGas": self.w3.eth.gas_price
-                        * 2,  # Double the gas price for better chances
-                        "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                        "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,  # EIP-1559 transaction type
+                        **fees,  # Nonce and EIP-1559 fees from the fee oracle
                     }
                 )
 
@@ -475,144 +632,103 @@ class BlazeSwapHandler:
                     "needs_approval": False,
                 }
 
-            # Convert amount to Wei
-            amount_in_wei = self.w3.to_wei(amount_in, "ether")
-            print(f"Debug - Amount in wei: {amount_in_wei}")
-
             router = self.w3.eth.contract(
                 address=self.w3.to_checksum_address(router_address), abi=self.router_abi
             )
+            wrapped_native = self.tokens[self.wrapped_native_symbol]
+            # Native legs trade through the wrapped native token
+            token_in_address = self.tokens.get(token_in.upper(), "native")
+            route_start = self._pool_token(token_in) or wrapped_native
+            route_end = self._pool_token(token_out)
+            if route_start == route_end:
+                raise ValueError(
+                    f"{token_in} and {token_out} trade as the same token, so there is nothing to swap."
+                )
 
-            # Get token addresses and handle native token correctly
-            if token_in.upper() == "FLR":
-                token_in_address = "native"
-                print("Debug - Using native token for input")
-            else:
-                # Make sure the token is in the tokens dictionary
-                if token_in.upper() not in self.tokens:
-                    raise ValueError(
-                        f"Unsupported input token: {token_in}. Supported tokens: {', '.join(self.tokens.keys())}"
-                    )
-                token_in_address = self.tokens[token_in.upper()]
-                print(f"Debug - Using token address for input: {token_in_address}")
+            # Search the route, fetch fee parameters and read the allowance in
+            # a single round trip; native token doesn't need approval
+            allowance_check = (
+                asyncio.sleep(0, result=None)
+                if token_in_address == "native"
+                else self._allowance(token_in_address, wallet_address, router_address)
+            )
+            quote, fees, current_allowance = await asyncio.gather(
+                self._route(router, amount_in_wei, route_start, route_end),
+                self._fee_params(wallet_address),
+                allowance_check,
+                return_exceptions=True,
+            )
+            if isinstance(quote, NoRouteError):
+                # Get available pairs for helpful error message
+                available_pairs = await self.get_available_pairs()
+                pairs_str = ", ".join([p["pair"] for p in available_pairs]) if available_pairs else "None"
 
-            # Make sure the output token is in the tokens dictionary
-            if token_out.upper() not in self.tokens:
                 raise ValueError(
-                    f"Unsupported output token: {token_out}. Supported tokens: {', '.join(self.tokens.keys())}"
+                    f"No liquidity pool exists for {token_in}/{token_out}. "
+                    f"Available pairs: {pairs_str}. "
+                    f"You can add liquidity for this pair to enable swaps."
                 )
-            token_out_address = self.tokens[token_out.upper()]
-            print(f"Debug - Output token address: {token_out_address}")
+            for result in (fees, current_allowance):
+                if isinstance(result, BaseException):
+                    raise result
+            if isinstance(quote, BaseException):
+                print(f"Error getting amounts out: {quote!s}")
+                raise Exception(
+                    f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {quote!s}"
+                )
+            path = list(quote.path)
+            print(f"Debug - Swap path: {path}")
+            print(f"Debug - Expected amounts: {quote.amounts}")
+            min_amount_out = quote.min_amount_out(settings.swap_slippage_bips)
+            print(f"Debug - Min amount out: {min_amount_out}")
 
             # Set deadline 20 minutes from now
             deadline = int(time.time()) + 1200
-
-            # Prepare the path and transaction based on token types
-            if token_in.upper() == "FLR":
-                # For FLR to any token, we need to go through Wrapped Native
-                path = [self.tokens[self.wrapped_native_symbol], token_out_address]  # FLR -> WFLR -> token
-                print(f"Debug - Swap path for FLR: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For FLR to token swaps, use swapExactNATForTokens
-                    tx = router.functions.swapExactNATForTokens(
-                        min_amount_out,  # Minimum amount to receive
-                        path,
-                        wallet_address,
-                        deadline,
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": amount_in_wei,
-                            "gas": 3000000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built native token swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
-            elif token_out.upper() == "FLR":
+            needs_approval = (
+                current_allowance is not None and current_allowance < amount_in_wei
+            )
+            # The approval goes first at the pending nonce, the swap after it
+            approval_tx = None
+            if needs_approval:
+                token_contract = self.w3.eth.contract(
+                    address=self.w3.to_checksum_address(token_in_address),
+                    abi=self.erc20_abi,
+                )
+                approval_tx = await token_contract.functions.approve(
+                    router_address, amount_in_wei
+                ).build_transaction(
+                    {
+                        "from": wallet_address,
+                        "gas": 100000,
+                        **fees,
+                    }
+                )
+            tx_params = {
+                "from": wallet_address,
+                "value": 0,
+                "gas": 300000,
+                **fees,
+                "nonce": fees["nonce"] + (1 if needs_approval else 0),
+            }
+            if token_in_address == "native":
+                # For FLR to token swaps, use swapExactNATForTokens
+                swap = router.functions.swapExactNATForTokens(
+                    min_amount_out, path, wallet_address, deadline
+                )
+                tx_params.update({"value": amount_in_wei, "gas": 3000000})
+            elif self.tokens[token_out.upper()] == "native":
                 # For token to FLR swaps, use swapExactTokensForNAT
-                path = [token_in_address, self.tokens[self.wrapped_native_symbol]]  # token -> WFLR -> FLR
-                print(f"Debug - Swap path for token to FLR: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For token to FLR swaps, use swapExactTokensForNAT
-                    tx = router.functions.swapExactTokensForNAT(
-                        min_amount_out, path, wallet_address, deadline
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": 0,
-                            "gas": 300000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built token to NAT swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
+                swap = router.functions.swapExactTokensForNAT(
+                    min_amount_out, path, wallet_address, deadline
+                )
             else:
-                # For token to token swaps
-                path = [token_in_address, token_out_address]
-                print(f"Debug - Swap path for token to token: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For token to token swaps, use swapExactTokensForTokens
-                    tx = router.functions.swapExactTokensForTokens(
-                        min_amount_out,  # Use only the minimum amount out parameter
-                        path,
-                        wallet_address,
-                        deadline,
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": 0,
-                            "gas": 300000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built token to token swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
+                # For token to token swaps, use swapExactTokensForTokens
+                swap = router.functions.swapExactTokensForTokens(
+                    min_amount_out, path, wallet_address, deadline
+                )
+            # Every field is supplied, so building the transaction is local
+            tx = await swap.build_transaction(tx_params)
+            print("Debug - Built swap transaction")
 
             # Convert values to hex strings for proper JSON serialization
             tx["value"] = hex(tx["value"])
@@ -623,26 +739,20 @@ class BlazeSwapHandler:
             tx["chainId"] = hex(tx["chainId"])
             tx["type"] = "0x2"
 
-            # Check if approval is needed for token_in
-            needs_approval = False
-            if token_in.upper() != "FLR":  # Native token doesn't need approval
-                token_contract = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(token_in_address),
-                    abi=self.erc20_abi,
-                )
-                current_allowance = token_contract.functions.allowance(
-                    wallet_address, router_address
-                ).call()
-                if current_allowance < amount_in_wei:
-                    needs_approval = True
-
             return {
                 "transaction": tx,
                 "token_in": token_in,
                 "token_out": token_out,
                 "amount_in": amount_in,
+                "path": path,
+                "route": [self._symbol(address) for address in path],
+                "expected_amount_out": quote.amount_out,
                 "min_amount_out": min_amount_out,
+                "price_impact": quote.price_impact,
                 "needs_approval": needs_approval,
+                "approval_transaction": (
+                    self._format_tx_for_json(approval_tx) if approval_tx else None
+                ),
             }
         except Exception as e:
             print(f"Error building transaction: {e!s}")
@@ -666,6 +776,7 @@ class BlazeSwapHandler:
             wallet_address: User's wallet address
             router_address: BlazeSwap router address
         """
+        await self.ensure_network()
         try:
             # 1. Input validation and address formatting
             wallet_address = self.w3.to_checksum_address(wallet_address)
@@ -696,33 +807,32 @@ class BlazeSwapHandler:
                 address=token_address, abi=self.erc20_abi
             )
 
-            current_allowance = token_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
+            current_allowance, fees = await asyncio.gather(
+                token_contract.functions.allowance(
+                    wallet_address, router_address
+                ).call(),
+                self._fee_params(wallet_address),
+            )
 
             needs_approval = current_allowance < amount_token_wei
 
             # 7. Prepare approval transaction if needed
             approval_tx = None
             if needs_approval:
-                approval_tx = token_contract.functions.approve(
+                approval_tx = await token_contract.functions.approve(
                     router_address, amount_token_wei
                 ).build_transaction(
                     {
                         "from": wallet_address,
                         "gas": 100000,
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                        "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
+                        **fees,
                     }
                 )
 
             # 8. Prepare add liquidity transaction
             router = self.w3.eth.contract(address=router_address, abi=self.router_abi)
 
-            add_liquidity_tx = router.functions.addLiquidityNAT(
+            add_liquidity_tx = await router.functions.addLiquidityNAT(
                 token_address,  # token address
                 amount_token_wei,  # amount token desired
                 amount_token_min,  # amount token min
@@ -735,12 +845,8 @@ class BlazeSwapHandler:
                     "from": wallet_address,
                     "value": amount_flr_wei,  # Native FLR amount
                     "gas": 300000,
-                    "maxFeePerGas": self.w3.eth.gas_price * 2,
-                    "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                    "nonce": self.w3.eth.get_transaction_count(wallet_address)
-                    + (1 if needs_approval else 0),
-                    "chainId": self.w3.eth.chain_id,
-                    "type": 2,
+                    **fees,
+                    "nonce": fees["nonce"] + (1 if needs_approval else 0),
                 }
             )
 
@@ -797,6 +903,7 @@ class BlazeSwapHandler:
             wallet_address: User's wallet address
             router_address: BlazeSwap router address
         """
+        await self.ensure_network()
         try:
             # 1. Input validation and address formatting
             wallet_address = self.w3.to_checksum_address(wallet_address)
@@ -830,33 +937,32 @@ class BlazeSwapHandler:
                 address=token_b_address, abi=self.erc20_abi
             )
 
-            allowance_a = token_a_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
-
-            allowance_b = token_b_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
+            allowance_a, allowance_b, fees = await asyncio.gather(
+                token_a_contract.functions.allowance(
+                    wallet_address, router_address
+                ).call(),
+                token_b_contract.functions.allowance(
+                    wallet_address, router_address
+                ).call(),
+                self._fee_params(wallet_address),
+            )
 
             needs_approval_a = allowance_a < amount_a_wei
             needs_approval_b = allowance_b < amount_b_wei
 
             # 7. Prepare approval transactions if needed
             formatted_txs = []
-            nonce = self.w3.eth.get_transaction_count(wallet_address)
+            nonce = fees.pop("nonce")
 
             if needs_approval_a:
-                approval_a_tx = token_a_contract.functions.approve(
+                approval_a_tx = await token_a_contract.functions.approve(
                     router_address, amount_a_wei
                 ).build_transaction(
                     {
                         "from": wallet_address,
                         "gas": 50000,  # Reduced gas for approval
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": int(self.w3.eth.max_priority_fee * 0.1),
                         "nonce": nonce,
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
+                        **fees,
                     }
                 )
                 formatted_txs.append(
@@ -868,17 +974,14 @@ class BlazeSwapHandler:
                 nonce += 1
 
             if needs_approval_b:
-                approval_b_tx = token_b_contract.functions.approve(
+                approval_b_tx = await token_b_contract.functions.approve(
                     router_address, amount_b_wei
                 ).build_transaction(
                     {
                         "from": wallet_address,
                         "gas": 50000,  # Reduced gas for approval
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": int(self.w3.eth.max_priority_fee * 0.1),
                         "nonce": nonce,
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
+                        **fees,
                     }
                 )
                 formatted_txs.append(
@@ -892,7 +995,7 @@ class BlazeSwapHandler:
             # 8. Prepare add liquidity transaction
             router = self.w3.eth.contract(address=router_address, abi=self.router_abi)
 
-            add_liquidity_tx = router.functions.addLiquidity(
+            add_liquidity_tx = await router.functions.addLiquidity(
                 token_a_address,  # tokenA
                 token_b_address,  # tokenB
                 amount_a_wei,  # amountADesired
@@ -908,14 +1011,8 @@ class BlazeSwapHandler:
                     "from": wallet_address,
                     "value": 0,
                     "gas": 2891350,  # Exact gas limit from successful transaction
-                    "maxFeePerGas": self.w3.eth.gas_price
-                    * 2,  # Base * 2 to get 50 max fee
-                    "maxPriorityFeePerGas": int(
-                        self.w3.eth.max_priority_fee * 0.1
-                    ),  # Reduced to get 2.50 max priority
                     "nonce": nonce,
-                    "chainId": self.w3.eth.chain_id,
-                    "type": 2,
+                    **fees,
                 }
             )
 
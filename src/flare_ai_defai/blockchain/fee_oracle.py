@@ -0,0 +1,208 @@
+"""
+Fee Oracle Module
+
+This module prices EIP-1559 transactions for every transaction builder. Fees
+come from one `eth_feeHistory` read: the next block's base fee, plus the
+median over recent blocks of a percentile of the priority fees actually
+paid. `maxFeePerGas` leaves `fee_base_multiplier` headroom over the next
+base fee for the time the user takes to sign, instead of doubling the gas
+price; the sender still only pays base fee plus tip.
+
+Fees are cached for one block (`fee_cache_seconds`, Flare's block time) and
+the chain ID for the lifetime of the process, so a bundle of transactions
+or a burst of concurrent swaps costs at most one fee read per block and no
+chain ID reads. There is one oracle per RPC URL, shared like the client.
+"""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from web3 import AsyncWeb3
+
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+# Concurrent transaction builders share one fee history read per block
+fee_flight = SingleFlight("fee_oracle")
+
+_oracles: dict[str, "FeeOracle"] = {}
+
+
+@dataclass(frozen=True)
+class Fees:
+    """
+    EIP-1559 fee parameters.
+
+    Attributes:
+        base_fee (int): Base fee of the next block, in wei
+        max_priority_fee (int): Tip per gas, in wei
+        max_fee (int): Cap per gas, in wei
+        block (int): Newest block the fees were computed from
+    """
+
+    base_fee: int
+    max_priority_fee: int
+    max_fee: int
+    block: int
+
+
+def compute_fees(
+    fee_history: Any, base_fee_multiplier: float, block: int
+) -> Fees:
+    """
+    Derive fees from an `eth_feeHistory` response.
+
+    Args:
+        fee_history: Response with `baseFeePerGas` (one entry per block plus
+            the next block) and `reward` (one percentile per block)
+        base_fee_multiplier: Headroom applied to the next block's base fee
+        block: Newest block covered by the history
+
+    Returns:
+        Fees: Next base fee, median tip and the resulting cap
+    """
+    base_fee = int(fee_history["baseFeePerGas"][-1])
+    rewards = [int(reward[0]) for reward in fee_history.get("reward") or [] if reward]
+    priority_fee = int(statistics.median(rewards)) if rewards else 0
+    max_fee = int(base_fee * base_fee_multiplier) + priority_fee
+    return Fees(base_fee, priority_fee, max_fee, block)
+
+
+class FeeOracle:
+    """
+    Block-scoped EIP-1559 fees and a process-lifetime chain ID.
+
+    Attributes:
+        w3 (AsyncWeb3): Client used for fee and chain ID reads
+        history_blocks (int): Blocks of fee history sampled
+        reward_percentile (float): Percentile of each block's tips sampled
+        base_fee_multiplier (float): Headroom over the next block's base fee
+        cache_seconds (float): Seconds fees are reused before a new read
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        history_blocks: int | None = None,
+        reward_percentile: float | None = None,
+        base_fee_multiplier: float | None = None,
+        cache_seconds: float | None = None,
+    ) -> None:
+        """
+        Initialize the oracle.
+
+        Args:
+            w3: Client used for fee and chain ID reads
+            history_blocks: Blocks of fee history sampled (defaults to settings)
+            reward_percentile: Percentile of each block's tips sampled
+                (defaults to settings)
+            base_fee_multiplier: Headroom over the next block's base fee
+                (defaults to settings)
+            cache_seconds: Seconds fees are reused (defaults to settings)
+        """
+        self.w3 = w3
+        self.history_blocks = history_blocks or settings.fee_history_blocks
+        self.reward_percentile = (
+            settings.fee_reward_percentile
+            if reward_percentile is None
+            else reward_percentile
+        )
+        self.base_fee_multiplier = (
+            base_fee_multiplier or settings.fee_base_multiplier
+        )
+        self.cache_seconds = (
+            settings.fee_cache_seconds if cache_seconds is None else cache_seconds
+        )
+        self._chain_id: int | None = None
+        self._fees: Fees | None = None
+        self._fetched_at = 0.0
+        self.logger = logger.bind(url=getattr(w3.provider, "endpoint_uri", None))
+
+    async def chain_id(self) -> int:
+        """Return the chain ID, read once per process."""
+        if self._chain_id is None:
+            self._chain_id = await fee_flight.do(
+                (id(self), "chain_id"), lambda: self.w3.eth.chain_id
+            )
+        return self._chain_id
+
+    async def fees(self) -> Fees:
+        """Return fees for the current block, reading fee history if stale."""
+        if self._fees is not None and (
+            time.monotonic() - self._fetched_at < self.cache_seconds
+        ):
+            return self._fees
+        return await fee_flight.do((id(self), "fees"), self._refresh)
+
+    async def tx_params(self) -> dict[str, int]:
+        """
+        Return the fee and chain fields of a type 2 transaction.
+
+        Returns:
+            dict: maxFeePerGas, maxPriorityFeePerGas, chainId and type
+        """
+        fees = await self.fees()
+        return {
+            "maxFeePerGas": fees.max_fee,
+            "maxPriorityFeePerGas": fees.max_priority_fee,
+            "chainId": await self.chain_id(),
+            "type": 2,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Report the cached chain ID and fees."""
+        return {
+            "chain_id": self._chain_id,
+            "block": self._fees.block if self._fees else None,
+            "base_fee": self._fees.base_fee if self._fees else None,
+            "max_priority_fee": self._fees.max_priority_fee if self._fees else None,
+        }
+
+    async def _refresh(self) -> Fees:
+        history = await self.w3.eth.fee_history(
+            self.history_blocks, "latest", [self.reward_percentile]
+        )
+        block = int(history["oldestBlock"]) + len(history["baseFeePerGas"]) - 2
+        fees = compute_fees(history, self.base_fee_multiplier, block)
+        if not history.get("reward"):
+            # Nodes without reward history still answer the tip estimate
+            tip = await self.w3.eth.max_priority_fee
+            fees = Fees(
+                fees.base_fee,
+                tip,
+                int(fees.base_fee * self.base_fee_multiplier) + tip,
+                block,
+            )
+        self._fees = fees
+        self._fetched_at = time.monotonic()
+        self.logger.debug(
+            "fees_refreshed",
+            block=block,
+            base_fee=fees.base_fee,
+            max_priority_fee=fees.max_priority_fee,
+        )
+        return fees
+
+
+def get_fee_oracle(web3_provider_url: str) -> FeeOracle:
+    """
+    Return the shared FeeOracle for an RPC URL.
+
+    Args:
+        web3_provider_url: JSON-RPC endpoint
+
+    Returns:
+        FeeOracle: Oracle reading through the shared client for the URL
+    """
+    oracle = _oracles.get(web3_provider_url)
+    if oracle is None:
+        oracle = _oracles[web3_provider_url] = FeeOracle(
+            get_async_web3(web3_provider_url)
+        )
+    return oracle
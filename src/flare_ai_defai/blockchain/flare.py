@@ -3,16 +3,27 @@ Flare Network Provider Module
 
 This module provides a FlareProvider class for interacting with the Flare Network.
 It handles account management, transaction queuing, and blockchain interactions.
+RPC calls go through the shared pooled `AsyncWeb3` client for the provider URL,
+so independent reads are issued concurrently.
 """
 
+import asyncio
+
 from dataclasses import dataclass
 
 import structlog
 from eth_account import Account
 from eth_typing import ChecksumAddress
-from web3 import Web3
+from web3.contract import AsyncContract
+from web3.exceptions import TimeExhausted
 from web3.types import TxParams
 
+from flare_ai_defai.blockchain.fee_oracle import get_fee_oracle
+from flare_ai_defai.blockchain.multicall import Multicall, WalletBalances
+from flare_ai_defai.blockchain.nonce_manager import get_nonce_manager
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+
+from .erc20_abi import ERC20_ABI
 from .network_config import NETWORK_CONFIGS
 
 
@@ -40,7 +51,10 @@ class FlareProvider:
 
     Attributes:
         address (ChecksumAddress | None): The account's checksum address
-        w3 (Web3): Web3 instance for blockchain interactions
+        w3 (AsyncWeb3): Shared async Web3 client for blockchain interactions
+        multicall (Multicall): Batches balance reads into one request
+        fee_oracle (FeeOracle): Block-scoped fees and cached chain ID
+        nonces (NonceManager): Local nonce allocation for sent transactions
         logger (BoundLogger): Structured logger for the provider
     """
 
@@ -50,7 +64,11 @@ class FlareProvider:
         Args:
             web3_provider_url: URL of the Web3 provider
         """
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        self.w3 = get_async_web3(web3_provider_url)
+        self.multicall = Multicall(self.w3)
+        self.fee_oracle = get_fee_oracle(web3_provider_url)
+        self.nonces = get_nonce_manager(web3_provider_url)
+        self._token_contracts: dict[str, AsyncContract] = {}
         self.network = "flare" if "flare-api" in web3_provider_url else "coston2"
         self.address: str | None = None
 
@@ -82,7 +100,7 @@ class FlareProvider:
         )
         return self.address
 
-    def sign_and_send_transaction(self, tx: TxParams) -> str:
+    async def sign_and_send_transaction(self, tx: TxParams) -> str:
         """
         Sign and send a transaction to the network.
 
@@ -101,63 +119,82 @@ class FlareProvider:
         signed_tx = self.w3.eth.account.sign_transaction(
             tx, private_key=self.private_key
         )
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        nonce = tx.get("nonce")
+        try:
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            if nonce is not None:
+                self.nonces.release(self.address, [int(nonce)])
+            raise
+        try:
+            await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        except TimeExhausted:
+            # Dropped or stuck; re-read the pending count before the next nonce
+            self.nonces.forget(self.address)
+            raise
+        if nonce is not None:
+            self.nonces.confirm(self.address, int(nonce))
         self.logger.debug("sign_and_send_transaction", tx=tx)
         return "0x" + tx_hash.hex()
 
-    def check_balance(self) -> float:
+    async def check_balance(self, address: str | None = None) -> float:
         """
-        Check the balance of the current account.
+        Check the native balance of an account.
+
+        Args:
+            address: Account to check (defaults to the provider's own account)
 
         Returns:
             float: Account balance in FLR
 
         Raises:
-            ValueError: If account does not exist
+            ValueError: If no address is given and account does not exist
         """
-        if not self.address:
+        address = address or self.address
+        if not address:
             msg = "No wallet connected"
             raise ValueError(msg)
-        balance_wei = self.w3.eth.get_balance(self.address)
+        balance_wei = await self.w3.eth.get_balance(address)
         self.logger.debug("check_balance", balance_wei=balance_wei)
         return float(self.w3.from_wei(balance_wei, "ether"))
 
-    def check_token_balance(self, token_address: str, decimals: int = 18) -> float:
+    async def check_token_balance(
+        self, token_address: str, decimals: int = 18, address: str | None = None
+    ) -> float:
         """
-        Check the balance of an ERC20 token for the current account.
+        Check the balance of an ERC20 token for an account.
 
         Args:
             token_address: Contract address of the ERC20 token
             decimals: Number of decimals the token uses (default: 18)
+            address: Account to check (defaults to the provider's own account)
 
         Returns:
             float: Token balance
 
         Raises:
-            ValueError: If account does not exist
+            ValueError: If no address is given and account does not exist
         """
-        if not self.address:
+        address = address or self.address
+        if not address:
             msg = "No wallet connected"
             raise ValueError(msg)
 
-        # Import ERC20 ABI
-        from .erc20_abi import ERC20_ABI
-
-        # Create contract instance
-        token_contract = self.w3.eth.contract(
-            address=self.w3.to_checksum_address(token_address), abi=ERC20_ABI
-        )
+        token_contract = self._token_contracts.get(token_address)
+        if token_contract is None:
+            token_contract = self._token_contracts[token_address] = self.w3.eth.contract(
+                address=self.w3.to_checksum_address(token_address), abi=ERC20_ABI
+            )
 
         # Get balance
-        balance_raw = token_contract.functions.balanceOf(self.address).call()
+        balance_raw = await token_contract.functions.balanceOf(address).call()
 
         # Convert to human-readable format
         balance = balance_raw / (10**decimals)
 
         return float(balance)
 
-    def check_all_token_balances(self, token_addresses: dict[str, str], token_decimals: dict[str, int], include_zero: bool = False) -> dict[str, float]:
+    async def check_all_token_balances(self, token_addresses: dict[str, str], token_decimals: dict[str, int], include_zero: bool = False, address: str | None = None) -> dict[str, float]:
         """
         Check balances for multiple ERC20 tokens.
 
@@ -165,54 +202,92 @@ class FlareProvider:
             token_addresses: Dictionary mapping token symbols to contract addresses
             token_decimals: Dictionary mapping token symbols to their decimal places
             include_zero: Whether to include tokens with zero balance
+            address: Account to check (defaults to the provider's own account)
 
         Returns:
             dict[str, float]: Dictionary mapping token symbols to their balances
+
+        Raises:
+            ValueError: If no address is given and account does not exist
         """
-        balances = {}
+        address = address or self.address
+        if not address:
+            msg = "No wallet connected"
+            raise ValueError(msg)
+        (wallet,) = await self.get_wallet_balances(
+            [address], token_addresses, token_decimals
+        )
+        return {
+            symbol: balance
+            for symbol, balance in wallet.tokens.items()
+            if include_zero or balance > 0  # Optionally include tokens with zero balance
+        }
 
-        for symbol, address in token_addresses.items():
-            if address == "native":
-                # Skip native token, it's handled separately
-                continue
+    async def get_wallet_balances(
+        self,
+        addresses: list[str],
+        token_addresses: dict[str, str],
+        token_decimals: dict[str, int],
+    ) -> list[WalletBalances]:
+        """
+        Fetch native and ERC20 balances for several wallets in one batched read.
 
-            try:
-                decimals = token_decimals.get(symbol, 18)
-                balance = self.check_token_balance(address, decimals)
-                if include_zero or balance > 0:  # Optionally include tokens with zero balance
-                    balances[symbol] = balance
-            except Exception as e:
-                self.logger.warning(f"Failed to get balance for {symbol}", error=str(e))
+        Args:
+            addresses: Wallet addresses to check
+            token_addresses: Dictionary mapping token symbols to contract addresses
+            token_decimals: Dictionary mapping token symbols to their decimal places
 
+        Returns:
+            list[WalletBalances]: Balances for each wallet, in input order
+        """
+        balances = await self.multicall.balances(
+            addresses, token_addresses, token_decimals
+        )
+        self.logger.debug("get_wallet_balances", wallets=len(addresses))
         return balances
 
-    def create_send_flr_tx(self, to_address: str, amount: float) -> TxParams:
+    async def create_send_flr_tx(
+        self, to_address: str, amount: float, from_address: str | None = None
+    ) -> TxParams:
         """
         Create a transaction to send FLR tokens.
 
         Args:
             to_address (str): Recipient address
             amount (float): Amount of FLR to send
+            from_address (str | None): Sender (defaults to the provider's own account)
 
         Returns:
             TxParams: Transaction parameters for sending FLR
 
         Raises:
-            ValueError: If account does not exist
+            ValueError: If no sender is given and account does not exist
         """
-        if not self.address:
+        from_address = from_address or self.address
+        if not from_address:
             msg = "Account does not exist"
             raise ValueError(msg)
+        # Only transactions this provider signs itself are allocated locally;
+        # another wallet's transaction may never be sent, so read its pending count
+        if self.address and from_address.lower() == self.address.lower():
+            # Reserved only once the fee read succeeds, so a failed read
+            # cannot leave a nonce reserved with no transaction behind it
+            fee_params = await self.fee_oracle.tx_params()
+            (nonce,) = await self.nonces.reserve(from_address)
+        else:
+            nonce, fee_params = await asyncio.gather(
+                self.w3.eth.get_transaction_count(
+                    self.w3.to_checksum_address(from_address), "pending"
+                ),
+                self.fee_oracle.tx_params(),
+            )
         tx: TxParams = {
-            "from": self.address,
-            "nonce": self.w3.eth.get_transaction_count(self.address),
+            "from": from_address,
+            "nonce": nonce,
             "to": self.w3.to_checksum_address(to_address),
             "value": self.w3.to_wei(amount, unit="ether"),
             "gas": 21000,
-            "maxFeePerGas": self.w3.eth.gas_price,
-            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-            "chainId": self.w3.eth.chain_id,
-            "type": 2,
+            **fee_params,
         }
         return tx
 
@@ -230,7 +305,7 @@ class FlareProvider:
             The balance in native token units (e.g., FLR)
         """
         try:
-            balance_wei = self.w3.eth.get_balance(wallet_address)
+            balance_wei = await self.w3.eth.get_balance(wallet_address)
             balance_eth = self.w3.from_wei(balance_wei, "ether")
             return float(balance_eth)
         except Exception as e:
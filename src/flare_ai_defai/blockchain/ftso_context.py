@@ -1,11 +1,45 @@
-from typing import Optional
-import binascii
+"""
+FTSO Context Module
+
+This module attaches the Flare Time Series Oracle (FTSO v2) context to
+decision packets: the feed of the traded asset, the voting round the
+decision was made in and the feed's price at that moment.
+
+All watched feeds are read together with the current voting round ID in one
+Multicall3 `aggregate3` eth_call (`FtsoV2.getFeedsById` and
+`FlareSystemsManager.getCurrentVotingEpochId`). The two contract addresses
+are resolved once from the Flare contract registry.
+
+Snapshots are cached per voting round. The round a request falls in is
+derived from the clock (`ftso_first_voting_round_start`,
+`ftso_voting_round_seconds`), so a new round invalidates the cache without a
+read. Within a round a snapshot is reused for `ftso_cache_seconds`, one
+update of the block-latency feeds, and concurrent requests share one read.
+There is one cache per RPC client, shared like the client.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
 import structlog
+from eth_abi import decode, encode
 from web3 import Web3
+
 from flare_ai_defai.blockchain.flare import FlareProvider
+from flare_ai_defai.blockchain.multicall import Call, Multicall
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
+# Concurrent decisions share one snapshot read per voting round
+ftso_flight = SingleFlight("ftso_context")
+
+GET_CONTRACT_ADDRESS_BY_NAME = Web3.keccak(text="getContractAddressByName(string)")[:4]
+GET_FEEDS_BY_ID = Web3.keccak(text="getFeedsById(bytes21[])")[:4]
+GET_CURRENT_VOTING_EPOCH_ID = Web3.keccak(text="getCurrentVotingEpochId()")[:4]
+
 # Standard FTSO v2 Feed IDs are 21 bytes.
 # Category 01 = Crypto.
 # Format: 01 + Hex("TOKEN/USD") + Padding
@@ -16,7 +50,7 @@ logger = structlog.get_logger(__name__)
 # BTC/USD  = 4254432f555344 -> 0x014254432f55534400000000000000000000000000
 
 FTSO_FEED_IDS = {
-    "FLR": "0x01464c522f55534400000000000000000000000000", 
+    "FLR": "0x01464c522f55534400000000000000000000000000",
     "WFLR": "0x01464c522f55534400000000000000000000000000",
     "USDC": "0x01555344432f555344000000000000000000000000",
     "USDT": "0x01555344542f555344000000000000000000000000",
@@ -25,6 +59,12 @@ FTSO_FEED_IDS = {
     "BTC": "0x014254432f55534400000000000000000000000000",
 }
 
+# Every distinct feed, read together in each snapshot
+WATCHED_FEED_IDS = list(dict.fromkeys(FTSO_FEED_IDS.values()))
+
+_caches: dict[int, "FtsoCache"] = {}
+
+
 def get_feed_id(symbol: str) -> Optional[str]:
     """
     Get the FTSO Feed ID for a given token symbol.
@@ -35,51 +75,215 @@ def get_feed_id(symbol: str) -> Optional[str]:
         if symbol == "WC2FLR":
             return FTSO_FEED_IDS.get("FLR")
         symbol = "USDC"
-    
+
     return FTSO_FEED_IDS.get(symbol)
 
+
+def current_voting_round(now: float | None = None) -> int:
+    """Return the FTSO voting round containing a unix time (default: now)."""
+    elapsed = (time.time() if now is None else now) - settings.ftso_first_voting_round_start
+    return int(elapsed // settings.ftso_voting_round_seconds)
+
+
+@dataclass(frozen=True)
+class FtsoSnapshot:
+    """
+    Values of every watched feed in one voting round.
+
+    Attributes:
+        voting_round_id (int): Voting round reported by FlareSystemsManager
+        timestamp (int): Unix time of the feeds' last update
+        values (dict[str, tuple[int, int]]): Raw value and decimals by feed ID
+    """
+
+    voting_round_id: int
+    timestamp: int
+    values: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def price(self, feed_id: str) -> float | None:
+        """Return a feed's price, or None if it is missing or unset."""
+        value, decimals = self.values.get(feed_id.lower(), (0, 0))
+        if value == 0:
+            return None
+        return value / 10**decimals
+
+
+class FtsoCache:
+    """
+    Voting-round-scoped snapshots of the watched FTSO v2 feeds.
+
+    Attributes:
+        multicall (Multicall): Batcher the snapshot reads are sent through
+        registry (str): Flare contract registry address
+        cache_seconds (float): Seconds a snapshot is reused within its round
+    """
+
+    def __init__(
+        self,
+        multicall: Multicall,
+        registry: str | None = None,
+        cache_seconds: float | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            multicall: Batcher the snapshot reads are sent through
+            registry: Flare contract registry address (defaults to settings)
+            cache_seconds: Seconds a snapshot is reused within its round
+                (defaults to settings)
+        """
+        self.multicall = multicall
+        self.registry = Web3.to_checksum_address(
+            registry or settings.ftso_registry_address
+        )
+        self.cache_seconds = (
+            settings.ftso_cache_seconds if cache_seconds is None else cache_seconds
+        )
+        self._contracts: tuple[str, str] | None = None
+        self._snapshot: FtsoSnapshot | None = None
+        self._round = -1
+        self._fetched_at = 0.0
+        self.reads = 0
+        self.logger = logger.bind(registry=self.registry)
+
+    async def snapshot(self) -> FtsoSnapshot:
+        """Return the current round's snapshot, reading it if stale."""
+        round_id = current_voting_round()
+        if (
+            self._snapshot is not None
+            and self._round == round_id
+            and time.monotonic() - self._fetched_at < self.cache_seconds
+        ):
+            return self._snapshot
+        return await ftso_flight.do((id(self), round_id), lambda: self._refresh(round_id))
+
+    def stats(self) -> dict[str, Any]:
+        """Report the cached round and the number of snapshot reads."""
+        return {
+            "voting_round_id": self._snapshot.voting_round_id if self._snapshot else None,
+            "timestamp": self._snapshot.timestamp if self._snapshot else None,
+            "reads": self.reads,
+        }
+
+    async def _resolve_contracts(self) -> tuple[str, str]:
+        """Look up the FtsoV2 and FlareSystemsManager addresses once."""
+        if self._contracts is None:
+            results = await self.multicall.aggregate(
+                [
+                    Call(
+                        self.registry,
+                        GET_CONTRACT_ADDRESS_BY_NAME + encode(["string"], [name]),
+                    )
+                    for name in ("FtsoV2", "FlareSystemsManager")
+                ]
+            )
+            if any(not raw for raw in results):
+                msg = "FtsoV2 or FlareSystemsManager missing from the contract registry"
+                raise ValueError(msg)
+            ftso_v2, systems_manager = (
+                Web3.to_checksum_address(decode(["address"], raw)[0])  # type: ignore[arg-type]
+                for raw in results
+            )
+            self._contracts = (ftso_v2, systems_manager)
+        return self._contracts
+
+    async def _refresh(self, round_id: int) -> FtsoSnapshot:
+        ftso_v2, systems_manager = await self._resolve_contracts()
+        feed_ids = [bytes.fromhex(feed_id[2:]) for feed_id in WATCHED_FEED_IDS]
+        feeds, voting_round = await self.multicall.aggregate(
+            [
+                Call(ftso_v2, GET_FEEDS_BY_ID + encode(["bytes21[]"], [feed_ids])),
+                Call(systems_manager, GET_CURRENT_VOTING_EPOCH_ID),
+            ]
+        )
+        if not feeds or not voting_round:
+            msg = "FTSO snapshot read reverted"
+            raise ValueError(msg)
+        values, decimals, timestamp = decode(["uint256[]", "int8[]", "uint64"], feeds)
+        snapshot = FtsoSnapshot(
+            voting_round_id=decode(["uint32"], voting_round)[0],
+            timestamp=timestamp,
+            values={
+                feed_id.lower(): (value, decimal)
+                for feed_id, value, decimal in zip(
+                    WATCHED_FEED_IDS, values, decimals, strict=True
+                )
+            },
+        )
+        self._snapshot = snapshot
+        self._round = round_id
+        self._fetched_at = time.monotonic()
+        self.reads += 1
+        self.logger.debug(
+            "ftso_snapshot_refreshed",
+            voting_round_id=snapshot.voting_round_id,
+            timestamp=snapshot.timestamp,
+        )
+        return snapshot
+
+
+def get_ftso_cache(blockchain_provider: FlareProvider) -> FtsoCache:
+    """
+    Return the shared FtsoCache for a provider's RPC client.
+
+    Args:
+        blockchain_provider: Provider whose client and batcher are used
+
+    Returns:
+        FtsoCache: Cache shared by every provider on the same client
+    """
+    key = id(blockchain_provider.w3)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = FtsoCache(blockchain_provider.multicall)
+    return cache
+
+
+def ftso_stats() -> dict[str, Any]:
+    """Report every FTSO cache, keyed by RPC endpoint."""
+    return {
+        getattr(cache.multicall.w3.provider, "endpoint_uri", str(key)): cache.stats()
+        for key, cache in _caches.items()
+    }
+
+
 async def get_ftso_context(
-    blockchain_provider: FlareProvider, 
+    blockchain_provider: FlareProvider,
     symbol: str
-) -> dict[str, Optional[str | int]]:
+) -> dict[str, Optional[str | int | float]]:
     """
-    Fetch the current FTSO context (Feed ID, Round ID) for a symbol.
-    
+    Fetch the current FTSO context (feed, voting round, price) for a symbol.
+
     Args:
         blockchain_provider: The FlareProvider instance to use for RPC calls.
         symbol: The asset symbol (e.g. "FLR", "USDC").
-        
+
     Returns:
         dict: {
             "ftso_feed_id": str | None,
-            "ftso_round_id": int | None
+            "ftso_round_id": int | None,
+            "ftso_price": float | None,
+            "ftso_timestamp": int | None
         }
     """
-    feed_id = get_feed_id(symbol)
-    if not feed_id:
-        return {"ftso_feed_id": None, "ftso_round_id": None}
-        
-    # In a production environment, we would call the FTSO Registry or FastUpdater
-    # to get the current round and price.
-    # For this implementation, we attempt to get the latest block number as a proxy 
-    # for the "Round ID" if the actual FTSO contract call is not fully configured,
-    # OR we return a mocked round ID if we can't connect, to ensure the decision flows.
-    
-    # NOTE: FTSO rounds are time-based (e.g. 90s or 1.8s blocks). 
-    # Real implementations would query the Relay contract.
-    
+    context: dict[str, Optional[str | int | float]] = {
+        "ftso_feed_id": get_feed_id(symbol),
+        "ftso_round_id": None,
+        "ftso_price": None,
+        "ftso_timestamp": None,
+    }
+    feed_id = context["ftso_feed_id"]
+    if not isinstance(feed_id, str):
+        return context
+
     try:
-        # Placeholder: Fetch block number as a rough proxy for "time/round" context
-        # This proves we have *some* blockchain context at the time of decision.
-        block_number = blockchain_provider.w3.eth.block_number
-        
-        # If we had the FTSO contract address:
-        # round_id = contract.functions.getCurrentVotingRoundId().call()
-        
-        return {
-            "ftso_feed_id": feed_id,
-            "ftso_round_id": block_number # Using block number as verifiable timestamp context
-        }
+        snapshot = await get_ftso_cache(blockchain_provider).snapshot()
     except Exception as e:
         logger.warning("ftso_context_fetch_failed", error=str(e))
-        return {"ftso_feed_id": feed_id, "ftso_round_id": None}
+        return context
+
+    context["ftso_round_id"] = snapshot.voting_round_id
+    context["ftso_price"] = snapshot.price(feed_id)
+    context["ftso_timestamp"] = snapshot.timestamp
+    return context
@@ -0,0 +1,235 @@
+"""
+Multicall Module
+
+This module batches contract reads through Multicall3's `aggregate3`, so the
+native and ERC20 balances of any number of wallets come back from one
+`eth_call` per `multicall_batch_size` reads instead of one call per token.
+On chains where Multicall3 is not deployed the same reads are sent as a
+JSON-RPC batch request instead.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import structlog
+from eth_abi import decode, encode
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.types import RPCEndpoint
+
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+AGGREGATE3 = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+GET_ETH_BALANCE = Web3.keccak(text="getEthBalance(address)")[:4]
+BALANCE_OF = Web3.keccak(text="balanceOf(address)")[:4]
+
+# A JSON-RPC request as (method, params)
+RPCRequest = tuple[RPCEndpoint, list[Any]]
+
+
+@dataclass(frozen=True)
+class Call:
+    """
+    A single contract read.
+
+    Attributes:
+        target (str): Contract address
+        data (bytes): ABI-encoded calldata
+    """
+
+    target: str
+    data: bytes
+
+    def to_request(self) -> RPCRequest:
+        """Return the equivalent standalone eth_call request."""
+        return (
+            RPCEndpoint("eth_call"),
+            [{"to": self.target, "data": HexBytes(self.data).to_0x_hex()}, "latest"],
+        )
+
+
+@dataclass
+class WalletBalances:
+    """
+    Native and ERC20 balances held by one wallet.
+
+    Attributes:
+        address (str): Checksum address of the wallet
+        native (float): Native balance in whole tokens
+        tokens (dict[str, float]): ERC20 balances by symbol in whole tokens;
+            tokens whose read failed are left out
+    """
+
+    address: str
+    native: float
+    tokens: dict[str, float] = field(default_factory=dict)
+
+
+def _to_int(raw: bytes | None) -> int | None:
+    return None if raw is None or not raw else int.from_bytes(raw, "big")
+
+
+class Multicall:
+    """
+    Batches contract reads against one RPC endpoint.
+
+    Whether Multicall3 is deployed is looked up once with `eth_getCode` and
+    remembered for the lifetime of the instance.
+
+    Attributes:
+        w3 (AsyncWeb3): Client the reads are sent through
+        address (str): Multicall3 contract address
+        batch_size (int): Maximum reads per eth_call or JSON-RPC batch
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        address: str | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            w3: Client the reads are sent through
+            address: Multicall3 contract address (defaults to settings)
+            batch_size: Maximum reads per request (defaults to settings)
+        """
+        self.w3 = w3
+        self.address = Web3.to_checksum_address(address or settings.multicall_address)
+        self.batch_size = batch_size or settings.multicall_batch_size
+        self._deployed: bool | None = None
+        self.logger = logger.bind(multicall=self.address)
+
+    async def is_deployed(self) -> bool:
+        """Return whether Multicall3 has code at `address` on this chain."""
+        if self._deployed is None:
+            code = await self.w3.eth.get_code(self.address)
+            self._deployed = len(code) > 0
+            if not self._deployed:
+                self.logger.info("multicall_not_deployed", fallback="jsonrpc_batch")
+        return self._deployed
+
+    async def aggregate(self, calls: Sequence[Call]) -> list[bytes | None]:
+        """
+        Execute contract reads in as few requests as possible.
+
+        Args:
+            calls: Reads to execute
+
+        Returns:
+            list[bytes | None]: Return data of each read in order, or None for
+                reads that reverted
+        """
+        if await self.is_deployed():
+            return await self._chunked(self._aggregate3, list(calls))
+        return await self._chunked(self._batch, [call.to_request() for call in calls])
+
+    async def balances(
+        self,
+        wallets: Sequence[str],
+        token_addresses: Mapping[str, str],
+        token_decimals: Mapping[str, int],
+    ) -> list[WalletBalances]:
+        """
+        Fetch native and ERC20 balances for many wallets at once.
+
+        Args:
+            wallets: Wallet addresses
+            token_addresses: Token contract addresses by symbol; entries whose
+                address is "native" are skipped
+            token_decimals: Decimal places by symbol (default: 18)
+
+        Returns:
+            list[WalletBalances]: Balances for each wallet, in input order
+
+        Raises:
+            ValueError: If the native balance of a wallet cannot be read
+        """
+        owners = [Web3.to_checksum_address(wallet) for wallet in wallets]
+        tokens = {
+            symbol: Web3.to_checksum_address(address)
+            for symbol, address in token_addresses.items()
+            if address != "native"
+        }
+        token_calls = [
+            Call(token, BALANCE_OF + encode(["address"], [owner]))
+            for owner in owners
+            for token in tokens.values()
+        ]
+
+        if await self.is_deployed():
+            native_calls = [
+                Call(self.address, GET_ETH_BALANCE + encode(["address"], [owner]))
+                for owner in owners
+            ]
+            results = await self._chunked(self._aggregate3, native_calls + token_calls)
+        else:
+            requests: list[RPCRequest] = [
+                (RPCEndpoint("eth_getBalance"), [owner, "latest"]) for owner in owners
+            ]
+            requests += [call.to_request() for call in token_calls]
+            results = await self._chunked(self._batch, requests)
+
+        native, token_results = results[: len(owners)], results[len(owners) :]
+        balances = []
+        for i, owner in enumerate(owners):
+            native_wei = _to_int(native[i])
+            if native_wei is None:
+                msg = f"Failed to read native balance of {owner}"
+                raise ValueError(msg)
+            wallet = WalletBalances(address=owner, native=float(Web3.from_wei(native_wei, "ether")))
+            row = token_results[i * len(tokens) : (i + 1) * len(tokens)]
+            for symbol, raw in zip(tokens, row, strict=True):
+                value = _to_int(raw)
+                if value is None:
+                    self.logger.warning("token_balance_failed", symbol=symbol, address=owner)
+                    continue
+                wallet.tokens[symbol] = value / 10 ** token_decimals.get(symbol, 18)
+            balances.append(wallet)
+        return balances
+
+    async def _chunked(
+        self,
+        run: Callable[[list[T]], Awaitable[list[bytes | None]]],
+        items: list[T],
+    ) -> list[bytes | None]:
+        """Split items into batch_size chunks and run the chunks concurrently."""
+        chunks = [
+            items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)
+        ]
+        results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return [result for chunk in results for result in chunk]
+
+    async def _aggregate3(self, calls: list[Call]) -> list[bytes | None]:
+        """Execute reads in one aggregate3 eth_call, allowing each to fail."""
+        data = AGGREGATE3 + encode(
+            ["(address,bool,bytes)[]"], [[(c.target, True, c.data) for c in calls]]
+        )
+        # Sent to the provider directly: the read needs none of web3's request
+        # middleware, whose transaction validation costs an eth_chainId per call
+        method, params = Call(self.address, data).to_request()
+        response = await self.w3.provider.make_request(method, params)
+        if "error" in response:
+            msg = f"Multicall aggregate3 failed: {response['error']}"
+            raise ValueError(msg)
+        (results,) = decode(["(bool,bytes)[]"], HexBytes(response["result"]))
+        return [bytes(result) if success else None for success, result in results]
+
+    async def _batch(self, requests: list[RPCRequest]) -> list[bytes | None]:
+        """Send requests as one JSON-RPC batch."""
+        responses = await self.w3.provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            msg = f"JSON-RPC batch failed: {responses.get('error')}"
+            raise ValueError(msg)
+        return [
+            None if response.get("result") is None else bytes(HexBytes(response["result"]))
+            for response in responses
+        ]
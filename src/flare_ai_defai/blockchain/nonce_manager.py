@@ -0,0 +1,238 @@
+"""
+Nonce Manager Module
+
+This module allocates transaction nonces locally so several transactions
+for one address can be prepared and submitted concurrently without reusing
+a nonce, and without a `get_transaction_count` RPC per transaction.
+
+Each address is seeded once from its `pending` transaction count. Nonces
+are then handed out sequentially, a bundle at a time, and each one stays
+reserved until its receipt is reported (`confirm`), the caller gives it
+back (`release`) or it expires after `reservation_ttl`. An expired
+reservation may have been signed, dropped or never sent, so the next
+allocation re-reads the pending count and continues from whichever is
+higher: the chain or the highest live reservation. An address with no
+live reservations is re-read after `sync_interval`, which picks up
+transactions its wallet sent elsewhere.
+
+Only transactions the server signs itself are allocated here. Previews
+built for a user's wallet read the pending count instead, since an
+unsigned preview never confirms or releases its nonce.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from web3 import AsyncWeb3
+
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+# Concurrent allocations for one address share one pending count read
+nonce_flight = SingleFlight("nonce_manager")
+
+_managers: dict[str, "NonceManager"] = {}
+
+
+@dataclass
+class _Account:
+    next_nonce: int
+    synced_at: float
+    # Outstanding nonce -> monotonic time its reservation expires
+    reserved: dict[int, float] = field(default_factory=dict)
+    stale: bool = False
+
+
+class NonceManager:
+    """
+    Per-address nonce allocator with reservation expiry and reconciliation.
+
+    Attributes:
+        w3 (AsyncWeb3): Client used for pending count reads
+        reservation_ttl (float): Seconds an unconfirmed nonce stays reserved
+        sync_interval (float): Seconds an idle address's counter is trusted
+        max_accounts (int): Addresses tracked before the least recent is dropped
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        reservation_ttl: float | None = None,
+        sync_interval: float | None = None,
+        max_accounts: int | None = None,
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            w3: Client used for pending count reads
+            reservation_ttl: Seconds an unconfirmed nonce stays reserved
+                (defaults to settings)
+            sync_interval: Seconds an idle address's counter is trusted
+                (defaults to settings)
+            max_accounts: Addresses tracked before the least recent is
+                dropped (defaults to settings)
+        """
+        self.w3 = w3
+        self.reservation_ttl = (
+            settings.nonce_reservation_ttl
+            if reservation_ttl is None
+            else reservation_ttl
+        )
+        self.sync_interval = (
+            settings.nonce_sync_interval if sync_interval is None else sync_interval
+        )
+        self.max_accounts = max_accounts or settings.nonce_max_accounts
+        self._accounts: OrderedDict[str, _Account] = OrderedDict()
+        self._counters = {"reserved": 0, "syncs": 0, "expired": 0, "rewound": 0}
+        self.logger = logger.bind(url=getattr(w3.provider, "endpoint_uri", None))
+
+    async def sync(self, address: str) -> None:
+        """
+        Make sure an address's counter is seeded and current.
+
+        Reads the pending count only if the address is new, has expired
+        reservations, or has been idle for longer than `sync_interval`.
+        Callers can run this alongside other reads so that a following
+        `reserve` is local.
+
+        Args:
+            address: Sending address
+        """
+        key = address.lower()
+        account = self._accounts.get(key)
+        if account is not None:
+            self._expire(account, time.monotonic())
+        if account is None or account.stale or (
+            not account.reserved
+            and time.monotonic() - account.synced_at > self.sync_interval
+        ):
+            await nonce_flight.do((id(self), key), lambda: self._sync(address))
+
+    async def reserve(self, address: str, count: int = 1) -> list[int]:
+        """
+        Reserve consecutive nonces for a bundle of transactions.
+
+        Args:
+            address: Sending address
+            count: Number of transactions in the bundle
+
+        Returns:
+            list[int]: Nonces in submission order
+        """
+        await self.sync(address)
+        account = self._accounts[address.lower()]
+        self._accounts.move_to_end(address.lower())
+        expires_at = time.monotonic() + self.reservation_ttl
+        nonces = list(range(account.next_nonce, account.next_nonce + count))
+        account.next_nonce += count
+        for nonce in nonces:
+            account.reserved[nonce] = expires_at
+        self._counters["reserved"] += count
+        self.logger.debug("nonces_reserved", address=address, nonces=nonces)
+        return nonces
+
+    def confirm(self, address: str, nonce: int) -> None:
+        """
+        Record that a transaction was mined.
+
+        A mined nonce also settles every lower nonce of the address.
+
+        Args:
+            address: Sending address
+            nonce: Nonce of the mined transaction
+        """
+        account = self._accounts.get(address.lower())
+        if account is None:
+            return
+        for reserved in [n for n in account.reserved if n <= nonce]:
+            del account.reserved[reserved]
+        account.next_nonce = max(account.next_nonce, nonce + 1)
+
+    def release(self, address: str, nonces: Iterable[int]) -> None:
+        """
+        Give back nonces whose transactions will not be sent.
+
+        If no live reservation sits above them the counter rewinds so the
+        nonces are reused; otherwise they are left as a gap for the next
+        reconciliation with the chain.
+
+        Args:
+            address: Sending address
+            nonces: Nonces to give back
+        """
+        account = self._accounts.get(address.lower())
+        if account is None:
+            return
+        released = [n for n in nonces if account.reserved.pop(n, None) is not None]
+        if not released:
+            return
+        floor = max(account.reserved, default=-1) + 1
+        rewound = max(floor, min(released))
+        if rewound < account.next_nonce:
+            account.next_nonce = rewound
+            self._counters["rewound"] += 1
+
+    def forget(self, address: str) -> None:
+        """Drop an address, e.g. after a dropped transaction; it is re-seeded on next use."""
+        self._accounts.pop(address.lower(), None)
+
+    def stats(self) -> dict[str, Any]:
+        """Report tracked addresses, live reservations and counters."""
+        return {
+            "accounts": len(self._accounts),
+            "live_reservations": sum(len(a.reserved) for a in self._accounts.values()),
+            **self._counters,
+        }
+
+    def _expire(self, account: _Account, now: float) -> None:
+        expired = [n for n, expires_at in account.reserved.items() if expires_at <= now]
+        for nonce in expired:
+            del account.reserved[nonce]
+        if expired:
+            account.stale = True
+            self._counters["expired"] += len(expired)
+
+    async def _sync(self, address: str) -> None:
+        pending = await self.w3.eth.get_transaction_count(
+            self.w3.to_checksum_address(address), "pending"
+        )
+        key = address.lower()
+        account = self._accounts.get(key)
+        now = time.monotonic()
+        if account is None:
+            account = self._accounts[key] = _Account(pending, now)
+            while len(self._accounts) > self.max_accounts:
+                self._accounts.popitem(last=False)
+        else:
+            # Reservations made while the read was in flight stay valid
+            account.next_nonce = max(pending, max(account.reserved, default=-1) + 1)
+            account.synced_at = now
+            account.stale = False
+        self._counters["syncs"] += 1
+        self.logger.debug("nonce_synced", address=address, pending=pending)
+
+
+def get_nonce_manager(web3_provider_url: str) -> NonceManager:
+    """
+    Return the shared NonceManager for an RPC URL.
+
+    Args:
+        web3_provider_url: JSON-RPC endpoint
+
+    Returns:
+        NonceManager: Manager reading through the shared client for the URL
+    """
+    manager = _managers.get(web3_provider_url)
+    if manager is None:
+        manager = _managers[web3_provider_url] = NonceManager(
+            get_async_web3(web3_provider_url)
+        )
+    return manager
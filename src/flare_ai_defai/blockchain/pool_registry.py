@@ -0,0 +1,234 @@
+"""
+Pool Registry Module
+
+This module keeps an in-memory index of every pair created by a BlazeSwap
+(Uniswap V2) factory, keyed by token pair, so pool existence checks are
+dictionary lookups instead of `getPair` RPCs.
+
+The factory's `allPairs` list is append-only and mirrors its `PairCreated`
+events, so the index is loaded once with `allPairsLength`/`allPairs`
+(batched through Multicall) and refreshed by fetching only the entries past
+the last known index. An optional JSON snapshot on disk lets a restart skip
+the full scan and fetch just the pairs created while the process was down.
+"""
+
+import json
+import os
+import time
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+from eth_abi import decode, encode
+from web3 import AsyncWeb3, Web3
+
+from flare_ai_defai.blockchain.multicall import Call, Multicall
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+ALL_PAIRS_LENGTH = Web3.keccak(text="allPairsLength()")[:4]
+ALL_PAIRS = Web3.keccak(text="allPairs(uint256)")[:4]
+TOKEN0 = Web3.keccak(text="token0()")[:4]
+TOKEN1 = Web3.keccak(text="token1()")[:4]
+
+# Concurrent loads and refreshes of the same factory share one scan
+registry_flight = SingleFlight("pool_registry")
+
+
+@dataclass(frozen=True)
+class Pool:
+    """
+    A factory pair.
+
+    Attributes:
+        pair (str): Pair contract address
+        token0 (str): Lower-sorted token address
+        token1 (str): Higher-sorted token address
+    """
+
+    pair: str
+    token0: str
+    token1: str
+
+
+def pair_key(token_a: str, token_b: str) -> tuple[str, str]:
+    """Return the order-independent index key for two token addresses."""
+    a, b = token_a.lower(), token_b.lower()
+    return (a, b) if a < b else (b, a)
+
+
+def _address(raw: bytes | None) -> str:
+    if not raw:
+        msg = "Factory read returned no data"
+        raise ValueError(msg)
+    return Web3.to_checksum_address(decode(["address"], raw)[0])
+
+
+class PoolRegistry:
+    """
+    Index of a factory's pairs with incremental refresh.
+
+    Lookups never touch the network once the index is loaded, except that a
+    miss refreshes the index when it is older than `refresh_interval`, so a
+    pool created since the last refresh is still found.
+
+    Attributes:
+        factory (str): Factory contract address
+        snapshot_path (Path | None): JSON snapshot location, if persisted
+        refresh_interval (float): Minimum seconds between refreshes on a miss
+        pools (dict[tuple[str, str], Pool]): Pools keyed by `pair_key`
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        factory: str,
+        snapshot_path: str | Path | None = None,
+        refresh_interval: float = 60.0,
+        multicall: Multicall | None = None,
+    ) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            w3: Client used for factory reads
+            factory: Factory contract address
+            snapshot_path: JSON snapshot location (None disables persistence)
+            refresh_interval: Minimum seconds between refreshes on a miss
+            multicall: Batcher for factory and pair reads
+        """
+        self.factory = Web3.to_checksum_address(factory)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.refresh_interval = refresh_interval
+        self.multicall = multicall or Multicall(w3)
+        self.pools: dict[tuple[str, str], Pool] = {}
+        self._pairs: list[Pool] = []
+        self._loaded = False
+        self._refreshed_at = 0.0
+        self.logger = logger.bind(factory=self.factory)
+
+    @classmethod
+    def from_settings(cls, w3: AsyncWeb3, factory: str) -> "PoolRegistry":
+        """
+        Build a registry configured from application settings.
+
+        The snapshot file name includes the factory address, so one snapshot
+        directory can serve several networks.
+        """
+        snapshot_path = None
+        if settings.pool_registry_dir:
+            snapshot_path = Path(settings.pool_registry_dir) / f"pools-{factory.lower()}.json"
+        return cls(
+            w3,
+            factory,
+            snapshot_path=snapshot_path,
+            refresh_interval=settings.pool_registry_refresh_interval,
+        )
+
+    async def get_pool(self, token_a: str, token_b: str) -> Pool | None:
+        """
+        Look up the pool for two token addresses.
+
+        Args:
+            token_a: Address of one token
+            token_b: Address of the other token
+
+        Returns:
+            Pool | None: The pool, or None if the factory has no such pair
+        """
+        await self.ensure_loaded()
+        key = pair_key(token_a, token_b)
+        pool = self.pools.get(key)
+        if pool is None and time.monotonic() - self._refreshed_at > self.refresh_interval:
+            await self.refresh()
+            pool = self.pools.get(key)
+        return pool
+
+    async def ensure_loaded(self) -> None:
+        """Load the index from the snapshot or the chain on first use."""
+        if not self._loaded:
+            await registry_flight.do((self.factory, id(self), "load"), self._load)
+
+    async def refresh(self) -> int:
+        """
+        Add pairs created since the last refresh.
+
+        Returns:
+            int: Number of new pairs
+        """
+        await self.ensure_loaded()
+        return await registry_flight.do((self.factory, id(self), "refresh"), self._refresh)
+
+    def stats(self) -> dict[str, Any]:
+        """Report index size and age."""
+        return {
+            "pools": len(self._pairs),
+            "loaded": self._loaded,
+            "age_seconds": time.monotonic() - self._refreshed_at if self._loaded else None,
+        }
+
+    async def _load(self) -> None:
+        if self._loaded:
+            return
+        self._read_snapshot()
+        await self._refresh()
+        self._loaded = True
+
+    async def _refresh(self) -> int:
+        (raw_length,) = await self.multicall.aggregate(
+            [Call(self.factory, ALL_PAIRS_LENGTH)]
+        )
+        length = decode(["uint256"], raw_length)[0] if raw_length else 0
+        start = len(self._pairs)
+        self._refreshed_at = time.monotonic()
+        if length <= start:
+            return 0
+
+        raw_pairs = await self.multicall.aggregate(
+            [Call(self.factory, ALL_PAIRS + encode(["uint256"], [i])) for i in range(start, length)]
+        )
+        pairs = [_address(raw) for raw in raw_pairs]
+        raw_tokens = await self.multicall.aggregate(
+            [Call(pair, selector) for pair in pairs for selector in (TOKEN0, TOKEN1)]
+        )
+        for i, pair in enumerate(pairs):
+            self._add(Pool(pair, _address(raw_tokens[2 * i]), _address(raw_tokens[2 * i + 1])))
+
+        self.logger.info("pool_registry_refreshed", added=length - start, total=length)
+        self._write_snapshot()
+        return length - start
+
+    def _add(self, pool: Pool) -> None:
+        self._pairs.append(pool)
+        self.pools[pair_key(pool.token0, pool.token1)] = pool
+
+    def _read_snapshot(self) -> None:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return
+        try:
+            data = json.loads(self.snapshot_path.read_text())
+            if data.get("factory") != self.factory:
+                return
+            for pair, token0, token1 in data["pairs"]:
+                self._add(Pool(pair, token0, token1))
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning("pool_snapshot_unreadable", path=str(self.snapshot_path), error=str(e))
+            self.pools.clear()
+            self._pairs.clear()
+            return
+        self.logger.info("pool_snapshot_loaded", pools=len(self._pairs))
+
+    def _write_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        data = {"factory": self.factory, "pairs": [astuple(p) for p in self._pairs]}
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            self.logger.warning("pool_snapshot_write_failed", path=str(self.snapshot_path), error=str(e))
@@ -0,0 +1,434 @@
+"""
+Quote Engine Module
+
+This module quotes BlazeSwap swaps locally. BlazeSwap pairs are Uniswap V2
+constant-product pools, so with a pair's reserves the router's
+`getAmountsOut` can be reproduced exactly in integer math.
+
+Reserves are tracked only for the registry pools that can lie on a route
+of up to `swap_max_hops` pools between two of the configured tokens, not
+for every pair the factory has created. They are fetched together in one
+Multicall batch and cached until the chain advances to a new block. The
+block number itself is polled at most once per `block_poll_interval`, so
+once reserves are warm any number of quotes, route searches or liquidity
+sizings costs no RPCs at all.
+
+Route search enumerates the simple paths of up to `swap_max_hops` pools
+through the cached reserve graph and keeps the one with the largest output.
+"""
+
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from eth_abi import decode
+from web3 import AsyncWeb3, Web3
+
+from flare_ai_defai.blockchain.multicall import Call, Multicall
+from flare_ai_defai.blockchain.pool_registry import Pool, PoolRegistry, pair_key
+from flare_ai_defai.settings import settings
+from flare_ai_defai.singleflight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+# BlazeSwap (Uniswap V2) swap fee: 0.3% of the input stays in the pool
+FEE_NUMERATOR, FEE_DENOMINATOR = 997, 1000
+BIPS = 10_000
+
+GET_RESERVES = Web3.keccak(text="getReserves()")[:4]
+
+# Concurrent quotes share one block poll and one reserves fetch per block
+reserves_flight = SingleFlight("blazeswap_reserves")
+
+Reserves = tuple[int, int]
+# Reserves by token, then by neighbouring token, ordered (token, neighbour)
+PoolGraph = Mapping[str, Mapping[str, Reserves]]
+
+
+class NoRouteError(ValueError):
+    """Raised when no path of pools connects two tokens."""
+
+
+def get_amount_out(amount_in: int, reserve_in: int, reserve_out: int) -> int:
+    """
+    Output of one constant-product hop, as computed by the BlazeSwap router.
+
+    Args:
+        amount_in: Input amount in the input token's smallest unit
+        reserve_in: Pool reserve of the input token
+        reserve_out: Pool reserve of the output token
+
+    Returns:
+        int: Output amount in the output token's smallest unit
+
+    Raises:
+        ValueError: If the amount or either reserve is not positive
+    """
+    if amount_in <= 0:
+        msg = "Insufficient input amount"
+        raise ValueError(msg)
+    if reserve_in <= 0 or reserve_out <= 0:
+        msg = "Insufficient liquidity"
+        raise ValueError(msg)
+    amount_in_with_fee = amount_in * FEE_NUMERATOR
+    return (amount_in_with_fee * reserve_out) // (
+        reserve_in * FEE_DENOMINATOR + amount_in_with_fee
+    )
+
+
+def quote_liquidity(amount_a: int, reserve_a: int, reserve_b: int) -> int:
+    """Amount of token B matching `amount_a` at the pool's current ratio."""
+    if reserve_a <= 0 or reserve_b <= 0:
+        msg = "Insufficient liquidity"
+        raise ValueError(msg)
+    return amount_a * reserve_b // reserve_a
+
+
+def min_amount_out(amount_out: int, slippage_bips: int) -> int:
+    """Lowest acceptable output after allowing `slippage_bips` of slippage."""
+    return amount_out * (BIPS - slippage_bips) // BIPS
+
+
+def find_best_path(
+    graph: PoolGraph,
+    amount_in: int,
+    token_in: str,
+    token_out: str,
+    max_hops: int,
+) -> tuple[int, list[str]] | None:
+    """
+    Find the path of at most `max_hops` pools with the largest output.
+
+    Paths never revisit a token. Outputs are computed hop by hop while the
+    search descends, so each prefix is evaluated once.
+
+    Args:
+        graph: Reserves by token and neighbouring token
+        amount_in: Input amount in token_in's smallest unit
+        token_in: Address of the input token
+        token_out: Address of the output token
+        max_hops: Maximum pools along the path
+
+    Returns:
+        tuple[int, list[str]] | None: Best output and its path, or None if
+            no path within max_hops yields any output
+    """
+    best: tuple[int, list[str]] | None = None
+
+    def visit(token: str, amount: int, path: list[str]) -> None:
+        nonlocal best
+        for neighbour, (reserve_in, reserve_out) in graph.get(token, {}).items():
+            if neighbour in path or reserve_in <= 0 or reserve_out <= 0:
+                continue
+            amount_out = get_amount_out(amount, reserve_in, reserve_out)
+            if amount_out <= 0:
+                continue
+            if neighbour == token_out:
+                if best is None or amount_out > best[0]:
+                    best = (amount_out, [*path, neighbour])
+            elif len(path) < max_hops:
+                visit(neighbour, amount_out, [*path, neighbour])
+
+    if amount_in > 0 and token_in != token_out:
+        visit(token_in, amount_in, [token_in])
+    return best
+
+
+def reachable_pools(
+    pools: Mapping[tuple[str, str], Pool],
+    tokens: Iterable[str],
+    max_hops: int,
+) -> dict[tuple[str, str], Pool]:
+    """
+    Select the pools that can lie on a route between two of `tokens`.
+
+    A pool between u and v is kept when some pair of distinct tokens s and t
+    has d(s, u) + 1 + d(v, t) <= max_hops, d counting the pools between them.
+
+    Args:
+        pools: Registry pools by pair key
+        tokens: Addresses routes start and end at
+        max_hops: Maximum pools along a route
+
+    Returns:
+        dict: The selected pools by pair key
+    """
+    neighbours: dict[str, list[str]] = {}
+    for token_a, token_b in pools:
+        neighbours.setdefault(token_a, []).append(token_b)
+        neighbours.setdefault(token_b, []).append(token_a)
+    # Token -> configured token -> pools between them, up to max_hops - 1
+    reach: dict[str, dict[str, int]] = {}
+    for source in {token.lower() for token in tokens}:
+        reach.setdefault(source, {})[source] = 0
+        frontier = [source]
+        for depth in range(1, max_hops):
+            reached = []
+            for token in frontier:
+                for neighbour in neighbours.get(token, ()):
+                    if source not in reach.setdefault(neighbour, {}):
+                        reach[neighbour][source] = depth
+                        reached.append(neighbour)
+            frontier = reached
+
+    def routable(key: tuple[str, str]) -> bool:
+        ends_a, ends_b = reach.get(key[0], {}), reach.get(key[1], {})
+        return any(
+            start != end and to_a + 1 + to_b <= max_hops
+            for start, to_a in ends_a.items()
+            for end, to_b in ends_b.items()
+        )
+
+    return {key: pool for key, pool in pools.items() if routable(key)}
+
+
+@dataclass(frozen=True)
+class Quote:
+    """
+    A swap quote.
+
+    Attributes:
+        path (tuple[str, ...]): Token addresses along the route
+        amounts (tuple[int, ...]): Amount at each step, as getAmountsOut returns
+        price_impact (float | None): Fraction of the output lost to moving the
+            pools' prices, excluding the swap fee (None if quoted by the router)
+        block (int | None): Block whose reserves were used (None if quoted by
+            the router)
+    """
+
+    path: tuple[str, ...]
+    amounts: tuple[int, ...]
+    price_impact: float | None = None
+    block: int | None = None
+
+    @property
+    def amount_in(self) -> int:
+        """Input amount."""
+        return self.amounts[0]
+
+    @property
+    def amount_out(self) -> int:
+        """Final output amount."""
+        return self.amounts[-1]
+
+    def min_amount_out(self, slippage_bips: int) -> int:
+        """Lowest acceptable output after allowing `slippage_bips` of slippage."""
+        return min_amount_out(self.amount_out, slippage_bips)
+
+
+class QuoteEngine:
+    """
+    Quotes swaps and sizes liquidity from cached pool reserves.
+
+    Attributes:
+        registry (PoolRegistry): Index of the factory's pools
+        tokens (frozenset[str] | None): Lowercased addresses routes start and
+            end at; reserves are tracked for the pools between them (every
+            registry pool if None)
+        block_poll_interval (float): Minimum seconds between block number reads
+        max_hops (int): Maximum pools along a searched route
+        block (int | None): Block the cached reserves belong to
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        registry: PoolRegistry,
+        block_poll_interval: float | None = None,
+        multicall: Multicall | None = None,
+        max_hops: int | None = None,
+        tokens: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            w3: Client used for block number reads
+            registry: Index of the factory's pools
+            block_poll_interval: Minimum seconds between block number reads
+                (defaults to settings)
+            multicall: Batcher for reserve reads (defaults to the registry's)
+            max_hops: Maximum pools along a searched route (defaults to settings)
+            tokens: Addresses routes start and end at (defaults to tracking
+                every registry pool)
+        """
+        self.w3 = w3
+        self.registry = registry
+        self.block_poll_interval = (
+            settings.quote_block_poll_interval
+            if block_poll_interval is None
+            else block_poll_interval
+        )
+        self.multicall = multicall or registry.multicall
+        self.max_hops = max_hops or settings.swap_max_hops
+        self.tokens = (
+            None if tokens is None else frozenset(token.lower() for token in tokens)
+        )
+        self.block: int | None = None
+        self._block_checked_at = 0.0
+        # Pools selected for the registry at its last seen size (append-only)
+        self._tracked: dict[tuple[str, str], Pool] = {}
+        self._tracked_size = -1
+        # Pools whose reserves the last load requested, including failed reads
+        self._loaded: frozenset[tuple[str, str]] = frozenset()
+        self._reserves: dict[tuple[str, str], Reserves] = {}
+        self._graph: dict[str, dict[str, Reserves]] = {}
+        self.logger = logger.bind(factory=registry.factory)
+
+    async def quote(self, amount_in: int, path: Sequence[str]) -> Quote:
+        """
+        Quote an exact-input swap along a path.
+
+        Args:
+            amount_in: Input amount in the first token's smallest unit
+            path: Token addresses along the route
+
+        Returns:
+            Quote: Amounts at each step, price impact and block
+
+        Raises:
+            ValueError: If a hop has no pool or no liquidity
+        """
+        return self._quote(amount_in, path, await self.refresh())
+
+    async def quote_many(self, amounts_in: Sequence[int], path: Sequence[str]) -> list[Quote]:
+        """Quote several input amounts along one path from the same reserves."""
+        block = await self.refresh()
+        return [self._quote(amount_in, path, block) for amount_in in amounts_in]
+
+    async def best_route(self, amount_in: int, token_in: str, token_out: str) -> Quote:
+        """
+        Quote the best path of up to `max_hops` pools between two tokens.
+
+        Args:
+            amount_in: Input amount in token_in's smallest unit
+            token_in: Address of the input token
+            token_out: Address of the output token
+
+        Returns:
+            Quote: Path, amounts and price impact of the best route
+
+        Raises:
+            NoRouteError: If no path within max_hops connects the tokens
+        """
+        block = await self.refresh()
+        found = find_best_path(
+            self._graph,
+            amount_in,
+            Web3.to_checksum_address(token_in),
+            Web3.to_checksum_address(token_out),
+            self.max_hops,
+        )
+        if found is None:
+            msg = f"No route of up to {self.max_hops} pools from {token_in} to {token_out}"
+            raise NoRouteError(msg)
+        return self._quote(amount_in, found[1], block)
+
+    def _quote(self, amount_in: int, path: Sequence[str], block: int) -> Quote:
+        amounts = [amount_in]
+        # Fee-adjusted output at the pools' mid prices, for the price impact
+        ideal = float(amount_in)
+        for token_in, token_out in zip(path, path[1:], strict=False):
+            reserve_in, reserve_out = self.reserves(token_in, token_out)
+            amounts.append(get_amount_out(amounts[-1], reserve_in, reserve_out))
+            ideal *= reserve_out / reserve_in * FEE_NUMERATOR / FEE_DENOMINATOR
+        impact = max(0.0, 1 - amounts[-1] / ideal) if ideal else 0.0
+        return Quote(tuple(path), tuple(amounts), impact, block)
+
+    async def liquidity_amount(self, token_a: str, token_b: str, amount_a: int) -> int | None:
+        """
+        Size the token B deposit matching `amount_a` of token A.
+
+        Args:
+            token_a: Address of the token whose amount is fixed
+            token_b: Address of the other token
+            amount_a: Token A amount in its smallest unit
+
+        Returns:
+            int | None: Token B amount, or None if the pool does not exist or
+                is empty, in which case the depositor sets the price
+        """
+        await self.refresh()
+        try:
+            reserve_a, reserve_b = self.reserves(token_a, token_b)
+            return quote_liquidity(amount_a, reserve_a, reserve_b)
+        except ValueError:
+            return None
+
+    def reserves(self, token_a: str, token_b: str) -> Reserves:
+        """
+        Cached reserves of a pool, ordered as (token_a, token_b).
+
+        Raises:
+            ValueError: If the pair has no pool
+        """
+        key = pair_key(token_a, token_b)
+        reserves = self._reserves.get(key)
+        if reserves is None:
+            msg = f"No liquidity pool exists for {token_a}/{token_b}"
+            raise ValueError(msg)
+        return reserves if key[0] == token_a.lower() else (reserves[1], reserves[0])
+
+    async def refresh(self) -> int:
+        """
+        Make sure cached reserves belong to the latest block.
+
+        Returns:
+            int: Block the cached reserves belong to
+        """
+        if self.block is not None and (
+            time.monotonic() - self._block_checked_at < self.block_poll_interval
+        ):
+            return self.block
+        return await reserves_flight.do((id(self), "refresh"), self._refresh)
+
+    def stats(self) -> dict[str, Any]:
+        """Report cached block, tracked pools and pools with reserves."""
+        return {
+            "block": self.block,
+            "tracked_pools": len(self._tracked),
+            "pools": len(self._reserves),
+        }
+
+    def _tracked_pools(self) -> dict[tuple[str, str], Pool]:
+        pools = self.registry.pools
+        if len(pools) != self._tracked_size:
+            self._tracked = (
+                dict(pools)
+                if self.tokens is None
+                else reachable_pools(pools, self.tokens, self.max_hops)
+            )
+            self._tracked_size = len(pools)
+        return self._tracked
+
+    async def _refresh(self) -> int:
+        await self.registry.ensure_loaded()
+        block = await self.w3.eth.block_number
+        self._block_checked_at = time.monotonic()
+        tracked = self._tracked_pools()
+        if block != self.block or self._loaded != tracked.keys():
+            await self._load_reserves(block, tracked)
+        return block
+
+    async def _load_reserves(
+        self, block: int, tracked: Mapping[tuple[str, str], Pool]
+    ) -> None:
+        pools = list(tracked.items())
+        results = await self.multicall.aggregate(
+            [Call(pool.pair, GET_RESERVES) for _, pool in pools]
+        )
+        reserves: dict[tuple[str, str], Reserves] = {}
+        graph: dict[str, dict[str, Reserves]] = {}
+        for (key, pool), raw in zip(pools, results, strict=True):
+            if raw:
+                reserve0, reserve1, _ = decode(["uint112", "uint112", "uint32"], raw)
+                reserves[key] = (reserve0, reserve1)
+                graph.setdefault(pool.token0, {})[pool.token1] = (reserve0, reserve1)
+                graph.setdefault(pool.token1, {})[pool.token0] = (reserve1, reserve0)
+        self._reserves = reserves
+        self._graph = graph
+        self._loaded = frozenset(tracked)
+        self.block = block
+        self.logger.debug("reserves_loaded", block=block, pools=len(reserves))
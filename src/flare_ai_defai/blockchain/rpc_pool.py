@@ -0,0 +1,297 @@
+"""
+RPC Endpoint Pool Module
+
+This module spreads JSON-RPC traffic over several endpoints of the same
+chain, so one lagging or failing node no longer degrades every request.
+
+Each endpoint is scored from its recent latencies, an exponentially
+weighted error rate and how far its head block trails the best head seen
+across the pool. Heads are refreshed by probing `eth_blockNumber` on every
+endpoint at most once per `rpc_probe_interval`. An endpoint that raised is
+cooled down for `rpc_failure_cooldown` seconds, and one more than
+`rpc_max_block_lag` blocks behind is only used when nothing better is left.
+
+Reads go to the best endpoint. If it has not answered after its own p95
+latency (clamped to `rpc_hedge_min_delay`..`rpc_hedge_max_delay`) the same
+request is also sent to the runner-up and whichever answers first wins.
+A read that fails outright fails over to the next endpoint. Writes, and the
+nonce reads they depend on, stick to one endpoint until it fails, so a
+transaction and the pending state it was built from come from the same node.
+
+JSON-RPC error responses (e.g. reverts) are answers, not endpoint failures;
+only transport errors count against an endpoint.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+import structlog
+from web3 import AsyncHTTPProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Methods sent to the sticky endpoint rather than the best-scored one
+STICKY_METHODS = frozenset(
+    {"eth_sendRawTransaction", "eth_sendTransaction", "eth_getTransactionCount"}
+)
+# Latency samples kept per endpoint
+LATENCY_WINDOW = 200
+# Weight of the latest outcome in the error rate
+ERROR_RATE_ALPHA = 0.1
+
+_pools: list["RPCPoolProvider"] = []
+
+
+class Endpoint:
+    """
+    Health record for one endpoint of the pool.
+
+    Attributes:
+        provider (AsyncJSONBaseProvider): Provider sending the endpoint's requests
+        url (str): JSON-RPC endpoint
+        latencies (deque[float]): Recent successful request latencies in seconds
+        error_rate (float): Exponentially weighted share of failed requests
+        head (int): Latest block number seen from the endpoint
+        cooldown_until (float): Monotonic time until which the endpoint is avoided
+    """
+
+    def __init__(self, provider: AsyncJSONBaseProvider) -> None:
+        """
+        Initialize the record.
+
+        Args:
+            provider: Provider sending the endpoint's requests
+        """
+        self.provider = provider
+        self.url: str = getattr(provider, "endpoint_uri", repr(provider))
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.error_rate = 0.0
+        self.head = 0
+        self.cooldown_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def quantile(self, q: float) -> float | None:
+        """Return a latency quantile, or None before the first sample."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+    def record(self, seconds: float, failed: bool) -> None:
+        """Record the outcome of one request."""
+        self.requests += 1
+        self.error_rate += ERROR_RATE_ALPHA * (float(failed) - self.error_rate)
+        if failed:
+            self.failures += 1
+            self.cooldown_until = time.monotonic() + settings.rpc_failure_cooldown
+        else:
+            self.latencies.append(seconds)
+
+    def rank(self, best_head: int, now: float) -> tuple[bool, bool, float]:
+        """Sort key: cooling down, then lagging, then expected cost."""
+        median = self.quantile(0.5) or 0.0
+        return (
+            self.cooldown_until > now,
+            best_head - self.head > settings.rpc_max_block_lag,
+            median * (1.0 + 10.0 * self.error_rate),
+        )
+
+
+class RPCPoolProvider(AsyncJSONBaseProvider):
+    """
+    Async provider routing each request to the healthiest of several endpoints.
+
+    Attributes:
+        endpoints (list[Endpoint]): Health records, in configured order
+        endpoint_uri (str): First configured endpoint, for logging
+    """
+
+    def __init__(self, providers: list[AsyncJSONBaseProvider]) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            providers: One provider per endpoint; the first is preferred
+                until latencies have been measured
+        """
+        super().__init__()
+        for provider in providers:
+            # Failing over beats retrying the same endpoint with backoff
+            if isinstance(provider, AsyncHTTPProvider):
+                provider.exception_retry_configuration = None
+        self.endpoints = [Endpoint(provider) for provider in providers]
+        self.endpoint_uri = self.endpoints[0].url
+        self._sticky = self.endpoints[0]
+        self._probed_at = -math.inf
+        self._probe: asyncio.Task[None] | None = None
+        self._counters = {"hedged": 0, "hedges_won": 0, "failovers": 0}
+        self.logger = logger.bind(pool=[e.url for e in self.endpoints])
+        _pools.append(self)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a request to the sticky endpoint (writes) or the best (reads)."""
+        self._maybe_probe()
+        if method in STICKY_METHODS:
+            return await self._send_sticky(method, params)
+        return await self._send_hedged(method, params)
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send a batch to the best endpoint, failing over without hedging."""
+        self._maybe_probe()
+        error: BaseException | None = None
+        for endpoint in self._ranked():
+            try:
+                return await self._timed(
+                    endpoint, endpoint.provider.make_batch_request(batch_requests)
+                )
+            except Exception as e:  # noqa: BLE001
+                error = e
+                self._counters["failovers"] += 1
+        raise error  # type: ignore[misc]
+
+    def stats(self) -> dict[str, Any]:
+        """Report per-endpoint health and hedging counters."""
+        best_head = max(e.head for e in self.endpoints)
+        return {
+            **self._counters,
+            "sticky": self._sticky.url,
+            "endpoints": {
+                e.url: {
+                    "requests": e.requests,
+                    "failures": e.failures,
+                    "error_rate": round(e.error_rate, 4),
+                    "p50": e.quantile(0.5),
+                    "p95": e.quantile(0.95),
+                    "head": e.head,
+                    "lag": best_head - e.head,
+                }
+                for e in self.endpoints
+            },
+        }
+
+    def _ranked(self) -> list[Endpoint]:
+        best_head = max(e.head for e in self.endpoints)
+        now = time.monotonic()
+        return sorted(self.endpoints, key=lambda e: e.rank(best_head, now))
+
+    def _hedge_delay(self, endpoint: Endpoint) -> float:
+        p95 = endpoint.quantile(0.95)
+        if p95 is None:
+            return settings.rpc_hedge_max_delay
+        return min(max(p95, settings.rpc_hedge_min_delay), settings.rpc_hedge_max_delay)
+
+    async def _timed(self, endpoint: Endpoint, request: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            response = await request
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            endpoint.record(time.perf_counter() - started_at, failed=True)
+            self.logger.warning("rpc_endpoint_failed", url=endpoint.url)
+            raise
+        endpoint.record(time.perf_counter() - started_at, failed=False)
+        return response
+
+    async def _send(
+        self, endpoint: Endpoint, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        response = await self._timed(
+            endpoint, endpoint.provider.make_request(method, params)
+        )
+        if method == "eth_blockNumber" and isinstance(response.get("result"), str):
+            endpoint.head = max(endpoint.head, int(response["result"], 16))
+        return response
+
+    async def _send_sticky(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        ranked = self._ranked()
+        best_head = max(e.head for e in self.endpoints)
+        # Move off the sticky endpoint only once it is cooling down or lagging
+        if any(self._sticky.rank(best_head, time.monotonic())[:2]):
+            self._sticky = ranked[0]
+        order = [self._sticky, *(e for e in ranked if e is not self._sticky)]
+        error: BaseException | None = None
+        for endpoint in order:
+            try:
+                response = await self._send(endpoint, method, params)
+            except Exception as e:  # noqa: BLE001
+                error = e
+                self._counters["failovers"] += 1
+                continue
+            self._sticky = endpoint
+            return response
+        raise error  # type: ignore[misc]
+
+    async def _send_hedged(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        ranked = self._ranked()
+        candidates: Iterator[Endpoint] = iter(ranked)
+        primary = next(candidates)
+        tasks = {asyncio.ensure_future(self._send(primary, method, params)): primary}
+        pending = set(tasks)
+        hedge_delay: float | None = self._hedge_delay(primary)
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The primary is slower than usual: race the runner-up
+                    hedge_delay = None
+                    runner_up = next(candidates, None)
+                    if runner_up is not None:
+                        self._counters["hedged"] += 1
+                        task = asyncio.ensure_future(self._send(runner_up, method, params))
+                        tasks[task] = runner_up
+                        pending.add(task)
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task] is not primary:
+                            self._counters["hedges_won"] += 1
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    fallback = next(candidates, None)
+                    if fallback is not None:
+                        self._counters["failovers"] += 1
+                        task = asyncio.ensure_future(self._send(fallback, method, params))
+                        tasks[task] = fallback
+                        pending.add(task)
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error  # type: ignore[misc]
+
+    def _maybe_probe(self) -> None:
+        now = time.monotonic()
+        if now - self._probed_at < settings.rpc_probe_interval:
+            return
+        self._probed_at = now
+        self._probe = asyncio.ensure_future(self._probe_heads())
+
+    async def _probe_heads(self) -> None:
+        """Refresh every endpoint's head block."""
+        await asyncio.gather(
+            *(
+                self._send(endpoint, RPCEndpoint("eth_blockNumber"), [])
+                for endpoint in self.endpoints
+            ),
+            return_exceptions=True,
+        )
+
+
+def rpc_pool_stats() -> dict[str, Any]:
+    """Report the health of every endpoint pool, keyed by first endpoint."""
+    return {pool.endpoint_uri: pool.stats() for pool in _pools}
@@ -2,14 +2,18 @@
 sFLR Staking Module
 
 This module provides functions to stake FLR tokens to sFLR on Flare Network.
+Staking transactions are priced by the shared fee oracle for the RPC URL.
 """
 
+import asyncio
 import logging
 from typing import Any
 
 from web3 import Web3
 
 from flare_ai_defai.blockchain.abis.sflr import SFLR_ABI
+from flare_ai_defai.blockchain.fee_oracle import get_fee_oracle
+from flare_ai_defai.blockchain.web3_client import get_async_web3
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -19,7 +23,7 @@ logger = logging.getLogger(__name__)
 SFLR_CONTRACT_ADDRESS = "0x12e605bc104e93B45e1aD99F9e555f659051c2BB"
 
 
-def stake_flr_to_sflr(
+async def stake_flr_to_sflr(
     web3_provider_url: str,
     wallet_address: str,
     amount: float,
@@ -38,8 +42,9 @@ def stake_flr_to_sflr(
         Dict containing transaction details
     """
     try:
-        # Initialize Web3
-        w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        # Shared pooled client and fee oracle for the provider URL
+        w3 = get_async_web3(web3_provider_url)
+        fee_oracle = get_fee_oracle(web3_provider_url)
 
         # Convert wallet address to checksum address
         wallet_address = w3.to_checksum_address(wallet_address)
@@ -51,19 +56,19 @@ def stake_flr_to_sflr(
         # Convert amount to Wei
         amount_wei = w3.to_wei(amount, "ether")
 
-        # Get the nonce
-        nonce = w3.eth.get_transaction_count(wallet_address)
+        # The user's wallet signs this, so read its pending nonce with the fees
+        nonce, fee_params = await asyncio.gather(
+            w3.eth.get_transaction_count(wallet_address, "pending"),
+            fee_oracle.tx_params(),
+        )
 
         # Build the transaction using contract function
-        transaction = contract.functions.submit().build_transaction({
+        transaction = await contract.functions.submit().build_transaction({
             "from": wallet_address,
             "value": amount_wei,  # Amount of FLR to stake
             "gas": 300000,  # Higher gas limit for safety
-            "maxFeePerGas": w3.eth.gas_price * 2,  # Double gas price for better chances
-            "maxPriorityFeePerGas": w3.eth.max_priority_fee,
             "nonce": nonce,
-            "chainId": w3.eth.chain_id,
-            "type": 2,  # EIP-1559 transaction type
+            **fee_params,
         })
 
         # Convert numeric values to hex strings for JSON serialization
@@ -0,0 +1,247 @@
+"""
+Async Web3 Client Module
+
+This module builds the `AsyncWeb3` instances used by the blockchain
+providers. There is one instance per RPC URL, so `FlareProvider`,
+`BlazeSwapHandler` and the FTSO context lookup share a single keep-alive
+connection pool instead of each opening a fresh connection per request
+(web3's default async session sets `force_close`).
+
+Single JSON-RPC requests issued within `rpc_batch_window` of each other
+(e.g. the legs of one `asyncio.gather`) are coalesced into one JSON-RPC
+batch of at most `rpc_batch_max_size` requests, so a burst of reads costs
+one HTTP round trip. Responses are matched back to their callers by
+request id, and an error response only fails the call it belongs to.
+
+If `flare_rpc_fallback_urls` is set, the client for `flare_rpc_url` routes
+over all of those endpoints through an `RPCPoolProvider` instead, with a
+pooled, batching provider per endpoint.
+
+Every JSON-RPC request is timed by method and reported through
+`flare_ai_defai.metrics` alongside the blocking upstream calls.
+"""
+
+import asyncio
+import contextvars
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3._utils.caching import generate_cache_key
+from web3.types import RPCEndpoint, RPCResponse
+
+from flare_ai_defai.blockchain.rpc_pool import RPCPoolProvider
+from flare_ai_defai.executor import RPC
+from flare_ai_defai.metrics import (
+    RPC_BATCH_SIZE,
+    UPSTREAM_ERRORS,
+    UPSTREAM_SECONDS,
+    add_request_timing,
+)
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+_clients: dict[str, AsyncWeb3] = {}
+
+
+@dataclass
+class _PendingBatch:
+    calls: list[tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]"]]
+    flush: asyncio.TimerHandle
+
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that reuses connections, coalesces concurrent requests
+    into JSON-RPC batches and records request latency.
+
+    aiohttp sessions are bound to an event loop, so one pooled session is
+    created per running loop and registered with web3's session cache before
+    the first request on that loop. Pending batches are kept per loop too.
+
+    Attributes:
+        pool_size (int): Maximum open connections to the endpoint
+        timeout (float): Total timeout per request in seconds
+        batch_window (float): Seconds a request waits for others to join its batch
+        batch_max_size (int): Maximum requests per batch (1 disables batching)
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        pool_size: int,
+        timeout: float,
+        batch_window: float = 0.0,
+        batch_max_size: int = 1,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            endpoint_uri: JSON-RPC endpoint
+            pool_size: Maximum open connections to the endpoint
+            timeout: Total timeout per request in seconds
+            batch_window: Seconds a request waits for others to join its batch
+            batch_max_size: Maximum requests per batch (1 disables batching)
+        """
+        super().__init__(endpoint_uri)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.batch_max_size = batch_max_size
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, ClientSession
+        ] = weakref.WeakKeyDictionary()
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PendingBatch
+        ] = weakref.WeakKeyDictionary()
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def _ensure_session(self) -> None:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is not None and not session.closed:
+            return
+        session = ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(limit=self.pool_size, enable_cleanup_closed=True),
+            timeout=ClientTimeout(total=self.timeout),
+        )
+        self._sessions[loop] = session
+        displaced = await self.cache_async_session(session)
+        if displaced is not session:
+            # web3 caches sessions by loop id, which a closed loop's successor
+            # can reuse; it then swaps in its own non-pooled session. Evict
+            # only this loop's entry so sessions on other loops keep serving
+            self._request_session_manager.session_cache.pop(
+                generate_cache_key(f"{id(loop)}:{self.endpoint_uri}")
+            )
+            if not displaced.closed:
+                await displaced.close()
+            await self.cache_async_session(session)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request over the pooled session, batched if enabled."""
+        started_at = time.perf_counter()
+        try:
+            if self.batch_max_size > 1:
+                # Joins the batch before any await so a gather's legs stay together
+                return await self._enqueue(method, params)
+            await self._ensure_session()
+            return await super().make_request(method, params)
+        except Exception:
+            UPSTREAM_ERRORS.inc(upstream=RPC, op=method)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            UPSTREAM_SECONDS.observe(elapsed, upstream=RPC, op=method)
+            add_request_timing(f"{RPC}.{method}", elapsed)
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send a JSON-RPC batch over the pooled session."""
+        await self._ensure_session()
+        started_at = time.perf_counter()
+        try:
+            return await super().make_batch_request(batch_requests)
+        except Exception:
+            UPSTREAM_ERRORS.inc(upstream=RPC, op="batch")
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            UPSTREAM_SECONDS.observe(elapsed, upstream=RPC, op="batch")
+            add_request_timing(f"{RPC}.batch", elapsed)
+
+    def _enqueue(
+        self, method: RPCEndpoint, params: Any
+    ) -> "asyncio.Future[RPCResponse]":
+        """Add a request to this loop's pending batch and return its future."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[RPCResponse] = loop.create_future()
+        batch = self._pending.get(loop)
+        if batch is None:
+            # Flushes run outside the caller's context so per-request timings
+            # are only recorded by the callers themselves
+            flush = loop.call_later(
+                self.batch_window, self._flush, loop, context=contextvars.Context()
+            )
+            batch = self._pending[loop] = _PendingBatch([], flush)
+        batch.calls.append((method, params, future))
+        if len(batch.calls) >= self.batch_max_size:
+            self._flush(loop)
+        return future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._pending.pop(loop, None)
+        if batch is None:
+            return
+        batch.flush.cancel()
+        task = loop.create_task(
+            self._send_batch(batch.calls), context=contextvars.Context()
+        )
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send_batch(
+        self, calls: list[tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]"]]
+    ) -> None:
+        """Send pending requests as one HTTP request and resolve their futures."""
+        RPC_BATCH_SIZE.observe(len(calls))
+        try:
+            if len(calls) == 1:
+                method, params, _ = calls[0]
+                await self._ensure_session()
+                responses: list[RPCResponse] = [await super().make_request(method, params)]
+            else:
+                batch = await self.make_batch_request([(m, p) for m, p, _ in calls])
+                # A rejected batch is one error response shared by every call
+                responses = batch if isinstance(batch, list) else [batch] * len(calls)
+                if len(responses) != len(calls):
+                    msg = f"JSON-RPC batch returned {len(responses)} of {len(calls)} responses"
+                    raise ValueError(msg)
+        except Exception as e:  # noqa: BLE001
+            for *_, future in calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), response in zip(calls, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
+
+
+def get_async_web3(web3_provider_url: str) -> AsyncWeb3:
+    """
+    Return the shared AsyncWeb3 instance for an RPC URL.
+
+    Args:
+        web3_provider_url: JSON-RPC endpoint
+
+    Returns:
+        AsyncWeb3: Instance backed by a pooled provider, or by an endpoint
+            pool if fallbacks are configured for the URL
+    """
+    w3 = _clients.get(web3_provider_url)
+    if w3 is None:
+        urls = [web3_provider_url]
+        if web3_provider_url == settings.flare_rpc_url:
+            urls += settings.flare_rpc_fallback_urls
+        providers = [
+            PooledAsyncHTTPProvider(
+                url,
+                pool_size=settings.rpc_connection_pool_size,
+                timeout=settings.rpc_timeout,
+                batch_window=settings.rpc_batch_window,
+                batch_max_size=settings.rpc_batch_max_size,
+            )
+            for url in urls
+        ]
+        provider = providers[0] if len(providers) == 1 else RPCPoolProvider(providers)
+        w3 = _clients[web3_provider_url] = AsyncWeb3(provider)
+        logger.debug("async_web3_created", url=web3_provider_url)
+    return w3
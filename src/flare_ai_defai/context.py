@@ -0,0 +1,71 @@
+"""
+Request Context Module
+
+This module holds the per-request wallet context for the chat pipeline in a
+ContextVar. Every asyncio task gets its own copy of the context, and the
+blocking executor propagates it to worker threads. Concurrent requests
+therefore never see each other's wallet, unlike the previous approach of
+mutating the shared `FlareProvider.address`.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RequestContext:
+    """
+    Immutable context for a single chat request.
+
+    Attributes:
+        request_id (str): ID returned to the client for follow-up requests
+        wallet_address (str | None): Wallet connected by the client, if any
+        session_id (str | None): Chat session ID, if any
+    """
+
+    request_id: str
+    wallet_address: str | None = None
+    session_id: str | None = None
+
+
+_current: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
+def current_context() -> RequestContext | None:
+    """Return the context of the request being handled, if any."""
+    return _current.get()
+
+
+def set_request_context(ctx: RequestContext) -> None:
+    """
+    Bind a context for the rest of the current task.
+
+    Use this where a `with` block cannot span the work, e.g. inside a
+    streaming response generator that is driven by its own task.
+
+    Args:
+        ctx: Context to bind
+    """
+    _current.set(ctx)
+
+
+@contextmanager
+def request_context(ctx: RequestContext) -> Iterator[RequestContext]:
+    """
+    Bind a context for the duration of a block.
+
+    Args:
+        ctx: Context to bind
+
+    Yields:
+        RequestContext: The bound context
+    """
+    token = _current.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current.reset(token)
@@ -24,6 +24,8 @@ class DecisionPacket(BaseModel):
     model_hash: str = Field(..., description="Hash of the Model ID + Prompt Template used")
     ftso_feed_id: Optional[str] = Field(None, description="Flare Time Series Oracle Feed ID if relevant")
     ftso_round_id: Optional[int] = Field(None, description="FTSO Round ID for price validity")
+    ftso_price: Optional[float] = Field(None, description="FTSO feed price in the round, in USD")
+    ftso_timestamp: Optional[int] = Field(None, description="Unix timestamp of the FTSO feed update")
     fdc_proof_hash: Optional[str] = Field(None, description="Flare Data Connector proof hash if used")
     timestamp: int = Field(default_factory=lambda: int(time.time()), description="Unix timestamp of decision")
     backend_signer: str = Field(..., description="Address of the backend TEE/Signer that authorized this packet")
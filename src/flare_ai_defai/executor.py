@@ -0,0 +1,198 @@
+"""
+Blocking Call Executor Module
+
+This module runs synchronous provider calls (the google-generativeai SDK, web3
+HTTP requests) off the event loop on bounded, per-upstream thread pools. A slow
+RPC node can then only exhaust its own pool instead of stalling every in-flight
+request handled by the uvicorn worker.
+
+Each upstream keeps queue-depth and timing counters so saturation is visible
+before it shows up as tail latency.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import structlog
+
+from flare_ai_defai.metrics import (
+    UPSTREAM_ERRORS,
+    UPSTREAM_QUEUE_SECONDS,
+    UPSTREAM_SECONDS,
+    add_request_timing,
+)
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Upstream identifiers
+GEMINI = "gemini"
+RPC = "rpc"
+
+
+@dataclass
+class UpstreamStats:
+    """
+    Counters for a single upstream pool.
+
+    Attributes:
+        max_workers (int): Size of the thread pool
+        in_flight (int): Calls submitted and not yet finished
+        running (int): Calls currently executing on a worker thread
+        submitted (int): Total calls submitted
+        failed (int): Total calls that raised
+        max_queue_depth (int): Highest number of calls seen waiting for a worker
+        total_wait_seconds (float): Cumulative time calls spent queued
+        total_run_seconds (float): Cumulative time calls spent executing
+    """
+
+    max_workers: int
+    in_flight: int = 0
+    running: int = 0
+    submitted: int = 0
+    failed: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return self.in_flight - self.running
+
+
+class BlockingExecutor:
+    """
+    Runs blocking callables on bounded thread pools, one pool per upstream.
+
+    Attributes:
+        pool_sizes (dict[str, int]): Worker count for each upstream
+        logger (BoundLogger): Structured logger for the executor
+    """
+
+    def __init__(self, pool_sizes: dict[str, int]) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            pool_sizes: Mapping of upstream name to maximum worker threads
+        """
+        self.pool_sizes = dict(pool_sizes)
+        self._pools = {
+            name: ThreadPoolExecutor(max_workers=size, thread_name_prefix=name)
+            for name, size in self.pool_sizes.items()
+        }
+        self._stats = {
+            name: UpstreamStats(max_workers=size)
+            for name, size in self.pool_sizes.items()
+        }
+        self._lock = threading.Lock()
+        self.logger = logger.bind(component="blocking_executor")
+
+    @classmethod
+    def from_settings(cls) -> "BlockingExecutor":
+        """Create an executor sized from the application settings."""
+        return cls(
+            {
+                GEMINI: settings.gemini_pool_size,
+                RPC: settings.rpc_pool_size,
+            }
+        )
+
+    async def run(
+        self, upstream: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking callable on the pool for the given upstream.
+
+        The caller's context variables are propagated to the worker thread.
+        Run time is recorded per upstream and callable name.
+
+        Args:
+            upstream: Name of the upstream pool (e.g. GEMINI, RPC)
+            func: Blocking callable to execute
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            KeyError: If the upstream has no configured pool
+        """
+        pool = self._pools[upstream]
+        stats = self._stats[upstream]
+        op = getattr(func, "__name__", type(func).__name__)
+        submitted_at = time.perf_counter()
+
+        with self._lock:
+            stats.submitted += 1
+            stats.in_flight += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+        def task() -> T:
+            started_at = time.perf_counter()
+            with self._lock:
+                stats.running += 1
+                stats.total_wait_seconds += started_at - submitted_at
+            UPSTREAM_QUEUE_SECONDS.observe(started_at - submitted_at, upstream=upstream)
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    stats.failed += 1
+                UPSTREAM_ERRORS.inc(upstream=upstream, op=op)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started_at
+                with self._lock:
+                    stats.running -= 1
+                    stats.total_run_seconds += elapsed
+                UPSTREAM_SECONDS.observe(elapsed, upstream=upstream, op=op)
+                add_request_timing(f"{upstream}.{op}", elapsed)
+
+        def done(_: Future[T]) -> None:
+            # Also runs when a queued call is cancelled before it starts
+            with self._lock:
+                stats.in_flight -= 1
+
+        ctx = contextvars.copy_context()
+        future = pool.submit(ctx.run, task)
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Snapshot the counters for every upstream.
+
+        Returns:
+            dict: Upstream name mapped to its counters and current queue depth
+        """
+        with self._lock:
+            return {
+                name: {**asdict(stats), "queue_depth": stats.queue_depth}
+                for name, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down all pools.
+
+        Args:
+            wait: Whether to block until running calls complete
+        """
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+        self.logger.debug("shutdown", wait=wait)
+
+
+# Shared executor used by providers and routers
+blocking_executor = BlockingExecutor.from_settings()
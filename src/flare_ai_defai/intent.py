@@ -0,0 +1,386 @@
+"""
+Local Intent Classifier Module
+
+This module provides a fast, in-process classifier that sits in front of the
+Gemini `semantic_router` prompt. Confident cases are resolved locally in
+microseconds; everything else falls back to the LLM.
+
+Classification runs in two tiers:
+1. Compiled regex grammars for well-formed commands ("swap 1 FLR to WC2FLR",
+   "send 5 FLR to 0x..."). These also extract parameters, so token sends no
+   longer need a second LLM call to parse the recipient and amount.
+2. Cosine similarity between a hashed n-gram embedding of the message and a
+   set of canned exemplars per route.
+
+Transaction routes are only resolved locally for imperative commands.
+Questions ("should I swap 100 FLR to USDT?", "how do I stake FLR") never
+build a transaction here; they fall back to the LLM, which can answer them
+as conversation.
+
+Hit and fallback counters are kept so the threshold can be tuned against
+real traffic.
+"""
+
+import re
+import threading
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import pairwise
+from typing import Any
+
+import numpy as np
+import structlog
+
+from flare_ai_defai.prompts import SemanticRouterResponse
+from flare_ai_defai.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Dimension of the hashed feature space
+EMBEDDING_DIM = 1024
+
+_AMOUNT = r"(?P<amount>\d+(?:\.\d+)?)"
+_ADDRESS = r"(?P<to_address>0x[0-9a-fA-F]{40})"
+_NATIVE = r"(?:c2flr|flr|flare)"
+_SEND_VERB = r"(?:send|transfer|pay|give)"
+# Action grammars start at the command verb, after an optional courtesy word
+_LEAD = r"^\s*(?:(?:please|pls|kindly)\s+)?"
+
+# Messages phrased as a question rather than a command
+_QUESTION = re.compile(
+    r"\?\s*$|^\s*(?:how|what|why|when|where|which|who|should|shall|can|could|"
+    r"would|will|is|are|am|do|does|did|may|might|must)\b",
+    re.IGNORECASE,
+)
+
+# Routes that build a transaction
+ACTION_ROUTES = frozenset(
+    {
+        SemanticRouterResponse.SEND_TOKEN,
+        SemanticRouterResponse.SWAP_TOKEN,
+        SemanticRouterResponse.STAKE_FLR,
+        SemanticRouterResponse.CROSS_CHAIN_SWAP,
+    }
+)
+
+# Grammars in the same order of precedence as the semantic_router prompt.
+# Each needs a command verb and its parameters; attestation requests have no
+# parameters and are left to the similarity tier. Action grammars are anchored
+# to the start of the message so a verb inside a sentence does not match.
+GRAMMARS: list[tuple[SemanticRouterResponse, re.Pattern[str]]] = [
+    (
+        SemanticRouterResponse.STAKE_FLR,
+        re.compile(rf"{_LEAD}stake\s+{_AMOUNT}\s*{_NATIVE}\b", re.IGNORECASE),
+    ),
+    (
+        SemanticRouterResponse.CHECK_BALANCE,
+        re.compile(
+            r"^\s*(?:/?balance|check\s+(?:my\s+)?balances?|"
+            r"(?:show|what(?:'s|\s+is))\s+my\s+(?:balance|holdings|wallet))\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        SemanticRouterResponse.SEND_TOKEN,
+        re.compile(
+            rf"{_LEAD}{_SEND_VERB}\s+{_AMOUNT}\s*(?:{_NATIVE}\s+)?(?:to\s+)?{_ADDRESS}\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        SemanticRouterResponse.SEND_TOKEN,
+        re.compile(
+            rf"{_LEAD}{_SEND_VERB}\s+(?:to\s+)?{_ADDRESS}\s+{_AMOUNT}\s*(?:{_NATIVE})?\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        SemanticRouterResponse.CROSS_CHAIN_SWAP,
+        re.compile(
+            rf"{_LEAD}(?:bridge|move|send|transfer|swap)\s+{_AMOUNT}\s*"
+            r"(?P<token_in>[a-z][a-z0-9.]*)(?:\s+(?:to|for|into)\s+[a-z][a-z0-9.]*)?"
+            r"\s+(?:to|on|onto)\s+(?P<chain>arb(?:itrum)?)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        SemanticRouterResponse.SWAP_TOKEN,
+        re.compile(
+            rf"{_LEAD}(?:swap|exchange|trade|convert)\s+{_AMOUNT}\s*"
+            r"(?P<token_in>[a-z][a-z0-9.]*)\s+(?:to|for|into)\s+"
+            r"(?P<token_out>[a-z][a-z0-9.]*)\b",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+# Canned exemplars for the similarity tier
+EXEMPLARS: dict[SemanticRouterResponse, list[str]] = {
+    SemanticRouterResponse.CHECK_BALANCE: [
+        "what is my balance",
+        "show my balance",
+        "check my wallet balance",
+        "how much flr do i have",
+        "how many tokens do i own",
+        "show my token holdings",
+        "what tokens are in my wallet",
+        "balance please",
+        "view my portfolio balance",
+    ],
+    SemanticRouterResponse.SEND_TOKEN: [
+        "send flr to my friend",
+        "transfer tokens to another address",
+        "i want to send some flr",
+        "pay someone in flr",
+        "send 10 flr to 0x address",
+        "transfer 5 flr to this wallet",
+    ],
+    SemanticRouterResponse.SWAP_TOKEN: [
+        "swap flr to wc2flr",
+        "swap 1 flr for flx",
+        "exchange my flr for usdt",
+        "trade wflr into weth",
+        "convert flr to wrapped flr",
+        "i want to swap tokens",
+        "swap some flx for flr",
+    ],
+    SemanticRouterResponse.STAKE_FLR: [
+        "stake 10 flr",
+        "i want to stake my flr tokens",
+        "stake flr to get sflr",
+        "deposit flr into sflr staking",
+        "earn staking rewards with my flr",
+    ],
+    SemanticRouterResponse.CROSS_CHAIN_SWAP: [
+        "bridge flr to arbitrum",
+        "swap flr to wc2flr on arb",
+        "move my tokens to another chain",
+        "cross chain swap flr",
+    ],
+    SemanticRouterResponse.REQUEST_ATTESTATION: [
+        "request an attestation",
+        "verify the enclave",
+        "prove you are running in a tee",
+        "show me the remote attestation",
+        "check enclave attestation",
+    ],
+    SemanticRouterResponse.CONVERSATIONAL: [
+        "hello",
+        "hi there",
+        "what is flare",
+        "what is the ftso",
+        "how does blazeswap work",
+        "explain the flare data connector",
+        "what can you do",
+        "tell me about flare network",
+        "how do i use this app",
+        "how do i stake flr for sflr rewards",
+        "how does staking flr work",
+        "how do i send flr to someone",
+        "how does bridging to arbitrum work",
+        "should i swap my flr or hold",
+        "explain how token swaps work",
+        "thanks",
+    ],
+}
+
+_TOKEN_RE = re.compile(r"0x[0-9a-f]{40}|\d+(?:\.\d+)?|[a-z][a-z0-9']*")
+
+
+@dataclass
+class IntentMatch:
+    """
+    Result of a confident local classification.
+
+    Attributes:
+        route (SemanticRouterResponse): Classified route
+        confidence (float): 1.0 for grammar hits, cosine similarity otherwise
+        source (str): "grammar" or "similarity"
+        params (dict[str, Any]): Parameters extracted by the grammar, if any
+    """
+
+    route: SemanticRouterResponse
+    confidence: float
+    source: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase and tokenize, collapsing numbers and addresses to placeholders."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token.startswith("0x") and len(token) == 42:  # noqa: PLR2004
+            tokens.append("<addr>")
+        elif token[0].isdigit():
+            tokens.append("<num>")
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def embed(text: str) -> np.ndarray:
+    """
+    Embed text as an L2-normalised vector of hashed word and character n-grams.
+
+    Args:
+        text: Input text
+
+    Returns:
+        np.ndarray: Unit vector of size EMBEDDING_DIM
+    """
+    tokens = _tokenize(text)
+    features = list(tokens)
+    features.extend(f"{a} {b}" for a, b in pairwise(tokens))
+    for token in tokens:
+        padded = f"#{token}#"
+        features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for feature, count in Counter(features).items():
+        digest = zlib.crc32(feature.encode())
+        sign = 1.0 if digest & 1 else -1.0
+        vector[(digest >> 1) % EMBEDDING_DIM] += sign * (1.0 + np.log(count))
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class IntentClassifier:
+    """
+    Two-tier local classifier for semantic routes.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a similarity hit
+        min_margin (float): Minimum lead over the runner-up route
+        logger (BoundLogger): Structured logger for the classifier
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        min_margin: float = 0.08,
+        exemplars: dict[SemanticRouterResponse, list[str]] | None = None,
+    ) -> None:
+        """
+        Initialize the classifier and embed the exemplars.
+
+        Args:
+            threshold: Minimum cosine similarity for a similarity hit
+            min_margin: Minimum lead over the runner-up route
+            exemplars: Route to example phrases (defaults to EXEMPLARS)
+        """
+        self.threshold = threshold
+        self.min_margin = min_margin
+        exemplars = exemplars or EXEMPLARS
+        self._routes = [route for route, phrases in exemplars.items() for _ in phrases]
+        self._matrix = np.stack(
+            [embed(phrase) for phrases in exemplars.values() for phrase in phrases]
+        )
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self.logger = logger.bind(component="intent_classifier")
+
+    @classmethod
+    def from_settings(cls) -> "IntentClassifier":
+        """Create a classifier tuned from the application settings."""
+        return cls(
+            threshold=settings.intent_confidence_threshold,
+            min_margin=settings.intent_min_margin,
+        )
+
+    def _count(self, *keys: str) -> None:
+        with self._lock:
+            self._counts.update(keys)
+
+    def _match_grammar(self, message: str) -> IntentMatch | None:
+        question = _QUESTION.search(message) is not None
+        for route, pattern in GRAMMARS:
+            if question and route in ACTION_ROUTES:
+                continue
+            match = pattern.search(message)
+            if match:
+                params = {k: v for k, v in match.groupdict().items() if v is not None}
+                if "amount" in params:
+                    params["amount"] = float(params["amount"])
+                return IntentMatch(
+                    route=route, confidence=1.0, source="grammar", params=params
+                )
+        return None
+
+    def _match_similarity(self, message: str) -> IntentMatch | None:
+        scores = self._matrix @ embed(message)
+        best: dict[SemanticRouterResponse, float] = {}
+        for route, score in zip(self._routes, scores.tolist(), strict=True):
+            best[route] = max(score, best.get(route, -1.0))
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        route, top = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if top < self.threshold or top - runner_up < self.min_margin:
+            return None
+        if route in ACTION_ROUTES and _QUESTION.search(message):
+            return None
+        return IntentMatch(route=route, confidence=top, source="similarity")
+
+    def classify(self, message: str) -> IntentMatch | None:
+        """
+        Classify a message locally.
+
+        Args:
+            message: Raw user message
+
+        Returns:
+            IntentMatch | None: The match, or None when the LLM should decide
+        """
+        match = self._match_grammar(message) or self._match_similarity(message)
+        if match is None:
+            self._count("total", "fallback")
+            return None
+        self._count("total", match.source, f"route:{match.route.value}")
+        self.logger.debug(
+            "intent_classified",
+            route=match.route.value,
+            source=match.source,
+            confidence=round(match.confidence, 3),
+        )
+        return match
+
+    def parse_send(self, message: str) -> dict[str, Any] | None:
+        """
+        Extract `to_address` and `amount` from a token send message.
+
+        Args:
+            message: Raw user message
+
+        Returns:
+            dict | None: Parsed parameters, or None when the LLM should parse
+        """
+        for route, pattern in GRAMMARS:
+            if route != SemanticRouterResponse.SEND_TOKEN:
+                continue
+            match = pattern.search(message)
+            if match:
+                self._count("send_parse_hit")
+                return {
+                    "to_address": match.group("to_address"),
+                    "amount": float(match.group("amount")),
+                }
+        self._count("send_parse_fallback")
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report hit and fallback counters.
+
+        Returns:
+            dict: Raw counters plus hit and fallback rates
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        total = counts.get("total", 0)
+        fallbacks = counts.get("fallback", 0)
+        return {
+            **counts,
+            "hit_rate": (total - fallbacks) / total if total else 0.0,
+            "fallback_rate": fallbacks / total if total else 0.0,
+        }
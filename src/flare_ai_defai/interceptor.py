@@ -30,6 +30,8 @@ class DecisionInterceptor:
         model_id: str = "gemini-1.5-flash",
         ftso_feed_id: Optional[str] = None,
         ftso_round_id: Optional[int] = None,
+        ftso_price: Optional[float] = None,
+        ftso_timestamp: Optional[int] = None,
         decision_id: Optional[UUID] = None,
     ) -> DecisionPacket:
         """
@@ -42,6 +44,10 @@ class DecisionInterceptor:
             ai_response_text: The text reply from the AI
             transaction_data: The JSON string or dict of the constructed tx
             model_id: ID of the model used
+            ftso_feed_id: FTSO feed of the traded asset
+            ftso_round_id: FTSO voting round the decision was made in
+            ftso_price: Feed price in that round
+            ftso_timestamp: Unix timestamp of the feed update
 
         Returns:
             DecisionPacket: The verifiable decision record
@@ -80,6 +86,8 @@ class DecisionInterceptor:
             "model_id": model_id,
             "ftso_feed_id": ftso_feed_id,
             "ftso_round_id": ftso_round_id,
+            "ftso_price": ftso_price,
+            "ftso_timestamp": ftso_timestamp,
             "subject": subject
         }
         if decision_id:
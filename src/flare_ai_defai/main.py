@@ -15,6 +15,7 @@ Dependencies:
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from flare_ai_defai import (
     ChatRouter,
@@ -24,9 +25,13 @@ from flare_ai_defai import (
     Vtpm,
 )
 from flare_ai_defai.api.middleware.rate_limit import RateLimitMiddleware
+from flare_ai_defai.api.middleware.timing import TimingMiddleware
+from flare_ai_defai.metrics import metrics
 from flare_ai_defai.settings import settings
+from flare_ai_defai.warmup import WarmUp, lifespan
 from flare_ai_defai.api.routes.trust import router as trust_router
 from flare_ai_defai.api.routes.verify import router as verify_router
+from flare_ai_defai.api.routes.wallets import router as wallets_router
 
 logger = structlog.get_logger(__name__)
 
@@ -44,6 +49,10 @@ def create_app() -> FastAPI:
        - Vtpm for attestation services
        - PromptService for managing chat prompts
     4. Sets up routing for chat endpoints
+    5. Registers the background warm-up reported by /ready
+
+    Construction does no network I/O; chain detection, the pool index and
+    fee estimates are loaded in the background once the app is serving.
 
     Returns:
         FastAPI: Configured FastAPI application instance
@@ -61,6 +70,7 @@ def create_app() -> FastAPI:
         title="Flare AI DeFi",
         description="AI-powered DeFi agent on Flare Network",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # Configure CORS middleware with settings from configuration
@@ -75,6 +85,9 @@ def create_app() -> FastAPI:
     # Add Rate Limiting for Trust APIs
     app.add_middleware(RateLimitMiddleware)
 
+    # Record request latency; the X-Timing breakdown is only exposed in debug
+    app.add_middleware(TimingMiddleware, expose_header=settings.debug)
+
     # Initialize chat router
     chat = ChatRouter(
         ai=GeminiProvider(
@@ -101,13 +114,29 @@ def create_app() -> FastAPI:
     # So app.include_router(verify_router, prefix="/api") -> /api/trust/verify/...
     app.include_router(trust_router, prefix="/api")
     app.include_router(verify_router, prefix="/api")
+    # Bulk multi-wallet balances for back-office dashboards (/api/wallets/...)
+    app.include_router(wallets_router, prefix="/api")
     
     # Register RAG management routes
     from flare_ai_defai.api.routes.rag import router as rag_router
     app.include_router(rag_router, prefix="/api/rag", tags=["rag"])
     
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def prometheus_metrics() -> str:
+        """Expose latency summaries and counters in Prometheus text format."""
+        return metrics.render()
+
+    # Network-bound initialisation runs in the background once serving
+    warm_up = WarmUp.for_chat(chat)
+
+    @app.get("/ready", include_in_schema=False)
+    async def ready() -> JSONResponse:
+        """Report warm-up progress; 503 until every step has finished."""
+        return JSONResponse(warm_up.status(), status_code=200 if warm_up.ready else 503)
+
     # Store chat router in app state for access by other routes (e.g. RAG)
     app.state.chat_router = chat
+    app.state.warm_up = warm_up
 
     return app
 
@@ -0,0 +1,288 @@
+"""
+Metrics Module
+
+This module provides in-process counters and latency summaries rendered in
+the Prometheus text exposition format, so `/metrics` can be scraped without
+running a separate collector.
+
+Summaries keep a bounded window of recent samples per label set and report
+p50/p95/p99 alongside `_sum` and `_count`. A per-request timing recorder
+(held in a ContextVar) feeds the `X-Timing` header in debug mode.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import numpy as np
+
+# Quantiles reported for every summary
+QUANTILES = (0.5, 0.95, 0.99)
+# Recent samples kept per label set for quantile estimation
+WINDOW_SIZE = 2048
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], **extra: str) -> str:
+    pairs = [*zip(names, values, strict=True), *extra.items()]
+    if not pairs:
+        return ""
+    body = ",".join(
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+class Counter:
+    """
+    Monotonic counter with optional labels.
+
+    Attributes:
+        name (str): Metric name
+        help (str): Metric description
+        labels (tuple[str, ...]): Label names
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:  # noqa: A002
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter for a label set."""
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set."""
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> list[str]:
+        """Render the counter in Prometheus text format."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}_total{_format_labels(self.labels, key)} {value}"
+            for key, value in items
+        ]
+
+
+class Summary:
+    """
+    Latency summary reporting quantiles over a sliding window.
+
+    Attributes:
+        name (str): Metric name
+        help (str): Metric description
+        labels (tuple[str, ...]): Label names
+    """
+
+    type = "summary"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:  # noqa: A002
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._samples: dict[tuple[str, ...], deque[float]] = {}
+        self._totals: dict[tuple[str, ...], tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record a sample for a label set."""
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            window = self._samples.get(key)
+            if window is None:
+                window = self._samples[key] = deque(maxlen=WINDOW_SIZE)
+            window.append(value)
+            count, total = self._totals.get(key, (0, 0.0))
+            self._totals[key] = (count + 1, total + value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of a block."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def label_sets(self) -> list[dict[str, str]]:
+        """Return every label set that has been observed."""
+        with self._lock:
+            keys = list(self._samples)
+        return [dict(zip(self.labels, key, strict=True)) for key in keys]
+
+    def quantiles(self, **labels: str) -> dict[float, float]:
+        """Return the configured quantiles for a label set."""
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if not samples:
+            return {}
+        values = np.quantile(np.asarray(samples), QUANTILES)
+        return dict(zip(QUANTILES, values.tolist(), strict=True))
+
+    def render(self) -> list[str]:
+        """Render the summary in Prometheus text format."""
+        with self._lock:
+            snapshot = {
+                key: (np.asarray(window), self._totals[key])
+                for key, window in sorted(self._samples.items())
+            }
+        lines = []
+        for key, (samples, (count, total)) in snapshot.items():
+            for q, v in zip(QUANTILES, np.quantile(samples, QUANTILES).tolist(), strict=True):
+                lines.append(
+                    f"{self.name}{_format_labels(self.labels, key, quantile=str(q))} {v}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on `/metrics`."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Summary] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:  # noqa: A002
+        """Get or create a counter."""
+        return self._register(Counter(name, help, labels))
+
+    def summary(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Summary:  # noqa: A002
+        """Get or create a summary."""
+        return self._register(Summary(name, help, labels))
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text ending with a newline
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class TimingRecorder:
+    """Accumulates stage durations for a single request."""
+
+    def __init__(self) -> None:
+        self._timings: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add a duration to a stage."""
+        with self._lock:
+            self._timings[stage] = self._timings.get(stage, 0.0) + seconds
+
+    def header(self) -> str:
+        """Format the timings as `stage;dur=<ms>` entries, slowest first."""
+        with self._lock:
+            items = sorted(self._timings.items(), key=lambda item: -item[1])
+        return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in items)
+
+
+# Shared registry and the metrics recorded across the app
+metrics = MetricsRegistry()
+STAGE_SECONDS = metrics.summary(
+    "defai_stage_seconds", "Duration of chat pipeline stages", ("stage",)
+)
+STAGE_ERRORS = metrics.counter(
+    "defai_stage_errors", "Chat pipeline stages that raised", ("stage",)
+)
+UPSTREAM_SECONDS = metrics.summary(
+    "defai_upstream_seconds", "Duration of blocking upstream calls", ("upstream", "op")
+)
+UPSTREAM_QUEUE_SECONDS = metrics.summary(
+    "defai_upstream_queue_seconds",
+    "Time blocking upstream calls waited for a worker",
+    ("upstream",),
+)
+UPSTREAM_ERRORS = metrics.counter(
+    "defai_upstream_errors", "Blocking upstream calls that raised", ("upstream", "op")
+)
+RPC_BATCH_SIZE = metrics.summary(
+    "defai_rpc_batch_size", "JSON-RPC requests coalesced into one HTTP request"
+)
+HTTP_SECONDS = metrics.summary(
+    "defai_http_request_seconds", "HTTP request latency", ("method", "route", "status")
+)
+
+_recorder: ContextVar[TimingRecorder | None] = ContextVar("timing_recorder", default=None)
+
+
+def start_request_timing() -> TimingRecorder:
+    """Bind a fresh timing recorder for the current request."""
+    recorder = TimingRecorder()
+    _recorder.set(recorder)
+    return recorder
+
+
+def record_stage(stage: str, seconds: float, error: bool = False) -> None:
+    """
+    Record a stage duration in the metrics and the request's recorder.
+
+    Args:
+        stage: Stage name
+        seconds: Duration in seconds
+        error: Whether the stage raised
+    """
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    if error:
+        STAGE_ERRORS.inc(stage=stage)
+    add_request_timing(stage, seconds)
+
+
+def add_request_timing(stage: str, seconds: float) -> None:
+    """Add a duration to the current request's breakdown, if one is bound."""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.add(stage, seconds)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    Time a block as a named stage.
+
+    Args:
+        stage: Stage name, e.g. "chat.route" or "rag.embed"
+    """
+    started_at = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record_stage(stage, time.perf_counter() - started_at, error=error)
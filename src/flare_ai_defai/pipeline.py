@@ -0,0 +1,182 @@
+"""
+Stage Pipeline Module
+
+This module runs a small DAG of independent async stages concurrently, each
+with its own timeout. A stage starts as soon as the stages it depends on have
+finished and receives their values as keyword arguments.
+
+Stages are best-effort: a failed or timed-out stage yields its `default`
+value and dependents still run. Stages marked `detach_on_timeout` keep running
+in the background after their deadline so the caller can collect the late
+result (e.g. to serve it from a follow-up endpoint).
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Stage outcome statuses
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+@dataclass
+class Stage:
+    """
+    A single node in the pipeline.
+
+    Attributes:
+        name (str): Unique stage name, also the keyword dependents receive
+        func (Callable[..., Awaitable[Any]]): Coroutine function to run
+        deps (tuple[str, ...]): Names of stages whose values `func` needs
+        timeout (float | None): Seconds before the stage is abandoned
+        default (Any): Value used when the stage fails or times out
+        detach_on_timeout (bool): Keep running in the background after the
+            timeout instead of being cancelled
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    deps: tuple[str, ...] = ()
+    timeout: float | None = None
+    default: Any = None
+    detach_on_timeout: bool = False
+
+
+@dataclass
+class StageOutcome:
+    """
+    Result of running a stage.
+
+    Attributes:
+        status (str): One of OK, TIMEOUT or ERROR
+        value (Any): Stage return value, or its default on failure
+        elapsed (float): Seconds from stage start to outcome
+        error (str | None): Error message for failed stages
+    """
+
+    status: str
+    value: Any
+    elapsed: float
+    error: str | None = None
+
+
+@dataclass
+class PipelineResult:
+    """
+    Outcomes of a pipeline run.
+
+    Attributes:
+        outcomes (dict[str, StageOutcome]): Outcome for each stage
+        detached (dict[str, asyncio.Task]): Still-running detached stages
+    """
+
+    outcomes: dict[str, StageOutcome] = field(default_factory=dict)
+    detached: dict[str, asyncio.Task[Any]] = field(default_factory=dict)
+
+    def value(self, name: str) -> Any:
+        """Return the value (or default) produced by a stage."""
+        return self.outcomes[name].value
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """Return status and elapsed milliseconds for every stage."""
+        return {
+            name: {"status": o.status, "ms": round(o.elapsed * 1000, 2)}
+            for name, o in self.outcomes.items()
+        }
+
+
+async def run_stages(
+    stages: Sequence[Stage],
+    on_complete: Callable[[str, StageOutcome], None] | None = None,
+) -> PipelineResult:
+    """
+    Run stages concurrently, respecting dependencies and per-stage timeouts.
+
+    Args:
+        stages: Stages in topological order (dependencies listed first)
+        on_complete: Optional callback invoked with each stage's name and
+            outcome as soon as that stage finishes
+
+    Returns:
+        PipelineResult: Outcome of every stage plus any detached tasks
+
+    Raises:
+        ValueError: If a stage name is duplicated or a dependency is not
+            declared before the stage that needs it
+        asyncio.CancelledError: If the caller is cancelled; stages not
+            marked `detach_on_timeout` are cancelled with it
+    """
+    seen: set[str] = set()
+    for stage in stages:
+        if stage.name in seen:
+            msg = f"Duplicate stage name: {stage.name}"
+            raise ValueError(msg)
+        missing = [dep for dep in stage.deps if dep not in seen]
+        if missing:
+            msg = f"Stage {stage.name} depends on undeclared stages: {missing}"
+            raise ValueError(msg)
+        seen.add(stage.name)
+
+    result = PipelineResult()
+    tasks: dict[str, asyncio.Task[StageOutcome]] = {}
+
+    async def run(stage: Stage) -> StageOutcome:
+        inputs = {}
+        for dep in stage.deps:
+            inputs[dep] = (await tasks[dep]).value
+
+        started_at = time.perf_counter()
+        try:
+            # Inside the try so a stage failing synchronously is its own error
+            work: asyncio.Future[Any] | Awaitable[Any] = stage.func(**inputs)
+            if stage.detach_on_timeout:
+                work = asyncio.ensure_future(work)
+                guarded: Awaitable[Any] = asyncio.shield(work)
+            else:
+                guarded = work
+            value = await asyncio.wait_for(guarded, stage.timeout)
+            outcome = StageOutcome(OK, value, time.perf_counter() - started_at)
+        except TimeoutError:
+            if stage.detach_on_timeout:
+                result.detached[stage.name] = work  # type: ignore[assignment]
+            outcome = StageOutcome(
+                TIMEOUT, stage.default, time.perf_counter() - started_at
+            )
+        except Exception as e:
+            outcome = StageOutcome(
+                ERROR, stage.default, time.perf_counter() - started_at, error=str(e)
+            )
+
+        if outcome.status != OK:
+            logger.warning(
+                "stage_incomplete",
+                stage=stage.name,
+                status=outcome.status,
+                error=outcome.error,
+                timeout=stage.timeout,
+            )
+        if on_complete is not None:
+            on_complete(stage.name, outcome)
+        return outcome
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(run(stage))
+
+    try:
+        for name, task in tasks.items():
+            result.outcomes[name] = await task
+    except asyncio.CancelledError:
+        # The caller gave up: only detached stages may outlive it
+        for stage in stages:
+            if not stage.detach_on_timeout:
+                tasks[stage.name].cancel()
+        raise
+    return result
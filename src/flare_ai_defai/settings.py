@@ -34,11 +34,12 @@ class Settings(BaseSettings):
     # API version to use at the backend
     api_version: str = "v1"
     # URL for the Flare Network RPC provider
-    # URL for the Flare Network RPC provider
     flare_rpc_url: str = Field(
         default="https://flare-api.flare.network/ext/C/rpc",
         validation_alias="WEB3_PROVIDER_URL"
     )
+    # Further RPC endpoints pooled with flare_rpc_url (JSON list)
+    flare_rpc_fallback_urls: list[str] = []
     # URL for the Flare Network block explorer
     web3_explorer_url: str = "https://testnet.flarescan.com/"
     
@@ -57,6 +58,98 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
 
+    # Worker threads for blocking Gemini SDK calls
+    gemini_pool_size: int = 8
+    # Worker threads for blocking web3 RPC calls
+    rpc_pool_size: int = 16
+    # Keep-alive connections shared by the async web3 clients, per RPC URL
+    rpc_connection_pool_size: int = 32
+    # Total timeout (seconds) for a single async JSON-RPC request
+    rpc_timeout: float = 10.0
+    # Seconds a JSON-RPC request waits for concurrent requests to share its batch
+    rpc_batch_window: float = 0.002
+    # Maximum JSON-RPC requests coalesced into one HTTP request (1 disables)
+    rpc_batch_max_size: int = 100
+    # Bounds (seconds) on the p95-based delay before a slow read is hedged
+    rpc_hedge_min_delay: float = 0.05
+    rpc_hedge_max_delay: float = 1.0
+    # Blocks an endpoint may trail the pool's best head before it is avoided
+    rpc_max_block_lag: int = 3
+    # Seconds between head block probes of every pooled endpoint
+    rpc_probe_interval: float = 5.0
+    # Seconds a pooled endpoint is avoided after a transport error
+    rpc_failure_cooldown: float = 5.0
+    # Multicall3 contract used to batch contract reads into one eth_call
+    multicall_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    # Maximum calls packed into one aggregate3 eth_call or JSON-RPC batch
+    multicall_batch_size: int = 500
+    # Maximum wallets accepted by one bulk balance request
+    bulk_balance_max_wallets: int = 200
+    # Directory for BlazeSwap pool registry snapshots (empty disables persistence)
+    pool_registry_dir: str = ""
+    # Minimum seconds between pool registry refreshes triggered by a lookup miss
+    pool_registry_refresh_interval: float = 60.0
+    # Minimum seconds between block number reads that invalidate cached reserves
+    quote_block_poll_interval: float = 1.0
+    # Slippage allowed on swap outputs, in basis points
+    swap_slippage_bips: int = 500
+    # Maximum pools along a searched swap route
+    swap_max_hops: int = 3
+    # Blocks of eth_feeHistory sampled for the priority fee
+    fee_history_blocks: int = 10
+    # Percentile of each block's priority fees sampled
+    fee_reward_percentile: float = 50.0
+    # Headroom on the next block's base fee in maxFeePerGas
+    fee_base_multiplier: float = 1.5
+    # Seconds fee estimates are reused (one Flare block)
+    fee_cache_seconds: float = 1.8
+    # Flare contract registry resolving the FtsoV2 and FlareSystemsManager addresses
+    ftso_registry_address: str = "0xaD67FE66660Fb8dFE9d6b1b4240d8650e30F6019"
+    # Start (unix seconds) of voting round 0 and round length on Flare and Coston2
+    ftso_first_voting_round_start: int = 1658430000
+    ftso_voting_round_seconds: int = 90
+    # Seconds an FTSO price snapshot is reused within its voting round (one
+    # block-latency feed update)
+    ftso_cache_seconds: float = 1.8
+    # Seconds an unconfirmed nonce stays reserved before it is reconciled
+    nonce_reservation_ttl: float = 120.0
+    # Seconds an idle address's nonce counter is trusted without a chain read
+    nonce_sync_interval: float = 30.0
+    # Addresses whose nonce counters are tracked
+    nonce_max_accounts: int = 10000
+
+    # Seconds between attempts of a failing background warm-up step
+    warmup_retry_interval: float = 5.0
+
+    # Minimum cosine similarity for the local intent classifier to skip the LLM
+    intent_confidence_threshold: float = 0.6
+    # Minimum lead of the best route over the runner-up for a local match
+    intent_min_margin: float = 0.1
+
+    # Deadlines (seconds) for the concurrent post-handler stages in /chat
+    ftso_stage_timeout: float = 2.0
+    decision_packet_stage_timeout: float = 1.0
+    suggestions_stage_timeout: float = 1.5
+    # Late suggestions kept for GET /api/routes/chat/suggestions/{request_id}
+    suggestions_cache_size: int = 1024
+    suggestions_cache_ttl: float = 300.0
+
+    # Maximum live chat sessions before least recently used are evicted
+    session_max_entries: int = 1000
+    # Seconds of inactivity before a chat session is evicted
+    session_idle_ttl: float = 1800.0
+    # Approximate history tokens kept per chat session
+    session_token_budget: int = 8000
+    # SQLite file for evicted sessions (empty disables the on-disk tier)
+    session_db_path: str = ""
+
+    # Minimum cosine similarity for a semantic cache hit on knowledge-base answers
+    semantic_cache_threshold: float = 0.95
+    # Maximum cached answers (and memoised query embeddings)
+    semantic_cache_size: int = 512
+    # Seconds a cached answer stays valid
+    semantic_cache_ttl: float = 3600.0
+
     # Optional settings
     debug: bool = False
     log_level: str = "INFO"
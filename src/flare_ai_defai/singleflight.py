@@ -0,0 +1,173 @@
+"""
+Single-Flight Module
+
+This module collapses identical concurrent async calls into one upstream
+request. The first caller for a key starts the call, and callers arriving
+while it is in flight await the same result, or the same exception.
+
+Cancellation is reference-counted. A waiter that is cancelled only detaches
+itself; the shared call keeps running for the remaining waiters, and is
+cancelled only once every waiter has gone.
+
+Each SingleFlight instance registers itself by name so `/stats` can report
+counters for every deduplicated call site. Keys can hold user data (chat
+messages, wallet addresses), so per-key counters are labelled by a keyed
+hash of the key rather than the key itself.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Maximum keys tracked in per-key stats for each instance
+MAX_TRACKED_KEYS = 256
+
+_registry: dict[str, "SingleFlight"] = {}
+
+# Per-process secret so key labels cannot be matched against guessed keys
+_LABEL_KEY = os.urandom(16)
+
+
+@dataclass
+class KeyStats:
+    """
+    Counters for a single key.
+
+    Attributes:
+        calls (int): Total callers
+        executions (int): Upstream calls actually made
+        shared (int): Callers served by another caller's upstream call
+        failures (int): Upstream calls that raised
+        cancellations (int): Upstream calls cancelled after all waiters left
+    """
+
+    calls: int = 0
+    executions: int = 0
+    shared: int = 0
+    failures: int = 0
+    cancellations: int = 0
+
+
+@dataclass
+class _Call:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    Attributes:
+        name (str): Name used in stats and logs
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize and register the instance.
+
+        Args:
+            name: Name used in stats and logs
+        """
+        self.name = name
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats: OrderedDict[str, KeyStats] = OrderedDict()
+        self._lock = threading.Lock()
+        self.logger = logger.bind(singleflight=name)
+        _registry[name] = self
+
+    @staticmethod
+    def label(key: Hashable) -> str:
+        """Return the opaque label a key's counters are reported under."""
+        return hashlib.blake2s(
+            repr(key).encode(), key=_LABEL_KEY, digest_size=8
+        ).hexdigest()
+
+    def _key_stats(self, key: Hashable) -> KeyStats:
+        label = self.label(key)
+        with self._lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = KeyStats()
+                while len(self._stats) > MAX_TRACKED_KEYS:
+                    self._stats.popitem(last=False)
+            else:
+                self._stats.move_to_end(label)
+            return stats
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `func`, or join the in-flight call for the same key.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            func: Zero-argument coroutine function making the upstream call
+
+        Returns:
+            The shared result
+        """
+        stats = self._key_stats(key)
+        stats.calls += 1
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(task=asyncio.ensure_future(func()))
+            self._calls[key] = call
+            stats.executions += 1
+
+            def done(task: asyncio.Task[Any]) -> None:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                if not task.cancelled() and task.exception() is not None:
+                    stats.failures += 1
+
+            call.task.add_done_callback(done)
+        else:
+            stats.shared += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Last waiter gone: new callers must not join a dying call
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+                stats.cancellations += 1
+
+    def in_flight(self) -> int:
+        """Return the number of keys with an upstream call in flight."""
+        return len(self._calls)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot per-key counters.
+
+        Returns:
+            dict: In-flight count, counters summed over recently seen keys,
+                and counters per key label (see `label`)
+        """
+        with self._lock:
+            keys = {label: asdict(s) for label, s in self._stats.items()}
+        totals = {
+            name: sum(counters[name] for counters in keys.values())
+            for name in asdict(KeyStats())
+        }
+        return {"in_flight": self.in_flight(), "totals": totals, "keys": keys}
+
+
+def singleflight_stats() -> dict[str, dict[str, Any]]:
+    """Report stats for every registered SingleFlight instance."""
+    return {name: flight.stats() for name, flight in _registry.items()}
@@ -0,0 +1,134 @@
+"""
+Warm-Up Module
+
+This module runs the network-bound initialisation of long-lived components
+(chain detection, the pool index, fee estimates) in the background once the
+app is serving, instead of in their constructors. Startup therefore never
+waits on the RPC, health checks answer immediately, and the first requests
+find the caches already filled.
+
+Each step is retried every `warmup_retry_interval` seconds until it
+succeeds. Components stay usable while warming up: anything not yet loaded
+is loaded on first use instead. `/ready` reports the state of every step.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fastapi import FastAPI
+
+from flare_ai_defai.settings import settings
+
+if TYPE_CHECKING:
+    from flare_ai_defai.api.routes.chat import ChatRouter
+
+logger = structlog.get_logger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+
+class WarmUp:
+    """
+    Background runner for named warm-up steps.
+
+    Attributes:
+        retry_interval (float): Seconds between attempts of a failing step
+    """
+
+    def __init__(self, retry_interval: float | None = None) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            retry_interval: Seconds between attempts of a failing step
+                (defaults to settings)
+        """
+        self.retry_interval = (
+            settings.warmup_retry_interval if retry_interval is None else retry_interval
+        )
+        self._steps: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._status: dict[str, dict[str, Any]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._started_at: float | None = None
+
+    @classmethod
+    def for_chat(cls, chat: "ChatRouter") -> "WarmUp":
+        """Create a runner for the chat router's chain detection, pool index and fees."""
+        warm_up = cls()
+        warm_up.add("blazeswap", chat.blazeswap.warm_up)
+        warm_up.add("fees", chat.blockchain.fee_oracle.fees)
+        return warm_up
+
+    def add(self, name: str, step: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Register a step.
+
+        Args:
+            name: Name reported by `status`
+            step: Coroutine function doing the warm-up
+        """
+        self._steps[name] = step
+        self._status[name] = {"state": PENDING, "attempts": 0, "seconds": None}
+
+    def start(self) -> None:
+        """Start every step in the background; must run inside the event loop."""
+        self._started_at = time.perf_counter()
+        self._tasks = [
+            asyncio.create_task(self._run(name, step), name=f"warmup:{name}")
+            for name, step in self._steps.items()
+        ]
+
+    async def stop(self) -> None:
+        """Cancel steps that are still running."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def wait(self) -> None:
+        """Wait until every step has succeeded."""
+        await asyncio.gather(*self._tasks)
+
+    @property
+    def ready(self) -> bool:
+        """Whether every step has succeeded."""
+        return all(status["state"] == READY for status in self._status.values())
+
+    def status(self) -> dict[str, Any]:
+        """Report overall readiness and the state of every step."""
+        return {"ready": self.ready, "steps": self._status}
+
+    async def _run(self, name: str, step: Callable[[], Awaitable[Any]]) -> None:
+        status = self._status[name]
+        while True:
+            status["attempts"] += 1
+            try:
+                await step()
+            except Exception as e:  # noqa: BLE001
+                status.update(state=FAILED, error=str(e))
+                logger.warning("warmup_step_failed", step=name, error=str(e))
+                await asyncio.sleep(self.retry_interval)
+                continue
+            status.update(state=READY, error=None)
+            status["seconds"] = round(time.perf_counter() - (self._started_at or 0.0), 4)
+            logger.info("warmup_step_ready", step=name, seconds=status["seconds"])
+            return
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run `app.state.warm_up`, if set, in the background while the app serves."""
+    warm_up: WarmUp | None = getattr(app.state, "warm_up", None)
+    if warm_up is not None:
+        warm_up.start()
+    try:
+        yield
+    finally:
+        if warm_up is not None:
+            await warm_up.stop()
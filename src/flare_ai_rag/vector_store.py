@@ -226,21 +226,29 @@ class VectorStoreManager:
         # Save to disk
         self._save_data()
 
-    def similarity_search(self, query: str, k: int = 4) -> list[dict[str, Any]]:
-        """Search for similar texts in the vector store."""
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query with the retrieval-query task type."""
+        return np.array(
+            self.encoder.embed_content(
+                embedding_model=self.embedding_model,
+                contents=query,
+                task_type=EmbeddingTaskType.RETRIEVAL_QUERY
+            )
+        )
+
+    def search_by_vector(
+        self, query_embedding: np.ndarray, k: int = 4
+    ) -> list[dict[str, Any]]:
+        """Search for texts similar to an already embedded query.
+
+        Each result carries the document's index in the store as "id".
+        """
         if not self.documents:
             return []
 
-        # Generate query embedding using Gemini
-        query_embedding = self.encoder.embed_content(
-            embedding_model=self.embedding_model,
-            contents=query,
-            task_type=EmbeddingTaskType.RETRIEVAL_QUERY
-        )
-
         # Search
         indices, distances = self.index.get_nns_by_vector(
-            query_embedding, min(k, len(self.documents)), include_distances=True
+            list(query_embedding), min(k, len(self.documents)), include_distances=True
         )
 
         # Format results
@@ -251,6 +259,7 @@ class VectorStoreManager:
 
             results.append(
                 {
+                    "id": idx,
                     "text": self.documents[idx],
                     "metadata": self.metadatas[idx],
                     "score": float(similarity),
@@ -258,3 +267,11 @@ class VectorStoreManager:
             )
 
         return results
+
+    def similarity_search(self, query: str, k: int = 4) -> list[dict[str, Any]]:
+        """Search for similar texts in the vector store."""
+        if not self.documents:
+            return []
+
+        # Generate query embedding using Gemini
+        return self.search_by_vector(self.embed_query(query), k=k)
@@ -0,0 +1,54 @@
+import asyncio
+
+from web3 import Web3
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FakeRPCServer
+from benchmarks.load import run
+from benchmarks.startup import run as run_startup
+
+
+def test_fake_rpc_answers_web3_reads() -> None:
+    with FakeRPCServer() as server:
+        w3 = Web3(Web3.HTTPProvider(server.url))
+        assert w3.eth.chain_id == 14
+        wallet = Web3.to_checksum_address("0x00000000000000000000000000000000000a11ce")
+        assert w3.eth.get_balance(wallet) > 0
+        router = w3.eth.contract(
+            address="0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",
+            abi=[
+                {
+                    "name": "getAmountsOut",
+                    "type": "function",
+                    "stateMutability": "view",
+                    "inputs": [
+                        {"name": "amountIn", "type": "uint256"},
+                        {"name": "path", "type": "address[]"},
+                    ],
+                    "outputs": [{"name": "", "type": "uint256[]"}],
+                }
+            ],
+        )
+        path = [Web3.to_checksum_address(f"0x{i:040x}") for i in (1, 2, 3)]
+        amounts = router.functions.getAmountsOut(10**18, path).call()
+        assert len(amounts) == 3
+        assert amounts[0] > amounts[1] > amounts[2]
+
+
+def test_load_driver_runs_offline() -> None:
+    instant = LatencyModel(median=0.0, p99=0.0)
+    result = asyncio.run(
+        run(["help", "balance", "send"], requests=4, concurrency=2, gemini=instant, rpc=instant)
+    )
+    assert [r["scenario"] for r in result["routes"]] == ["help", "balance", "send"]
+    assert all(r["errors"] == 0 for r in result["routes"])
+    assert result["rpc_calls"]["eth_call"] >= 4
+
+
+def test_startup_answers_before_warm_up() -> None:
+    instant = LatencyModel(median=0.0, p99=0.0)
+    result = asyncio.run(run_startup(rpc=instant, gemini=instant))
+    assert result["first_request_ok"]
+    assert result["first_swap_ok"]
+    assert result["ready"] >= result["build"]
+    assert result["rpc_calls_until_ready"]["eth_chainId"] >= 1
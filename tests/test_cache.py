@@ -0,0 +1,13 @@
+from flare_ai_defai.cache import TTLCache
+
+
+def test_ttl_cache_expiry_and_eviction() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+    cache.set("d", 4, ttl=-1)
+    assert "d" not in cache
+    assert cache.stats()["evictions"] == 2
@@ -0,0 +1,76 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI
+
+from flare_ai_defai.api.routes.chat import ChatRouter
+from flare_ai_defai.blockchain import WalletBalances
+from flare_ai_defai.executor import BlockingExecutor
+
+N_REQUESTS = 64
+
+
+class FakeBlockchain:
+    """FlareProvider stand-in whose balance is derived from the queried address."""
+
+    native_symbol = "FLR"
+    address = None
+
+    async def get_wallet_balances(self, addresses: list[str], *_) -> list[WalletBalances]:
+        await asyncio.sleep(random.uniform(0, 0.01))
+        return [
+            WalletBalances(
+                address=a,
+                native=float(int(a, 16) % 1000),
+                tokens={"TKN": float(int(a, 16) % 1000)},
+            )
+            for a in addresses
+        ]
+
+
+class FakeBlazeSwap:
+    """BlazeSwapHandler stand-in whose network is already known."""
+
+    tokens = {"TKN": "0x1"}
+    token_decimals = {"TKN": 18}
+
+    async def ensure_network(self) -> None:
+        return None
+
+
+class FakeAI:
+    def generate(self, *_, **__) -> SimpleNamespace:
+        return SimpleNamespace(text="[]")
+
+
+def test_concurrent_balance_requests_do_not_cross_talk() -> None:
+    executor = BlockingExecutor({"rpc": 8, "gemini": 8})
+    chat = ChatRouter(
+        ai=FakeAI(),
+        blockchain=FakeBlockchain(),
+        attestation=None,
+        prompts=SimpleNamespace(get_formatted_prompt=lambda *_, **__: ("", None, None)),
+        executor=executor,
+        blazeswap=FakeBlazeSwap(),
+    )
+    app = FastAPI()
+    app.include_router(chat.router)
+    wallets = [f"0x{i:040x}" for i in range(1, N_REQUESTS + 1)]
+
+    async def request(client: httpx.AsyncClient, wallet: str) -> tuple[str, dict]:
+        response = await client.post("/", data={"message": "balance", "walletAddress": wallet})
+        return wallet, response.json()
+
+    async def main() -> list[tuple[str, dict]]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(request(client, w) for w in wallets))
+
+    for wallet, body in asyncio.run(main()):
+        expected = int(wallet, 16) % 1000
+        assert f"({wallet[:6]}...{wallet[-4:]})" in body["response"]
+        assert f"**FLR**: {expected:,.6f}" in body["response"]
+        assert body["decision_packet"]["wallet_address"].lower() == wallet
+    executor.shutdown()
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from flare_ai_defai.executor import BlockingExecutor
+
+
+def test_run_off_event_loop() -> None:
+    executor = BlockingExecutor({"rpc": 2})
+
+    async def main() -> str:
+        return await executor.run("rpc", lambda: threading.current_thread().name)
+
+    thread_name = asyncio.run(main())
+    assert thread_name.startswith("rpc")
+    executor.shutdown()
+
+
+def test_slow_upstream_does_not_block_loop() -> None:
+    executor = BlockingExecutor({"rpc": 1, "gemini": 1})
+
+    async def main() -> list[str]:
+        order: list[str] = []
+
+        async def slow() -> None:
+            await executor.run("rpc", time.sleep, 0.2)
+            order.append("slow")
+
+        async def fast() -> None:
+            await executor.run("gemini", lambda: None)
+            order.append("fast")
+
+        await asyncio.gather(slow(), fast())
+        return order
+
+    assert asyncio.run(main()) == ["fast", "slow"]
+    executor.shutdown()
+
+
+def test_queue_depth_stats() -> None:
+    executor = BlockingExecutor({"rpc": 1})
+
+    async def main() -> None:
+        await asyncio.gather(*(executor.run("rpc", time.sleep, 0.02) for _ in range(4)))
+
+    asyncio.run(main())
+    stats = executor.stats()["rpc"]
+    assert stats["submitted"] == 4
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_depth"] >= 1
+    assert stats["total_wait_seconds"] > 0
+    executor.shutdown()
+
+
+def test_failures_are_counted() -> None:
+    executor = BlockingExecutor({"rpc": 1})
+
+    def boom() -> None:
+        raise RuntimeError("rpc down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(executor.run("rpc", boom))
+    assert executor.stats()["rpc"]["failed"] == 1
+    executor.shutdown()
+
+
+def test_cancelled_queued_call_is_not_in_flight() -> None:
+    executor = BlockingExecutor({"rpc": 1})
+
+    async def main() -> None:
+        running = asyncio.ensure_future(executor.run("rpc", time.sleep, 0.05))
+        queued = asyncio.ensure_future(executor.run("rpc", time.sleep, 0.05))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(main())
+    stats = executor.stats()["rpc"]
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    executor.shutdown()
@@ -0,0 +1,47 @@
+import asyncio
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import GAS_PRICE, PRIORITY_FEE, FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.blockchain.fee_oracle import compute_fees
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+RECIPIENT = "0x00000000000000000000000000000000000A11cE"
+
+
+def test_fees_use_next_base_fee_and_median_tip() -> None:
+    history = {
+        "baseFeePerGas": [100, 110, 120, 130],
+        "reward": [[5], [1], [9]],
+    }
+    fees = compute_fees(history, base_fee_multiplier=1.5, block=7)
+    assert fees.base_fee == 130
+    assert fees.max_priority_fee == 5
+    assert fees.max_fee == 195 + 5
+    assert compute_fees({"baseFeePerGas": [10], "reward": []}, 2.0, 0).max_fee == 20
+
+
+def test_transaction_bundle_shares_one_fee_read_and_chain_id() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        provider = FlareProvider(web3_provider_url=server.url)
+        provider.fee_oracle.cache_seconds = 60.0
+
+        async def build() -> list:
+            return list(
+                await asyncio.gather(
+                    *(provider.create_send_flr_tx(RECIPIENT, 1.0, RECIPIENT) for _ in range(5))
+                )
+            )
+
+        txs = asyncio.run(build())
+
+    base_fee = GAS_PRICE - PRIORITY_FEE
+    for tx in txs:
+        assert tx["maxPriorityFeePerGas"] == PRIORITY_FEE
+        assert tx["maxFeePerGas"] == int(base_fee * 1.5) + PRIORITY_FEE
+        assert tx["maxFeePerGas"] < GAS_PRICE * 2
+        assert tx["chainId"] == 14
+    assert node.calls["eth_feeHistory"] == 1
+    assert node.calls["eth_chainId"] == 1
+    assert "eth_gasPrice" not in node.calls
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FEED_DECIMALS, FakeRPCNode, FakeRPCServer, feed_value, voting_round
+from flare_ai_defai.blockchain import FlareProvider, ftso_context
+from flare_ai_defai.blockchain.ftso_context import FTSO_FEED_IDS, get_ftso_cache, get_ftso_context
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+BTC_FEED = FTSO_FEED_IDS["BTC"]
+
+
+def test_concurrent_contexts_share_one_snapshot_read() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        provider = FlareProvider(web3_provider_url=server.url)
+
+        async def contexts() -> list[dict]:
+            return await asyncio.gather(
+                *(get_ftso_context(provider, symbol) for symbol in ["BTC", "FLR", "USDT"] * 10)
+            )
+
+        results = asyncio.run(contexts())
+    btc = results[0]
+    assert btc["ftso_feed_id"] == BTC_FEED
+    assert btc["ftso_round_id"] == voting_round()
+    assert btc["ftso_price"] == feed_value(bytes.fromhex(BTC_FEED[2:])) / 10**FEED_DECIMALS
+    assert {r["ftso_round_id"] for r in results} == {btc["ftso_round_id"]}
+    # One registry lookup, then one aggregate3 for every feed and the round
+    assert node.calls == {"eth_getCode": 1, "eth_call": 2}
+
+
+def test_new_voting_round_invalidates_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        provider = FlareProvider(web3_provider_url=server.url)
+        cache = get_ftso_cache(provider)
+        cache.cache_seconds = 60.0
+
+        async def two_rounds() -> None:
+            await get_ftso_context(provider, "ETH")
+            await get_ftso_context(provider, "ETH")
+            monkeypatch.setattr(
+                ftso_context, "current_voting_round", lambda: voting_round() + 1
+            )
+            await get_ftso_context(provider, "ETH")
+
+        asyncio.run(two_rounds())
+    assert cache.reads == 2
+    assert node.calls["eth_call"] == 3
+
+
+def test_failed_read_keeps_feed_id() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    node.methods["eth_call"] = lambda *_: "0x"
+    with FakeRPCServer(node) as server:
+        provider = FlareProvider(web3_provider_url=server.url)
+        context = asyncio.run(get_ftso_context(provider, "USDT"))
+    assert context == {
+        "ftso_feed_id": FTSO_FEED_IDS["USDT"],
+        "ftso_round_id": None,
+        "ftso_price": None,
+        "ftso_timestamp": None,
+    }
@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import structlog
+
+from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai.rag import Document, RetrievalResult
+from flare_ai_defai.ai.semantic_cache import SemanticCache
+from flare_ai_defai.intent import embed
+
+GREETING = {"role": "model", "parts": ["Hi, I'm Flint"]}
+DOCS = [Document(content="Flare docs", metadata={}, source="flare.csv", doc_id=1)]
+
+
+class FakeRAG:
+    """Retrieves the same documents for every query, embedding it locally."""
+
+    version = 0
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    async def embed_query(self, query: str):
+        self.embedded.append(query)
+        return embed(query)
+
+    async def retrieve_relevant_docs(self, query: str) -> RetrievalResult:
+        return RetrievalResult(DOCS, [0.9], query_embedding=await self.embed_query(query))
+
+    def augment_prompt(self, query: str, retrieved_docs: RetrievalResult) -> str:
+        return query
+
+
+def make_provider() -> GeminiProvider:
+    """Provider wired to stubs; the real one needs a Gemini API key."""
+    service = GeminiProvider.__new__(GeminiProvider)
+    service.logger = structlog.get_logger(__name__)
+    service.chat_history = [GREETING]
+    service.semantic_cache = SemanticCache()
+    service.rag_processor = FakeRAG()  # type: ignore[assignment]
+    return service
+
+
+class FakeStream:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield SimpleNamespace(text=chunk)
+
+    async def resolve(self) -> None:
+        pass
+
+
+class FakeChat:
+    """Chat whose history holds an unresolved turn while a stream is open."""
+
+    def __init__(self) -> None:
+        self.history: list[Any] = [GREETING]
+        self.sent: list[str] = []
+
+    async def send_message_async(self, prompt: str, stream: bool = False) -> FakeStream:
+        self.history = [*self.history, {"role": "user", "parts": [prompt]}, "pending"]
+        if stream:
+            return FakeStream(["Hello", " there"])
+        self.sent.append(prompt)
+        return SimpleNamespace(
+            text=f"answer to {prompt}", candidates=[None], prompt_feedback=None
+        )
+
+
+def test_abandoned_stream_rolls_back_session() -> None:
+    service = make_provider()
+    chat = FakeChat()
+    service._get_chat = lambda _: chat  # type: ignore[method-assign]
+    history = chat.history
+    docs = RetrievalResult(documents=[], scores=[])
+
+    async def main() -> None:
+        stream = service.stream_message("hi", session_id="s", retrieved_docs=docs)
+        assert await anext(stream) == "Hello"
+        await stream.aclose()
+
+    asyncio.run(main())
+    assert chat.history == history
+
+    async def consume() -> list[str]:
+        return [
+            chunk
+            async for chunk in service.stream_message(
+                "hi", session_id="s", retrieved_docs=docs
+            )
+        ]
+
+    assert asyncio.run(consume()) == ["Hello", " there"]
+    assert chat.history[-1] == "pending"
+
+
+def test_semantic_cache_keys_on_the_question() -> None:
+    service = make_provider()
+    chats: dict[str, FakeChat] = {}
+    service._get_chat = lambda session_id: chats.setdefault(session_id, FakeChat())  # type: ignore[method-assign]
+
+    def template(question: str) -> str:
+        return f"You are Flint. Answer using the docs. Question: {question}"
+
+    async def ask(session_id: str, question: str) -> str:
+        response = await service.send_message(
+            template(question), session_id=session_id, question=question
+        )
+        return response.text
+
+    async def main() -> list[str]:
+        return [
+            await ask("a", "what is flare"),
+            await ask("b", "how do I stake my tokens for rewards"),
+            await ask("c", "what is flare"),
+        ]
+
+    first, second, repeat = asyncio.run(main())
+    assert second != first
+    assert repeat == first
+    assert chats["b"].sent and not chats["c"].sent
+    # One embedding per turn, of the question rather than the template
+    assert service.rag_processor.embedded == [  # type: ignore[attr-defined]
+        "what is flare",
+        "how do I stake my tokens for rewards",
+        "what is flare",
+    ]
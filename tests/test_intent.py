@@ -0,0 +1,77 @@
+from flare_ai_defai.intent import IntentClassifier
+from flare_ai_defai.prompts import SemanticRouterResponse
+
+ADDRESS = "0x" + "ab" * 20
+
+
+def test_grammar_extracts_send_params() -> None:
+    classifier = IntentClassifier()
+    match = classifier.classify(f"please send 2.5 FLR to {ADDRESS}")
+    assert match is not None
+    assert match.route == SemanticRouterResponse.SEND_TOKEN
+    assert match.source == "grammar"
+    assert match.params == {"amount": 2.5, "to_address": ADDRESS}
+    assert classifier.parse_send(f"transfer {ADDRESS} 3") == {
+        "to_address": ADDRESS,
+        "amount": 3.0,
+    }
+
+
+def test_grammar_precedence() -> None:
+    classifier = IntentClassifier()
+    cases = {
+        "swap 1 FLR to WC2FLR": SemanticRouterResponse.SWAP_TOKEN,
+        "swap 1 FLR to WC2FLR on arbitrum": SemanticRouterResponse.CROSS_CHAIN_SWAP,
+        "bridge 10 FLR to arbitrum": SemanticRouterResponse.CROSS_CHAIN_SWAP,
+        "stake 10 FLR": SemanticRouterResponse.STAKE_FLR,
+        "check my balance": SemanticRouterResponse.CHECK_BALANCE,
+    }
+    for message, route in cases.items():
+        match = classifier.classify(message)
+        assert match is not None
+        assert match.route == route, message
+
+
+def test_questions_do_not_match_grammars() -> None:
+    classifier = IntentClassifier()
+    for message in (
+        "what is remote attestation?",
+        "what is a cross-chain bridge",
+        "how do I move tokens to arbitrum later?",
+    ):
+        match = classifier.classify(message)
+        assert match is None or match.source != "grammar", message
+
+
+def test_questions_do_not_build_transactions() -> None:
+    classifier = IntentClassifier()
+    for message in (
+        "should I swap 100 flr to usdt or hold?",
+        "how do i stake flr?",
+        "can you explain how to bridge flr to arbitrum",
+        "how do i send flr to a friend",
+        f"could you send 1 flr to {ADDRESS}?",
+    ):
+        match = classifier.classify(message)
+        assert match is None or match.route == SemanticRouterResponse.CONVERSATIONAL, (
+            message
+        )
+
+
+def test_similarity_tier() -> None:
+    classifier = IntentClassifier(threshold=0.6, min_margin=0.1)
+    match = classifier.classify("how much FLR do I have")
+    assert match is not None
+    assert match.route == SemanticRouterResponse.CHECK_BALANCE
+    assert match.source == "similarity"
+
+
+def test_ambiguous_message_falls_back() -> None:
+    classifier = IntentClassifier(threshold=0.6, min_margin=0.1)
+    assert classifier.classify("can you explain liquidity pools") is None
+    assert classifier.parse_send("send some tokens to my friend") is None
+
+    stats = classifier.stats()
+    assert stats["fallback"] == 1
+    assert stats["send_parse_fallback"] == 1
+    assert stats["fallback_rate"] == 1.0
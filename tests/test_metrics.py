@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from flare_ai_defai.api.middleware.timing import TimingMiddleware
+from flare_ai_defai.executor import BlockingExecutor
+from flare_ai_defai.metrics import (
+    STAGE_ERRORS,
+    STAGE_SECONDS,
+    UPSTREAM_SECONDS,
+    MetricsRegistry,
+    timed,
+)
+
+
+def test_summary_quantiles_and_render() -> None:
+    registry = MetricsRegistry()
+    latency = registry.summary("test_latency_seconds", "Test latency", ("stage",))
+    for i in range(1, 101):
+        latency.observe(i / 100, stage="route")
+
+    quantiles = latency.quantiles(stage="route")
+    assert quantiles[0.5] == pytest.approx(0.505)
+    assert quantiles[0.99] == pytest.approx(0.9901)
+
+    text = registry.render()
+    assert "# TYPE test_latency_seconds summary" in text
+    assert 'test_latency_seconds{stage="route",quantile="0.95"}' in text
+    assert 'test_latency_seconds_count{stage="route"} 100' in text
+
+
+def test_counter_and_registry_reuse() -> None:
+    registry = MetricsRegistry()
+    errors = registry.counter("test_errors", "Test errors", ("op",))
+    assert registry.counter("test_errors", "Test errors", ("op",)) is errors
+    errors.inc(op='quote"x')
+    errors.inc(2, op='quote"x')
+    assert errors.value(op='quote"x') == 3
+    assert 'test_errors_total{op="quote\\"x"} 3.0' in registry.render()
+
+
+def test_timed_records_errors() -> None:
+    before = STAGE_ERRORS.value(stage="test.failing")
+    with pytest.raises(RuntimeError), timed("test.failing"):
+        raise RuntimeError
+    assert STAGE_ERRORS.value(stage="test.failing") == before + 1
+    assert STAGE_SECONDS.quantiles(stage="test.failing")
+
+
+def test_executor_records_upstream_latency() -> None:
+    executor = BlockingExecutor({"rpc": 1})
+
+    def get_block_number() -> int:
+        time.sleep(0.01)
+        return 1
+
+    asyncio.run(executor.run("rpc", get_block_number))
+    executor.shutdown()
+    assert UPSTREAM_SECONDS.quantiles(upstream="rpc", op="get_block_number")[0.5] >= 0.01
+
+
+def test_timing_header_in_debug_mode() -> None:
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, expose_header=True)
+
+    @app.get("/slow")
+    async def slow() -> dict:
+        with timed("test.route"):
+            await asyncio.sleep(0.01)
+        return {}
+
+    async def main() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/slow")
+
+    response = asyncio.run(main())
+    entries = dict(
+        entry.split(";dur=") for entry in response.headers["X-Timing"].split(", ")
+    )
+    assert float(entries["total"]) >= float(entries["test.route"]) >= 10
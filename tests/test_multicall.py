@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI
+from web3 import Web3
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from flare_ai_defai.api.routes.wallets import router
+from flare_ai_defai.blockchain import FlareProvider
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+TOKENS = {
+    "FLR": "native",
+    "USDT": "0x0B38e83B86d491735fEaa0a791F65c2B99535396",
+    "WFLR": "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",
+}
+DECIMALS = {"USDT": 6, "WFLR": 18}
+WALLETS = [Web3.to_checksum_address(f"0x{i:040x}") for i in (0xA11CE, 0xB0B)]
+
+
+class FakeBlazeSwap:
+    """BlazeSwapHandler stand-in whose network is already known."""
+
+    tokens = TOKENS
+    token_decimals = DECIMALS
+
+    async def ensure_network(self) -> None:
+        return None
+
+
+def expected(wallet: str, decimals: int = 18) -> float:
+    return int(wallet, 16) % 10**6 * 10**15 / 10**decimals
+
+
+def fetch(node: FakeRPCNode) -> list:
+    with FakeRPCServer(node) as server:
+        provider = FlareProvider(web3_provider_url=server.url)
+        return asyncio.run(provider.get_wallet_balances(WALLETS, TOKENS, DECIMALS))
+
+
+def test_balances_are_read_in_one_multicall() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    balances = fetch(node)
+    assert [b.address for b in balances] == WALLETS
+    for wallet in balances:
+        assert wallet.native == expected(wallet.address)
+        assert wallet.tokens == {
+            "USDT": expected(wallet.address, 6),
+            "WFLR": expected(wallet.address),
+        }
+    assert node.calls == {"eth_getCode": 1, "eth_call": 1}
+
+
+def test_balances_fall_back_to_jsonrpc_batch() -> None:
+    node = FakeRPCNode(latency=INSTANT, multicall=False)
+    balances = fetch(node)
+    assert [b.native for b in balances] == [expected(w) for w in WALLETS]
+    assert balances[1].tokens["USDT"] == expected(WALLETS[1], 6)
+    assert node.calls == {"eth_getCode": 1, "eth_getBalance": 2, "eth_call": 4}
+
+
+def test_bulk_balance_route() -> None:
+    with FakeRPCServer(FakeRPCNode(latency=INSTANT)) as server:
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.state.chat_router = SimpleNamespace(
+            blockchain=FlareProvider(web3_provider_url=server.url),
+            blazeswap=FakeBlazeSwap(),
+        )
+
+        async def post(body: dict) -> httpx.Response:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/wallets/balances", json=body)
+
+        response = asyncio.run(post({"addresses": WALLETS, "tokens": ["USDT"]}))
+        assert response.status_code == 200
+        body = response.json()
+        assert [w["address"] for w in body["wallets"]] == WALLETS
+        assert body["wallets"][0]["tokens"] == {"USDT": expected(WALLETS[0], 6)}
+
+        assert asyncio.run(post({"addresses": ["0x123"]})).status_code == 400
+        assert asyncio.run(post({"addresses": WALLETS, "tokens": ["DOGE"]})).status_code == 400
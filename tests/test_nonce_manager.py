@@ -0,0 +1,93 @@
+import asyncio
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain import BlazeSwapHandler, FlareProvider
+from flare_ai_defai.blockchain.nonce_manager import NonceManager
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+WALLET = "0x00000000000000000000000000000000000A11cE"
+ROUTER = "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06"
+SERVER = "0x000000000000000000000000000000000000bEEF"
+
+
+def test_concurrent_bundles_get_distinct_nonces_from_one_read() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        nonces = NonceManager(get_async_web3(server.url))
+
+        async def reserve() -> list:
+            return list(await asyncio.gather(*(nonces.reserve(WALLET, 3) for _ in range(4))))
+
+        bundles = asyncio.run(reserve())
+    assert sorted(n for bundle in bundles for n in bundle) == list(range(12))
+    assert all(bundle == list(range(bundle[0], bundle[0] + 3)) for bundle in bundles)
+    assert node.calls["eth_getTransactionCount"] == 1
+
+
+def test_release_confirm_and_expiry_reconcile_the_counter() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        nonces = NonceManager(get_async_web3(server.url), reservation_ttl=60.0)
+
+        async def flow() -> tuple:
+            first = await nonces.reserve(WALLET, 2)
+            nonces.release(WALLET, [1])
+            reused = await nonces.reserve(WALLET)
+            nonces.confirm(WALLET, 1)
+            nonces.reservation_ttl = 0.0
+            await nonces.reserve(WALLET)
+            # The unsent nonce 2 expired, so the chain's count of 0 wins
+            reconciled = await nonces.reserve(WALLET)
+            return first, reused, reconciled
+
+        first, reused, reconciled = asyncio.run(flow())
+    assert first == [0, 1]
+    assert reused == [1]
+    assert reconciled == [0]
+    assert nonces.stats()["expired"] == 1
+
+
+def test_wallet_previews_read_the_pending_nonce_without_reserving() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        handler = BlazeSwapHandler(server.url, chain_id=14)
+        provider = FlareProvider(web3_provider_url=server.url)
+        provider.address = SERVER
+
+        async def prepare() -> tuple:
+            bundles = [
+                await handler.prepare_add_liquidity_transaction(
+                    "USDT", "WETH", 1.0, 1.0, WALLET, ROUTER
+                )
+                for _ in range(2)
+            ]
+            sends = [
+                await provider.create_send_flr_tx(WALLET, 1.0, sender)
+                for sender in (WALLET, WALLET, SERVER, SERVER)
+            ]
+            return bundles, sends
+
+        bundles, sends = asyncio.run(prepare())
+    # A rejected preview leaves no gap: each bundle starts at the pending count
+    for bundle in bundles:
+        nonces = [int(tx["tx"]["nonce"], 16) for tx in bundle["transactions"]]
+        assert nonces == [0, 1, 2]
+    # Only the provider's own account is allocated locally
+    assert [tx["nonce"] for tx in sends] == [0, 0, 0, 1]
+    assert provider.nonces.stats()["live_reservations"] == 2
+
+
+def test_swap_needing_approval_returns_the_approval_first() -> None:
+    with FakeRPCServer(FakeRPCNode(latency=INSTANT)) as server:
+        handler = BlazeSwapHandler(server.url, chain_id=14)
+        swap = asyncio.run(
+            handler.prepare_swap_transaction("USDT", "WETH", 1.0, WALLET, ROUTER)
+        )
+    approval = swap["approval_transaction"]
+    assert swap["needs_approval"]
+    assert approval["to"] == handler.tokens["USDT"]
+    # The approval fills the pending nonce and the swap follows it
+    assert int(approval["nonce"], 16) == 0
+    assert int(swap["transaction"]["nonce"], 16) == 1
@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from flare_ai_defai.pipeline import ERROR, OK, TIMEOUT, Stage, run_stages
+
+
+def test_independent_stages_run_concurrently() -> None:
+    async def slow(value: int) -> int:
+        await asyncio.sleep(0.1)
+        return value
+
+    async def main() -> tuple[float, dict[str, int]]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await run_stages(
+            [
+                Stage("a", lambda: slow(1)),
+                Stage("b", lambda: slow(2)),
+                Stage("c", lambda a: slow(a + 10), deps=("a",)),
+            ]
+        )
+        values = {name: o.value for name, o in result.outcomes.items()}
+        return loop.time() - started, values
+
+    elapsed, values = asyncio.run(main())
+    assert values == {"a": 1, "b": 2, "c": 11}
+    assert elapsed < 0.3
+
+
+def test_timeout_and_error_use_default() -> None:
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    async def boom() -> None:
+        raise RuntimeError("down")
+
+    async def main():
+        return await run_stages(
+            [
+                Stage("hang", hang, timeout=0.01, default="late"),
+                Stage("boom", boom, default="failed"),
+                Stage("after", lambda hang, boom: asyncio.sleep(0, f"{hang}/{boom}"), deps=("hang", "boom")),
+            ]
+        )
+
+    result = asyncio.run(main())
+    assert result.outcomes["hang"].status == TIMEOUT
+    assert result.outcomes["boom"].status == ERROR
+    assert result.outcomes["after"].status == OK
+    assert result.value("after") == "late/failed"
+    assert not result.detached
+
+
+def test_detached_stage_keeps_running() -> None:
+    async def main() -> str:
+        result = await run_stages(
+            [
+                Stage(
+                    "suggestions",
+                    lambda: asyncio.sleep(0.05, "done"),
+                    timeout=0.01,
+                    detach_on_timeout=True,
+                )
+            ]
+        )
+        assert result.outcomes["suggestions"].status == TIMEOUT
+        return await result.detached["suggestions"]
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_undeclared_dependency_rejected() -> None:
+    with pytest.raises(ValueError, match="undeclared"):
+        asyncio.run(run_stages([Stage("b", asyncio.sleep, deps=("a",))]))
+
+
+def test_synchronous_failure_is_stage_error() -> None:
+    def broken() -> None:
+        raise RuntimeError("bad arguments")
+
+    async def main():
+        return await run_stages(
+            [
+                Stage("broken", broken, default="fallback"),
+                Stage("other", lambda: asyncio.sleep(0, "ok")),
+            ]
+        )
+
+    result = asyncio.run(main())
+    assert result.outcomes["broken"].status == ERROR
+    assert result.outcomes["broken"].error == "bad arguments"
+    assert result.value("broken") == "fallback"
+    assert result.value("other") == "ok"
+
+
+def test_on_complete_reports_in_finish_order() -> None:
+    finished: list[str] = []
+
+    async def main() -> None:
+        await run_stages(
+            [
+                Stage("slow", lambda: asyncio.sleep(0.05, "s")),
+                Stage("fast", lambda: asyncio.sleep(0, "f")),
+            ],
+            on_complete=lambda name, _: finished.append(name),
+        )
+
+    asyncio.run(main())
+    assert finished == ["fast", "slow"]
+
+
+def test_cancelling_the_caller_cancels_attached_stages() -> None:
+    cancelled: list[str] = []
+
+    async def hang(name: str) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    async def main() -> str:
+        detached_work = asyncio.Event()
+
+        async def background() -> str:
+            await asyncio.sleep(0.05)
+            detached_work.set()
+            return "done"
+
+        caller = asyncio.create_task(
+            run_stages(
+                [
+                    Stage("first", lambda: hang("first")),
+                    Stage("second", lambda: hang("second")),
+                    Stage("report", background, timeout=1, detach_on_timeout=True),
+                ]
+            )
+        )
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == ["first", "second"]
+        await asyncio.wait_for(detached_work.wait(), 1)
+        return "finished"
+
+    assert asyncio.run(main()) == "finished"
@@ -0,0 +1,80 @@
+import asyncio
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import PAIRS, POOL_TOKENS, FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain import BlazeSwapHandler
+from flare_ai_defai.blockchain.pool_registry import PoolRegistry
+from flare_ai_defai.blockchain.web3_client import get_async_web3
+
+FACTORY = "0x440602f459D7Dd500a74528003e6A20A46d6e2A6"
+WFLR, USDT, WETH, FLX = POOL_TOKENS
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+
+
+def test_registry_indexes_factory_pairs_and_answers_lookups_locally() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        registry = PoolRegistry(get_async_web3(server.url), FACTORY)
+
+        async def lookups() -> list:
+            return [
+                await registry.get_pool(USDT, WFLR),
+                await registry.get_pool(WFLR, USDT),
+                await registry.get_pool(WETH, "0x" + "11" * 20),
+            ]
+
+        found, reversed_found, missing = asyncio.run(lookups())
+    assert found is not None and found == reversed_found
+    assert found.pair in PAIRS
+    assert missing is None
+    assert len(registry.pools) == len(PAIRS)
+    # allPairsLength, allPairs and token0/token1 are one aggregate3 each
+    assert node.calls == {"eth_getCode": 1, "eth_call": 3}
+
+
+def test_registry_restarts_from_snapshot(tmp_path) -> None:
+    snapshot = tmp_path / "pools.json"
+    with FakeRPCServer(FakeRPCNode(latency=INSTANT)) as server:
+        w3 = get_async_web3(server.url)
+        asyncio.run(PoolRegistry(w3, FACTORY, snapshot_path=snapshot).ensure_loaded())
+    assert snapshot.exists()
+
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        registry = PoolRegistry(get_async_web3(server.url), FACTORY, snapshot_path=snapshot)
+        pool = asyncio.run(registry.get_pool(FLX, WETH))
+    assert pool is not None
+    # Only allPairsLength is read to confirm nothing was added
+    assert node.calls == {"eth_getCode": 1, "eth_call": 1}
+
+
+def test_blazeswap_pool_checks_use_registry() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        handler = BlazeSwapHandler(server.url, chain_id=14)
+
+        async def checks() -> tuple:
+            pairs = await handler.get_available_pairs()
+            exists = await handler.check_pool_exists("FLR", "USDT")
+            return pairs, exists
+
+        pairs, exists = asyncio.run(checks())
+    assert exists
+    assert {"FLR/USDT", "WFLR/USDT", "USDT/WETH", "WETH/FLX"} <= {p["pair"] for p in pairs}
+    assert "FLR/WFLR" not in {p["pair"] for p in pairs}
+    assert node.calls["eth_call"] == 3
+
+
+def test_blazeswap_detects_chain_lazily() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        handler = BlazeSwapHandler(server.url)
+        assert not handler.ready
+        assert node.calls == {}
+
+        asyncio.run(handler.warm_up())
+    assert handler.ready
+    assert handler.chain_id == 14
+    assert handler.tokens["USDT"] == USDT
+    assert handler.stats()["pool_registry"]["pools"] == len(PAIRS)
+    assert node.calls["eth_chainId"] == 1
@@ -0,0 +1,181 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from web3 import Web3
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import POOL_TOKENS, RESERVE, FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain import BlazeSwapHandler
+from flare_ai_defai.blockchain.pool_registry import Pool, pair_key
+from flare_ai_defai.blockchain.quote import (
+    QuoteEngine,
+    find_best_path,
+    get_amount_out,
+    min_amount_out,
+    quote_liquidity,
+    reachable_pools,
+)
+
+ROUTER = "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06"
+GET_AMOUNTS_OUT_ABI = [
+    {
+        "name": "getAmountsOut",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [
+            {"name": "amountIn", "type": "uint256"},
+            {"name": "path", "type": "address[]"},
+        ],
+        "outputs": [{"name": "", "type": "uint256[]"}],
+    }
+]
+WFLR, USDT, WETH, FLX = POOL_TOKENS
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+
+
+def test_constant_product_math() -> None:
+    # Uniswap V2 reference: 1 token into a 100/200 pool
+    assert get_amount_out(10**18, 100 * 10**18, 200 * 10**18) == 1974316068794122597
+    assert quote_liquidity(3, 100, 250) == 7
+    assert min_amount_out(10_000, 50) == 9_950
+    with pytest.raises(ValueError, match="liquidity"):
+        get_amount_out(1, 0, 10)
+
+
+def test_local_quotes_match_router_and_cost_no_rpcs_once_warm() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        handler = BlazeSwapHandler(server.url, chain_id=14)
+        handler.quotes.block_poll_interval = 60.0
+        path = [WFLR, USDT, WETH]
+        router = Web3(Web3.HTTPProvider(server.url)).eth.contract(
+            address=ROUTER, abi=GET_AMOUNTS_OUT_ABI
+        )
+        on_chain = router.functions.getAmountsOut(10**18, path).call()
+
+        async def quotes() -> tuple:
+            first = await handler.quotes.quote(10**18, path)
+            warm = dict(node.calls)
+            many = await handler.quotes.quote_many([10**15, 10**18, 10**23], [WFLR, FLX])
+            size = await handler.liquidity_amount("FLR", "USDT", 2.0)
+            return first, warm, many, size
+
+        first, warm, many, size = asyncio.run(quotes())
+        after = dict(node.calls)
+
+    assert list(first.amounts) == on_chain
+    assert first.block is not None
+    assert 0 <= first.price_impact < 1e-5
+    assert many[0].price_impact < many[1].price_impact < many[2].price_impact
+    assert many[2].price_impact == pytest.approx(0.997e23 / (RESERVE + 0.997e23))
+    # Equal fake reserves: 2 FLR sizes to 2 USDT despite the differing decimals
+    assert size == pytest.approx(2.0 * 10**12)
+    assert after == warm
+
+
+def graph(*pools: tuple[str, str, int, int]) -> dict:
+    edges: dict = {}
+    for a, b, reserve_a, reserve_b in pools:
+        edges.setdefault(a, {})[b] = (reserve_a, reserve_b)
+        edges.setdefault(b, {})[a] = (reserve_b, reserve_a)
+    return edges
+
+
+def test_route_search_prefers_deep_multi_hop_paths() -> None:
+    pools = graph(
+        ("A", "C", 10**18, 10**18),  # shallow direct pool
+        ("A", "B", 10**24, 10**24),
+        ("B", "C", 10**24, 10**24),
+        ("C", "D", 10**24, 10**24),
+    )
+    amount_out, path = find_best_path(pools, 10**18, "A", "C", max_hops=3)
+    assert path == ["A", "B", "C"]
+    assert amount_out == get_amount_out(get_amount_out(10**18, 10**24, 10**24), 10**24, 10**24)
+    assert find_best_path(pools, 10**18, "A", "C", max_hops=1)[1] == ["A", "C"]
+    assert find_best_path(pools, 10**18, "A", "D", max_hops=3)[1] == ["A", "B", "C", "D"]
+    assert find_best_path(pools, 10**18, "B", "E", max_hops=3) is None
+
+
+def test_swap_transaction_follows_searched_route() -> None:
+    with FakeRPCServer(FakeRPCNode(latency=INSTANT)) as server:
+        handler = BlazeSwapHandler(server.url, chain_id=14)
+        swap = asyncio.run(
+            handler.prepare_swap_transaction(
+                "FLR", "USDT", 1.0, "0x00000000000000000000000000000000000A11cE", ROUTER
+            )
+        )
+    assert swap["path"] == [WFLR, USDT]
+    assert swap["route"] == ["WFLR", "USDT"]
+    assert swap["min_amount_out"] == swap["expected_amount_out"] * 95 // 100
+    assert swap["transaction"]["value"] == hex(10**18)
+
+
+def pools(*pairs: tuple[str, str]) -> dict:
+    return {pair_key(a, b): Pool(f"{a}{b}", *sorted((a, b))) for a, b in pairs}
+
+
+def test_only_pools_routable_between_configured_tokens_are_tracked() -> None:
+    registry = pools(("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("x", "y"))
+    # Routes a-b-c-d; d-e only leads away from both ends
+    assert set(reachable_pools(registry, ["a", "d"], 3)) == {
+        ("a", "b"),
+        ("b", "c"),
+        ("c", "d"),
+    }
+    assert set(reachable_pools(registry, ["a", "d"], 2)) == set()
+    assert set(reachable_pools(registry, ["a", "c"], 2)) == {("a", "b"), ("b", "c")}
+
+
+class StubEth:
+    def __init__(self) -> None:
+        self.block = 1
+
+    @property
+    async def block_number(self) -> int:
+        return self.block
+
+
+class StubMulticall:
+    """Returns empty data, as for a failed call, for pairs in `failing`."""
+
+    def __init__(self, failing: set[str]) -> None:
+        self.failing = failing
+        self.batches: list[int] = []
+
+    async def aggregate(self, calls: list) -> list:
+        self.batches.append(len(calls))
+        reserves = "0x" + "00" * 31 + "64" + "00" * 31 + "c8" + "00" * 32
+        return [
+            None if call.target in self.failing else bytes.fromhex(reserves[2:])
+            for call in calls
+        ]
+
+
+def test_failed_reserve_reads_do_not_force_reloads() -> None:
+    registry = SimpleNamespace(
+        pools=pools(("a", "b"), ("b", "c"), ("x", "y")),
+        factory="factory",
+        ensure_loaded=lambda: asyncio.sleep(0),
+    )
+    eth = StubEth()
+    multicall = StubMulticall(failing={"bc"})
+    engine = QuoteEngine(
+        SimpleNamespace(eth=eth),  # type: ignore[arg-type]
+        registry,  # type: ignore[arg-type]
+        block_poll_interval=0.0,
+        multicall=multicall,  # type: ignore[arg-type]
+        max_hops=2,
+        tokens=["a", "c"],
+    )
+
+    async def polls() -> None:
+        for _ in range(3):
+            await engine.refresh()
+        eth.block = 2
+        await engine.refresh()
+
+    asyncio.run(polls())
+    # One load per block, of the two pools between a and c only
+    assert multicall.batches == [2, 2]
+    assert engine.stats() == {"block": 2, "tracked_pools": 2, "pools": 1}
@@ -0,0 +1,81 @@
+import asyncio
+
+from aiohttp import ClientSession
+from web3 import AsyncWeb3, Web3
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain.web3_client import PooledAsyncHTTPProvider
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+WALLETS = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 11)]
+
+
+def batching_web3(url: str, batch_max_size: int = 100) -> AsyncWeb3:
+    return AsyncWeb3(
+        PooledAsyncHTTPProvider(
+            url, pool_size=4, timeout=5.0, batch_window=0.005, batch_max_size=batch_max_size
+        )
+    )
+
+
+def test_gathered_calls_share_one_http_request() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        w3 = batching_web3(server.url)
+
+        async def reads() -> list:
+            return list(
+                await asyncio.gather(w3.eth.chain_id, *(w3.eth.get_balance(w) for w in WALLETS))
+            )
+
+        chain_id, *balances = asyncio.run(reads())
+    assert chain_id == 14
+    assert balances == [int(w, 16) % 10**6 * 10**15 for w in WALLETS]
+    assert node.calls["eth_getBalance"] == len(WALLETS)
+    assert node.http_requests == 1
+
+
+def test_errors_are_isolated_and_batches_are_capped() -> None:
+    node = FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(node) as server:
+        w3 = batching_web3(server.url, batch_max_size=4)
+
+        async def reads() -> list:
+            return list(
+                await asyncio.gather(
+                    w3.provider.make_request("eth_unknownMethod", []),
+                    *(w3.eth.get_balance(w) for w in WALLETS),
+                )
+            )
+
+        failed, *balances = asyncio.run(reads())
+    assert "error" in failed
+    assert len(balances) == len(WALLETS)
+    # 11 requests in batches of at most 4
+    assert node.http_requests == 3
+
+
+def test_displaced_session_is_evicted_without_closing_other_loops() -> None:
+    with FakeRPCServer(FakeRPCNode(latency=INSTANT)) as server:
+        w3 = batching_web3(server.url, batch_max_size=1)
+        provider = w3.provider
+        first, second = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first.run_until_complete(w3.eth.chain_id)
+
+            async def on_second_loop() -> tuple:
+                # web3's own session already holds this loop's cache slot
+                stale = await provider.cache_async_session(ClientSession())
+                chain_id = await w3.eth.chain_id
+                return stale, chain_id
+
+            stale, chain_id = second.run_until_complete(on_second_loop())
+            assert chain_id == 14
+            assert stale.closed
+            assert not provider._sessions[first].closed
+            assert first.run_until_complete(w3.eth.chain_id) == 14
+        finally:
+            for loop in (first, second):
+                loop.run_until_complete(provider._sessions[loop].close())
+                loop.close()
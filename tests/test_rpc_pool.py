@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from web3 import AsyncWeb3
+
+from benchmarks.fake_ai import LatencyModel
+from benchmarks.fake_rpc import FakeRPCNode, FakeRPCServer
+from flare_ai_defai.blockchain.rpc_pool import RPCPoolProvider
+from flare_ai_defai.blockchain.web3_client import PooledAsyncHTTPProvider
+from flare_ai_defai.settings import settings
+
+INSTANT = LatencyModel(median=0.0, p99=0.0)
+SLOW = LatencyModel(median=0.4, p99=0.4)
+
+
+class FailingNode(FakeRPCNode):
+    """Node answering every HTTP request with a 503."""
+
+    async def handle(self, request: Request) -> JSONResponse:
+        self.http_requests += 1
+        return JSONResponse({}, status_code=503)
+
+
+def pool_web3(*urls: str) -> AsyncWeb3:
+    return AsyncWeb3(
+        RPCPoolProvider([PooledAsyncHTTPProvider(url, pool_size=4, timeout=5.0) for url in urls])
+    )
+
+
+def test_reads_fail_over_from_a_dead_endpoint() -> None:
+    dead, node = FailingNode(), FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(dead) as dead_server, FakeRPCServer(node) as server:
+        w3 = pool_web3(dead_server.url, server.url)
+
+        async def reads() -> list[int]:
+            return [await w3.eth.chain_id for _ in range(3)]
+
+        assert asyncio.run(reads()) == [14, 14, 14]
+    stats = w3.provider.stats()
+    # The head probe and first read hit the dead endpoint; it then cooled down
+    assert dead.http_requests == 2
+    assert stats["endpoints"][dead_server.url]["failures"] == 2
+    assert stats["failovers"] == 1
+    assert stats["hedged"] == 0
+    assert node.calls["eth_chainId"] == 3
+
+
+def test_slow_reads_are_hedged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "rpc_hedge_max_delay", 0.05)
+    slow, fast = FakeRPCNode(latency=SLOW), FakeRPCNode(latency=INSTANT)
+    with FakeRPCServer(slow) as slow_server, FakeRPCServer(fast) as fast_server:
+        w3 = pool_web3(slow_server.url, fast_server.url)
+
+        async def read() -> tuple[int, float]:
+            loop = asyncio.get_running_loop()
+            started_at = loop.time()
+            chain_id = await w3.eth.chain_id
+            return chain_id, loop.time() - started_at
+
+        chain_id, elapsed = asyncio.run(read())
+    assert chain_id == 14
+    assert elapsed < SLOW.median
+    assert w3.provider.stats()["hedges_won"] == 1
+
+
+def test_lagging_endpoints_are_avoided_and_writes_stick() -> None:
+    lagging, current = FakeRPCNode(latency=INSTANT), FakeRPCNode(latency=INSTANT)
+    lagging.methods["eth_blockNumber"] = lambda: hex(current.block_number - 10)
+    with FakeRPCServer(lagging) as lagging_server, FakeRPCServer(current) as current_server:
+        w3 = pool_web3(lagging_server.url, current_server.url)
+        wallet = w3.to_checksum_address(f"0x{1:040x}")
+
+        async def calls() -> None:
+            await w3.eth.block_number
+            # Let the head probe of every endpoint finish
+            await asyncio.sleep(0.1)
+            for _ in range(5):
+                await w3.eth.get_balance(wallet)
+                await w3.eth.get_transaction_count(wallet, "pending")
+
+        asyncio.run(calls())
+    assert "eth_getBalance" not in lagging.calls
+    assert current.calls["eth_getBalance"] == 5
+    # The sticky endpoint moved off the lagging node and stayed put
+    assert current.calls["eth_getTransactionCount"] == 5
+    assert w3.provider.stats()["sticky"] == current_server.url
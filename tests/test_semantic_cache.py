@@ -0,0 +1,40 @@
+import time
+
+import numpy as np
+
+from flare_ai_defai.ai.semantic_cache import SemanticCache
+
+
+def test_near_duplicate_query_hits() -> None:
+    cache = SemanticCache(threshold=0.95)
+    cache.set(np.array([1.0, 0.0, 0.0]), (1, 2), version=0, value="answer")
+
+    assert cache.get(np.array([0.99, 0.05, 0.0]), (1, 2), version=0) == "answer"
+    assert cache.get(np.array([0.0, 1.0, 0.0]), (1, 2), version=0) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_different_documents_miss() -> None:
+    cache = SemanticCache()
+    cache.set(np.array([1.0, 0.0]), (1, 2), version=0, value="answer")
+    assert cache.get(np.array([1.0, 0.0]), (1, 3), version=0) is None
+
+
+def test_version_bump_invalidates() -> None:
+    cache = SemanticCache()
+    cache.set(np.array([1.0, 0.0]), (1,), version=0, value="stale")
+    assert cache.get(np.array([1.0, 0.0]), (1,), version=1) is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_and_size_bounds() -> None:
+    cache = SemanticCache(maxsize=2, ttl=0.01)
+    for i in range(3):
+        cache.set(np.eye(3)[i], (i,), version=0, value=str(i))
+    assert cache.stats()["evictions"] == 1
+    time.sleep(0.02)
+    assert cache.get(np.eye(3)[2], (2,), version=0) is None
+    assert cache.stats()["size"] == 0
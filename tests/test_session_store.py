@@ -0,0 +1,65 @@
+import time
+
+import google.generativeai as genai
+
+from flare_ai_defai.ai.session_store import (
+    SessionStore,
+    SQLiteSessionTier,
+    serialize_history,
+)
+
+
+def turn(text: str, role: str = "user") -> dict:
+    return {"role": role, "parts": [text]}
+
+
+def start_chat(history=None) -> genai.ChatSession:
+    return genai.GenerativeModel("gemini-1.5-flash").start_chat(history=history or [])
+
+
+def test_capacity_eviction_persists_and_rehydrates(tmp_path) -> None:
+    tier = SQLiteSessionTier(str(tmp_path / "sessions.db"))
+    store = SessionStore(max_entries=1, tier=tier)
+
+    first = store.get_or_create("a", start_chat)
+    first.history = [turn("hi"), turn("hello", "model")]
+    store.get_or_create("b", start_chat)
+
+    assert "a" not in store
+    assert store.stats()["evicted_capacity"] == 1
+    assert store.stats()["persisted"] == 1
+
+    rehydrated = store.get_or_create("a", start_chat)
+    assert serialize_history(rehydrated.history) == [turn("hi"), turn("hello", "model")]
+    assert store.stats()["rehydrated"] == 1
+
+
+def test_idle_eviction() -> None:
+    store = SessionStore(idle_ttl=0.01)
+    store.get_or_create("a", start_chat)
+    time.sleep(0.02)
+    store.get_or_create("b", start_chat)
+    assert "a" not in store
+    assert store.stats()["evicted_idle"] == 1
+
+
+def test_history_truncated_to_token_budget() -> None:
+    store = SessionStore(token_budget=10)
+    chat = store.get_or_create("a", start_chat)
+    chat.history = [turn("x" * 40), turn("y" * 40, "model"), turn("q"), turn("a", "model")]
+
+    chat = store.get_or_create("a", start_chat)
+    assert serialize_history(chat.history) == [turn("q"), turn("a", "model")]
+    assert store.stats()["truncated"] == 1
+    assert store.stats()["bytes_held"] == 2
+
+
+def test_persisted_sessions_expire(tmp_path) -> None:
+    tier = SQLiteSessionTier(str(tmp_path / "sessions.db"), ttl=0.05)
+    tier.save("a", [turn("hi")])
+    time.sleep(0.06)
+    assert tier.load("a") is None
+
+    tier.save("b", [turn("hello")])
+    assert tier.count() == 1
+    assert tier.load("b") == [turn("hello")]
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from flare_ai_defai.singleflight import SingleFlight, singleflight_stats
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight("test_share")
+    calls = 0
+
+    async def upstream() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(flight.do("k", upstream) for _ in range(10)))
+
+    assert asyncio.run(main()) == [42] * 10
+    assert calls == 1
+    stats = flight.stats()["keys"][SingleFlight.label("k")]
+    assert stats["executions"] == 1
+    assert stats["shared"] == 9
+    assert flight.stats()["totals"]["calls"] == 10
+    assert "test_share" in singleflight_stats()
+
+
+def test_stats_do_not_expose_keys() -> None:
+    flight = SingleFlight("test_private")
+    message = "send 5 flr to 0x" + "ab" * 20
+
+    asyncio.run(flight.do(message, lambda: asyncio.sleep(0, 1)))
+    assert message not in repr(singleflight_stats())
+    assert list(flight.stats()["keys"]) == [SingleFlight.label(message)]
+
+
+def test_errors_fan_out_and_are_not_cached() -> None:
+    flight = SingleFlight("test_errors")
+
+    async def boom() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    async def main() -> list:
+        return await asyncio.gather(
+            *(flight.do("k", boom) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        asyncio.run(flight.do("k", boom))
+    assert flight.stats()["keys"][SingleFlight.label("k")]["failures"] == 2
+
+
+def test_cancelled_waiter_does_not_cancel_others() -> None:
+    flight = SingleFlight("test_cancel")
+
+    async def main() -> int:
+        first = asyncio.create_task(flight.do("k", lambda: asyncio.sleep(0.02, 7)))
+        second = asyncio.create_task(flight.do("k", lambda: asyncio.sleep(0.02, 8)))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == 7
+
+
+def test_last_waiter_cancelling_cancels_upstream() -> None:
+    flight = SingleFlight("test_cancel_last")
+
+    async def main() -> bool:
+        started = asyncio.Event()
+        upstream_cancelled = False
+
+        async def upstream() -> None:
+            nonlocal upstream_cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                upstream_cancelled = True
+                raise
+
+        waiter = asyncio.create_task(flight.do("k", upstream))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0)
+        return upstream_cancelled
+
+    assert asyncio.run(main()) is True
+    assert flight.in_flight() == 0
+    assert flight.stats()["keys"][SingleFlight.label("k")]["cancellations"] == 1
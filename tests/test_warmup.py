@@ -0,0 +1,32 @@
+import asyncio
+
+from flare_ai_defai.warmup import WarmUp
+
+
+def test_failing_steps_are_retried_until_ready() -> None:
+    attempts = {"flaky": 0}
+
+    async def flaky() -> None:
+        attempts["flaky"] += 1
+        if attempts["flaky"] < 3:
+            raise ConnectionError("node unreachable")
+
+    async def steady() -> None:
+        return None
+
+    warm_up = WarmUp(retry_interval=0.0)
+    warm_up.add("flaky", flaky)
+    warm_up.add("steady", steady)
+
+    async def run() -> tuple[bool, dict]:
+        warm_up.start()
+        before = warm_up.ready
+        await warm_up.wait()
+        return before, warm_up.status()
+
+    before, status = asyncio.run(run())
+    assert not before
+    assert status["ready"]
+    assert status["steps"]["flaky"]["attempts"] == 3
+    assert status["steps"]["flaky"]["state"] == "ready"
+    assert status["steps"]["steady"]["attempts"] == 1